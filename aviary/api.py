@@ -112,6 +112,9 @@ from aviary.utils.functions import create_opts2vals, add_opts2vals, Null
 # TODO: check and see if this works with both sides, or just GASP
 from aviary.mission.base_ode import BaseODE
 from aviary.mission.flops_based.ode.energy_ODE import EnergyODE
+from aviary.mission.flops_based.ode.breguet_cruise_ode import (
+    BreguetCruiseODE as HeightEnergyBreguetCruiseODE,
+)
 from aviary.mission.flops_based.ode.landing_ode import LandingODE as DetailedLandingODE
 from aviary.mission.flops_based.ode.landing_ode import FlareODE as DetailedFlareODE
 from aviary.mission.flops_based.ode.takeoff_ode import TakeoffODE as DetailedTakeoffODE
@@ -141,6 +144,9 @@ from aviary.mission.phase_builder_base import PhaseBuilderBase
 from aviary.mission.flops_based.phases.energy_phase import (
     EnergyPhase as HeightEnergyPhaseBuilder,
 )
+from aviary.mission.flops_based.phases.breguet_cruise_phase import (
+    BreguetCruisePhase as HeightEnergyBreguetCruisePhaseBuilder,
+)
 from aviary.mission.flops_based.phases.build_landing import (
     Landing as HeightEnergyLandingPhaseBuilder,
 )
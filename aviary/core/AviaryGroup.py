@@ -1,8 +1,10 @@
+import dymos as dm
 import openmdao.api as om
 from openmdao.utils.mpi import MPI
 
 from aviary.utils.aviary_values import AviaryValues
 from aviary.variable_info.enums import EquationsOfMotion
+from aviary.variable_info.functions import get_input_default, get_metadata_index
 from aviary.variable_info.variables import Settings
 
 HEIGHT_ENERGY = EquationsOfMotion.HEIGHT_ENERGY
@@ -34,46 +36,33 @@ class AviaryGroup(om.Group):
         aviary_metadata = self.options['aviary_metadata']
 
         # Find promoted name of every input in the model.
-        all_prom_inputs = []
+        all_prom_inputs = set()
 
         # We can call list_inputs on the subsystems.
         for system in self.system_iter(recurse=False):
             var_abs = system.list_inputs(out_stream=None, val=False)
-            var_prom = [v['prom_name'] for k, v in var_abs]
-            all_prom_inputs.extend(var_prom)
+            all_prom_inputs.update(v['prom_name'] for k, v in var_abs)
 
             # Calls to promotes aren't handled until this group resolves.
             # Here, we address anything promoted with an alias in AviaryProblem.
             input_meta = system._var_promotes['input']
-            var_prom = [v[0][1] for v in input_meta if isinstance(v[0], tuple)]
-            all_prom_inputs.extend(var_prom)
-            var_prom = [v[0] for v in input_meta if not isinstance(v[0], tuple)]
-            all_prom_inputs.extend(var_prom)
+            all_prom_inputs.update(v[0][1] for v in input_meta if isinstance(v[0], tuple))
+            all_prom_inputs.update(v[0] for v in input_meta if not isinstance(v[0], tuple))
 
         if MPI and self.comm.size > 1:
             # Under MPI, promotion info only lives on rank 0, so broadcast.
             all_prom_inputs = self.comm.bcast(all_prom_inputs, root=0)
 
-        for key in aviary_metadata:
-            if ':' not in key or key.startswith('dynamic:'):
-                continue
-
-            if aviary_metadata[key]['option']:
-                continue
-
+        for key in get_metadata_index(aviary_metadata).inputs:
             # Skip anything that is not presently an input.
             if key not in all_prom_inputs:
                 continue
 
-            if key in aviary_options:
-                val, units = aviary_options.get_item(key)
-            else:
-                val = aviary_metadata[key]['default_value']
-                units = aviary_metadata[key]['units']
+            val, units = get_input_default(key, aviary_options, aviary_metadata)
 
-                if val is None:
-                    # optional, but no default value
-                    continue
+            if val is None:
+                # optional, but no default value
+                continue
 
             self.set_input_defaults(key, val=val, units=units)
 
@@ -81,22 +70,31 @@ class AviaryGroup(om.Group):
         # This will require some modifications to the enums
         mission_method = aviary_options.get_val(Settings.EQUATIONS_OF_MOTION)
 
+        traj = getattr(self, 'traj', None)
+
+        # Set more appropriate solvers for dymos when the phases are linked.
+        if (
+            MPI
+            and isinstance(traj, dm.Trajectory)
+            and isinstance(traj.phases.linear_solver, om.PETScKrylov)
+        ):
+            # When any phase is connected with input_initial = True and the phases are
+            # distributed over processes, dymos puts a krylov solver and a jacobi solver
+            # in the phases group. This is necessary in case the phases are cyclic.
+            # However, the krylov solver causes some problems with the newton solvers in
+            # Aviary, exacerbating issues with solver tolerances at multiple levels.
+            # Since Aviary's phases are in series, block jacobi is a much better choice:
+            # each iteration carries the coupling one phase further down the chain, so it
+            # converges once it has been run once per phase.
+            maxiter = len(traj._phases) + 1
+            traj.phases.linear_solver = om.LinearBlockJac(maxiter=maxiter, iprint=0)
+            if isinstance(traj.phases.nonlinear_solver, om.NonlinearBlockJac):
+                traj.phases.nonlinear_solver.options['maxiter'] = maxiter
+
         # Temporarily add extra stuff here, probably patched soon
-        if mission_method is HEIGHT_ENERGY:
+        if mission_method is HEIGHT_ENERGY and traj is not None:
             phase_info = self.options['phase_info']
 
-            # Set a more appropriate solver for dymos when the phases are linked.
-            if MPI and isinstance(self.traj.phases.linear_solver, om.PETScKrylov):
-                # When any phase is connected with input_initial = True, dymos puts
-                # a jacobi solver in the phases group. This is necessary in case
-                # the phases are cyclic. However, this causes some problems
-                # with the newton solvers in Aviary, exacerbating issues with
-                # solver tolerances at multiple levels. Since Aviary's phases
-                # are basically in series, the jacobi solver is a much better
-                # choice and should be able to handle it in a couple of
-                # iterations.
-                self.traj.phases.linear_solver = om.LinearBlockJac(maxiter=5)
-
             # Due to recent changes in dymos, there is now a solver in any phase
             # that has connected initial states. It is not clear that this solver
             # is necessary except in certain corner cases that do not apply to the
@@ -105,11 +103,15 @@ class AviaryGroup(om.Group):
             # numerical problems, and can slow things down, we need to move it down
             # into the state interp component.
             # TODO: Future updates to dymos may make this unneccesary.
-            for phase in self.traj.phases.system_iter(recurse=False):
+            for phase in traj.phases.system_iter(recurse=False):
                 # Don't move the solvers if we are using solve segements.
                 if phase_info[phase.name]['user_options'].get('solve_for_distance'):
                     continue
 
+                # Only the Radau and Gauss-Lobatto transcriptions have a state input component.
+                if not hasattr(phase, 'indep_states'):
+                    continue
+
                 phase.nonlinear_solver = om.NonlinearRunOnce()
                 phase.linear_solver = om.LinearRunOnce()
                 if isinstance(phase.indep_states, om.ImplicitComponent):
@@ -8,9 +8,11 @@ from aviary.interface.graphical_input import _exec_flight_profile, _setup_flight
 from aviary.interface.methods_for_level1 import _exec_level1, _setup_level1_parser
 from aviary.interface.plot_drag_polar import _exec_plot_drag_polar, _setup_plot_drag_polar_parser
 from aviary.utils.aero_table_conversion import _exec_ATC, _setup_ATC_parser
+from aviary.utils.batch_conversion import _exec_batch, _setup_batch_parser
 from aviary.utils.engine_deck_conversion import EDC_description, _exec_EDC, _setup_EDC_parser
 from aviary.utils.fortran_to_aviary import _exec_F2A, _setup_F2A_parser
 from aviary.utils.propeller_map_conversion import _exec_PMC, _setup_PMC_parser
+from aviary.validation_cases.component_benchmarks import _exec_bench, _setup_bench_parser
 from aviary.visualization.dashboard import _dashboard_cmd, _dashboard_setup_parser
 
 
@@ -66,6 +68,12 @@ _command_map = {
         _exec_ATC,
         'Converts FLOPS- or GASP-formatted aero data files into Aviary csv format.',
     ),
+    'convert_batch': (
+        _setup_batch_parser,
+        _exec_batch,
+        'Converts libraries of legacy vehicle decks, engine decks or aero tables in parallel, '
+        'skipping decks that are unchanged since their last conversion.',
+    ),
     'convert_prop_table': (
         _setup_PMC_parser,
         _exec_PMC,
@@ -76,6 +84,11 @@ _command_map = {
         _exec_plot_drag_polar,
         'Plot a Drag Polar Graph using a provided polar data csv input',
     ),
+    'bench': (
+        _setup_bench_parser,
+        _exec_bench,
+        'Times compute and compute_partials of core mission components across num_nodes',
+    ),
 }
 
 
@@ -114,7 +127,7 @@ def aviary_cmd():
     cmdargs = [a for a in sys.argv[1:] if a not in ('-h',)]
 
     if len(args) == 1 and len(user_args) == 0:
-        if args[0] not in ('draw_mission', 'run_mission', 'plot_drag_polar'):
+        if args[0] not in ('draw_mission', 'run_mission', 'plot_drag_polar', 'bench'):
             parser.parse_args([args[0], '-h'])
 
     if not set(args).intersection(subs.choices) and len(args) == 1 and os.path.isfile(cmdargs[0]):
@@ -0,0 +1,225 @@
+"""
+Adaptive grid refinement for the collocation phases of an AviaryProblem.
+
+The mission is first converged on the coarse grid given in phase_info. The collocation
+error of every phase is then estimated, only the phases whose error exceeds the refinement
+tolerance get a finer grid (more segments or a higher order in the segments that need it),
+and the problem is set up again and warm started from the interpolated previous solution.
+This repeats until every phase meets the tolerance or the iteration limit is reached. The
+final grid is written back to the user_options of the phase_info, so later runs can start
+from it directly.
+
+The grid refinement algorithms themselves ('hp' and 'ph') are the ones from dymos.
+"""
+
+from collections.abc import Sequence
+
+import dymos as dm
+import numpy as np
+from dymos.grid_refinement.error_estimation import check_error
+from dymos.grid_refinement.hp_adaptive.hp_adaptive import HPAdaptive
+from dymos.grid_refinement.ph_adaptive.ph_adaptive import PHAdaptive
+
+from aviary.variable_info.enums import Verbosity
+
+_REFINEMENT_METHODS = {'hp': HPAdaptive, 'ph': PHAdaptive}
+
+
+def _refinable_phases(prob):
+    """Return the collocation phases of the trajectory, keyed by phase name."""
+    return {
+        phase.name: phase
+        for phase in prob.traj.phases.system_iter(recurse=False, typ=dm.Phase)
+        if isinstance(phase.options['transcription'], (dm.Radau, dm.GaussLobatto))
+    }
+
+
+def _include_control_rates(phases):
+    """
+    Add the control rates to the timeseries of the phases, as the error estimates need them.
+
+    Returns True if the timeseries of any phase changed.
+    """
+    changed = False
+
+    for phase in phases.values():
+        if not phase.timeseries_options['include_control_rates']:
+            phase.timeseries_options['include_control_rates'] = True
+            changed = True
+
+        # The error estimates look for the rates under these names, regardless of the
+        # naming used by the timeseries. Nothing is added if the timeseries has them.
+        for name in phase.control_options:
+            for rate in ('rate', 'rate2'):
+                if phase.add_timeseries_output(
+                    f'{name}_{rate}', output_name=f'control_rates:{name}_{rate}'
+                ):
+                    changed = True
+
+    return changed
+
+
+def _target_phase_parameters(traj):
+    """
+    Point the trajectory parameters at the parameters they added to the phases.
+
+    On setup, the trajectory adds a parameter to each phase that a parameter targets with a
+    list of ODE inputs, and it refuses to add a parameter that a phase already has. Once the
+    phases have them, the trajectory parameters can target them by name instead, which
+    connects them the same way on the next setup.
+    """
+    for name, options in traj.parameter_options.items():
+        targets = options['targets']
+
+        if not isinstance(targets, dict):
+            continue
+
+        phase_targets = {}
+
+        for phase_name, target in targets.items():
+            if isinstance(target, Sequence) and not isinstance(target, str):
+                target = name
+
+            phase_targets[phase_name] = target
+
+        traj.set_parameter_options(name, opt=options['opt'], targets=phase_targets)
+
+
+def resetup_from_solution(prob):
+    """
+    Set up prob again, keeping the current values of all of its variables.
+
+    The values of the phases are interpolated onto their current grids, which may have
+    changed since the values were computed.
+
+    Parameters
+    ----------
+    prob : AviaryProblem
+        Problem that has been set up and run.
+    """
+    solution = {
+        'inputs': prob.model.list_inputs(
+            out_stream=None, return_format='dict', units=True, prom_name=True
+        ),
+        'outputs': prob.model.list_outputs(
+            out_stream=None, return_format='dict', units=True, prom_name=True
+        ),
+    }
+
+    _target_phase_parameters(prob.traj)
+
+    prob.setup()
+    prob.load_case(solution)
+
+
+def _grid_user_options(transcription):
+    """Return the grid of a transcription in the form used by the phase_info."""
+    options = transcription.options
+    order = np.atleast_1d(options['order'])
+    segment_ends = options['segment_ends']
+
+    if segment_ends is None:
+        segment_ends = np.linspace(-1.0, 1.0, options['num_segments'] + 1)
+
+    if np.all(order == order[0]):
+        order = int(order[0])
+    else:
+        order = [int(i) for i in order]
+
+    return {
+        'num_segments': int(options['num_segments']),
+        'order': order,
+        'segment_ends': [float(x) for x in segment_ends],
+    }
+
+
+def refine_grid(
+    prob,
+    refine_iteration_limit,
+    refine_method='hp',
+    refine_tolerance=None,
+    verbosity=Verbosity.BRIEF,
+):
+    """
+    Converge the mission, refining the grids of the phases that do not meet the tolerance.
+
+    On return, the grids of the refined phases have been written to the phase_info of the
+    problem and the problem holds the solution of the last refinement, interpolated onto
+    its final grid. The driver still needs to be run once more to converge on that grid.
+
+    Parameters
+    ----------
+    prob : AviaryProblem
+        Problem that has been set up, with initial guesses.
+    refine_iteration_limit : int
+        Maximum number of refinement iterations.
+    refine_method : str
+        Refinement algorithm, either 'hp' (default) or 'ph'.
+    refine_tolerance : float or None
+        Relative error tolerance of every refined phase. If None, the tolerance given in
+        the refine options of each phase is used.
+    verbosity : Verbosity
+        Sets level of information outputted to the terminal.
+
+    Returns
+    -------
+    list of str
+        Names of the phases whose grid was refined.
+    """
+    if refine_method not in _REFINEMENT_METHODS:
+        raise ValueError(
+            f'Invalid refine_method "{refine_method}". Please choose from '
+            f'{", ".join(_REFINEMENT_METHODS)}.'
+        )
+
+    phases = _refinable_phases(prob)
+    refined = []
+
+    if not phases:
+        return refined
+
+    if refine_tolerance is not None:
+        for phase in phases.values():
+            phase.set_refine_options(tol=refine_tolerance)
+
+    # The refinement algorithm is keyed by the path of each phase.
+    names = {phase.pathname: name for name, phase in phases.items()}
+    refinement = _REFINEMENT_METHODS[refine_method](
+        {phase.pathname: phase for phase in phases.values()}
+    )
+
+    prob.run_driver()
+
+    if _include_control_rates(phases):
+        resetup_from_solution(prob)
+        prob.run_model()
+
+    for iteration in range(1, refine_iteration_limit + 1):
+        if iteration > 1:
+            prob.run_driver()
+
+        errors = check_error(refinement.phases)
+
+        needs_refinement = [
+            names[path] for path, error in errors.items() if np.any(error['need_refinement'])
+        ]
+
+        if not needs_refinement:
+            break
+
+        refinement.refine(errors, iteration)
+
+        if verbosity >= Verbosity.BRIEF:
+            print(f'Grid refinement iteration {iteration}: refining {", ".join(needs_refinement)}')
+
+        for name in needs_refinement:
+            if name in prob.phase_info:
+                grid = _grid_user_options(phases[name].options['transcription'])
+                prob.phase_info[name]['user_options'].update(grid)
+
+            if name not in refined:
+                refined.append(name)
+
+        resetup_from_solution(prob)
+
+    return refined
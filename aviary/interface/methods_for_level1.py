@@ -22,6 +22,8 @@ def run_aviary(
     phase_info_parameterization=None,
     optimization_history_filename=None,
     verbosity=None,
+    profile=False,
+    refine_iteration_limit=0,
 ):
     """
     Run the Aviary optimization problem for a specified aircraft configuration and mission.
@@ -63,6 +65,12 @@ def run_aviary(
     verbosity : Verbosity or int, optional
         Sets level of information outputted to the terminal during model execution.
         If provided, overrides verbosity specified in aircraft_data.
+    profile : bool, optional
+        If True, record per-phase timings of components and solvers and write them to
+        the reports folder. Defaults to False.
+    refine_iteration_limit : int, optional
+        Maximum number of grid refinement iterations of the collocation phases, defaults
+        to 0 (no grid refinement).
 
     Returns
     -------
@@ -82,7 +90,7 @@ def run_aviary(
         name = None
 
     # Build problem
-    prob = AviaryProblem(analysis_scheme, name=name, verbosity=verbosity)
+    prob = AviaryProblem(analysis_scheme, name=name, verbosity=verbosity, profile=profile)
 
     # Load aircraft and options data from user
     # Allow for user overrides here
@@ -119,6 +127,7 @@ def run_aviary(
         make_plots=make_plots,
         optimization_history_filename=optimization_history_filename,
         verbosity=verbosity,
+        refine_iteration_limit=refine_iteration_limit,
     )
 
     return prob
@@ -131,6 +140,7 @@ def run_level_1(
     max_iter=50,
     verbosity=Verbosity.BRIEF,
     analysis_scheme=AnalysisScheme.COLLOCATION,
+    profile=False,
 ):
     """
     This file enables running aviary from the command line with a user specified input deck.
@@ -147,6 +157,7 @@ def run_level_1(
     # else:
     kwargs['optimizer'] = optimizer
     kwargs['verbosity'] = Verbosity(verbosity)
+    kwargs['profile'] = profile
 
     if isinstance(phase_info, str):
         phase_info_path = get_path(phase_info)
@@ -190,6 +201,12 @@ def _setup_level1_parser(parser):
         help='verbosity settings: 0=quiet, 1=brief, 2=verbose, 3=debug',
         choices=(0, 1, 2, 3),
     )
+    parser.add_argument(
+        '--profile',
+        action='store_true',
+        help='Record time spent in components and solvers per phase and write it to the '
+        'reports folder',
+    )
 
 
 def _exec_level1(args, user_args):
@@ -212,4 +229,5 @@ def _exec_level1(args, user_args):
         max_iter=args.max_iter,
         verbosity=args.verbosity,
         analysis_scheme=analysis_scheme,
+        profile=args.profile,
     )
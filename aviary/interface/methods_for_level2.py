@@ -19,6 +19,8 @@ from aviary.core.AviaryGroup import AviaryGroup
 from aviary.core.PostMissionGroup import PostMissionGroup
 from aviary.core.PreMissionGroup import PreMissionGroup
 from aviary.interface.default_phase_info.two_dof_fiti import add_default_sgm_args
+from aviary.interface.grid_refinement import refine_grid
+from aviary.interface.payload_range import payload_range
 from aviary.interface.utils.check_phase_info import check_phase_info
 from aviary.mission.gasp_based.phases.time_integration_traj import FlexibleTraj
 from aviary.mission.height_energy_problem_configurator import HeightEnergyProblemConfigurator
@@ -34,6 +36,7 @@ from aviary.utils.functions import convert_strings_to_data
 from aviary.utils.merge_variable_metadata import merge_meta_data
 from aviary.utils.preprocessors import preprocess_options
 from aviary.utils.process_input_decks import create_vehicle, update_GASP_options
+from aviary.utils.profiling import AviaryProfiler, active_profiler
 from aviary.utils.utils import wrapped_convert_units
 from aviary.variable_info.enums import (
     AnalysisScheme,
@@ -69,9 +72,20 @@ class AviaryProblem(om.Problem):
 
     This Problem object is simply a specialized OpenMDAO Problem that has
     additional methods to help users create and solve Aviary problems.
+
+    If profile is True, the time spent in each component, solver, core subsystem builder
+    and SimuPy right-hand-side evaluation is recorded per phase and written to
+    "profile.md" and "profile.json" in the reports folder at the end of
+    run_aviary_problem(). Nothing is instrumented when profile is False.
     """
 
-    def __init__(self, analysis_scheme=AnalysisScheme.COLLOCATION, verbosity=None, **kwargs):
+    def __init__(
+        self,
+        analysis_scheme=AnalysisScheme.COLLOCATION,
+        verbosity=None,
+        profile=False,
+        **kwargs,
+    ):
         # Modify OpenMDAO's default_reports for this session.
         new_reports = [
             'subsystems',
@@ -103,6 +117,10 @@ class AviaryProblem(om.Problem):
         self.reserve_phases = []
         self.builder = None
 
+        # SGM phases build their own sub-problems, which find the profiler through
+        # active_profiler() during setup and runs of this problem
+        self.profiler = AviaryProfiler() if profile else None
+
     def load_inputs(
         self,
         aircraft_data,
@@ -295,6 +313,10 @@ class AviaryProblem(om.Problem):
                                 False
                             )
 
+                elif self.mission_method is EquationsOfMotion.HEIGHT_ENERGY:
+                    # height energy phases are only analytic when requested
+                    analytic = self.phase_info[phase_name]['user_options'].get('analytic', False)
+
                 if 'target_duration' in self.phase_info[phase_name]['user_options']:
                     target_duration = self.phase_info[phase_name]['user_options']['target_duration']
                     if target_duration[0] <= 0:
@@ -348,7 +370,14 @@ class AviaryProblem(om.Problem):
         ## Set Up Core Subsystems ##
         prop = CorePropulsionBuilder('core_propulsion', engine_models=self.engine_builders)
         mass = CoreMassBuilder('core_mass', code_origin=self.mass_method)
-        aero = CoreAerodynamicsBuilder('core_aerodynamics', code_origin=self.aero_method)
+        # Mission-invariant GASP aero geometry is computed once in pre-mission and passed
+        # to the phases as bus variables. The shooting trajectories and the descent
+        # estimation submodel do not connect bus variables, so they compute it in the ODE.
+        aero = CoreAerodynamicsBuilder(
+            'core_aerodynamics',
+            code_origin=self.aero_method,
+            premission_geometry=self.analysis_scheme is AnalysisScheme.COLLOCATION,
+        )
 
         # TODO These values are currently hardcoded, in future should come from user?
         code_origin_to_prioritize = None
@@ -379,6 +408,10 @@ class AviaryProblem(om.Problem):
             'aerodynamics': aero,
         }
 
+        if self.profiler is not None:
+            for subsystem in subsystems.values():
+                self.profiler.instrument_builder(subsystem)
+
         # TODO optionally accept which subsystems to load from phase_info
         default_mission_subsystems = [
             subsystems['aerodynamics'],
@@ -640,6 +673,8 @@ class AviaryProblem(om.Problem):
 
         parallel_phases (bool, optional): If True, the top-level container of all phases
             will be a ParallelGroup, otherwise it will be a standard OpenMDAO Group.
+            When run under MPI (e.g. `mpirun -n 4`), the phases are then distributed
+            over the processes and linked by constraints instead of connections.
             Defaults to True.
 
         Returns
@@ -1122,7 +1157,7 @@ class AviaryProblem(om.Problem):
                     phases_to_link.append(phase_name)
 
             if len(phases_to_link) > 1:  # TODO: hack
-                self.traj.link_phases(phases=phases_to_link, vars=[var], connected=True)
+                self.traj.link_phases(phases=phases_to_link, vars=[var], connected=true_unless_mpi)
 
         self.builder.link_phases(self, phases, connect_directly=true_unless_mpi)
 
@@ -1653,7 +1688,11 @@ class AviaryProblem(om.Problem):
             warnings.simplefilter('ignore', om.OpenMDAOWarning)
             warnings.simplefilter('ignore', om.PromotionWarning)
 
-            super().setup(**kwargs)
+            with active_profiler(self.profiler):
+                super().setup(**kwargs)
+
+        if self.profiler is not None:
+            self.profiler.instrument_model(self.model)
 
     def set_initial_guesses(self, parent_prob=None, parent_prefix='', verbosity=None):
         """
@@ -1829,6 +1868,9 @@ class AviaryProblem(om.Problem):
         simulate=False,
         make_plots=True,
         verbosity=None,
+        refine_iteration_limit=0,
+        refine_method='hp',
+        refine_tolerance=None,
     ):
         """
         This function actually runs the Aviary problem, which could be a simulation,
@@ -1859,6 +1901,20 @@ class AviaryProblem(om.Problem):
             False.
         make_plots : bool, optional
             If True (default), Dymos html plots will be generated as part of the output.
+        verbosity : Verbosity or int, optional
+            Sets level of information outputted to the terminal during model execution.
+            If provided, overrides verbosity specified in aircraft_data.
+        refine_iteration_limit : int, optional
+            The maximum number of grid refinement iterations. After the mission converges,
+            the grids of the collocation phases whose error exceeds the tolerance are
+            refined, and the problem is set up again and solved starting from the previous
+            solution. The final grids are written to phase_info. The default is 0, which
+            disables grid refinement.
+        refine_method : str, optional
+            The grid refinement algorithm, either 'hp' (default) or 'ph'.
+        refine_tolerance : float, optional
+            The relative error tolerance of the refined phases. If None (default), the
+            refine options of each phase are used.
         """
         # `self.verbosity` is "true" verbosity for entire run. `verbosity` is verbosity
         # override for just this method
@@ -1880,41 +1936,60 @@ class AviaryProblem(om.Problem):
             recorder = om.SqliteRecorder(optimization_history_filename)
             self.driver.add_recorder(recorder)
 
-        # and run mission, and dynamics
-        if run_driver:
-            failed = dm.run_problem(
-                self,
-                run_driver=run_driver,
-                simulate=simulate,
-                make_plots=make_plots,
-                solution_record_file=record_filename,
-                restart=restart_filename,
-            )
+        # SGM sub-problems set up again while the problem runs are profiled too
+        with active_profiler(self.profiler):
+            # and run mission, and dynamics
+            if run_driver:
+                if refine_iteration_limit > 0:
+                    if self.analysis_scheme is AnalysisScheme.SHOOTING:
+                        warnings.warn('Grid refinement is not available for shooting missions.')
+                    else:
+                        if restart_filename is not None:
+                            self.load_case(om.CaseReader(restart_filename).get_case('final'))
+                            restart_filename = None
+
+                        refine_grid(
+                            self,
+                            refine_iteration_limit,
+                            refine_method=refine_method,
+                            refine_tolerance=refine_tolerance,
+                            verbosity=verbosity,
+                        )
 
-            # TODO this is only used in a single test. Either self.problem_ran_successfully
-            #      should be removed, or rework this option to be more helpful (store
-            # entire "failed" object?) and implement more rigorously in benchmark
-            # tests
-            if self.analysis_scheme is AnalysisScheme.SHOOTING:
-                self.problem_ran_successfully = not failed
-            else:
-                if failed.exit_status == 'FAIL':
-                    self.problem_ran_successfully = False
+                failed = dm.run_problem(
+                    self,
+                    run_driver=run_driver,
+                    simulate=simulate,
+                    make_plots=make_plots,
+                    solution_record_file=record_filename,
+                    restart=restart_filename,
+                )
+
+                # TODO this is only used in a single test. Either self.problem_ran_successfully
+                #      should be removed, or rework this option to be more helpful (store
+                # entire "failed" object?) and implement more rigorously in benchmark
+                # tests
+                if self.analysis_scheme is AnalysisScheme.SHOOTING:
+                    self.problem_ran_successfully = not failed
                 else:
-                    self.problem_ran_successfully = True
-            # Manually print out a failure message for low verbosity modes that suppress
-            # optimizer printouts, which may include the results message. Assumes success,
-            # alerts user on a failure
-            if (
-                not self.problem_ran_successfully and verbosity <= Verbosity.BRIEF  # QUIET, BRIEF
-            ):
-                warnings.warn('\nAviary run failed. See the dashboard for more details.\n')
-        else:
-            # prevent UserWarning that is displayed when an event is triggered
-            warnings.filterwarnings('ignore', category=UserWarning)
-            # TODO failed doesn't exist for run_model(), no return from method
-            failed = self.run_model()
-            warnings.filterwarnings('default', category=UserWarning)
+                    if failed.exit_status == 'FAIL':
+                        self.problem_ran_successfully = False
+                    else:
+                        self.problem_ran_successfully = True
+                # Manually print out a failure message for low verbosity modes that suppress
+                # optimizer printouts, which may include the results message. Assumes success,
+                # alerts user on a failure
+                if (
+                    not self.problem_ran_successfully
+                    and verbosity <= Verbosity.BRIEF  # QUIET, BRIEF
+                ):
+                    warnings.warn('\nAviary run failed. See the dashboard for more details.\n')
+            else:
+                # prevent UserWarning that is displayed when an event is triggered
+                warnings.filterwarnings('ignore', category=UserWarning)
+                # TODO failed doesn't exist for run_model(), no return from method
+                failed = self.run_model()
+                warnings.filterwarnings('default', category=UserWarning)
 
         # update n2 diagram after run.
         outdir = Path(self.get_reports_dir(force=True))
@@ -1929,6 +2004,9 @@ class AviaryProblem(om.Problem):
             with open('output_list.txt', 'w') as outfile:
                 self.model.list_outputs(out_stream=outfile)
 
+        if self.profiler is not None:
+            self.profiler.write_reports(outdir)
+
         self.problem_ran_successfully = not failed
 
     def alternate_mission(
@@ -1974,42 +2052,6 @@ class AviaryProblem(om.Problem):
         else:
             verbosity = self.verbosity  # defaults to BRIEF
 
-        mass_method = self.aviary_inputs.get_val(Settings.MASS_METHOD)
-        equations_of_motion = self.aviary_inputs.get_val(Settings.EQUATIONS_OF_MOTION)
-        if mass_method == LegacyCode.FLOPS:
-            if num_first is None or num_business is None or num_tourist is None:
-                if verbosity > Verbosity.BRIEF:  # VERBOSE, DEBUG
-                    warnings.warn(
-                        'Incomplete PAX numbers for FLOPS fallout - assume same as design'
-                    )
-                num_first = self.aviary_inputs.get_val(Aircraft.CrewPayload.Design.NUM_FIRST_CLASS)
-                num_business = self.aviary_inputs.get_val(
-                    Aircraft.CrewPayload.Design.NUM_BUSINESS_CLASS
-                )
-                num_tourist = self.aviary_inputs.get_val(
-                    Aircraft.CrewPayload.Design.NUM_TOURIST_CLASS
-                )
-            if wing_cargo is None or misc_cargo is None:
-                if verbosity > Verbosity.BRIEF:  # VERBOSE, DEBUG
-                    warnings.warn(
-                        'Incomplete Cargo masses for FLOPS fallout - assume same as design'
-                    )
-                wing_cargo = self.aviary_inputs.get_val(Aircraft.CrewPayload.WING_CARGO, 'lbm')
-                misc_cargo = self.aviary_inputs.get_val(Aircraft.CrewPayload.MISC_CARGO, 'lbm')
-            num_pax = cargo_mass = 0
-        elif mass_method == LegacyCode.GASP:
-            if num_pax is None:
-                if verbosity > Verbosity.BRIEF:  # VERBOSE, DEBUG
-                    warnings.warn('Unspecified PAX number for GASP fallout - assume same as design')
-                num_pax = self.aviary_inputs.get_val(Aircraft.CrewPayload.Design.NUM_PASSENGERS)
-            if cargo_mass is None:
-                if verbosity > Verbosity.BRIEF:  # VERBOSE, DEBUG
-                    warnings.warn('Unspecified Cargo mass for GASP fallout - assume same as design')
-                cargo_mass = self.get_val(Aircraft.CrewPayload.CARGO_MASS, 'lbm')
-            num_first = num_business = num_tourist = wing_cargo = misc_cargo = 0
-
-        if phase_info is None:
-            phase_info = self.phase_info
         if mission_range is None:
             # mission range is sliced from a column vector numpy array, i.e. it is a len
             # 1 numpy array
@@ -2020,11 +2062,9 @@ class AviaryProblem(om.Problem):
         mission_mass = self.get_val(Mission.Design.GROSS_MASS)
         optimizer = self.driver.options['optimizer']
 
-        prob_alternate = _load_off_design(
+        off_design_args = self._off_design_args(
             json_filename,
             ProblemType.ALTERNATE,
-            equations_of_motion,
-            mass_method,
             phase_info,
             num_first,
             num_business,
@@ -2033,20 +2073,11 @@ class AviaryProblem(om.Problem):
             wing_cargo,
             misc_cargo,
             cargo_mass,
-            mission_range,
-            mission_mass,
+            verbosity,
         )
+        prob_alternate = _load_off_design(*off_design_args, mission_range, mission_mass)
 
-        prob_alternate.check_and_preprocess_inputs()
-        prob_alternate.add_pre_mission_systems()
-        prob_alternate.add_phases()
-        prob_alternate.add_post_mission_systems()
-        prob_alternate.link_phases()
-        prob_alternate.add_driver(optimizer, verbosity=verbosity)
-        prob_alternate.add_design_variables()
-        prob_alternate.add_objective()
-        prob_alternate.setup()
-        prob_alternate.set_initial_guesses()
+        _setup_off_design(prob_alternate, optimizer, verbosity=verbosity)
         if run_mission:
             prob_alternate.run_aviary_problem(record_filename='alternate_problem_history.db')
         return prob_alternate
@@ -2094,6 +2125,108 @@ class AviaryProblem(om.Problem):
         else:
             verbosity = self.verbosity  # defaults to BRIEF
 
+        if mission_mass is None:
+            # mission mass is sliced from a column vector numpy array, i.e. it is a len 1
+            # numpy array
+            mission_mass = self.get_val(Mission.Design.GROSS_MASS)[0]
+
+        optimizer = self.driver.options['optimizer']
+
+        off_design_args = self._off_design_args(
+            json_filename,
+            ProblemType.FALLOUT,
+            phase_info,
+            num_first,
+            num_business,
+            num_tourist,
+            num_pax,
+            wing_cargo,
+            misc_cargo,
+            cargo_mass,
+            verbosity,
+        )
+        prob_fallout = _load_off_design(*off_design_args, None, mission_mass, verbosity=verbosity)
+
+        _setup_off_design(prob_fallout, optimizer, verbosity=verbosity)
+        if run_mission:
+            prob_fallout.run_aviary_problem(record_filename='fallout_problem_history.db')
+        return prob_fallout
+
+    def payload_range(
+        self,
+        json_filename='sizing_problem.json',
+        max_payload=None,
+        num_points=3,
+        phase_info=None,
+        max_workers=1,
+        max_iter=50,
+    ):
+        """
+        Compute the payload-range diagram of the sized aircraft from fallout missions.
+
+        The off-design problem is set up once (per worker process), and each point starts
+        from the solution of its neighbour. The table and the diagram are written to the
+        reports directory of this problem.
+
+        Parameters
+        ----------
+        json_filename : str
+            Name of the file that the sizing mission has been saved to.
+        max_payload : float, optional
+            Maximum payload, in lbm. Defaults to the payload of the design mission.
+        num_points : int
+            Number of points between each pair of corner points (maximum payload, maximum
+            fuel, and ferry).
+        phase_info : dict, optional
+            Dictionary containing the phases and their required parameters. Its time bounds
+            must allow for the range of the ferry point.
+        max_workers : int
+            Number of worker processes the points are spread over. If 1, the points are
+            flown in this process. If None, defaults to the number of processors.
+        max_iter : int
+            Maximum number of iterations of the driver at each point.
+
+        Returns
+        -------
+        DataFrame
+            Payload, gross mass and fuel (lbm), range (NM), and driver success of each
+            point.
+        """
+        return payload_range(
+            self,
+            json_filename=json_filename,
+            max_payload=max_payload,
+            num_points=num_points,
+            phase_info=phase_info,
+            max_workers=max_workers,
+            max_iter=max_iter,
+        )
+
+    def _off_design_args(
+        self,
+        json_filename,
+        problem_type,
+        phase_info,
+        num_first,
+        num_business,
+        num_tourist,
+        num_pax,
+        wing_cargo,
+        misc_cargo,
+        cargo_mass,
+        verbosity,
+    ):
+        """
+        Return the leading arguments of _load_off_design for an off-design mission.
+
+        Payload quantities that are not given default to those of the design mission, and
+        phase_info defaults to that of this problem.
+
+        Returns
+        -------
+        tuple
+            Arguments of _load_off_design, up to and including cargo_mass.
+        """
         mass_method = self.aviary_inputs.get_val(Settings.MASS_METHOD)
         equations_of_motion = self.aviary_inputs.get_val(Settings.EQUATIONS_OF_MOTION)
         if mass_method == LegacyCode.FLOPS:
@@ -2130,16 +2263,10 @@ class AviaryProblem(om.Problem):
 
         if phase_info is None:
             phase_info = self.phase_info
-        if mission_mass is None:
-            # mission mass is sliced from a column vector numpy array, i.e. it is a len 1
-            # numpy array
-            mission_mass = self.get_val(Mission.Design.GROSS_MASS)[0]
 
-        optimizer = self.driver.options['optimizer']
-
-        prob_fallout = _load_off_design(
+        return (
             json_filename,
-            ProblemType.FALLOUT,
+            problem_type,
             equations_of_motion,
             mass_method,
             phase_info,
@@ -2150,25 +2277,8 @@ class AviaryProblem(om.Problem):
             wing_cargo,
             misc_cargo,
             cargo_mass,
-            None,
-            mission_mass,
-            verbosity=verbosity,
         )
 
-        prob_fallout.check_and_preprocess_inputs()
-        prob_fallout.add_pre_mission_systems()
-        prob_fallout.add_phases()
-        prob_fallout.add_post_mission_systems()
-        prob_fallout.link_phases()
-        prob_fallout.add_driver(optimizer, verbosity=verbosity)
-        prob_fallout.add_design_variables()
-        prob_fallout.add_objective()
-        prob_fallout.setup()
-        prob_fallout.set_initial_guesses()
-        if run_mission:
-            prob_fallout.run_aviary_problem(record_filename='fallout_problem_history.db')
-        return prob_fallout
-
     def save_sizing_to_json(self, json_filename='sizing_problem.json'):
         """
         This function saves an aviary problem object into a json file.
@@ -2415,6 +2525,33 @@ def _read_sizing_json(aviary_problem, json_filename):
     return aviary_problem
 
 
+def _setup_off_design(prob, optimizer, max_iter=50, verbosity=Verbosity.BRIEF):
+    """
+    Build and set up an off-design problem returned by _load_off_design.
+
+    Parameters
+    ----------
+    prob : AviaryProblem
+        Off-design problem, with its inputs loaded.
+    optimizer : str
+        Optimizer of the driver.
+    max_iter : int
+        Maximum number of iterations of the driver.
+    verbosity : Verbosity or int, optional
+        Controls the level of printouts for this method.
+    """
+    prob.check_and_preprocess_inputs()
+    prob.add_pre_mission_systems()
+    prob.add_phases()
+    prob.add_post_mission_systems()
+    prob.link_phases()
+    prob.add_driver(optimizer, max_iter=max_iter, verbosity=verbosity)
+    prob.add_design_variables()
+    prob.add_objective()
+    prob.setup()
+    prob.set_initial_guesses()
+
+
 def _load_off_design(
     json_filename,
     problem_type,
@@ -2504,6 +2641,10 @@ def _load_off_design(
     prob.aviary_inputs.set_val(Aircraft.CrewPayload.NUM_PASSENGERS, num_pax, units='unitless')
     prob.aviary_inputs.set_val(Aircraft.CrewPayload.CARGO_MASS, cargo_mass, 'lbm')
 
+    if num_pax == 0:
+        # otherwise preprocessing assumes the design passengers are on board
+        prob.aviary_inputs.set_val(Aircraft.CrewPayload.TOTAL_PAYLOAD_MASS, 0.0, 'lbm')
+
     if problem_type == ProblemType.ALTERNATE:
         # Set mission range, aviary will calculate required fuel
         if mission_range is None:
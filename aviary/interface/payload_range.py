@@ -0,0 +1,367 @@
+"""
+Payload-range diagram of a sized aircraft.
+
+Each point of the diagram is a fallout mission: the takeoff gross mass and the payload are
+fixed, and the driver finds the range flown with the remaining fuel. The envelope runs from
+the maximum payload point, where the aircraft takes off at its design gross mass, through
+the maximum fuel point, where the fuel tanks are full and the payload is reduced to stay at
+design gross mass, to the ferry point, with full tanks and no payload.
+
+The off-design problem is loaded and set up once for each number of passengers (once per
+worker process when the points are spread over a process pool). Each point then only
+changes the gross mass and the cargo mass, and runs the driver starting from the solution
+of the previous point, which is its neighbour on the envelope. The payload is reduced
+through the cargo first; below the payload of all the passengers, the passengers that no
+longer fit are removed, economy class first, so the cargo mass is never negative. Mass
+items that scale with the cargo or the passengers, such as the cargo containers, follow
+them, so the operating mass of the off-design points can differ slightly from that of the
+design.
+"""
+
+import itertools
+import os
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from matplotlib.figure import Figure
+
+from aviary.variable_info.enums import LegacyCode, ProblemType, Verbosity
+from aviary.variable_info.variables import Aircraft, Mission, Settings
+
+_COLUMNS = {
+    'payload': 'payload (lbm)',
+    'gross_mass': 'gross mass (lbm)',
+    'fuel': 'fuel (lbm)',
+    'range': 'range (NM)',
+    'success': 'success',
+}
+
+
+def payload_range_points(max_payload, max_gross_mass, operating_mass, fuel_capacity, num_points=3):
+    """
+    Return the payload and takeoff gross mass of each point of a payload-range envelope.
+
+    Parameters
+    ----------
+    max_payload : float
+        Maximum payload, in lbm.
+    max_gross_mass : float
+        Maximum takeoff gross mass, in lbm.
+    operating_mass : float
+        Operating empty mass, in lbm.
+    fuel_capacity : float
+        Mass of fuel the tanks can hold, in lbm.
+    num_points : int
+        Number of points between each pair of corner points.
+
+    Returns
+    -------
+    list of tuple
+        Payload and gross mass of each point, in lbm, in order of decreasing payload from
+        the maximum payload point to the ferry point.
+    """
+    max_fuel_payload = np.clip(max_gross_mass - operating_mass - fuel_capacity, 0.0, max_payload)
+
+    # a corner is dropped when it coincides with the previous one
+    corners = [max_payload]
+    if max_fuel_payload < max_payload:
+        corners.append(max_fuel_payload)
+    if max_fuel_payload > 0.0:
+        corners.append(0.0)
+
+    payloads = [corners[0]]
+    for start, end in zip(corners[:-1], corners[1:]):
+        payloads.extend(np.linspace(start, end, num_points + 2)[1:])
+
+    return [
+        (float(payload), float(min(max_gross_mass, operating_mass + payload + fuel_capacity)))
+        for payload in payloads
+    ]
+
+
+def split_payload(payload, passenger_counts, passenger_mass):
+    """
+    Split a payload into passengers and cargo, without negative cargo.
+
+    Parameters
+    ----------
+    payload : float
+        Payload, in lbm.
+    passenger_counts : tuple of int
+        Maximum number of passengers of each class. Passengers are removed from the last
+        class first.
+    passenger_mass : float
+        Payload mass of one passenger with bags, in lbm.
+
+    Returns
+    -------
+    passenger_counts : tuple of int
+        Number of passengers of each class.
+    cargo : float
+        Cargo mass, in lbm.
+    """
+    num_passengers = sum(passenger_counts)
+    if passenger_mass > 0.0:
+        num_passengers = min(num_passengers, int(np.floor(payload / passenger_mass + 1e-9)))
+
+    counts = []
+    for count in passenger_counts:
+        counts.append(min(count, num_passengers))
+        num_passengers -= counts[-1]
+
+    cargo = max(payload - sum(counts) * passenger_mass, 0.0)
+
+    return tuple(counts), cargo
+
+
+def _fly_points(off_design_args, points, optimizer, max_iter):
+    """
+    Set up a fallout problem once and fly it at each point, in order.
+
+    Parameters
+    ----------
+    off_design_args : tuple
+        Arguments of _load_off_design, up to and including cargo_mass.
+    points : list of tuple
+        Gross mass (lbm) of each point, and the value (lbm) of each cargo input.
+    optimizer : str
+        Optimizer of the driver.
+    max_iter : int
+        Maximum number of iterations of the driver at each point.
+
+    Returns
+    -------
+    list of dict
+        Payload, gross mass and fuel (lbm), range (NM), and driver success of each point.
+    """
+    from aviary.interface.methods_for_level2 import _load_off_design, _setup_off_design
+
+    prob = _load_off_design(*off_design_args, None, points[0][0], verbosity=Verbosity.QUIET)
+
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        _setup_off_design(prob, optimizer, max_iter=max_iter, verbosity=Verbosity.QUIET)
+
+    prob.set_solver_print(level=0)
+
+    rows = []
+    for gross_mass, cargo in points:
+        # the design variables are left at the solution of the previous point
+        prob.set_val(Mission.Summary.GROSS_MASS, gross_mass, units='lbm')
+        for name, value in cargo.items():
+            prob.set_val(name, value, units='lbm')
+
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore')
+            result = prob.run_driver()
+
+        zero_fuel_mass = prob.get_val(Aircraft.Design.ZERO_FUEL_MASS, 'lbm')[0]
+
+        rows.append(
+            {
+                'payload': zero_fuel_mass - prob.get_val(Aircraft.Design.OPERATING_MASS, 'lbm')[0],
+                'gross_mass': gross_mass,
+                'fuel': gross_mass - zero_fuel_mass,
+                'range': prob.get_val(Mission.Summary.RANGE, 'NM')[0],
+                'success': result.success,
+            }
+        )
+
+    return rows
+
+
+def plot_payload_range(data, filename):
+    """
+    Plot a payload-range diagram.
+
+    Parameters
+    ----------
+    data : DataFrame
+        Payload-range table, as returned by payload_range.
+    filename : str or Path
+        Path of the image file.
+    """
+    fig = Figure(figsize=(8, 5))
+    ax = fig.add_subplot()
+
+    ax.plot(data[_COLUMNS['range']], data[_COLUMNS['payload']], marker='o')
+
+    ax.set_xlabel('Range (NM)')
+    ax.set_ylabel('Payload (lbm)')
+    ax.set_xlim(left=0.0)
+    ax.set_ylim(bottom=0.0)
+    ax.grid(True)
+    ax.set_title('Payload-Range Diagram')
+
+    fig.savefig(filename, bbox_inches='tight')
+
+
+def payload_range(
+    prob,
+    json_filename='sizing_problem.json',
+    max_payload=None,
+    num_points=3,
+    phase_info=None,
+    max_workers=1,
+    max_iter=50,
+):
+    """
+    Compute the payload-range diagram of a sized aircraft.
+
+    The table and the diagram are written to 'payload_range.csv' and 'payload_range.png'
+    in the reports directory of the sizing problem.
+
+    Parameters
+    ----------
+    prob : AviaryProblem
+        Sizing problem, after it has been run.
+    json_filename : str
+        Name of the file that the sizing mission has been saved to.
+    max_payload : float, optional
+        Maximum payload, in lbm. Defaults to the payload of the design mission.
+    num_points : int
+        Number of points between each pair of corner points.
+    phase_info : dict, optional
+        Dictionary containing the phases and their required parameters. Defaults to the
+        phase_info of the sizing problem. Its time bounds must allow for the range of the
+        ferry point.
+    max_workers : int
+        Number of worker processes the points are spread over. If 1, the points are flown
+        in this process. If None, defaults to the number of processors.
+    max_iter : int
+        Maximum number of iterations of the driver at each point.
+
+    Returns
+    -------
+    DataFrame
+        Payload, gross mass and fuel (lbm), range (NM), and driver success of each point,
+        starting with the maximum payload at zero range.
+    """
+    aviary_inputs = prob.aviary_inputs
+    design_payload = prob.get_val(Aircraft.CrewPayload.TOTAL_PAYLOAD_MASS, 'lbm')[0]
+    operating_mass = prob.get_val(Aircraft.Design.OPERATING_MASS, 'lbm')[0]
+
+    num_passengers = aviary_inputs.get_val(Aircraft.CrewPayload.NUM_PASSENGERS)
+    passenger_mass = 0.0
+    if num_passengers > 0:
+        passenger_mass = (
+            prob.get_val(Aircraft.CrewPayload.PASSENGER_PAYLOAD_MASS, 'lbm')[0] / num_passengers
+        )
+
+    flops = aviary_inputs.get_val(Settings.MASS_METHOD) == LegacyCode.FLOPS
+    if flops:
+        # FLOPS sums the cargo from the wing and miscellaneous cargo, which are removed in
+        # that order
+        passenger_counts = tuple(
+            int(aviary_inputs.get_val(name))
+            for name in (
+                Aircraft.CrewPayload.Design.NUM_FIRST_CLASS,
+                Aircraft.CrewPayload.Design.NUM_BUSINESS_CLASS,
+                Aircraft.CrewPayload.Design.NUM_TOURIST_CLASS,
+            )
+        )
+        design_wing_cargo = aviary_inputs.get_val(Aircraft.CrewPayload.WING_CARGO, 'lbm')
+    else:
+        passenger_counts = (int(num_passengers),)
+
+    if max_payload is None:
+        max_payload = design_payload
+
+    points = payload_range_points(
+        max_payload,
+        prob.get_val(Mission.Design.GROSS_MASS, 'lbm')[0],
+        operating_mass,
+        prob.get_val(Aircraft.Fuel.TOTAL_CAPACITY, 'lbm')[0],
+        num_points,
+    )
+
+    # the points flown with each number of passengers, which is a setup option
+    segments = []
+    for payload, gross_mass in points:
+        counts, cargo = split_payload(payload, passenger_counts, passenger_mass)
+
+        if flops:
+            misc_cargo = max(cargo - design_wing_cargo, 0.0)
+            cargo = {
+                Aircraft.CrewPayload.WING_CARGO: cargo - misc_cargo,
+                Aircraft.CrewPayload.MISC_CARGO: misc_cargo,
+            }
+        else:
+            cargo = {Aircraft.CrewPayload.CARGO_MASS: cargo}
+
+        if not segments or segments[-1][0] != counts:
+            segments.append((counts, []))
+        segments[-1][1].append((gross_mass, cargo))
+
+    optimizer = prob.driver.options['optimizer']
+
+    if max_workers is None:
+        max_workers = os.cpu_count()
+
+    jobs = []
+    for counts, segment_points in segments:
+        cargo = segment_points[0][1]
+        payload_kwargs = dict.fromkeys(
+            (
+                'num_first',
+                'num_business',
+                'num_tourist',
+                'num_pax',
+                'wing_cargo',
+                'misc_cargo',
+                'cargo_mass',
+            )
+        )
+        if flops:
+            payload_kwargs.update(
+                num_first=counts[0],
+                num_business=counts[1],
+                num_tourist=counts[2],
+                wing_cargo=cargo[Aircraft.CrewPayload.WING_CARGO],
+                misc_cargo=cargo[Aircraft.CrewPayload.MISC_CARGO],
+            )
+        else:
+            payload_kwargs.update(
+                num_pax=counts[0], cargo_mass=cargo[Aircraft.CrewPayload.CARGO_MASS]
+            )
+
+        off_design_args = prob._off_design_args(
+            json_filename,
+            ProblemType.FALLOUT,
+            phase_info,
+            verbosity=Verbosity.QUIET,
+            **payload_kwargs,
+        )
+
+        # contiguous chunks, so each point still starts from its neighbour
+        num_chunks = min(
+            len(segment_points), max(1, round(max_workers * len(segment_points) / len(points)))
+        )
+        for chunk in np.array_split(np.arange(len(segment_points)), num_chunks):
+            jobs.append((off_design_args, [segment_points[i] for i in chunk], optimizer, max_iter))
+
+    if max_workers == 1 or len(jobs) < 2:
+        rows = list(itertools.chain.from_iterable(_fly_points(*job) for job in jobs))
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            results = executor.map(_fly_points, *zip(*jobs))
+            rows = [row for chunk_rows in results for row in chunk_rows]
+
+    zero_range = {
+        'payload': max_payload,
+        'gross_mass': operating_mass + max_payload,
+        'fuel': 0.0,
+        'range': 0.0,
+        'success': True,
+    }
+    data = pd.DataFrame([zero_range] + rows).rename(columns=_COLUMNS)
+
+    reports_folder = Path(prob.get_reports_dir(force=True))
+    reports_folder.mkdir(parents=True, exist_ok=True)
+    data.to_csv(reports_folder / 'payload_range.csv', index=False)
+    plot_payload_range(data, reports_folder / 'payload_range.png')
+
+    return data
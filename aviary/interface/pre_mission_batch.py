@@ -0,0 +1,279 @@
+"""
+Pre-mission sizing of a batch of design variants, for design of experiments.
+
+Each design variant is a set of values of some pre-mission inputs, such as the wing
+aspect ratio or the design gross mass. The pre-mission systems (propulsion, geometry,
+aerodynamics and mass, without takeoff) are set up once, the way AviaryProblem builds
+them, and the designs are then streamed through that single problem: each one only sets
+its input values and runs the model. The geometry and mass components are written for
+one aircraft at a time, so the designs are not evaluated as arrays. Instead, everything
+that does not depend on the design (loading the inputs, building and setting up the
+model, looking up the outputs and their units) is done once per batch.
+
+The Newton solvers of the model (such as the GASP wing and fuel mass groups) are solved
+per design, each starting from the solution of the aircraft in the input deck, so the
+results of a design do not depend on the other designs of the batch. A design whose solve
+does not converge, or whose inputs cannot be evaluated, is masked in the table: its
+outputs are NaN, its "success" column is False and its "error" column gives the reason.
+
+The designs can also be spread over a pool of worker processes, each of which sets up
+its own problem and evaluates a contiguous chunk of the designs.
+"""
+
+import os
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import openmdao.api as om
+import pandas as pd
+
+from aviary.variable_info.enums import Verbosity
+
+
+def setup_pre_mission_problem(aircraft_data, engine_builders=None, verbosity=Verbosity.QUIET):
+    """
+    Return a set-up AviaryProblem that only contains the pre-mission systems.
+
+    Parameters
+    ----------
+    aircraft_data : str, Path or AviaryValues
+        Aircraft input deck, or the values loaded from one.
+    engine_builders : list of EngineModel, optional
+        Engine models. By default, they are built from the aircraft data.
+    verbosity : Verbosity or int
+        Verbosity of the problem.
+
+    Returns
+    -------
+    AviaryProblem
+        The set-up problem, with the values of the aircraft data as inputs.
+    """
+    from aviary.interface.methods_for_level2 import AviaryProblem
+
+    prob = AviaryProblem(verbosity=verbosity, reports=False)
+    prob.load_inputs(
+        aircraft_data,
+        {'pre_mission': {'include_takeoff': False}},
+        engine_builders=engine_builders,
+        verbosity=verbosity,
+    )
+    prob.check_and_preprocess_inputs(verbosity=verbosity)
+    prob.add_pre_mission_systems(verbosity=verbosity)
+
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        prob.setup()
+
+    prob.set_solver_print(level=-1)
+
+    return prob
+
+
+def _columns(name, size):
+    """Return the table columns of a variable of the given size."""
+    if size == 1:
+        return [name]
+    return [f'{name}[{i}]' for i in range(size)]
+
+
+def _evaluate_designs(aircraft_data, engine_builders, designs, outputs):
+    """
+    Set up the pre-mission problem once and evaluate each design, in order.
+
+    Returns
+    -------
+    columns : list of str
+        Table columns of the outputs.
+    units : dict
+        Units of each output.
+    values : ndarray
+        Values of the outputs of each design, one row per design.
+    success : ndarray of bool
+        Whether each design could be evaluated.
+    errors : ndarray of str
+        Why each design could not be evaluated, or an empty string if it was.
+    """
+    prob = setup_pre_mission_problem(aircraft_data, engine_builders)
+    model = prob.model
+
+    for name in designs:
+        source = model.get_source(name)
+        if not source.startswith('_auto_ivc.'):
+            raise ValueError(
+                f'"{name}" is computed by {source.rpartition(".")[0]}, so it cannot be a '
+                'design input. Set it in the aircraft data to override it.'
+            )
+
+    # every solve must converge for a design to be valid
+    for system in model.system_iter(include_self=True, recurse=True):
+        if isinstance(system.nonlinear_solver, om.NewtonSolver):
+            system.nonlinear_solver.options['err_on_non_converge'] = True
+
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        prob.run_model()
+
+    if outputs is None:
+        outputs = {
+            meta['prom_name']: None
+            for meta in model.get_io_metadata(iotypes='output').values()
+            if meta['prom_name'].startswith(('aircraft:', 'mission:'))
+        }
+    elif not isinstance(outputs, dict):
+        outputs = dict.fromkeys(outputs)
+
+    # metadata of every output, keyed by absolute name
+    output_meta = model.get_io_metadata(
+        iotypes='output', metadata_keys=['units', 'size'], get_remote=True
+    )
+    columns = []
+    units = {}
+    table_outputs = []
+
+    for name, output_units in outputs.items():
+        if name in designs:
+            # already in the table, as a design input
+            continue
+
+        meta = output_meta[model.get_source(name)]
+
+        if output_units is None:
+            output_units = meta['units']
+
+        for column in _columns(name, meta['size']):
+            columns.append(column)
+            units[column] = output_units
+
+        table_outputs.append((name, output_units))
+
+    # the outputs of iterative solves start each design from the solution of the aircraft
+    # data; all other outputs are recomputed from the inputs. Components have no solver
+    # of their own, and groups without an iterative one run each subsystem once.
+    initial_outputs = {}
+    for system in model.system_iter(include_self=True, recurse=True):
+        solver = system.nonlinear_solver
+        if solver is not None and not isinstance(solver, om.NonlinearRunOnce):
+            for path in system.get_io_metadata(iotypes='output', return_rel_names=False):
+                initial_outputs[path] = prob.get_val(path).copy()
+
+    num_designs = len(next(iter(designs.values()))[0]) if designs else 0
+    values = np.full((num_designs, len(columns)), np.nan)
+    success = np.zeros(num_designs, dtype=bool)
+    errors = np.full(num_designs, '', dtype=object)
+
+    with warnings.catch_warnings(), np.errstate(all='ignore'):
+        warnings.simplefilter('ignore')
+
+        for i in range(num_designs):
+            for path, val in initial_outputs.items():
+                prob.set_val(path, val)
+
+            for name, (vals, val_units) in designs.items():
+                prob.set_val(name, vals[i], units=val_units)
+
+            try:
+                model.run_solve_nonlinear()
+            except (om.AnalysisError, ValueError) as err:
+                errors[i] = f'{type(err).__name__}: {err}'
+                continue
+
+            row = [prob.get_val(name, units=val_units).ravel() for name, val_units in table_outputs]
+            if row:
+                values[i] = np.concatenate(row)
+
+            nonfinite = [
+                name for (name, _), val in zip(table_outputs, row) if not np.all(np.isfinite(val))
+            ]
+            if nonfinite:
+                values[i] = np.nan
+                errors[i] = f'non-finite values of {", ".join(nonfinite)}'
+            else:
+                success[i] = True
+
+    return columns, units, values, success, errors
+
+
+def pre_mission_batch(aircraft_data, designs, outputs=None, engine_builders=None, max_workers=1):
+    """
+    Evaluate the pre-mission sizing of a batch of design variants.
+
+    Parameters
+    ----------
+    aircraft_data : str, Path or AviaryValues
+        Aircraft input deck, or the values loaded from one, that the designs are variants
+        of. Each variable that a design changes must be an input of the pre-mission
+        systems: variables that they compute can be made inputs by setting them in the
+        aircraft data.
+    designs : dict
+        Values of the design inputs, as (values, units) keyed by variable name. The first
+        axis of the values is the design.
+    outputs : list of str or dict, optional
+        Outputs to tabulate, or their units keyed by name. By default, every aircraft and
+        mission output of the pre-mission systems, in their own units.
+    engine_builders : list of EngineModel, optional
+        Engine models. By default, they are built from the aircraft data.
+    max_workers : int
+        Number of worker processes the designs are spread over. If 1, the designs are
+        evaluated in this process. If None, defaults to the number of processors.
+
+    Returns
+    -------
+    DataFrame
+        Inputs and outputs of each design, one row per design, with a "success" column
+        that is False for the designs that could not be evaluated, and an "error" column
+        that gives the reason (empty for the designs that were evaluated). The units of
+        each column are in the "units" entry of its attrs.
+    """
+    designs = {
+        name: (np.asarray(vals, dtype=float), units) for name, (vals, units) in designs.items()
+    }
+    num_designs = {len(vals) for vals, _ in designs.values()}
+    if len(num_designs) > 1:
+        raise ValueError('Every design input must have the same number of values.')
+    num_designs = num_designs.pop() if num_designs else 0
+
+    if max_workers is None:
+        max_workers = os.cpu_count()
+
+    if max_workers == 1 or num_designs < 2:
+        columns, units, values, success, errors = _evaluate_designs(
+            aircraft_data, engine_builders, designs, outputs
+        )
+    else:
+        chunks = np.array_split(np.arange(num_designs), min(max_workers, num_designs))
+        jobs = [
+            (
+                aircraft_data,
+                engine_builders,
+                {name: (vals[chunk], units) for name, (vals, units) in designs.items()},
+                outputs,
+            )
+            for chunk in chunks
+        ]
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(_evaluate_designs, *zip(*jobs)))
+
+        columns, units = results[0][:2]
+        values = np.vstack([result[2] for result in results])
+        success = np.concatenate([result[3] for result in results])
+        errors = np.concatenate([result[4] for result in results])
+
+    table = {}
+    table_units = {}
+
+    for name, (vals, val_units) in designs.items():
+        vals = vals.reshape(num_designs, -1)
+        for i, column in enumerate(_columns(name, vals.shape[1])):
+            table[column] = vals[:, i]
+            table_units[column] = val_units
+
+    data = pd.DataFrame(table, index=pd.RangeIndex(num_designs))
+    data = pd.concat([data, pd.DataFrame(values, columns=columns)], axis=1)
+    data['success'] = success
+    data['error'] = errors
+
+    table_units.update(units)
+    data.attrs['units'] = table_units
+
+    return data
@@ -10,6 +10,7 @@ from openmdao.utils.mpi import MPI
 from openmdao.utils.reports_system import register_report
 
 from aviary.interface.utils.markdown_utils import write_markdown_variable_table
+from aviary.utils.case_results import group_timeseries
 from aviary.utils.named_values import NamedValues
 from aviary.utils.utils import wrapped_convert_units
 
@@ -370,7 +371,7 @@ def timeseries_csv(prob, **kwargs):
     }
 
     unique_variable_names = set(
-        [timeseries_output.split('.')[-1] for timeseries_output in timeseries_outputs]
+        name for names in group_timeseries(timeseries_outputs).values() for name in names
     )
 
     timeseries_data = {}
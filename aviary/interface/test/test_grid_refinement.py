@@ -0,0 +1,53 @@
+import unittest
+from copy import deepcopy
+
+from numpy.testing import assert_almost_equal
+from openmdao.utils.testing_utils import use_tempdirs
+
+from aviary.interface.default_phase_info.height_energy import phase_info
+from aviary.interface.methods_for_level2 import AviaryProblem
+from aviary.variable_info.variables import Mission
+
+
+@use_tempdirs
+class GridRefinementTest(unittest.TestCase):
+    def test_height_energy(self):
+        local_phase_info = deepcopy(phase_info)
+        for name in ('climb', 'cruise', 'descent'):
+            local_phase_info[name]['user_options']['num_segments'] = 3
+
+        prob = AviaryProblem(verbosity=0)
+        prob.load_inputs('models/test_aircraft/aircraft_for_bench_FwFm.csv', local_phase_info)
+        prob.check_and_preprocess_inputs()
+        prob.add_pre_mission_systems()
+        prob.add_phases()
+        prob.add_post_mission_systems()
+        prob.link_phases()
+        prob.add_driver('SLSQP', max_iter=100)
+        prob.add_design_variables()
+        prob.add_objective()
+        prob.setup()
+        prob.set_initial_guesses()
+
+        prob.run_aviary_problem(make_plots=False, refine_iteration_limit=1, refine_tolerance=1.0e-5)
+
+        self.assertTrue(prob.problem_ran_successfully)
+
+        # The climb does not meet the tolerance on the coarse grid, while the cruise does.
+        climb = prob.phase_info['climb']['user_options']
+        cruise = prob.phase_info['cruise']['user_options']
+
+        self.assertIn('segment_ends', climb)
+        self.assertEqual(len(climb['segment_ends']), climb['num_segments'] + 1)
+        self.assertNotIn('segment_ends', cruise)
+
+        transcription = prob.traj.phases.climb.options['transcription']
+        self.assertEqual(transcription.options['num_segments'], climb['num_segments'])
+
+        assert_almost_equal(
+            prob.get_val(Mission.Summary.FUEL_BURNED, units='lbm'), 22513.0, decimal=-1
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
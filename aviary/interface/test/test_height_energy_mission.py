@@ -5,14 +5,16 @@ from copy import deepcopy
 
 import dymos
 from openmdao.core.problem import _clear_problem_names
+from openmdao.utils.assert_utils import assert_near_equal
 from openmdao.utils.reports_system import clear_reports
 from openmdao.utils.testing_utils import require_pyoptsparse, use_tempdirs
 
 from aviary.interface.methods_for_level1 import run_aviary
 from aviary.interface.methods_for_level2 import AviaryProblem
 from aviary.mission.flops_based.phases.energy_phase import EnergyPhase
+from aviary.subsystems.atmosphere.standard_atmosphere import StandardAtmosphere, standard_atmosphere
 from aviary.subsystems.test.test_dummy_subsystem import ArrayGuessSubsystemBuilder
-from aviary.variable_info.variables import Dynamic
+from aviary.variable_info.variables import Dynamic, Mission
 
 
 @use_tempdirs
@@ -249,6 +251,43 @@ class AircraftMissionTestSuite(unittest.TestCase):
             optimizer='SLSQP',
         )
 
+    def test_temperature_offset(self):
+        prob = AviaryProblem(verbosity=0)
+        prob.load_inputs(self.aircraft_definition_file, deepcopy(self.phase_info))
+        prob.aviary_inputs.set_val(Mission.Summary.TEMPERATURE_OFFSET, 27.0, units='degR')
+        prob.check_and_preprocess_inputs()
+        prob.add_pre_mission_systems()
+        prob.add_phases()
+        prob.add_post_mission_systems()
+        prob.link_phases()
+        prob.add_driver('SLSQP', max_iter=0)
+        prob.add_design_variables()
+        prob.add_objective()
+        prob.setup()
+        prob.set_initial_guesses()
+        prob.run_aviary_problem(run_driver=False, make_plots=False)
+
+        # every atmosphere of the mission flies the hot day
+        phases = set()
+        for atmosphere in prob.model.system_iter(typ=StandardAtmosphere):
+            self.assertEqual(atmosphere.options['delta_T'], 27.0)
+
+            altitude = prob.get_val(f'{atmosphere.pathname}.h', units='ft')
+            standard = standard_atmosphere(altitude, h_def=atmosphere.options['h_def'])
+            assert_near_equal(
+                prob.get_val(f'{atmosphere.pathname}.temp', units='degR'),
+                standard['temp'] + 27.0,
+                1e-12,
+            )
+
+            phases.update(
+                name
+                for name in ('climb', 'cruise', 'descent')
+                if f'.{name}.' in atmosphere.pathname
+            )
+
+        self.assertEqual(phases, {'climb', 'cruise', 'descent'})
+
     def test_custom_phase_builder_error(self):
         local_phase_info = self.phase_info.copy()
         local_phase_info['climb']['phase_builder'] = 'fake phase object'
@@ -0,0 +1,113 @@
+import unittest
+from copy import deepcopy
+from pathlib import Path
+
+import numpy as np
+from openmdao.utils.assert_utils import assert_near_equal
+from openmdao.utils.testing_utils import use_tempdirs
+
+import aviary.api as av
+from aviary.interface.default_phase_info.height_energy import (
+    phase_info,
+    phase_info_parameterization,
+)
+from aviary.interface.payload_range import payload_range_points, split_payload
+from aviary.variable_info.variables import Aircraft, Mission
+
+
+class PayloadRangePointsTest(unittest.TestCase):
+    def test_corners(self):
+        points = payload_range_points(30.0, 200.0, 100.0, 80.0, num_points=1)
+
+        # max payload, max fuel (payload 20) and ferry, with one point between each pair
+        expected = [(30.0, 200.0), (25.0, 200.0), (20.0, 200.0), (10.0, 190.0), (0.0, 180.0)]
+        assert_near_equal(points, expected)
+
+    def test_coincident_corners(self):
+        # the tanks can be filled at max payload: max fuel is also max payload
+        points = payload_range_points(30.0, 200.0, 100.0, 50.0, num_points=0)
+        assert_near_equal(points, [(30.0, 180.0), (0.0, 150.0)])
+
+        # max fuel needs all the payload to be offloaded: ferry is also max fuel
+        points = payload_range_points(30.0, 200.0, 100.0, 120.0, num_points=0)
+        assert_near_equal(points, [(30.0, 200.0), (0.0, 200.0)])
+
+    def test_split_payload(self):
+        # all the passengers fit, the rest of the payload is cargo
+        self.assertEqual(split_payload(1000.0, (2, 3, 4), 100.0), ((2, 3, 4), 100.0))
+        self.assertEqual(split_payload(900.0, (2, 3, 4), 100.0), ((2, 3, 4), 0.0))
+
+        # economy class passengers are removed first, and the cargo is never negative
+        self.assertEqual(split_payload(650.0, (2, 3, 4), 100.0), ((2, 3, 1), 50.0))
+        self.assertEqual(split_payload(150.0, (2, 3, 4), 100.0), ((1, 0, 0), 50.0))
+        self.assertEqual(split_payload(0.0, (2, 3, 4), 100.0), ((0, 0, 0), 0.0))
+
+        # without passengers the payload is all cargo
+        self.assertEqual(split_payload(650.0, (0,), 0.0), ((0,), 650.0))
+
+
+def _sizing_problem(max_iter=0):
+    prob = av.AviaryProblem(verbosity=0)
+    prob.load_inputs('models/test_aircraft/aircraft_for_bench_FwFm.csv', deepcopy(phase_info))
+    prob.check_and_preprocess_inputs()
+    prob.add_pre_mission_systems()
+    prob.add_phases(phase_info_parameterization=phase_info_parameterization)
+    prob.add_post_mission_systems()
+    prob.link_phases()
+    prob.add_driver('SLSQP', max_iter=max_iter)
+    prob.add_design_variables()
+    prob.add_objective()
+    prob.setup()
+    prob.set_initial_guesses()
+    prob.run_aviary_problem()
+    prob.save_sizing_to_json()
+
+    return prob
+
+
+@use_tempdirs
+class PayloadRangeTest(unittest.TestCase):
+    def test_payload_range(self):
+        prob = _sizing_problem()
+
+        table = prob.payload_range(num_points=0, phase_info=deepcopy(phase_info), max_iter=0)
+        data = {name: column.to_numpy() for name, column in table.items()}
+
+        # zero range, max payload, max fuel and ferry
+        self.assertEqual(len(table), 4)
+        assert_near_equal(data['range (NM)'][0], 0.0)
+        assert_near_equal(data['fuel (lbm)'][0], 0.0)
+
+        payload = prob.get_val(Aircraft.CrewPayload.TOTAL_PAYLOAD_MASS, 'lbm')[0]
+        gross_mass = prob.get_val(Mission.Design.GROSS_MASS, 'lbm')[0]
+        assert_near_equal(data['payload (lbm)'][:2], [payload, payload], 1e-10)
+        assert_near_equal(data['gross mass (lbm)'][1:3], [gross_mass, gross_mass], 1e-10)
+        assert_near_equal(data['payload (lbm)'][3], 0.0, tolerance=1e-8)
+
+        reports_folder = Path(prob.get_reports_dir())
+        self.assertTrue((reports_folder / 'payload_range.csv').is_file())
+        self.assertTrue((reports_folder / 'payload_range.png').is_file())
+
+    def test_envelope(self):
+        prob = _sizing_problem(max_iter=100)
+        self.assertTrue(prob.problem_ran_successfully)
+
+        # the time bounds must allow for the range of the ferry point
+        off_design_phase_info = deepcopy(phase_info)
+        off_design_phase_info['cruise']['user_options']['duration_bounds'] = ((56.5, 500.0), 'min')
+        off_design_phase_info['descent']['user_options']['initial_bounds'] = ((120.5, 700.0), 'min')
+
+        table = prob.payload_range(num_points=1, phase_info=off_design_phase_info)
+        data = {name: column.to_numpy() for name, column in table.items()}
+
+        self.assertTrue(data['success'].all())
+
+        # the range increases and the payload decreases along the envelope, down to the
+        # ferry point with no payload and no negative cargo
+        self.assertTrue((np.diff(data['range (NM)']) > 0.0).all())
+        self.assertTrue((np.diff(data['payload (lbm)']) <= 0.0).all())
+        assert_near_equal(data['payload (lbm)'][-1], 0.0, tolerance=1e-8)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,89 @@
+import unittest
+
+import numpy as np
+from openmdao.utils.assert_utils import assert_near_equal
+from openmdao.utils.testing_utils import use_tempdirs
+
+from aviary.interface.pre_mission_batch import pre_mission_batch, setup_pre_mission_problem
+from aviary.variable_info.variables import Aircraft, Mission
+
+
+@use_tempdirs
+class PreMissionBatchTest(unittest.TestCase):
+    def test_flops(self):
+        aircraft_data = 'models/test_aircraft/aircraft_for_bench_FwFm.csv'
+        designs = {
+            Aircraft.Wing.ASPECT_RATIO: ([11.0, 9.0, 13.0], 'unitless'),
+            Aircraft.Wing.AREA: ([1370.0, 1300.0, 1450.0], 'ft**2'),
+        }
+        outputs = {Aircraft.Wing.MASS: 'kg', Aircraft.Design.OPERATING_MASS: 'lbm'}
+
+        data = pre_mission_batch(aircraft_data, designs, outputs)
+
+        self.assertEqual(
+            list(data.columns),
+            [
+                Aircraft.Wing.ASPECT_RATIO,
+                Aircraft.Wing.AREA,
+                Aircraft.Wing.MASS,
+                Aircraft.Design.OPERATING_MASS,
+                'success',
+                'error',
+            ],
+        )
+        self.assertEqual(data.attrs['units'][Aircraft.Wing.MASS], 'kg')
+        self.assertEqual(data.attrs['units'][Aircraft.Wing.AREA], 'ft**2')
+        self.assertTrue(data['success'].all())
+        self.assertEqual(list(data['error']), ['', '', ''])
+
+        # each design gives the same results as its own problem
+        prob = setup_pre_mission_problem(aircraft_data)
+        for i in range(3):
+            for name, (vals, units) in designs.items():
+                prob.set_val(name, vals[i], units=units)
+            prob.run_model()
+
+            assert_near_equal(
+                data[Aircraft.Wing.MASS][i], prob.get_val(Aircraft.Wing.MASS, 'kg')[0], 1e-12
+            )
+            assert_near_equal(
+                data[Aircraft.Design.OPERATING_MASS][i],
+                prob.get_val(Aircraft.Design.OPERATING_MASS, 'lbm')[0],
+                1e-12,
+            )
+
+    def test_gasp_masking(self):
+        aircraft_data = 'models/test_aircraft/aircraft_for_bench_GwGm.csv'
+
+        # the wing mass solve does not converge for the second design
+        designs = {Mission.Design.GROSS_MASS: ([175400.0, 10000.0, 175400.0], 'lbm')}
+
+        data = pre_mission_batch(aircraft_data, designs, [Aircraft.Wing.MASS])
+
+        self.assertEqual(list(data['success']), [True, False, True])
+        self.assertTrue(np.isnan(data[Aircraft.Wing.MASS][1]))
+        self.assertEqual(data['error'][0], '')
+        self.assertIn('AnalysisError', data['error'][1])
+        self.assertIn('wing_mass', data['error'][1])
+
+        # the design after the failed one starts again from the input deck solution
+        assert_near_equal(data[Aircraft.Wing.MASS][2], data[Aircraft.Wing.MASS][0], 1e-12)
+
+    def test_errors(self):
+        aircraft_data = 'models/test_aircraft/aircraft_for_bench_GwGm.csv'
+
+        with self.assertRaises(ValueError) as cm:
+            pre_mission_batch(aircraft_data, {Aircraft.Wing.AREA: ([1300.0, 1400.0], 'ft**2')})
+        self.assertIn('cannot be a design input', str(cm.exception))
+
+        designs = {
+            Aircraft.Wing.ASPECT_RATIO: ([10.0, 11.0], 'unitless'),
+            Aircraft.Wing.SWEEP: ([25.0], 'deg'),
+        }
+        with self.assertRaises(ValueError) as cm:
+            pre_mission_batch(aircraft_data, designs)
+        self.assertIn('same number of values', str(cm.exception))
+
+
+if __name__ == '__main__':
+    unittest.main()
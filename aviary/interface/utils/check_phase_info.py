@@ -10,7 +10,7 @@ SOLVED_2DOF = EquationsOfMotion.SOLVED_2DOF
 # Define common keys for all phases
 common_keys = {
     'num_segments': int,
-    'order': int,
+    'order': (int, list),
     'fix_initial': (bool, dict),
 }
 
@@ -32,6 +32,15 @@ common_entries = {
     'duration_bounds': tuple,
 }
 
+# Entries of analytic (Breguet) cruise phases
+analytic_entries = {
+    'analytic': bool,
+    'initial_mach': tuple,
+    'final_mach': tuple,
+    'initial_altitude': tuple,
+    'final_altitude': tuple,
+}
+
 # Combine common and phase-specific entries
 phase_keys_height_energy = {
     'pre_mission': {'include_takeoff': bool, 'optimize_mass': bool},
@@ -205,7 +214,10 @@ def check_phase_info(phase_info, mission_method):
     elif mission_method is HEIGHT_ENERGY:
         for phase in phase_info:
             if phase != 'pre_mission' and phase != 'post_mission':
-                phase_keys[phase] = {**common_keys, **common_entries}
+                if phase_info[phase].get('user_options', {}).get('analytic', False):
+                    phase_keys[phase] = {**analytic_entries}
+                else:
+                    phase_keys[phase] = {**common_keys, **common_entries}
             else:
                 phase_keys[phase] = phase_keys_height_energy[phase]
     else:
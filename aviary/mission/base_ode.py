@@ -4,6 +4,7 @@ from aviary.subsystems.atmosphere.atmosphere import Atmosphere
 from aviary.utils.aviary_values import AviaryValues
 from aviary.utils.functions import promote_aircraft_and_mission_vars
 from aviary.variable_info.enums import AnalysisScheme
+from aviary.variable_info.functions import setup_model_options
 from aviary.variable_info.variable_meta_data import _MetaData
 
 
@@ -56,6 +57,31 @@ class BaseODE(om.Group):
             desc='The analysis method that will be used to close the trajectory; for example collocation or time integration',
         )
 
+    def load_model_options(self):
+        """
+        Load the model options, setting them up from aviary_options if the problem has none.
+
+        dymos also sets up the ODE of a phase in problems of its own, such as the ones that
+        estimate the collocation error during grid refinement. Those problems have no model
+        options, so the ODE passes its aviary_options to its subsystems itself.
+        """
+        if not self.model_options:
+            engine_models = None
+
+            for subsystem in self.options['core_subsystems']:
+                if hasattr(subsystem, 'engine_models'):
+                    engine_models = subsystem.engine_models
+
+            setup_model_options(
+                self,
+                self.options['aviary_options'],
+                meta_data=self.options['meta_data'],
+                engine_models=engine_models,
+                prefix=self.pathname,
+            )
+
+        super().load_model_options()
+
     def add_atmosphere(self, **kwargs):
         """Adds Atmosphere component to ODE."""
         nn = self.options['num_nodes']
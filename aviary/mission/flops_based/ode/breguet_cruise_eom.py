@@ -0,0 +1,247 @@
+import numpy as np
+import openmdao.api as om
+from dymos.utils.lgl import lgl
+from numpy.polynomial import legendre
+
+from aviary.variable_info.variables import Dynamic
+
+
+def lgl_integration_matrix(num_nodes):
+    """
+    Return the matrix that integrates a function sampled at the LGL nodes.
+
+    Row i of the matrix holds the weights of the integral, from -1 to the i-th node, of the
+    polynomial that interpolates the function at the Legendre-Gauss-Lobatto nodes. The last
+    row is therefore the LGL quadrature rule.
+
+    Parameters
+    ----------
+    num_nodes : int
+        Number of Legendre-Gauss-Lobatto nodes.
+
+    Returns
+    -------
+    ndarray
+        Integration matrix of shape (num_nodes, num_nodes).
+    """
+    tau, _ = lgl(num_nodes)
+
+    # Integrate each Legendre polynomial from -1, then change to the nodal basis.
+    vandermonde = legendre.legvander(tau, num_nodes - 1)
+    integrals = np.zeros((num_nodes, num_nodes))
+
+    for k in range(num_nodes):
+        coefs = np.zeros(num_nodes)
+        coefs[k] = 1.0
+        integrals[:, k] = legendre.legval(tau, legendre.legint(coefs, lbnd=-1.0))
+
+    return np.linalg.solve(vandermonde.T, integrals.T).T
+
+
+class CruiseProfile(om.ExplicitComponent):
+    """
+    Compute the altitude and Mach number of a cruise phase integrated over mass.
+
+    Both vary linearly with the fraction of the cruise fuel that has been burned, between
+    their initial and final values. The nodes must be the Legendre-Gauss-Lobatto nodes of
+    the phase, so that this fraction is fixed at each node. The derivatives of altitude
+    and Mach number with respect to mass are also computed, for the climb and
+    acceleration rates.
+    """
+
+    def initialize(self):
+        self.options.declare('num_nodes', types=int)
+
+    def setup(self):
+        nn = self.options['num_nodes']
+
+        self.add_input('initial_altitude', val=0.0, units='ft', desc='altitude at start of cruise')
+        self.add_input('final_altitude', val=0.0, units='ft', desc='altitude at end of cruise')
+        self.add_input('initial_mach', val=0.0, units='unitless', desc='Mach at start of cruise')
+        self.add_input('final_mach', val=0.0, units='unitless', desc='Mach at end of cruise')
+        self.add_input(
+            Dynamic.Vehicle.MASS,
+            val=np.linspace(150000.0, 140000.0, nn),
+            units='lbm',
+            desc='mass at each node, monotonically decreasing',
+        )
+
+        self.add_output(Dynamic.Mission.ALTITUDE, val=np.zeros(nn), units='ft')
+        self.add_output(Dynamic.Atmosphere.MACH, val=np.zeros(nn), units='unitless')
+        self.add_output(
+            'altitude_mass_slope',
+            val=np.zeros(nn),
+            units='ft/lbm',
+            desc='derivative of altitude with respect to mass',
+        )
+        self.add_output(
+            'mach_mass_slope',
+            val=np.zeros(nn),
+            units='1/lbm',
+            desc='derivative of Mach number with respect to mass',
+        )
+
+        tau, _ = lgl(nn)
+        self._fraction = 0.5 * (tau + 1.0)
+
+    def setup_partials(self):
+        nn = self.options['num_nodes']
+        fraction = self._fraction
+        ends = np.tile([0, nn - 1], nn)
+        rows = np.repeat(np.arange(nn), 2)
+
+        self.declare_partials(Dynamic.Mission.ALTITUDE, 'initial_altitude', val=1.0 - fraction)
+        self.declare_partials(Dynamic.Mission.ALTITUDE, 'final_altitude', val=fraction)
+        self.declare_partials(Dynamic.Atmosphere.MACH, 'initial_mach', val=1.0 - fraction)
+        self.declare_partials(Dynamic.Atmosphere.MACH, 'final_mach', val=fraction)
+
+        self.declare_partials('altitude_mass_slope', ['initial_altitude', 'final_altitude'])
+        self.declare_partials('mach_mass_slope', ['initial_mach', 'final_mach'])
+
+        self.declare_partials(
+            ['altitude_mass_slope', 'mach_mass_slope'],
+            Dynamic.Vehicle.MASS,
+            rows=rows,
+            cols=ends,
+        )
+
+    def compute(self, inputs, outputs):
+        fraction = self._fraction
+        mass = inputs[Dynamic.Vehicle.MASS]
+        fuel_mass = mass[-1] - mass[0]
+
+        for name, output, slope in (
+            ('altitude', Dynamic.Mission.ALTITUDE, 'altitude_mass_slope'),
+            ('mach', Dynamic.Atmosphere.MACH, 'mach_mass_slope'),
+        ):
+            initial = inputs[f'initial_{name}']
+            final = inputs[f'final_{name}']
+
+            outputs[output] = initial + (final - initial) * fraction
+            outputs[slope] = (final - initial) / fuel_mass
+
+    def compute_partials(self, inputs, J):
+        nn = self.options['num_nodes']
+        mass = inputs[Dynamic.Vehicle.MASS]
+        fuel_mass = mass[-1] - mass[0]
+
+        for name, slope in (('altitude', 'altitude_mass_slope'), ('mach', 'mach_mass_slope')):
+            delta = inputs[f'final_{name}'] - inputs[f'initial_{name}']
+
+            J[slope, f'initial_{name}'] = -np.ones(nn) / fuel_mass
+            J[slope, f'final_{name}'] = np.ones(nn) / fuel_mass
+            J[slope, Dynamic.Vehicle.MASS] = np.tile(
+                [delta[0] / fuel_mass**2, -delta[0] / fuel_mass**2], nn
+            )
+
+
+class RangeQuadrature(om.ExplicitComponent):
+    """
+    Compute the time and distance of a cruise phase integrated over mass.
+
+    With mass as the independent variable, dt/dm = 1 / fuel_flow and dr/dm = distance_rate /
+    fuel_flow. These are integrated with the Legendre-Gauss-Lobatto quadrature of the
+    nodes of the phase, which is exact for polynomial integrands of degree up to
+    2 * num_nodes - 3, so only a few nodes are needed for a smooth cruise.
+    """
+
+    def initialize(self):
+        self.options.declare('num_nodes', types=int)
+
+    def setup(self):
+        nn = self.options['num_nodes']
+
+        self.add_input('initial_time', val=0.0, units='s', desc='time at which cruise begins')
+        self.add_input(
+            'initial_distance', val=0.0, units='NM', desc='distance at which cruise begins'
+        )
+        self.add_input(
+            Dynamic.Vehicle.MASS,
+            val=np.linspace(150000.0, 140000.0, nn),
+            units='lbm',
+            desc='mass at each node, monotonically decreasing',
+        )
+        self.add_input(
+            Dynamic.Mission.DISTANCE_RATE,
+            val=np.ones(nn),
+            units='NM/s',
+            desc='horizontal velocity',
+        )
+        self.add_input(
+            Dynamic.Vehicle.Propulsion.FUEL_FLOW_RATE_NEGATIVE_TOTAL,
+            val=-np.ones(nn),
+            units='lbm/s',
+            desc='rate of change of mass, which is negative',
+        )
+
+        self.add_output('time', val=np.zeros(nn), units='s', desc='time at each node')
+        self.add_output('elapsed_time', val=np.zeros(nn), units='s', desc='time since cruise began')
+        self.add_output(
+            Dynamic.Mission.DISTANCE, val=np.zeros(nn), units='NM', desc='distance at each node'
+        )
+
+        self._integration_matrix = lgl_integration_matrix(nn)
+
+    def setup_partials(self):
+        nn = self.options['num_nodes']
+        ends = np.tile([0, nn - 1], nn)
+        rows = np.repeat(np.arange(nn), 2)
+
+        self.declare_partials('time', 'initial_time', val=1.0)
+        self.declare_partials(Dynamic.Mission.DISTANCE, 'initial_distance', val=1.0)
+
+        self.declare_partials(
+            ['time', 'elapsed_time', Dynamic.Mission.DISTANCE],
+            Dynamic.Vehicle.MASS,
+            rows=rows,
+            cols=ends,
+        )
+        self.declare_partials(
+            ['time', 'elapsed_time', Dynamic.Mission.DISTANCE],
+            Dynamic.Vehicle.Propulsion.FUEL_FLOW_RATE_NEGATIVE_TOTAL,
+        )
+        self.declare_partials(Dynamic.Mission.DISTANCE, Dynamic.Mission.DISTANCE_RATE)
+
+    def compute(self, inputs, outputs):
+        B = self._integration_matrix
+        mass = inputs[Dynamic.Vehicle.MASS]
+        fuel_flow = inputs[Dynamic.Vehicle.Propulsion.FUEL_FLOW_RATE_NEGATIVE_TOTAL]
+        distance_rate = inputs[Dynamic.Mission.DISTANCE_RATE]
+
+        half_fuel_mass = 0.5 * (mass[-1] - mass[0])
+
+        outputs['elapsed_time'] = half_fuel_mass * B.dot(1.0 / fuel_flow)
+        outputs['time'] = inputs['initial_time'] + outputs['elapsed_time']
+        outputs[Dynamic.Mission.DISTANCE] = inputs['initial_distance'] + half_fuel_mass * B.dot(
+            distance_rate / fuel_flow
+        )
+
+    def compute_partials(self, inputs, J):
+        B = self._integration_matrix
+        mass = inputs[Dynamic.Vehicle.MASS]
+        fuel_flow = inputs[Dynamic.Vehicle.Propulsion.FUEL_FLOW_RATE_NEGATIVE_TOTAL]
+        distance_rate = inputs[Dynamic.Mission.DISTANCE_RATE]
+
+        half_fuel_mass = 0.5 * (mass[-1] - mass[0])
+
+        for output, integrand, dintegrand_dff in (
+            ('time', 1.0 / fuel_flow, -1.0 / fuel_flow**2),
+            (
+                Dynamic.Mission.DISTANCE,
+                distance_rate / fuel_flow,
+                -distance_rate / fuel_flow**2,
+            ),
+        ):
+            integral = 0.5 * B.dot(integrand)
+
+            J[output, Dynamic.Vehicle.MASS] = np.stack((-integral, integral), axis=1).ravel()
+            J[output, Dynamic.Vehicle.Propulsion.FUEL_FLOW_RATE_NEGATIVE_TOTAL] = (
+                half_fuel_mass * B * dintegrand_dff
+            )
+
+        J['elapsed_time', Dynamic.Vehicle.MASS] = J['time', Dynamic.Vehicle.MASS]
+        J['elapsed_time', Dynamic.Vehicle.Propulsion.FUEL_FLOW_RATE_NEGATIVE_TOTAL] = J[
+            'time', Dynamic.Vehicle.Propulsion.FUEL_FLOW_RATE_NEGATIVE_TOTAL
+        ]
+
+        J[Dynamic.Mission.DISTANCE, Dynamic.Mission.DISTANCE_RATE] = half_fuel_mass * B / fuel_flow
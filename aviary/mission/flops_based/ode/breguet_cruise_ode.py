@@ -0,0 +1,120 @@
+import numpy as np
+import openmdao.api as om
+
+from aviary.mission.flops_based.ode.breguet_cruise_eom import CruiseProfile, RangeQuadrature
+from aviary.mission.flops_based.ode.energy_ODE import EnergyODE
+from aviary.mission.flops_based.ode.mission_EOM import MissionEOM
+from aviary.variable_info.enums import SpeedType
+from aviary.variable_info.variables import Dynamic
+
+
+class BreguetCruiseODE(EnergyODE):
+    """
+    The energy method cruise ODE, integrated over mass instead of time.
+
+    Altitude and Mach number vary linearly with the fuel burned, so the thrust required
+    (including the small climb and acceleration terms of the energy method) and the
+    throttle are solved only at the nodes of the phase. Time and distance then follow from
+    a quadrature over mass, so cruise has no states, controls or defects.
+    """
+
+    def setup(self):
+        nn = self.options['num_nodes']
+
+        self.add_subsystem(
+            'cruise_profile',
+            CruiseProfile(num_nodes=nn),
+            promotes_inputs=[
+                'initial_altitude',
+                'final_altitude',
+                'initial_mach',
+                'final_mach',
+                Dynamic.Vehicle.MASS,
+            ],
+            promotes_outputs=['*'],
+        )
+
+        self.add_atmosphere(input_speed_type=SpeedType.MACH)
+
+        sub1 = self.add_subsystem('solver_sub', om.Group(), promotes=['*'])
+
+        self.add_core_subsystems(solver_group=sub1)
+
+        self.add_external_subsystems(solver_group=sub1)
+
+        # The climb and acceleration rates depend on the fuel flow, so they are solved
+        # together with the throttle.
+        sub1.add_subsystem(
+            name='cruise_rates',
+            subsys=om.ExecComp(
+                [
+                    'altitude_rate = altitude_mass_slope * fuel_flow',
+                    'velocity_rate = mach_mass_slope * fuel_flow * sos',
+                ],
+                altitude_mass_slope={'units': 'ft/lbm', 'shape': (nn,)},
+                mach_mass_slope={'units': '1/lbm', 'shape': (nn,)},
+                fuel_flow={'units': 'lbm/s', 'shape': (nn,)},
+                sos={'units': 'ft/s', 'shape': (nn,)},
+                altitude_rate={'units': 'ft/s', 'shape': (nn,)},
+                velocity_rate={'units': 'ft/s**2', 'shape': (nn,)},
+                has_diag_partials=True,
+            ),
+            promotes_inputs=[
+                'altitude_mass_slope',
+                'mach_mass_slope',
+                ('fuel_flow', Dynamic.Vehicle.Propulsion.FUEL_FLOW_RATE_NEGATIVE_TOTAL),
+                ('sos', Dynamic.Atmosphere.SPEED_OF_SOUND),
+            ],
+            promotes_outputs=[
+                ('altitude_rate', Dynamic.Mission.ALTITUDE_RATE),
+                ('velocity_rate', Dynamic.Mission.VELOCITY_RATE),
+            ],
+        )
+
+        sub1.add_subsystem(
+            name='mission_EOM',
+            subsys=MissionEOM(num_nodes=nn),
+            promotes_inputs=[
+                Dynamic.Mission.VELOCITY,
+                Dynamic.Vehicle.MASS,
+                Dynamic.Vehicle.Propulsion.THRUST_MAX_TOTAL,
+                Dynamic.Vehicle.DRAG,
+                Dynamic.Mission.ALTITUDE_RATE,
+                Dynamic.Mission.VELOCITY_RATE,
+            ],
+            promotes_outputs=[
+                Dynamic.Mission.SPECIFIC_ENERGY_RATE_EXCESS,
+                Dynamic.Mission.ALTITUDE_RATE_MAX,
+                Dynamic.Mission.DISTANCE_RATE,
+                'thrust_required',
+            ],
+        )
+
+        self.add_throttle_balance(solver_group=sub1)
+
+        self.add_subsystem(
+            'range_quadrature',
+            RangeQuadrature(num_nodes=nn),
+            promotes_inputs=[
+                'initial_time',
+                'initial_distance',
+                Dynamic.Vehicle.MASS,
+                Dynamic.Mission.DISTANCE_RATE,
+                Dynamic.Vehicle.Propulsion.FUEL_FLOW_RATE_NEGATIVE_TOTAL,
+            ],
+            promotes_outputs=['time', 'elapsed_time', Dynamic.Mission.DISTANCE],
+        )
+
+        self.set_input_defaults(Dynamic.Vehicle.MASS, val=np.ones(nn), units='lbm')
+
+        sub1.nonlinear_solver = om.NewtonSolver(
+            solve_subsystems=True,
+            atol=1.0e-10,
+            rtol=1.0e-10,
+        )
+        sub1.nonlinear_solver.linesearch = om.BoundsEnforceLS()
+        sub1.linear_solver = om.DirectSolver(assemble_jac=True)
+        sub1.nonlinear_solver.options['err_on_non_converge'] = True
+        sub1.nonlinear_solver.options['iprint'] = 2
+
+        self.options['auto_order'] = True
@@ -42,8 +42,6 @@ class EnergyODE(_BaseODE):
         options = self.options
         nn = options['num_nodes']
         analysis_scheme = options['analysis_scheme']
-        aviary_options = options['aviary_options']
-        num_engine_type = len(aviary_options.get_val(Aircraft.Engine.NUM_ENGINES))
 
         if analysis_scheme is AnalysisScheme.SHOOTING:
             SGM_required_inputs = {
@@ -96,59 +94,7 @@ class EnergyODE(_BaseODE):
             ],
         )
 
-        # THROTTLE Section
-        # TODO: Split this out into a function that can be used by the other ODEs.
-        if num_engine_type > 1:
-            # Multi Engine
-
-            sub1.add_subsystem(
-                name='throttle_balance',
-                subsys=om.BalanceComp(
-                    name='aggregate_throttle',
-                    units='unitless',
-                    val=np.ones((nn,)),
-                    lhs_name='thrust_required',
-                    rhs_name=Dynamic.Vehicle.Propulsion.THRUST_TOTAL,
-                    eq_units='lbf',
-                    normalize=False,
-                    res_ref=1.0e6,
-                ),
-                promotes_inputs=['*'],
-                promotes_outputs=['*'],
-            )
-
-            sub1.add_subsystem(
-                'throttle_allocator',
-                ThrottleAllocator(
-                    num_nodes=nn, throttle_allocation=self.options['throttle_allocation']
-                ),
-                promotes_inputs=['*'],
-                promotes_outputs=['*'],
-            )
-
-        else:
-            # Single Engine
-
-            # Add a balance comp to compute throttle based on the required thrust.
-            sub1.add_subsystem(
-                name='throttle_balance',
-                subsys=om.BalanceComp(
-                    name=Dynamic.Vehicle.Propulsion.THROTTLE,
-                    units='unitless',
-                    val=np.ones((nn,)),
-                    lhs_name='thrust_required',
-                    rhs_name=Dynamic.Vehicle.Propulsion.THRUST_TOTAL,
-                    eq_units='lbf',
-                    normalize=False,
-                    lower=0.0 if options['throttle_enforcement'] == 'bounded' else None,
-                    upper=1.0 if options['throttle_enforcement'] == 'bounded' else None,
-                    res_ref=1.0e6,
-                ),
-                promotes_inputs=['*'],
-                promotes_outputs=['*'],
-            )
-
-            self.set_input_defaults(Dynamic.Vehicle.Propulsion.THROTTLE, val=1.0, units='unitless')
+        self.add_throttle_balance(solver_group=sub1)
 
         self.set_input_defaults(Dynamic.Atmosphere.MACH, val=np.ones(nn), units='unitless')
         self.set_input_defaults(Dynamic.Vehicle.MASS, val=np.ones(nn), units='kg')
@@ -201,3 +147,70 @@ class EnergyODE(_BaseODE):
         sub1.nonlinear_solver.options['iprint'] = print_level
 
         self.options['auto_order'] = True
+
+    def add_throttle_balance(self, solver_group):
+        """
+        Add the components that solve for the throttle giving the required thrust.
+
+        Parameters
+        ----------
+        solver_group : om.Group
+            Group with the Newton solver, which must also contain the propulsion and the
+            component that computes 'thrust_required'.
+        """
+        options = self.options
+        nn = options['num_nodes']
+        aviary_options = options['aviary_options']
+        num_engine_type = len(aviary_options.get_val(Aircraft.Engine.NUM_ENGINES))
+
+        if num_engine_type > 1:
+            # Multi Engine
+
+            solver_group.add_subsystem(
+                name='throttle_balance',
+                subsys=om.BalanceComp(
+                    name='aggregate_throttle',
+                    units='unitless',
+                    val=np.ones((nn,)),
+                    lhs_name='thrust_required',
+                    rhs_name=Dynamic.Vehicle.Propulsion.THRUST_TOTAL,
+                    eq_units='lbf',
+                    normalize=False,
+                    res_ref=1.0e6,
+                ),
+                promotes_inputs=['*'],
+                promotes_outputs=['*'],
+            )
+
+            solver_group.add_subsystem(
+                'throttle_allocator',
+                ThrottleAllocator(
+                    num_nodes=nn, throttle_allocation=self.options['throttle_allocation']
+                ),
+                promotes_inputs=['*'],
+                promotes_outputs=['*'],
+            )
+
+        else:
+            # Single Engine
+
+            # Add a balance comp to compute throttle based on the required thrust.
+            solver_group.add_subsystem(
+                name='throttle_balance',
+                subsys=om.BalanceComp(
+                    name=Dynamic.Vehicle.Propulsion.THROTTLE,
+                    units='unitless',
+                    val=np.ones((nn,)),
+                    lhs_name='thrust_required',
+                    rhs_name=Dynamic.Vehicle.Propulsion.THRUST_TOTAL,
+                    eq_units='lbf',
+                    normalize=False,
+                    lower=0.0 if options['throttle_enforcement'] == 'bounded' else None,
+                    upper=1.0 if options['throttle_enforcement'] == 'bounded' else None,
+                    res_ref=1.0e6,
+                ),
+                promotes_inputs=['*'],
+                promotes_outputs=['*'],
+            )
+
+            self.set_input_defaults(Dynamic.Vehicle.Propulsion.THROTTLE, val=1.0, units='unitless')
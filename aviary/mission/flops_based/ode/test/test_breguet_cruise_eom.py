@@ -0,0 +1,91 @@
+import unittest
+
+import numpy as np
+import openmdao.api as om
+from dymos.utils.lgl import lgl
+from openmdao.utils.assert_utils import assert_check_partials, assert_near_equal
+
+from aviary.mission.flops_based.ode.breguet_cruise_eom import (
+    CruiseProfile,
+    RangeQuadrature,
+    lgl_integration_matrix,
+)
+from aviary.variable_info.variables import Dynamic
+
+
+class LGLIntegrationMatrixTest(unittest.TestCase):
+    def test_polynomial(self):
+        nn = 6
+        tau, _ = lgl(nn)
+
+        # Integrals from -1 of a polynomial of degree nn - 1 are exact.
+        integrand = 3.0 * tau**5 - tau**2 + 2.0
+        expected = 0.5 * (tau**6 - 1.0) - (tau**3 + 1.0) / 3.0 + 2.0 * (tau + 1.0)
+
+        assert_near_equal(lgl_integration_matrix(nn).dot(integrand), expected, tolerance=1e-12)
+
+
+class BreguetCruiseEOMTest(unittest.TestCase):
+    def setUp(self):
+        nn = self.nn = 5
+        tau, _ = lgl(nn)
+
+        prob = self.prob = om.Problem()
+        prob.model.add_subsystem('profile', CruiseProfile(num_nodes=nn), promotes=['*'])
+        prob.model.add_subsystem('quadrature', RangeQuadrature(num_nodes=nn), promotes=['*'])
+
+        prob.setup(check=False, force_alloc_complex=True)
+
+        prob.set_val(Dynamic.Vehicle.MASS, 150000.0 - 6000.0 * (tau + 1.0), units='lbm')
+        prob.set_val('initial_altitude', 32000.0, units='ft')
+        prob.set_val('final_altitude', 34000.0, units='ft')
+        prob.set_val('initial_mach', 0.72)
+        prob.set_val('final_mach', 0.74)
+        prob.set_val('initial_time', 3600.0, units='s')
+        prob.set_val('initial_distance', 300.0, units='NM')
+
+    def test_constant_cruise(self):
+        prob = self.prob
+        prob.set_val(
+            Dynamic.Vehicle.Propulsion.FUEL_FLOW_RATE_NEGATIVE_TOTAL,
+            -6000.0 * np.ones(self.nn),
+            units='lbm/h',
+        )
+        prob.set_val(Dynamic.Mission.DISTANCE_RATE, 420.0 * np.ones(self.nn), units='kn')
+        prob.run_model()
+
+        # 12000 lbm at 6000 lbm/h is two hours of cruise.
+        assert_near_equal(prob.get_val('elapsed_time', units='h')[-1], 2.0, tolerance=1e-12)
+        assert_near_equal(prob.get_val('time', units='h')[-1], 3.0, tolerance=1e-12)
+        assert_near_equal(
+            prob.get_val(Dynamic.Mission.DISTANCE, units='NM')[-1], 1140.0, tolerance=1e-12
+        )
+
+        assert_near_equal(
+            prob.get_val(Dynamic.Mission.ALTITUDE, units='ft')[[0, 2, -1]],
+            [32000.0, 33000.0, 34000.0],
+            tolerance=1e-12,
+        )
+        assert_near_equal(
+            prob.get_val(Dynamic.Atmosphere.MACH)[[0, 2, -1]], [0.72, 0.73, 0.74], tolerance=1e-12
+        )
+        assert_near_equal(
+            prob.get_val('altitude_mass_slope', units='ft/lbm'), -np.ones(self.nn) / 6.0
+        )
+
+    def test_partials(self):
+        prob = self.prob
+        prob.set_val(
+            Dynamic.Vehicle.Propulsion.FUEL_FLOW_RATE_NEGATIVE_TOTAL,
+            -np.linspace(6000.0, 5500.0, self.nn),
+            units='lbm/h',
+        )
+        prob.set_val(Dynamic.Mission.DISTANCE_RATE, np.linspace(420.0, 425.0, self.nn), units='kn')
+        prob.run_model()
+
+        partial_data = prob.check_partials(out_stream=None, method='cs')
+        assert_check_partials(partial_data, atol=1e-10, rtol=1e-10)
+
+
+if __name__ == '__main__':
+    unittest.main()
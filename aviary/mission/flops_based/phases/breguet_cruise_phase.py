@@ -0,0 +1,323 @@
+from aviary.mission.flops_based.ode.breguet_cruise_ode import BreguetCruiseODE
+from aviary.mission.initial_guess_builders import InitialGuessIntegrationVariable, InitialGuessState
+from aviary.mission.phase_builder_base import PhaseBuilderBase
+from aviary.utils.aviary_options_dict import AviaryOptionsDictionary
+from aviary.utils.aviary_values import AviaryValues
+from aviary.variable_info.enums import ThrottleAllocation
+from aviary.variable_info.variables import Aircraft, Dynamic
+
+
+class BreguetCruisePhaseOptions(AviaryOptionsDictionary):
+    def declare_options(self):
+        self.declare(
+            'analytic',
+            types=bool,
+            default=True,
+            desc='When set to True, this is an analytic phase.',
+        )
+
+        self.declare(
+            'reserve',
+            types=bool,
+            default=False,
+            desc='Designate this phase as a reserve phase and contributes its fuel burn '
+            'towards the reserve mission fuel requirements. Reserve phases should be '
+            'be placed after all non-reserve phases in the phase_info.',
+        )
+
+        self.declare(
+            name='target_distance',
+            default=None,
+            units='m',
+            desc='The total distance traveled by the aircraft from takeoff to landing '
+            'for the primary mission, not including reserve missions. This value must '
+            'be positive.',
+        )
+
+        self.declare(
+            'target_duration',
+            types=tuple,
+            default=None,
+            units='s',
+            desc='The amount of time taken by this phase added as a constraint.',
+        )
+
+        self.declare(
+            name='num_nodes',
+            types=int,
+            default=5,
+            desc='The number of Legendre-Gauss-Lobatto nodes at which the aerodynamics and '
+            'propulsion are evaluated. Time and distance are integrated over mass with '
+            'the quadrature on these nodes.',
+        )
+
+        self.declare(
+            name='initial_mach',
+            types=float,
+            allow_none=True,
+            default=None,
+            desc='The Mach number at the start of the cruise.',
+        )
+
+        self.declare(
+            name='final_mach',
+            types=float,
+            allow_none=True,
+            default=None,
+            desc='The Mach number at the end of the cruise. The Mach number varies linearly '
+            'with the fuel burned between the initial and final values.',
+        )
+
+        self.declare(
+            name='initial_altitude',
+            types=tuple,
+            default=None,
+            units='ft',
+            desc='The altitude at the start of the cruise.',
+        )
+
+        self.declare(
+            name='final_altitude',
+            types=tuple,
+            default=None,
+            units='ft',
+            desc='The altitude at the end of the cruise. The altitude varies linearly with '
+            'the fuel burned between the initial and final values.',
+        )
+
+        self.declare(
+            'initial_bounds',
+            types=tuple,
+            default=(None, None),
+            units='min',
+            desc='Lower and upper bounds on the starting time for this phase relative to the '
+            'starting time of the mission. Only used for the initial guess of the cruise.',
+        )
+
+        self.declare(
+            name='duration_bounds',
+            types=tuple,
+            default=(None, None),
+            units='min',
+            desc='Lower and upper bounds on the phase duration, in the form of a nested tuple: '
+            'i.e. ((20, 36), "min"). The duration of the cruise follows from the fuel burned, '
+            'so these bounds are enforced with a constraint.',
+        )
+
+        self.declare(
+            name='throttle_enforcement',
+            default='boundary_constraint',
+            values=['path_constraint', 'boundary_constraint', 'bounded', None],
+            desc='Flag to enforce engine throttle constraints on the path or at the segment '
+            'boundaries or using solver bounds.',
+        )
+
+        self.declare(
+            name='throttle_allocation',
+            default=ThrottleAllocation.FIXED,
+            values=[
+                ThrottleAllocation.FIXED,
+                ThrottleAllocation.STATIC,
+            ],
+            desc='Specifies how to handle the throttles for multiple engines. FIXED is a '
+            'user-specified value. STATIC is specified by the optimizer as one value for the '
+            'whole phase.',
+        )
+
+
+class BreguetCruisePhase(PhaseBuilderBase):
+    """
+    A phase builder for an analytic height energy cruise.
+
+    The cruise is an AnalyticPhase integrated over mass, like the Breguet range equation:
+    the aerodynamics and propulsion are evaluated at a few nodes only, and time and
+    distance follow from a quadrature over the fuel burned. Altitude and Mach number vary
+    linearly with the fuel burned, between the initial and final values in the
+    user_options. The timeseries contain the same variables as the other height energy
+    phases, so the phase links to them and reports like any other.
+
+    The integration variable of the phase is named "mass": t_initial is the initial mass
+    and t_duration is the negative of the fuel burned.
+    """
+
+    default_name = 'cruise'
+    default_ode_class = BreguetCruiseODE
+    default_options_class = BreguetCruisePhaseOptions
+
+    _initial_guesses_meta_data_ = {}
+
+    def __init__(
+        self,
+        name=None,
+        subsystem_options=None,
+        user_options=None,
+        initial_guesses=None,
+        ode_class=None,
+        transcription=None,
+        core_subsystems=None,
+        external_subsystems=None,
+        meta_data=None,
+    ):
+        super().__init__(
+            name=name,
+            subsystem_options=subsystem_options,
+            user_options=user_options,
+            initial_guesses=initial_guesses,
+            ode_class=ode_class,
+            transcription=transcription,
+            core_subsystems=core_subsystems,
+            external_subsystems=external_subsystems,
+            meta_data=meta_data,
+            is_analytic_phase=True,
+        )
+
+        self.num_nodes = self.user_options['num_nodes']
+
+    def build_phase(self, aviary_options: AviaryValues = None):
+        """
+        Return a new analytic cruise phase for analysis using these constraints.
+
+        If ode_class is None, BreguetCruiseODE is used as the default.
+
+        Parameters
+        ----------
+        aviary_options : AviaryValues
+            Collection of Aircraft/Mission specific options
+
+        Returns
+        -------
+        dymos.AnalyticPhase
+        """
+        phase = super().build_phase(aviary_options)
+
+        num_engine_type = len(aviary_options.get_val(Aircraft.Engine.NUM_ENGINES))
+
+        user_options = self.user_options
+
+        initial_altitude, altitude_units = user_options['initial_altitude']
+        final_altitude = user_options.get_val('final_altitude', altitude_units)
+        throttle_enforcement = user_options['throttle_enforcement']
+
+        phase.add_parameter(
+            'initial_altitude',
+            opt=False,
+            val=initial_altitude,
+            units=altitude_units,
+            static_target=True,
+        )
+        phase.add_parameter(
+            'final_altitude',
+            opt=False,
+            val=final_altitude,
+            units=altitude_units,
+            static_target=True,
+        )
+        phase.add_parameter(
+            'initial_mach', opt=False, val=user_options['initial_mach'], static_target=True
+        )
+        phase.add_parameter(
+            'final_mach', opt=False, val=user_options['final_mach'], static_target=True
+        )
+        phase.add_parameter('initial_distance', opt=False, val=0.0, units='NM', static_target=True)
+        phase.add_parameter('initial_time', opt=False, val=0.0, units='s', static_target=True)
+
+        if num_engine_type > 1:
+            # Allocation should default to an even split so that we don't start
+            # with an allocation that might not produce enough thrust.
+            phase.add_parameter(
+                'throttle_allocations',
+                units='unitless',
+                val=[1.0 / num_engine_type] * (num_engine_type - 1),
+                shape=(num_engine_type - 1,),
+                opt=user_options['throttle_allocation'] == ThrottleAllocation.STATIC,
+                lower=0.0,
+                upper=1.0,
+            )
+
+        ##################
+        # Add Timeseries #
+        ##################
+        phase.add_timeseries_output('time', units='s')
+        phase.add_timeseries_output(Dynamic.Mission.DISTANCE, units='m')
+        phase.add_timeseries_output(Dynamic.Mission.ALTITUDE, units='ft')
+        phase.add_timeseries_output(Dynamic.Atmosphere.MACH, units='unitless')
+
+        for name, units in (
+            (Dynamic.Vehicle.Propulsion.THRUST_TOTAL, 'lbf'),
+            (Dynamic.Vehicle.DRAG, 'lbf'),
+            (Dynamic.Mission.SPECIFIC_ENERGY_RATE_EXCESS, 'm/s'),
+            (Dynamic.Vehicle.Propulsion.FUEL_FLOW_RATE_NEGATIVE_TOTAL, 'lbm/h'),
+            (Dynamic.Vehicle.Propulsion.ELECTRIC_POWER_IN_TOTAL, 'kW'),
+            (Dynamic.Mission.ALTITUDE_RATE, 'ft/s'),
+            (Dynamic.Vehicle.Propulsion.THROTTLE, 'unitless'),
+            (Dynamic.Mission.VELOCITY, 'm/s'),
+        ):
+            phase.add_timeseries_output(name, output_name=name, units=units)
+
+        ###################
+        # Add Constraints #
+        ###################
+        duration_bounds, duration_units = user_options['duration_bounds']
+
+        if duration_bounds is not None and any(bound is not None for bound in duration_bounds):
+            # The duration of the cruise follows from the fuel burned, so its bounds are
+            # enforced with a constraint.
+            phase.add_boundary_constraint(
+                'elapsed_time',
+                loc='final',
+                lower=duration_bounds[0],
+                upper=duration_bounds[1],
+                units=duration_units,
+                ref=duration_bounds[1],
+            )
+
+        if throttle_enforcement == 'boundary_constraint':
+            for loc in ('initial', 'final'):
+                phase.add_boundary_constraint(
+                    Dynamic.Vehicle.Propulsion.THROTTLE,
+                    loc=loc,
+                    lower=0.0,
+                    upper=1.0,
+                    units='unitless',
+                )
+
+        elif throttle_enforcement == 'path_constraint':
+            phase.add_path_constraint(
+                Dynamic.Vehicle.Propulsion.THROTTLE,
+                lower=0.0,
+                upper=1.0,
+                units='unitless',
+            )
+
+        # 'bounded' is enforced by the bounds on the throttle balance of the ODE, which the
+        # line search of its Newton solver respects, so it needs no constraint here.
+
+        return phase
+
+    def _extra_ode_init_kwargs(self):
+        """Return extra kwargs required for initializing the ODE."""
+        return {
+            'external_subsystems': self.external_subsystems,
+            'meta_data': self.meta_data,
+            'subsystem_options': self.subsystem_options,
+            'throttle_enforcement': self.user_options['throttle_enforcement'],
+            'throttle_allocation': self.user_options['throttle_allocation'],
+        }
+
+
+BreguetCruisePhase._add_initial_guess_meta_data(
+    InitialGuessIntegrationVariable(),
+    desc='initial guess for initial time and duration specified as a tuple',
+)
+
+BreguetCruisePhase._add_initial_guess_meta_data(
+    InitialGuessState('mass'), desc='initial guess for initial mass and change in mass'
+)
+
+BreguetCruisePhase._add_initial_guess_meta_data(
+    InitialGuessState('initial_distance'), desc='initial guess for initial_distance'
+)
+
+BreguetCruisePhase._add_initial_guess_meta_data(
+    InitialGuessState('initial_time'), desc='initial guess for initial_time'
+)
@@ -2828,6 +2828,7 @@ class TakeoffTrajectory:
         self._brake_to_abort = None
 
         self._phases = {}
+        self._branches = {}
         self._traj = None
 
     def get_phase_names(self):
@@ -2836,6 +2837,20 @@ class TakeoffTrajectory:
 
         return keys
 
+    def get_branches(self):
+        """
+        Return the base names of the phases in each independent branch of the trajectory.
+
+        The 'takeoff' branch holds the phases from brake release to the end of the
+        continued takeoff, which is flown with an engine out in a balanced field length
+        trajectory. If the aborted takeoff phases were assigned, the 'abort' branch holds
+        them. The branches are only coupled through linkage constraints, so they
+        can be evaluated at the same time.
+
+        Call only after `build_trajectory()`.
+        """
+        return {branch: list(names) for branch, names in self._branches.items()}
+
     def get_phase(self, key) -> dm.Phase:
         """
         Return the phase associated with the specified base name.
@@ -2948,7 +2963,12 @@ class TakeoffTrajectory:
         self._balanced_field_ref = balanced_field_ref
 
     def build_trajectory(
-        self, *, aviary_options: AviaryValues, model: om.Group = None, traj: dm.Trajectory = None
+        self,
+        *,
+        aviary_options: AviaryValues,
+        model: om.Group = None,
+        traj: dm.Trajectory = None,
+        parallel_branches=True,
     ) -> dm.Trajectory:
         """
         Return a new trajectory for detailed takeoff analysis.
@@ -2968,6 +2988,12 @@ class TakeoffTrajectory:
             the trajectory to update; if `None`, a new trajetory will be updated and
             returned
 
+        parallel_branches : bool (True)
+            if True, the phases of each independent branch (see `get_branches()`) are
+            assigned to their own MPI processor group, so that the continued and aborted
+            takeoff are evaluated concurrently when the phases of the trajectory run in
+            parallel under MPI; this has no effect when running on a single process
+
         Returns
         -------
         the updated trajectory; if the specified trajectory is `None`, a new trajectory
@@ -2978,13 +3004,16 @@ class TakeoffTrajectory:
         Do not modify this object or any of its referenced data between the call to
         `build_trajectory()` and the call to `apply_initial_guesses()`, or the behavior
         is undefined, no diagnostic required.
+
+        Phases in different branches are only linked with constraints, never with direct
+        connections, so no solver is needed to converge the trajectory across processors.
         """
         if traj is None:
-            traj = dm.Trajectory()
+            traj = dm.Trajectory(parallel_phases=parallel_branches)
 
         self._traj = traj
 
-        self._add_phases(aviary_options)
+        self._add_phases(aviary_options, parallel_branches)
         self._link_phases()
 
         if model is not None:
@@ -3044,36 +3073,45 @@ class TakeoffTrajectory:
 
         return not_applied
 
-    def _add_phases(self, aviary_options: AviaryValues):
+    def _add_phases(self, aviary_options: AviaryValues, parallel_branches=True):
         self._phases = {}
 
-        self._add_phase(self._brake_release_to_decision_speed, aviary_options)
-
-        self._add_phase(self._decision_speed_to_rotate, aviary_options)
-
-        self._add_phase(self._rotate_to_liftoff, aviary_options)
-
-        self._add_phase(self._liftoff_to_obstacle, aviary_options)
-
-        obstacle_to_mic_p2 = self._obstacle_to_mic_p2
-
-        if obstacle_to_mic_p2 is not None:
-            self._add_phase(obstacle_to_mic_p2, aviary_options)
-
-            self._add_phase(self._mic_p2_to_engine_cutback, aviary_options)
-
-            self._add_phase(self._engine_cutback, aviary_options)
-
-            self._add_phase(self._engine_cutback_to_mic_p1, aviary_options)
-
-            self._add_phase(self._mic_p1_to_climb, aviary_options)
-
-        decision_speed_to_brake = self._decision_speed_to_brake
-
-        if decision_speed_to_brake is not None:
-            self._add_phase(decision_speed_to_brake, aviary_options)
-
-            self._add_phase(self._brake_to_abort, aviary_options)
+        takeoff = [
+            self._brake_release_to_decision_speed,
+            self._decision_speed_to_rotate,
+            self._rotate_to_liftoff,
+            self._liftoff_to_obstacle,
+        ]
+
+        if self._obstacle_to_mic_p2 is not None:
+            takeoff += [
+                self._obstacle_to_mic_p2,
+                self._mic_p2_to_engine_cutback,
+                self._engine_cutback,
+                self._engine_cutback_to_mic_p1,
+                self._mic_p1_to_climb,
+            ]
+
+        branches = {'takeoff': takeoff}
+
+        if self._decision_speed_to_brake is not None:
+            branches['abort'] = [self._decision_speed_to_brake, self._brake_to_abort]
+
+        self._branches = {
+            branch: [phase_builder.name for phase_builder in phase_builders]
+            for branch, phase_builders in branches.items()
+        }
+
+        for branch, phase_builders in branches.items():
+            if parallel_branches and len(branches) > 1:
+                # all phases sharing a proc_group must have the same weight; weighting
+                # by the number of phases gives longer branches more processors
+                proc_kwargs = {'proc_group': branch, 'proc_weight': float(len(phase_builders))}
+            else:
+                proc_kwargs = {}
+
+            for phase_builder in phase_builders:
+                self._add_phase(phase_builder, aviary_options, **proc_kwargs)
 
     def _link_phases(self):
         traj: dm.Trajectory = self._traj
@@ -3143,10 +3181,10 @@ class TakeoffTrajectory:
                 ref=self._balanced_field_ref,
             )
 
-    def _add_phase(self, phase_builder: PhaseBuilderBase, aviary_options: AviaryValues):
+    def _add_phase(self, phase_builder: PhaseBuilderBase, aviary_options: AviaryValues, **kwargs):
         name = phase_builder.name
         phase = phase_builder.build_phase(aviary_options)
 
-        self._traj.add_phase(name, phase)
+        self._traj.add_phase(name, phase, **kwargs)
 
         self._phases[name] = self.MappedPhase(phase, phase_builder)
@@ -30,10 +30,36 @@ class GroundrollPhaseOptions(AviaryOptionsDictionary):
 
         self.declare(
             name='order',
-            types=int,
+            types=(int, list),
             default=3,
             desc='The order of polynomials for interpolation in the transcription '
-            'created in Dymos. The default value is 3.',
+            'created in Dymos, either one for all segments or a list with one per segment. '
+            'The default value is 3.',
+        )
+
+        self.declare(
+            name='segment_ends',
+            types=list,
+            default=None,
+            desc='Locations of the segment boundaries in the transcription created in Dymos, '
+            'normalized to the range [-1, 1]. If None, the default spacing is used.',
+        )
+
+        self.declare(
+            name='transcription',
+            values=['radau', 'gauss-lobatto', 'birkhoff'],
+            default='radau',
+            desc='The transcription created in Dymos: Radau pseudospectral (the default), '
+            'Gauss-Lobatto, or Birkhoff. The Birkhoff transcription uses a single segment '
+            'with num_segments * order + 1 nodes unless transcription_options says otherwise.',
+        )
+
+        self.declare(
+            name='transcription_options',
+            types=dict,
+            default=None,
+            desc='Options passed to the transcription created in Dymos, which override the '
+            "ones set from the other user_options, such as {'grid_type': 'lgl'} for Birkhoff.",
         )
 
         self.declare(
@@ -207,18 +233,7 @@ class GroundrollPhase(PhaseBuilderBase):
 
     def make_default_transcription(self):
         """Return a transcription object to be used by default in build_phase."""
-        user_options = self.user_options
-
-        num_segments = user_options['num_segments']
-        order = user_options['order']
-
-        seg_ends, _ = dm.utils.lgl.lgl(num_segments + 1)
-
-        transcription = dm.Radau(
-            num_segments=num_segments, order=order, compressed=True, segment_ends=seg_ends
-        )
-
-        return transcription
+        return self._make_transcription(lgl_segment_ends=True)
 
     def _extra_ode_init_kwargs(self):
         """Return extra kwargs required for initializing the ODE."""
@@ -0,0 +1,120 @@
+import unittest
+from copy import deepcopy
+
+import numpy as np
+from openmdao.utils.assert_utils import assert_near_equal
+from openmdao.utils.testing_utils import use_tempdirs
+
+from aviary.interface.default_phase_info.height_energy import phase_info
+from aviary.interface.methods_for_level1 import run_aviary
+from aviary.interface.methods_for_level2 import AviaryProblem
+from aviary.variable_info.variables import Dynamic, Mission
+
+
+def _analytic_phase_info(**cruise_options):
+    local_phase_info = deepcopy(phase_info)
+    local_phase_info['cruise']['user_options'] = {
+        'analytic': True,
+        'num_nodes': 5,
+        'initial_mach': (0.72, 'unitless'),
+        'final_mach': (0.72, 'unitless'),
+        'initial_altitude': (32000.0, 'ft'),
+        'final_altitude': (34000.0, 'ft'),
+        'duration_bounds': ((56.5, 169.5), 'min'),
+    }
+    local_phase_info['cruise']['user_options'].update(cruise_options)
+
+    return local_phase_info
+
+
+def _link_phases(local_phase_info):
+    prob = AviaryProblem(verbosity=0)
+    prob.load_inputs('models/test_aircraft/aircraft_for_bench_FwFm.csv', local_phase_info)
+    prob.check_and_preprocess_inputs()
+    prob.add_pre_mission_systems()
+    prob.add_phases()
+    prob.add_post_mission_systems()
+    prob.link_phases()
+
+    return prob
+
+
+@use_tempdirs
+class BreguetCruisePhaseTest(unittest.TestCase):
+    def test_height_energy_mission(self):
+        local_phase_info = _analytic_phase_info()
+
+        prob = run_aviary(
+            'models/test_aircraft/aircraft_for_bench_FwFm.csv',
+            local_phase_info,
+            optimizer='SLSQP',
+            max_iter=50,
+            make_plots=False,
+            verbosity=0,
+        )
+
+        self.assertTrue(prob.problem_ran_successfully)
+
+        # The collocated cruise of the same mission burns 22515 lbm.
+        assert_near_equal(prob.get_val(Mission.Summary.FUEL_BURNED, units='lbm'), 22513.0, 1e-3)
+
+        # The cruise is linked to the climb and descent like a collocated phase.
+        for name, units in (
+            ('time', 'min'),
+            (Dynamic.Vehicle.MASS, 'lbm'),
+            (Dynamic.Mission.DISTANCE, 'NM'),
+        ):
+            climb = prob.get_val(f'traj.climb.timeseries.{name}', units=units)
+            cruise = prob.get_val(f'traj.cruise.timeseries.{name}', units=units)
+            descent = prob.get_val(f'traj.descent.timeseries.{name}', units=units)
+
+            assert_near_equal(cruise[0], climb[-1], 1e-6)
+            assert_near_equal(descent[0], cruise[-1], 1e-6)
+
+        assert_near_equal(
+            prob.get_val('traj.cruise.timeseries.altitude', units='ft')[[0, -1]],
+            [[32000.0], [34000.0]],
+            1e-10,
+        )
+        self.assertEqual(prob.get_val('traj.cruise.timeseries.throttle').size, 5)
+
+    def test_mismatched_altitude(self):
+        local_phase_info = _analytic_phase_info(initial_altitude=(31000.0, 'ft'))
+
+        with self.assertRaises(ValueError) as cm:
+            _link_phases(local_phase_info)
+
+        self.assertIn('"climb" ends at altitude 32000.0 ft', str(cm.exception))
+
+    def test_optimized_neighbour_linkage(self):
+        local_phase_info = _analytic_phase_info()
+        local_phase_info['climb']['user_options']['optimize_mach'] = True
+        local_phase_info['descent']['user_options']['optimize_altitude'] = True
+
+        prob = _link_phases(local_phase_info)
+        linkages = prob.traj._linkages
+
+        self.assertIn(('mach', 'mach'), linkages['climb', 'cruise'])
+        self.assertNotIn(('altitude', 'altitude'), linkages['climb', 'cruise'])
+        self.assertIn(('altitude', 'altitude'), linkages['cruise', 'descent'])
+        self.assertNotIn(('mach', 'mach'), linkages['cruise', 'descent'])
+        self.assertFalse(linkages['cruise', 'descent']['altitude', 'altitude']['connected'])
+
+    def test_bounded_throttle(self):
+        local_phase_info = _analytic_phase_info(throttle_enforcement='bounded')
+
+        prob = _link_phases(local_phase_info)
+        prob.setup()
+
+        cruise = prob.model.traj.phases.cruise
+        meta = cruise.get_io_metadata(
+            iotypes='output', metadata_keys=['lower', 'upper'], return_rel_names=False
+        )
+        throttle = meta[f'{cruise.pathname}.rhs.solver_sub.throttle_balance.throttle']
+
+        assert_near_equal(throttle['lower'], np.zeros(5))
+        assert_near_equal(throttle['upper'], np.ones(5))
+
+
+if __name__ == '__main__':
+    unittest.main()
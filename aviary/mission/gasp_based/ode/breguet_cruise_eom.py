@@ -1,3 +1,5 @@
+from abc import ABC, abstractmethod
+
 import numpy as np
 import openmdao.api as om
 
@@ -5,8 +7,32 @@ from aviary.constants import GRAV_ENGLISH_LBM
 from aviary.variable_info.variables import Dynamic
 
 
-class RangeComp(om.ExplicitComponent):
-    """Compute the cruise range and time for the breguet range component."""
+class _CruiseRangeBase(om.ImplicitComponent, ABC):
+    """
+    Base class of the components that accumulate the cruise range and time node by node.
+
+    Subclasses compute the change in range across each two-node pair (dR), which depends only
+    on the inputs at the two nodes of the pair. Accumulating dR with np.cumsum would make
+    every output depend on all the previous nodes, with a dense lower-triangular Jacobian.
+    Instead, the range is an implicit output with the prefix-sum residuals
+
+        R_range[0] = range[0] - range_initial
+        R_range[i] = range[i] - range[i - 1] - dR[i - 1]
+
+    and the time at each node is that range divided by the average airspeed of the pair
+    that ends at the node:
+
+        R_time[0] = time[0] - time_initial
+        R_time[i] = time[i] - time_initial - (range[i] - range_initial) / vx_m[i - 1]
+
+    All the partials are then on a few diagonals, so their size and the cost of computing
+    them grow linearly with num_nodes. The outputs are computed explicitly in
+    solve_nonlinear, and the bidiagonal system is solved by a cumulative sum in
+    solve_linear, so no solver is needed.
+    """
+
+    # Names of the inputs, other than TAS_cruise, that dR depends on.
+    _pair_inputs = ()
 
     def initialize(self):
         self.options.declare('num_nodes', types=int)
@@ -23,20 +49,10 @@ class RangeComp(om.ExplicitComponent):
             units='NM',
             desc='range reference at which cruise begins',
         )
-
         self.add_input('TAS_cruise', val=0.0001 * np.ones(nn), units='NM/s', desc='true airspeed')
-        self.add_input(
-            'mass',
-            val=150000 * np.ones(nn),
-            units='lbm',
-            desc='mass at each node, monotonically nonincreasing',
-        )
 
-        self.add_input(
-            Dynamic.Vehicle.Propulsion.FUEL_FLOW_RATE_NEGATIVE_TOTAL,
-            0.74 * np.ones(nn),
-            units='lbm/h',
-        )
+    def _add_outputs(self):
+        nn = self.options['num_nodes']
 
         self.add_output(
             'cruise_time',
@@ -55,71 +71,155 @@ class RangeComp(om.ExplicitComponent):
 
     def setup_partials(self):
         nn = self.options['num_nodes']
+        ar = np.arange(nn)
 
-        # The nonzero partials of the change in range between each two nodes (dr) wrt fuel flow and mass are
-        # along two diagonals. The lower diagonal contains the partials wrt the initial values of mass or fuel
-        # flow across each two-node section. The upper diagonal contains the partials wrt the final values of mass
-        # or fuel flow across each two-node section. For instance, for five nodes we have:
+        # The change in range across each two-node pair depends on the inputs at the
+        # initial (i) and final (f) node of the pair. For instance, for five nodes:
         #
-        #           0  0  0  0  0
-        #           i  f  0  0  0
-        # ddR/dW =  0  i  f  0  0
-        #           0  0  i  f  0
-        #           0  0  0  i  f
-        #
-        # The change of range and time at the first node is zero, and it has no dependence on the mass
-        # history or fuel flow setting.
-        # Since dR is the difference in range between two nodes, we need to accumulate it across all provided masses
-        # using np.cumsum.
-        # The partial derivative of np.cumsum is just a lower triangular matrix of ones.
-        # Thus, the derivative of the accumulated range (and time) will be the matrix product:
-        #           1  0  0  0  0     0  0  0  0  0
-        #           1  1  0  0  0     i  f  0  0  0
-        # ddR/dW =  1  1  1  0  0  @  0  i  f  0  0
-        #           1  1  1  1  0     0  0  i  f  0
-        #           1  1  1  1  1     0  0  0  i  f
-        rs, cs = np.tril_indices(nn)
-        self._tril_rs, self._tril_cs = rs, cs
+        #                   0  0  0  0  0
+        #                   i  f  0  0  0
+        # dR_range/dx =  -  0  i  f  0  0
+        #                   0  0  i  f  0
+        #                   0  0  0  i  f
+        pair_rows = np.concatenate((ar[1:], ar[1:]))
+        pair_cols = np.concatenate((ar[:-1], ar[1:]))
 
         self.declare_partials(
             'cruise_range',
-            [
-                Dynamic.Vehicle.Propulsion.FUEL_FLOW_RATE_NEGATIVE_TOTAL,
-                'mass',
-                'TAS_cruise',
-            ],
-            rows=rs,
-            cols=cs,
+            ['TAS_cruise', *self._pair_inputs],
+            rows=pair_rows,
+            cols=pair_cols,
+        )
+        self.declare_partials(
+            'cruise_range', 'cruise_distance_initial', rows=[0], cols=[0], val=-1.0
         )
+        self.declare_partials(
+            'cruise_range',
+            'cruise_range',
+            rows=np.concatenate((ar, ar[1:])),
+            cols=np.concatenate((ar, ar[:-1])),
+            val=np.concatenate((np.ones(nn), -np.ones(nn - 1))),
+        )
+
+        self.declare_partials('cruise_time', 'TAS_cruise', rows=pair_rows, cols=pair_cols)
+        self.declare_partials('cruise_time', 'cruise_time_initial', val=-1.0)
+        self.declare_partials('cruise_time', 'cruise_time', rows=ar, cols=ar, val=1.0)
+        self.declare_partials('cruise_time', 'cruise_range', rows=ar[1:], cols=ar[1:])
         self.declare_partials(
             'cruise_time',
-            [
-                Dynamic.Vehicle.Propulsion.FUEL_FLOW_RATE_NEGATIVE_TOTAL,
-                'mass',
-                'TAS_cruise',
-            ],
-            rows=rs,
-            cols=cs,
+            'cruise_distance_initial',
+            rows=ar[1:],
+            cols=np.zeros(nn - 1, dtype=int),
         )
 
-        self.declare_partials('cruise_range', 'cruise_distance_initial', val=1.0)
-        self.declare_partials('cruise_time', 'cruise_time_initial', val=1.0)
+        # Average airspeed across each two-node pair, saved by linearize for solve_linear.
+        self._vx_m = np.ones(nn - 1)
+
+    @abstractmethod
+    def _delta_range(self, inputs):
+        """Return the change in range (NM) across each two-node pair."""
 
-        # Allocated memory so we don't have to repeatedly do it in compute_partials
-        # Note: since these are only used in compute_partials we don't have to worry about them supporting
-        # complex values under complex step.
-        self._d_cumsum_dx = np.tri(nn)
-        # Note: We could make this sparse, probably doesn't matter.
-        self._scratch_nn_x_nn = np.zeros((nn, nn))
+    @abstractmethod
+    def _delta_range_partials(self, inputs):
+        """
+        Return the partials of the change in range across each two-node pair.
 
-    def compute(self, inputs, outputs):
+        Returns
+        -------
+        dict
+            For each name in _pair_inputs and TAS_cruise, a tuple of the partials with
+            respect to the values at the initial and at the final node of each pair.
+        """
+
+    def apply_nonlinear(self, inputs, outputs, residuals):
+        v_x = inputs['TAS_cruise']
+        vx_m = (v_x[:-1] + v_x[1:]) / 2  # Average airspeed across each two-node pair.
+        r0 = inputs['cruise_distance_initial'][0]
+        t0 = inputs['cruise_time_initial'][0]
+        cruise_range = outputs['cruise_range']
+        cruise_time = outputs['cruise_time']
+
+        residuals['cruise_range'][0] = cruise_range[0] - r0
+        residuals['cruise_range'][1:] = (
+            cruise_range[1:] - cruise_range[:-1] - self._delta_range(inputs)
+        )
+        residuals['cruise_time'][0] = cruise_time[0] - t0
+        residuals['cruise_time'][1:] = cruise_time[1:] - t0 - (cruise_range[1:] - r0) / vx_m
+
+    def solve_nonlinear(self, inputs, outputs):
+        v_x = inputs['TAS_cruise']
+        vx_m = (v_x[:-1] + v_x[1:]) / 2  # Average airspeed across each two-node pair.
+        r0 = inputs['cruise_distance_initial'][0]
+        t0 = inputs['cruise_time_initial'][0]
+
+        drange_cruise = np.cumsum(self._delta_range(inputs))
+
+        outputs['cruise_range'][0] = r0
+        outputs['cruise_range'][1:] = r0 + drange_cruise
+        outputs['cruise_time'][0] = t0
+        outputs['cruise_time'][1:] = t0 + drange_cruise / vx_m
+
+    def linearize(self, inputs, outputs, J):
+        v_x = inputs['TAS_cruise']
+        vx_m = (v_x[:-1] + v_x[1:]) / 2  # Average airspeed across each two-node pair.
+        r0 = inputs['cruise_distance_initial'][0]
+
+        for name, (d_dx1, d_dx2) in self._delta_range_partials(inputs).items():
+            J['cruise_range', name] = -np.concatenate((d_dx1, d_dx2))
+
+        dtime_dvx = 0.5 * (outputs['cruise_range'][1:] - r0) / vx_m**2
+        J['cruise_time', 'TAS_cruise'] = np.concatenate((dtime_dvx, dtime_dvx))
+        J['cruise_time', 'cruise_range'] = -1.0 / vx_m
+        J['cruise_time', 'cruise_distance_initial'] = 1.0 / vx_m
+
+        self._vx_m = vx_m.real
+
+    def solve_linear(self, d_outputs, d_residuals, mode):
+        vx_m = self._vx_m
+
+        if mode == 'fwd':
+            d_range = np.cumsum(d_residuals['cruise_range'])
+            d_outputs['cruise_range'] = d_range
+            d_outputs['cruise_time'] = d_residuals['cruise_time']
+            d_outputs['cruise_time'][1:] += d_range[1:] / vx_m
+
+        else:
+            d_time = d_outputs['cruise_time']
+            d_range = d_outputs['cruise_range'].copy()
+            d_range[1:] += d_time[1:] / vx_m
+            d_residuals['cruise_time'] = d_time
+            d_residuals['cruise_range'] = np.cumsum(d_range[::-1])[::-1]
+
+
+class RangeComp(_CruiseRangeBase):
+    """Compute the cruise range and time for the breguet range component."""
+
+    _pair_inputs = ('mass', Dynamic.Vehicle.Propulsion.FUEL_FLOW_RATE_NEGATIVE_TOTAL)
+
+    def setup(self):
+        nn = self.options['num_nodes']
+
+        super().setup()
+
+        self.add_input(
+            'mass',
+            val=150000 * np.ones(nn),
+            units='lbm',
+            desc='mass at each node, monotonically nonincreasing',
+        )
+
+        self.add_input(
+            Dynamic.Vehicle.Propulsion.FUEL_FLOW_RATE_NEGATIVE_TOTAL,
+            0.74 * np.ones(nn),
+            units='lbm/h',
+        )
+
+        self._add_outputs()
+
+    def _delta_range(self, inputs):
         v_x = inputs['TAS_cruise']
         m = inputs['mass']
         FF = -inputs[Dynamic.Vehicle.Propulsion.FUEL_FLOW_RATE_NEGATIVE_TOTAL]
-        r0 = inputs['cruise_distance_initial']
-        t0 = inputs['cruise_time_initial']
-        r0 = r0[0]
-        t0 = t0[0]
 
         FF_1 = FF[:-1]  # Initial fuel flow across each two-node pair
         FF_2 = FF[1:]  # Final fuel flow across each two-node pair
@@ -131,24 +231,17 @@ class RangeComp(om.ExplicitComponent):
 
         vx_1 = v_x[:-1]  # Initial airspeed across each two-node pair
         vx_2 = v_x[1:]  # Final airspeed across each two-node pair
-        vx_m = (vx_1 + vx_2) / 2  # Average airspeed across each two-node pair.
 
         breg_1 = vx_1 * W1 * 3600 / FF_1
         breg_2 = vx_2 * W2 * 3600 / FF_2
         bregA = (breg_1 + breg_2) / 2
 
-        drange_cruise = bregA * np.log(1.0 / (1.0 - (W1 - W2) / W1))
+        return bregA * np.log(1.0 / (1.0 - (W1 - W2) / W1))
 
-        outputs['cruise_range'][0] = r0
-        outputs['cruise_range'][1:] = r0 + np.cumsum(drange_cruise)
-        outputs['cruise_time'][0] = t0
-        outputs['cruise_time'][1:] = t0 + np.cumsum(drange_cruise) / vx_m
-
-    def compute_partials(self, inputs, J):
+    def _delta_range_partials(self, inputs):
         v_x = inputs['TAS_cruise']
         vx_1 = v_x[:-1]  # Initial airspeed across each two-node pair
         vx_2 = v_x[1:]  # Final airspeed across each two-node pair
-        vx_m = (vx_1 + vx_2) / 2  # Average airspeed across each two-node pair.
 
         m = inputs['mass']
         # Initial mass across each two-node pair
@@ -189,84 +282,32 @@ class RangeComp(om.ExplicitComponent):
         dRange_dFF1 = dBregA_dFF1 * star
         dRange_dFF2 = dBregA_dFF2 * star
 
-        # Partials of cruise_range
-
-        # WRT Fuel Flow
-        np.fill_diagonal(self._scratch_nn_x_nn[1:, :-1], dRange_dFF1)
-        np.fill_diagonal(self._scratch_nn_x_nn[1:, 1:], dRange_dFF2)
+        # dRange_dm = dRange_dW * dW_dm
+        return {
+            'TAS_cruise': (dRange_dVx1, dRange_dVx2),
+            'mass': (dRange_dW1 * GRAV_ENGLISH_LBM, dRange_dW2 * GRAV_ENGLISH_LBM),
+            Dynamic.Vehicle.Propulsion.FUEL_FLOW_RATE_NEGATIVE_TOTAL: (dRange_dFF1, dRange_dFF2),
+        }
 
-        J['cruise_range', Dynamic.Vehicle.Propulsion.FUEL_FLOW_RATE_NEGATIVE_TOTAL][...] = (
-            self._d_cumsum_dx @ self._scratch_nn_x_nn
-        )[self._tril_rs, self._tril_cs]
 
-        # WRT Mass: dRange_dm = dRange_dW * dW_dm
-        np.fill_diagonal(self._scratch_nn_x_nn[1:, :-1], dRange_dW1 * GRAV_ENGLISH_LBM)
-        np.fill_diagonal(self._scratch_nn_x_nn[1:, 1:], dRange_dW2 * GRAV_ENGLISH_LBM)
-
-        J['cruise_range', 'mass'][...] = (self._d_cumsum_dx @ self._scratch_nn_x_nn)[
-            self._tril_rs, self._tril_cs
-        ]
-
-        # WRT TAS_cruise
-        np.fill_diagonal(self._scratch_nn_x_nn[1:, :-1], dRange_dVx1)
-        np.fill_diagonal(self._scratch_nn_x_nn[1:, 1:], dRange_dVx2)
-
-        J['cruise_range', 'TAS_cruise'][...] = (self._d_cumsum_dx @ self._scratch_nn_x_nn)[
-            self._tril_rs, self._tril_cs
-        ]
-
-        # Partials of cruise_time
-
-        # Here we need to multiply rows [1:] of the jacobian by (6076.1 / vx_m)
-        # But the jacobian is in a flat format in row-major order. The rows associated
-        # with the nonzero elements are stored in self._tril_rs.
-
-        J['cruise_time', Dynamic.Vehicle.Propulsion.FUEL_FLOW_RATE_NEGATIVE_TOTAL][1:] = (
-            J['cruise_range', Dynamic.Vehicle.Propulsion.FUEL_FLOW_RATE_NEGATIVE_TOTAL][1:]
-            / vx_m[self._tril_rs[1:] - 1]
-        )
-        J['cruise_time', 'mass'][1:] = J['cruise_range', 'mass'][1:] / vx_m[self._tril_rs[1:] - 1]
-
-        drange_cruise = bregA * star
-
-        f = np.cumsum(drange_cruise)[:, np.newaxis]
-        df_du = self._d_cumsum_dx @ self._scratch_nn_x_nn
-
-        np.fill_diagonal(self._scratch_nn_x_nn[1:, :-1], 0.5)
-        np.fill_diagonal(self._scratch_nn_x_nn[1:, 1:], 0.5)
-
-        g = vx_m[:, np.newaxis]
-        dg_du = self._scratch_nn_x_nn
-
-        dt_dvx = ((df_du[1:, ...] * g) - (dg_du[1:, ...] * f)) / g**2
-
-        J['cruise_time', 'TAS_cruise'][1:] = dt_dvx[self._tril_rs[1:] - 1, self._tril_cs[1:]]
-
-
-class E_RangeComp(om.ExplicitComponent):
+class E_RangeComp(_CruiseRangeBase):
     """
     Compute the cruise range and time for all-electrical aircraft.
     Assume the battery mass does not change during the cruise.
     """
 
-    def initialize(self):
-        self.options.declare('num_nodes', types=int)
+    _pair_inputs = (
+        Dynamic.Vehicle.CUMULATIVE_ELECTRIC_ENERGY_USED,
+        Dynamic.Vehicle.Propulsion.ELECTRIC_POWER_IN_TOTAL,
+    )
 
     def setup(self):
         nn = self.options['num_nodes']
         if nn < 2:
             raise Exception('num_nodes should be at least 2.')
 
-        self.add_input(
-            'cruise_time_initial', val=0.0, units='s', desc='time at which cruise begins'
-        )
-        self.add_input(
-            'cruise_distance_initial',
-            val=0.0,
-            units='NM',
-            desc='range reference at which cruise begins',
-        )
-        self.add_input('TAS_cruise', val=0.0001 * np.ones(nn), units='NM/s', desc='true airspeed')
+        super().setup()
+
         self.add_input(
             Dynamic.Vehicle.CUMULATIVE_ELECTRIC_ENERGY_USED,
             10.0 * np.ones(nn),
@@ -280,88 +321,12 @@ class E_RangeComp(om.ExplicitComponent):
             desc='total energy consumption, comes from propulsion',
         )
 
-        self.add_output(
-            'cruise_time',
-            shape=(nn,),
-            units='s',
-            desc='time in cruise',
-            tags=['dymos.state_source:cruise_time'],
-        )
-        self.add_output(
-            'cruise_range',
-            shape=(nn,),
-            units='NM',
-            desc='cruise range',
-            tags=['dymos.state_source:distance'],
-        )
-
-    def setup_partials(self):
-        nn = self.options['num_nodes']
+        self._add_outputs()
 
-        # The nonzero partials of the change in range between each two nodes (dr) wrt fuel flow and mass are
-        # along two diagonals. The lower diagonal contains the partials wrt the initial values of mass or fuel
-        # flow across each two-node section. The upper diagonal contains the partials wrt the final values of mass
-        # or fuel flow across each two-node section. For instance, for five nodes we have:
-        #
-        #           0  0  0  0  0
-        #           i  f  0  0  0
-        # ddR/dW =  0  i  f  0  0
-        #           0  0  i  f  0
-        #           0  0  0  i  f
-        #
-        # The change of range and time at the first node is zero, and it has no dependence on the mass
-        # history or fuel flow setting.
-        # Since dR is the difference in range between two nodes, we need to accumulate it across all provided masses
-        # using np.cumsum.
-        # The partial derivative of np.cumsum is just a lower triangular matrix of ones.
-        # Thus, the derivative of the accumulated range (and time) will be the matrix product:
-        #           1  0  0  0  0     0  0  0  0  0
-        #           1  1  0  0  0     i  f  0  0  0
-        # ddR/dW =  1  1  1  0  0  @  0  i  f  0  0
-        #           1  1  1  1  0     0  0  i  f  0
-        #           1  1  1  1  1     0  0  0  i  f
-        rs, cs = np.tril_indices(nn)
-        self._tril_rs, self._tril_cs = rs, cs
-
-        self.declare_partials(
-            'cruise_range',
-            [
-                Dynamic.Vehicle.CUMULATIVE_ELECTRIC_ENERGY_USED,
-                Dynamic.Vehicle.Propulsion.ELECTRIC_POWER_IN_TOTAL,
-                'TAS_cruise',
-            ],
-            rows=rs,
-            cols=cs,
-        )
-        self.declare_partials(
-            'cruise_time',
-            [
-                Dynamic.Vehicle.CUMULATIVE_ELECTRIC_ENERGY_USED,
-                Dynamic.Vehicle.Propulsion.ELECTRIC_POWER_IN_TOTAL,
-                'TAS_cruise',
-            ],
-            rows=rs,
-            cols=cs,
-        )
-
-        self.declare_partials('cruise_range', 'cruise_distance_initial', val=1.0)
-        self.declare_partials('cruise_time', 'cruise_time_initial', val=1.0)
-
-        # Allocated memory so we don't have to repeatedly do it in compute_partials
-        # Note: since these are only used in compute_partials we don't have to worry about them supporting
-        # complex values under complex step.
-        self._d_cumsum_dx = np.tri(nn)
-        # Note: We could make this sparse, probably doesn't matter.
-        self._scratch_nn_x_nn = np.zeros((nn, nn))
-
-    def compute(self, inputs, outputs):
+    def _delta_range(self, inputs):
         v_x = inputs['TAS_cruise']
         EE = inputs[Dynamic.Vehicle.CUMULATIVE_ELECTRIC_ENERGY_USED]
         EP = inputs[Dynamic.Vehicle.Propulsion.ELECTRIC_POWER_IN_TOTAL]
-        r0 = inputs['cruise_distance_initial']
-        t0 = inputs['cruise_time_initial']
-        r0 = r0[0]
-        t0 = t0[0]
 
         # All-electric version
         E_1 = EE[:-1]  # Initial energy across each two-node pair, kW*h
@@ -371,22 +336,16 @@ class E_RangeComp(om.ExplicitComponent):
 
         vx_1 = v_x[:-1]  # Initial airspeed across each two-node pair, NM/s
         vx_2 = v_x[1:]  # Final airspeed across each two-node pair
-        vx_m = (vx_1 + vx_2) / 2  # Average airspeed across each two-node pair.
 
         e_breg_1 = vx_1 * E_1 * 3600 / P_1  # NM
         e_breg_2 = vx_2 * E_2 * 3600 / P_2
-        e_drange_cruise = e_breg_2 - e_breg_1
 
-        outputs['cruise_range'][0] = r0
-        outputs['cruise_range'][1:] = r0 + np.cumsum(e_drange_cruise)
-        outputs['cruise_time'][0] = t0
-        outputs['cruise_time'][1:] = t0 + np.cumsum(e_drange_cruise) / vx_m
+        return e_breg_2 - e_breg_1
 
-    def compute_partials(self, inputs, J):
+    def _delta_range_partials(self, inputs):
         v_x = inputs['TAS_cruise']
         vx_1 = v_x[:-1]  # Initial airspeed across each two-node pair
         vx_2 = v_x[1:]  # Final airspeed across each two-node pair
-        vx_m = (vx_1 + vx_2) / 2  # Average airspeed across each two-node pair.
 
         e = inputs[Dynamic.Vehicle.CUMULATIVE_ELECTRIC_ENERGY_USED]
         # Initial energy across each two-node pair
@@ -397,10 +356,6 @@ class E_RangeComp(om.ExplicitComponent):
         EP_1 = EP[:-1]  # Initial power across each two-node pair
         EP_2 = EP[1:]  # Final power across each two-node pair
 
-        e_breg_1 = vx_1 * E_1 * 3600 / EP_1
-        e_breg_2 = vx_2 * E_2 * 3600 / EP_2
-        e_drange_cruise = e_breg_2 - e_breg_1
-
         dBreg1_dVx1 = E_1 * 3600 / EP_1
         dBreg1_dE1 = vx_1 * 3600 / EP_1
         dBreg1_dP1 = -vx_1 * E_1 * 3600 / EP_1**2
@@ -409,63 +364,8 @@ class E_RangeComp(om.ExplicitComponent):
         dBreg2_dE2 = vx_2 * 3600 / EP_2
         dBreg2_dP2 = -vx_2 * E_2 * 3600 / EP_2**2
 
-        dRange_dVx1 = -dBreg1_dVx1
-        dRange_dVx2 = dBreg2_dVx2
-        dRange_dE1 = -dBreg1_dE1
-        dRange_dE2 = dBreg2_dE2
-        dRange_dP1 = -dBreg1_dP1
-        dRange_dP2 = dBreg2_dP2
-
-        # Partials of cruise_range
-
-        # WRT electric power
-        np.fill_diagonal(self._scratch_nn_x_nn[1:, :-1], dRange_dP1)
-        np.fill_diagonal(self._scratch_nn_x_nn[1:, 1:], dRange_dP2)
-
-        J['cruise_range', Dynamic.Vehicle.Propulsion.ELECTRIC_POWER_IN_TOTAL][...] = (
-            self._d_cumsum_dx @ self._scratch_nn_x_nn
-        )[self._tril_rs, self._tril_cs]
-
-        # WRT CUMULATIVE_ELECTRIC_ENERGY_USED:
-        np.fill_diagonal(self._scratch_nn_x_nn[1:, :-1], dRange_dE1)
-        np.fill_diagonal(self._scratch_nn_x_nn[1:, 1:], dRange_dE2)
-
-        J['cruise_range', Dynamic.Vehicle.CUMULATIVE_ELECTRIC_ENERGY_USED][...] = (
-            self._d_cumsum_dx @ self._scratch_nn_x_nn
-        )[self._tril_rs, self._tril_cs]
-
-        # WRT TAS_cruise
-        np.fill_diagonal(self._scratch_nn_x_nn[1:, :-1], dRange_dVx1)
-        np.fill_diagonal(self._scratch_nn_x_nn[1:, 1:], dRange_dVx2)
-
-        J['cruise_range', 'TAS_cruise'][...] = (self._d_cumsum_dx @ self._scratch_nn_x_nn)[
-            self._tril_rs, self._tril_cs
-        ]
-
-        # Partials of cruise_time
-
-        # Here we need to multiply rows [1:] of the jacobian by (6076.1 / vx_m)
-        # But the jacobian is in a flat format in row-major order. The rows associated
-        # with the nonzero elements are stored in self._tril_rs.
-
-        J['cruise_time', Dynamic.Vehicle.Propulsion.ELECTRIC_POWER_IN_TOTAL][1:] = (
-            J['cruise_range', Dynamic.Vehicle.Propulsion.ELECTRIC_POWER_IN_TOTAL][1:]
-            / vx_m[self._tril_rs[1:] - 1]
-        )
-        J['cruise_time', Dynamic.Vehicle.CUMULATIVE_ELECTRIC_ENERGY_USED][1:] = (
-            J['cruise_range', Dynamic.Vehicle.CUMULATIVE_ELECTRIC_ENERGY_USED][1:]
-            / vx_m[self._tril_rs[1:] - 1]
-        )
-
-        f = np.cumsum(e_drange_cruise)[:, np.newaxis]
-        df_du = self._d_cumsum_dx @ self._scratch_nn_x_nn
-
-        np.fill_diagonal(self._scratch_nn_x_nn[1:, :-1], 0.5)
-        np.fill_diagonal(self._scratch_nn_x_nn[1:, 1:], 0.5)
-
-        g = vx_m[:, np.newaxis]
-        dg_du = self._scratch_nn_x_nn
-
-        dt_dvx = ((df_du[1:, ...] * g) - (dg_du[1:, ...] * f)) / g**2
-
-        J['cruise_time', 'TAS_cruise'][1:] = dt_dvx[self._tril_rs[1:] - 1, self._tril_cs[1:]]
+        return {
+            'TAS_cruise': (-dBreg1_dVx1, dBreg2_dVx2),
+            Dynamic.Vehicle.CUMULATIVE_ELECTRIC_ENERGY_USED: (-dBreg1_dE1, dBreg2_dE2),
+            Dynamic.Vehicle.Propulsion.ELECTRIC_POWER_IN_TOTAL: (-dBreg1_dP1, dBreg2_dP2),
+        }
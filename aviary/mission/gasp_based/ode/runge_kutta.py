@@ -0,0 +1,516 @@
+"""
+Adaptive Runge-Kutta integration of SGM phases.
+
+The phases of an SGM trajectory are integrated with the explicit Dormand-Prince 5(4)
+pair, with step size control on the embedded error estimate and its 4th order
+continuous extension for dense output, or with the implicit Radau IIA method of order 5
+for stiff phases. Events are located on the dense output, so no interpolant has to be
+rebuilt from the stored trajectory, and the output and event functions of the phase are
+each evaluated once per accepted step.
+"""
+
+import warnings
+
+import numpy as np
+from scipy.integrate import Radau
+from scipy.optimize import brentq
+
+# Dormand-Prince 5(4) tableau
+_C = np.array([0.0, 1 / 5, 3 / 10, 4 / 5, 8 / 9, 1.0])
+_A = (
+    (),
+    (1 / 5,),
+    (3 / 40, 9 / 40),
+    (44 / 45, -56 / 15, 32 / 9),
+    (19372 / 6561, -25360 / 2187, 64448 / 6561, -212 / 729),
+    (9017 / 3168, -355 / 33, 46732 / 5247, 49 / 176, -5103 / 18656),
+)
+_B = np.array([35 / 384, 0.0, 500 / 1113, 125 / 192, -2187 / 6784, 11 / 84])
+# difference between the 5th and 4th order solutions, including the FSAL stage
+_E = np.array([-71 / 57600, 0.0, 71 / 16695, -71 / 1920, 17253 / 339200, -22 / 525, 1 / 40])
+# continuous extension: x(t + theta * h) = x + h * K.T @ _P @ [theta, theta**2, ...]
+_P = np.array(
+    [
+        [1.0, -8048581381 / 2820520608, 8663915743 / 2820520608, -12715105075 / 11282082432],
+        [0.0, 0.0, 0.0, 0.0],
+        [
+            0.0,
+            131558114200 / 32700410799,
+            -68118460800 / 10900136933,
+            87487479700 / 32700410799,
+        ],
+        [
+            0.0,
+            -1754552775 / 470086768,
+            14199869525 / 1410260304,
+            -10690763975 / 1880347072,
+        ],
+        [
+            0.0,
+            127303824393 / 49829197408,
+            -318862633887 / 49829197408,
+            701980252875 / 199316789632,
+        ],
+        [0.0, -282668133 / 205662961, 2019193451 / 616988883, -1453857185 / 822651844],
+        [0.0, 40617522 / 29380423, -110615467 / 29380423, 69997945 / 29380423],
+    ]
+)
+
+_SAFETY = 0.9
+_MIN_FACTOR = 0.2
+_MAX_FACTOR = 10.0
+
+# the keys of the simupy integrator options that are used, and the Runge-Kutta method
+DEFAULT_INTEGRATOR_OPTIONS = {
+    'rtol': 1e-6,
+    'atol': 1e-12,
+    'nsteps': 500,
+    'max_step': 0.0,
+    'method': 'RK45',
+}
+
+DEFAULT_EVENT_FIND_OPTIONS = {
+    'xtol': 2e-12,
+    'rtol': 8.8817841970012523e-16,
+    'maxiter': 100,
+}
+
+
+class IntegrationResult:
+    """
+    Trajectory of an integrated phase.
+
+    The attributes match those of a simupy SimulationResult, so the results of both
+    integrators can be used interchangeably.
+
+    Attributes
+    ----------
+    t : ndarray
+        Times of the accepted steps and events.
+    x : ndarray
+        States at each time.
+    y : ndarray
+        Outputs at each time.
+    e : ndarray
+        Event function values at each time.
+    """
+
+    def __init__(self, dim_state, dim_output, num_events):
+        self._rows = []
+        self._shape = (dim_state, dim_output, num_events)
+
+    def add(self, t, x, y, e):
+        """Add a point to the trajectory."""
+        self._rows.append((t, np.array(x, dtype=float), y, e))
+
+    def finalize(self):
+        """Convert the stored points to arrays."""
+        dim_state, dim_output, num_events = self._shape
+        rows = self._rows
+        num_rows = len(rows)
+
+        self.t = np.array([row[0] for row in rows], dtype=float)
+        self.x = np.array([row[1] for row in rows], dtype=float).reshape(num_rows, dim_state)
+        self.y = np.array(
+            [np.zeros(dim_output) if row[2] is None else row[2] for row in rows], dtype=float
+        ).reshape(num_rows, dim_output)
+        self.e = np.array(
+            [np.zeros(num_events) if row[3] is None else row[3] for row in rows], dtype=float
+        ).reshape(num_rows, num_events)
+
+        del self._rows
+
+        return self
+
+
+class _DormandPrince:
+    """Single steps of the Dormand-Prince 5(4) pair with step size control."""
+
+    def __init__(self, fun, t0, x0, t_bound, rtol, atol, max_step, first_step=None):
+        self.fun = fun
+        self.t = t0
+        self.x = np.array(x0, dtype=float)
+        self.t_bound = t_bound
+        self.direction = np.sign(t_bound - t0) if t_bound != t0 else 1.0
+        self.rtol = rtol
+        self.atol = atol
+        self.max_step = max_step if max_step else np.inf
+
+        self.f = np.asarray(fun(t0, self.x), dtype=float)
+        self.K = np.empty((7, self.x.size))
+
+        if first_step:
+            self.h_abs = min(first_step, self.max_step)
+        else:
+            self.h_abs = self._initial_step()
+
+    def _initial_step(self):
+        # Hairer, Norsett and Wanner, Solving Ordinary Differential Equations I, II.4
+        x, f = self.x, self.f
+        interval = abs(self.t_bound - self.t)
+
+        if x.size == 0 or interval == 0.0:
+            return min(interval, self.max_step)
+
+        scale = self.atol + np.abs(x) * self.rtol
+        d0 = np.sqrt(np.mean((x / scale) ** 2))
+        d1 = np.sqrt(np.mean((f / scale) ** 2))
+
+        h0 = 1e-6 if d0 < 1e-5 or d1 < 1e-5 else 0.01 * d0 / d1
+        h0 = min(h0, interval)
+
+        f1 = np.asarray(self.fun(self.t + self.direction * h0, x + self.direction * h0 * f))
+        d2 = np.sqrt(np.mean(((f1 - f) / scale) ** 2)) / h0
+
+        if d1 <= 1e-15 and d2 <= 1e-15:
+            h1 = max(1e-6, h0 * 1e-3)
+        else:
+            h1 = (0.01 / max(d1, d2)) ** (1 / 5)
+
+        return min(100 * h0, h1, interval, self.max_step)
+
+    def step(self):
+        """
+        Take one accepted step.
+
+        Returns
+        -------
+        bool
+            False if the step size became too small to make progress.
+        """
+        t, x = self.t, self.x
+        K = self.K
+        min_step = 10 * np.abs(np.nextafter(t, self.direction * np.inf) - t)
+
+        h_abs = min(self.h_abs, self.max_step)
+        step_rejected = False
+
+        while True:
+            if h_abs < min_step:
+                return False
+
+            h = h_abs * self.direction
+            t_new = t + h
+            if self.direction * (t_new - self.t_bound) > 0:
+                t_new = self.t_bound
+            h = t_new - t
+            h_abs = abs(h)
+
+            K[0] = self.f
+            for stage in range(1, 6):
+                dx = K[:stage].T @ _A[stage] * h
+                K[stage] = self.fun(t + _C[stage] * h, x + dx)
+
+            x_new = x + h * (K[:6].T @ _B)
+            f_new = np.asarray(self.fun(t_new, x_new), dtype=float)
+            K[6] = f_new
+
+            scale = self.atol + np.maximum(np.abs(x), np.abs(x_new)) * self.rtol
+            error = h * (K.T @ _E) / scale
+            error_norm = np.sqrt(np.mean(error**2)) if error.size else 0.0
+
+            if error_norm < 1.0:
+                if error_norm == 0.0:
+                    factor = _MAX_FACTOR
+                else:
+                    factor = min(_MAX_FACTOR, _SAFETY * error_norm**-0.2)
+
+                if step_rejected:
+                    factor = min(1.0, factor)
+
+                self.h_abs = h_abs * factor
+                break
+
+            # a NaN error estimate also rejects the step
+            if np.isfinite(error_norm):
+                h_abs *= max(_MIN_FACTOR, _SAFETY * error_norm**-0.2)
+            else:
+                h_abs *= _MIN_FACTOR
+            step_rejected = True
+
+        self.t_old, self.x_old, self.h = t, x, h
+        self.Q = K.T @ _P
+        self.t, self.x, self.f = t_new, x_new, f_new
+
+        return True
+
+    def dense_state(self, t):
+        """Return the state at a time within the last step."""
+        theta = (t - self.t_old) / self.h
+        return self.x_old + self.h * self.Q @ (theta ** np.arange(1, 5))
+
+
+class _Radau:
+    """Single steps of the implicit Radau IIA method of order 5, for stiff phases."""
+
+    def __init__(self, fun, t0, x0, t_bound, rtol, atol, max_step, first_step=None):
+        x0 = np.array(x0, dtype=float)
+        shape = x0.shape
+
+        if first_step:
+            first_step = min(first_step, abs(t_bound - t0)) or None
+
+        # the Newton iterations of each step need the Jacobian of the state rates, which
+        # scipy approximates with finite differences
+        self._solver = Radau(
+            lambda t, x: np.asarray(fun(t, x), dtype=float).reshape(shape),
+            t0,
+            x0,
+            t_bound,
+            max_step=max_step if max_step else np.inf,
+            rtol=rtol,
+            atol=atol,
+            first_step=first_step,
+        )
+        self._dense_output = None
+
+    @property
+    def t(self):
+        return self._solver.t
+
+    @property
+    def x(self):
+        return self._solver.y
+
+    def step(self):
+        """
+        Take one accepted step.
+
+        Returns
+        -------
+        bool
+            False if the step size became too small to make progress.
+        """
+        self._solver.step()
+        if self._solver.status == 'failed':
+            return False
+
+        self._dense_output = self._solver.dense_output()
+
+        return True
+
+    def dense_state(self, t):
+        """Return the state at a time within the last step."""
+        return self._dense_output(t)
+
+
+_STEPPERS = {'RK45': _DormandPrince, 'Radau': _Radau}
+
+
+def _options(integrator_options):
+    options = DEFAULT_INTEGRATOR_OPTIONS.copy()
+    if integrator_options:
+        options.update((key, val) for key, val in integrator_options.items() if key in options)
+        options['first_step'] = integrator_options.get('first_step')
+
+    if options['method'] not in _STEPPERS:
+        raise ValueError(
+            f'Unknown Runge-Kutta method "{options["method"]}". Available methods are: '
+            f'{", ".join(_STEPPERS)}'
+        )
+
+    return options
+
+
+def _stepper(options, fun, t0, x0, t_bound):
+    return _STEPPERS[options['method']](
+        fun,
+        t0,
+        x0,
+        t_bound,
+        options['rtol'],
+        options['atol'],
+        options['max_step'],
+        options.get('first_step'),
+    )
+
+
+def integrate(fun, tspan, x0, integrator_options=None):
+    """
+    Integrate a system of ODEs without events, such as the co-states of the adjoint.
+
+    Parameters
+    ----------
+    fun : callable
+        Right hand side of the ODEs, fun(t, x).
+    tspan : tuple
+        Initial and final times.
+    x0 : array_like
+        Initial state.
+    integrator_options : dict
+        Relative and absolute tolerances (rtol, atol), maximum step size (max_step,
+        unlimited if 0), maximum number of steps (nsteps) and Runge-Kutta method (method,
+        'RK45' for the explicit Dormand-Prince pair or 'Radau' for the implicit Radau IIA
+        method). Other keys, such as the name of the simupy integrator, are ignored.
+
+    Returns
+    -------
+    IntegrationResult
+        The trajectory. The outputs and events are empty.
+    """
+    options = _options(integrator_options)
+    t0, tf = tspan
+    x0 = np.atleast_1d(np.array(x0, dtype=float))
+
+    result = IntegrationResult(x0.size, 0, 0)
+    result.add(t0, x0, None, None)
+
+    stepper = _stepper(options, fun, t0, x0, tf)
+
+    for _ in range(options['nsteps']):
+        if stepper.t == tf:
+            break
+
+        if not stepper.step():
+            warnings.warn(f'Integration step size became too small at t={stepper.t}')
+            break
+
+        result.add(stepper.t, stepper.x, None, None)
+    else:
+        if stepper.t != tf:
+            warnings.warn(f'Integration stopped at t={stepper.t} after {options["nsteps"]} steps')
+
+    return result.finalize()
+
+
+def simulate(
+    problem,
+    tspan,
+    integrator_options=None,
+    event_find_options=None,
+):
+    """
+    Integrate an SGM phase until its final time or its terminating event.
+
+    This follows the behavior of simupy's simulate for a SimuPyProblem. A point is stored
+    for every accepted step. When an event function changes sign, the event time is found
+    on the dense output of the step, a point is stored just before the event, and the
+    update_equation_function of the problem is applied just after it. The integration
+    stops if the state or outputs become NaN, which is how the problems signal a
+    terminating event. Sign changes during the first step out of t = 0 are ignored.
+
+    Unlike simupy, when several event functions change sign in the same step, only the
+    events at the first crossing are passed to update_equation_function.
+
+    Parameters
+    ----------
+    problem : SimuPyProblem
+        Phase to integrate. Its initial_condition must be set.
+    tspan : tuple
+        Initial and final times.
+    integrator_options : dict
+        Options of the integrator, see integrate.
+    event_find_options : dict
+        Options of the root finder (xtol, rtol, maxiter) used to locate events.
+
+    Returns
+    -------
+    IntegrationResult
+        Trajectory of the phase.
+    """
+    options = _options(integrator_options)
+    find_options = DEFAULT_EVENT_FIND_OPTIONS.copy()
+    if event_find_options:
+        find_options.update(event_find_options)
+
+    t0, tf = tspan
+    x0 = np.atleast_1d(np.array(problem.initial_condition, dtype=float))
+    num_events = problem.num_events
+    dim_output = problem.dim_output
+
+    if options['max_step'] == 0.0 and getattr(problem, 'dt', 0.0):
+        options['max_step'] = problem.dt
+
+    def state_rate(t, x):
+        return problem.state_equation_function(t, x)
+
+    def evaluate(t, x):
+        y = np.asarray(problem.output_equation_function(t, x), dtype=float).reshape(dim_output)
+        if num_events:
+            e = np.asarray(problem.event_equation_function(t, x), dtype=float).reshape(num_events)
+        else:
+            e = np.zeros(0)
+        return y, e
+
+    result = IntegrationResult(x0.size, dim_output, num_events)
+
+    problem.prepare_to_integrate(t0, x0)
+    y, e = evaluate(t0, x0)
+    result.add(t0, x0, y, e)
+
+    t, x = t0, x0
+
+    while t < tf:
+        stepper = _stepper(options, state_rate, t, x, tf)
+        restart = False
+
+        for _ in range(options['nsteps']):
+            if stepper.t == tf:
+                break
+
+            prev_t, prev_e = stepper.t, e
+
+            if not stepper.step():
+                warnings.warn(f'Integration step size became too small at t={stepper.t}')
+                return result.finalize()
+
+            t, x = stepper.t, stepper.x
+            y, e = evaluate(t, x)
+
+            crossed = np.flatnonzero(np.sign(prev_e) != np.sign(e))
+
+            if crossed.size == 0 or prev_t <= 0:
+                result.add(t, x, y, e)
+
+                if np.any(np.isnan(y)) or np.any(np.isnan(x)):
+                    return result.finalize()
+
+                continue
+
+            # locate the first event in the step on the dense output
+            def event_function(time, channel):
+                return problem.event_equation_function(time, stepper.dense_state(time))[channel]
+
+            event_ts = np.array(
+                [
+                    brentq(event_function, prev_t, t, args=(channel,), **find_options)
+                    for channel in crossed
+                ]
+            )
+            event_t = event_ts.min()
+            half_tol = find_options['xtol'] / 2
+
+            # only the events at the first crossing have happened
+            crossed = crossed[event_ts <= event_t + half_tol]
+
+            left_t = event_t - half_tol
+            left_x = stepper.dense_state(left_t)
+            left_y, left_e = evaluate(left_t, left_x)
+            result.add(left_t, left_x, left_y, left_e)
+
+            right_t = event_t + half_tol
+            right_x = np.asarray(
+                problem.update_equation_function(
+                    right_t, stepper.dense_state(right_t), event_channels=crossed
+                ),
+                dtype=float,
+            )
+            right_y, right_e = evaluate(right_t, right_x)
+
+            if np.any(np.isnan(right_x)) or np.any(np.isnan(right_y)):
+                return result.finalize()
+
+            result.add(right_t, right_x, right_y, right_e)
+
+            t, x, e = right_t, right_x, right_e
+            restart = True
+            break
+
+        else:
+            warnings.warn(f'Integration stopped at t={t} after {options["nsteps"]} steps')
+            break
+
+        if not restart:
+            break
+
+    return result.finalize()
@@ -2,7 +2,11 @@ import unittest
 
 import numpy as np
 import openmdao.api as om
-from openmdao.utils.assert_utils import assert_check_partials, assert_near_equal
+from openmdao.utils.assert_utils import (
+    assert_check_partials,
+    assert_check_totals,
+    assert_near_equal,
+)
 
 from aviary.constants import GRAV_ENGLISH_LBM
 from aviary.mission.gasp_based.ode.breguet_cruise_eom import E_RangeComp, RangeComp
@@ -181,6 +185,57 @@ class TestBreguetResults2(unittest.TestCase):
         assert_near_equal(np.diff(t), -np.diff(W) / fuel_flow_avg, tolerance=1.0e-6)
 
 
+class TestBreguetTotals(unittest.TestCase):
+    """Test the linear solve of the accumulated range and time."""
+
+    def _check_totals(self, mode, direct_solver):
+        nn = 20
+
+        prob = om.Problem()
+        prob.model.add_subsystem('range_comp', RangeComp(num_nodes=nn), promotes=['*'])
+
+        if direct_solver:
+            prob.model.linear_solver = om.DirectSolver()
+
+        for name in (
+            'TAS_cruise',
+            'mass',
+            Dynamic.Vehicle.Propulsion.FUEL_FLOW_RATE_NEGATIVE_TOTAL,
+            'cruise_distance_initial',
+            'cruise_time_initial',
+        ):
+            prob.model.add_design_var(name)
+
+        prob.model.add_constraint('cruise_range', lower=0.0)
+        prob.model.add_constraint('cruise_time', lower=0.0)
+
+        prob.setup(check=False, mode=mode, force_alloc_complex=True)
+
+        prob.set_val('TAS_cruise', 458.8 + 50 * np.random.rand(nn), units='kn')
+        prob.set_val('mass', np.linspace(171481, 171481 - 10000, nn), units='lbm')
+        prob.set_val(
+            Dynamic.Vehicle.Propulsion.FUEL_FLOW_RATE_NEGATIVE_TOTAL,
+            -5870 - 100 * np.random.rand(nn),
+            units='lbm/h',
+        )
+        prob.set_val('cruise_distance_initial', 100.0, units='NM')
+        prob.set_val('cruise_time_initial', 1000.0, units='s')
+
+        prob.run_model()
+
+        totals = prob.check_totals(method='cs', out_stream=None)
+        assert_check_totals(totals, atol=1e-9, rtol=1e-9)
+
+    def test_fwd(self):
+        self._check_totals('fwd', direct_solver=False)
+
+    def test_rev(self):
+        self._check_totals('rev', direct_solver=False)
+
+    def test_direct_solver(self):
+        self._check_totals('rev', direct_solver=True)
+
+
 class TestElectricBreguetResults(unittest.TestCase):
     """Test cruise range and time in E_RangeComp component."""
 
@@ -0,0 +1,123 @@
+import gc
+import unittest
+
+import numpy as np
+import openmdao.api as om
+from openmdao.utils.assert_utils import assert_near_equal
+
+from aviary.mission.gasp_based.ode.time_integration_base_classes import (
+    SimuPyProblem,
+    clear_problem_cache,
+    fingerprint,
+)
+
+
+class _DecayODE(om.Group):
+    def initialize(self):
+        self.options.declare('num_nodes', default=1)
+        self.options.declare('rate', default=0.5)
+
+    def setup(self):
+        nn = self.options['num_nodes']
+        self.add_subsystem(
+            'decay',
+            om.ExecComp(
+                f'x_rate = -{self.options["rate"]} * x',
+                x_rate={'shape': (nn,), 'units': 'm/s'},
+                x={'shape': (nn,), 'units': 'm', 'val': 2.0},
+            ),
+            promotes=['*'],
+        )
+        self.add_subsystem(
+            'clock',
+            om.ExecComp('t_out = t_curr', t_out={'units': 's'}, t_curr={'units': 's'}),
+            promotes=['*'],
+        )
+
+
+def _problem(**kwargs):
+    return SimuPyProblem(_DecayODE(**kwargs), states=['x'], parameters=[], outputs=['t_out'])
+
+
+class ProblemCacheTest(unittest.TestCase):
+    def setUp(self):
+        clear_problem_cache()
+
+    def tearDown(self):
+        clear_problem_cache()
+
+    def test_reuse(self):
+        first = _problem()
+        prob = first.prob
+
+        # problems in use are not shared
+        second = _problem()
+        self.assertIsNot(second.prob, prob)
+
+        # other options need another problem
+        third = _problem(rate=1.0)
+        self.assertIsNot(third.prob, prob)
+        self.assertIsNot(third.prob, second.prob)
+
+        first.set_val('x', 5.0)
+        first.compute()
+
+        del first
+        gc.collect()
+
+        reused = _problem()
+        self.assertIs(reused.prob, prob)
+
+        # the reused problem starts from the values right after setup
+        assert_near_equal(reused.get_val('x'), [2.0])
+        assert_near_equal(reused.get_val('x_rate'), [1.0])
+
+        assert_near_equal(reused.state_equation_function(0.0, np.array([4.0])), [-2.0])
+
+    def test_no_cache(self):
+        first = SimuPyProblem(_DecayODE(), states=['x'], cache_problem=False)
+        prob = first.prob
+
+        del first
+        gc.collect()
+
+        self.assertIsNot(_problem().prob, prob)
+
+    def test_release(self):
+        first = _problem()
+        prob = first.prob
+
+        first.set_val('x', 5.0)
+        first.compute()
+
+        # the problem can be reused as soon as it is released, while first is still alive
+        first.release()
+        self.assertIsNone(first.prob)
+
+        reused = _problem()
+        self.assertIs(reused.prob, prob)
+        assert_near_equal(reused.get_val('x'), [2.0])
+
+        # releasing again does not take the problem away from its new holder
+        first.release()
+        self.assertIsNot(_problem().prob, prob)
+
+    def test_complex_opt_in(self):
+        self.assertFalse(_problem().prob.model._outputs._alloc_complex)
+
+        prob = SimuPyProblem(_DecayODE(), states=['x'], force_alloc_complex=True).prob
+        self.assertTrue(prob.model._outputs._alloc_complex)
+
+    def test_fingerprint(self):
+        self.assertEqual(
+            fingerprint({'a': np.ones(3), 'b': [1, 'c']}),
+            fingerprint({'b': [1, 'c'], 'a': np.ones(3)}),
+        )
+        self.assertNotEqual(fingerprint(np.ones(3)), fingerprint(np.ones(4)))
+        self.assertNotEqual(
+            fingerprint(_DecayODE().options), fingerprint(_DecayODE(rate=1.0).options)
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
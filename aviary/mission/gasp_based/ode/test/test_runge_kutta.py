@@ -0,0 +1,103 @@
+import unittest
+
+import numpy as np
+from openmdao.utils.assert_utils import assert_near_equal
+
+from aviary.mission.gasp_based.ode.runge_kutta import integrate, simulate
+
+
+class _FallingBody:
+    """
+    A body dropped from 100 m, with the interface of a SimuPyProblem.
+
+    Event 0 terminates the integration at the ground, event 1 halves the velocity when the
+    body passes 50 m.
+    """
+
+    dim_state = 2
+    dim_output = 1
+    num_events = 2
+    g = 9.81
+
+    def __init__(self):
+        self.initial_condition = np.array([100.0, 0.0])
+        self.updates = []
+
+    def prepare_to_integrate(self, t0, x0):
+        self.output_nan = False
+        return self.output_equation_function(t0, x0)
+
+    def state_equation_function(self, t, x, u=None):
+        return np.array([x[1], -self.g])
+
+    def output_equation_function(self, t, x):
+        if self.output_nan:
+            return np.full(self.dim_output, np.nan)
+        return np.array([0.5 * x[1] ** 2])
+
+    def event_equation_function(self, t, x):
+        return np.array([x[0], x[0] - 50.0])
+
+    def update_equation_function(self, t, x, event_channels=None):
+        self.updates.append((t, list(event_channels)))
+        if 0 in event_channels:
+            self.output_nan = True
+            return x
+        return np.array([x[0], 0.5 * x[1]])
+
+
+class RungeKuttaTest(unittest.TestCase):
+    def test_integrate(self):
+        result = integrate(lambda t, x: -0.5 * x, (0.0, 4.0), [2.0, 1.0])
+
+        assert_near_equal(result.t[-1], 4.0)
+        assert_near_equal(result.x[-1], np.array([2.0, 1.0]) * np.exp(-2.0), 1e-6)
+
+    def test_integrate_stiff(self):
+        # the fast mode decays within 1e-4 s, the slow one sets the solution afterwards
+        def fun(t, x):
+            return np.array([-1e4 * (x[0] - np.cos(t)), -0.5 * x[1]])
+
+        explicit = integrate(fun, (0.0, 10.0), [0.0, 1.0], {'nsteps': 100_000})
+        implicit = integrate(fun, (0.0, 10.0), [0.0, 1.0], {'method': 'Radau'})
+
+        for result in (explicit, implicit):
+            assert_near_equal(result.x[-1, 0], np.cos(10.0), 1e-3)
+            assert_near_equal(result.x[-1, 1], np.exp(-5.0), 1e-5)
+
+        # the explicit steps are limited by stability instead of accuracy
+        self.assertLess(10 * implicit.t.size, explicit.t.size)
+
+    def test_unknown_method(self):
+        with self.assertRaises(ValueError):
+            integrate(lambda t, x: -x, (0.0, 1.0), [1.0], {'method': 'unknown'})
+
+    def test_events(self):
+        for method in ('RK45', 'Radau'):
+            with self.subTest(method=method):
+                self._check_events(method)
+
+    def _check_events(self, method):
+        body = _FallingBody()
+        result = simulate(body, (0.0, 100.0), {'method': method})
+
+        g = body.g
+        t_half = np.sqrt(100.0 / g)
+        v_half = 0.5 * g * t_half
+
+        # after 50 m, the body falls the remaining 50 m from v_half
+        t_ground = t_half + (-v_half + np.sqrt(v_half**2 + 100.0 * g)) / g
+
+        self.assertEqual(body.updates[0][1], [1])
+        assert_near_equal(body.updates[0][0], t_half, 1e-9)
+        assert_near_equal(result.t[-1], t_ground, 1e-9)
+        assert_near_equal(result.x[-1, 0], 0.0, 1e-6)
+
+        # the point after the terminating event is not stored
+        self.assertFalse(np.any(np.isnan(result.y)))
+        self.assertEqual(result.y.shape, (result.t.size, 1))
+        self.assertEqual(result.e.shape, (result.t.size, 2))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,3 +1,9 @@
+import enum
+import hashlib
+import itertools
+import types
+import weakref
+
 import numpy as np
 import openmdao.api as om
 from openmdao.utils import units
@@ -5,7 +11,9 @@ from scipy import interpolate
 from simupy.block_diagram import DEFAULT_INTEGRATOR_OPTIONS, SimulationMixin
 from simupy.systems import DynamicalSystem
 
+from aviary.mission.gasp_based.ode import runge_kutta
 from aviary.mission.gasp_based.ode.params import ParamPort
+from aviary.utils.profiling import get_active_profiler
 from aviary.variable_info.enums import Verbosity
 from aviary.variable_info.functions import setup_model_options
 from aviary.variable_info.variable_meta_data import _MetaData
@@ -69,6 +77,171 @@ class event_trigger:
         self.channel_name = channel_name
 
 
+# Set-up ODE problems, keyed on the ODE class and the options they were set up with. Each
+# problem is leased to one SimuPyProblem at a time, and can be reused by another
+# SimuPyProblem with the same key once its holder has released it or been garbage
+# collected.
+_problem_cache = {}
+_lease_counter = itertools.count(1)
+
+# Maximum number of set-up problems kept in the cache while no SimuPyProblem uses them
+MAX_IDLE_PROBLEMS = 32
+
+# Runge-Kutta method of runge_kutta.py used by each of the aviary integrators of SGMTrajBase
+_RUNGE_KUTTA_METHODS = {'aviary': 'RK45', 'aviary_radau': 'Radau'}
+
+
+class _CachedProblem:
+    """A set-up ODE problem, with the values of its vectors right after setup."""
+
+    def __init__(self, prob, ode):
+        self.prob = prob
+        self.ode = ode
+        self.inputs = prob.model._inputs.asarray(copy=True)
+        self.outputs = prob.model._outputs.asarray(copy=True)
+        self.holder = None
+        self.last_lease = 0
+
+    @property
+    def idle(self):
+        return self.holder is None or self.holder() is None
+
+    def lease(self, holder):
+        # reused problems start from the same values as a newly set-up problem
+        if self.last_lease:
+            self.prob.model._inputs.set_val(self.inputs)
+            self.prob.model._outputs.set_val(self.outputs)
+
+        self.holder = weakref.ref(holder)
+        self.last_lease = next(_lease_counter)
+
+    def release(self, holder):
+        if self.holder is not None and self.holder() is holder:
+            self.holder = None
+
+
+def _fingerprint(value, sha, visited):
+    """Add the contents of a value, recursing into containers and objects, to a hash."""
+    if isinstance(value, (str, bytes, int, float, complex, bool, type(None))):
+        sha.update(f'{type(value).__name__}:{value!r};'.encode())
+        return
+
+    if isinstance(value, type):
+        sha.update(f'type:{value.__module__}.{value.__qualname__};'.encode())
+        return
+
+    if isinstance(value, enum.Enum):
+        sha.update(f'enum:{type(value).__qualname__}.{value.name};'.encode())
+        return
+
+    if isinstance(value, np.ndarray):
+        sha.update(f'array:{value.dtype}{value.shape};'.encode())
+        sha.update(np.ascontiguousarray(value).tobytes())
+        return
+
+    if isinstance(value, np.generic):
+        _fingerprint(value.item(), sha, visited)
+        return
+
+    if isinstance(value, (types.FunctionType, types.MethodType, types.BuiltinFunctionType)):
+        # functions are only identified by the object itself
+        sha.update(f'{value!r};'.encode())
+        return
+
+    if id(value) in visited:
+        sha.update(f'ref:{visited[id(value)]};'.encode())
+        return
+    visited[id(value)] = len(visited)
+
+    sha.update(f'{type(value).__module__}.{type(value).__qualname__}('.encode())
+
+    if isinstance(value, dict):
+        for key in sorted(value, key=repr):
+            _fingerprint(key, sha, visited)
+            _fingerprint(value[key], sha, visited)
+    elif isinstance(value, (list, tuple)):
+        for item in value:
+            _fingerprint(item, sha, visited)
+    elif isinstance(value, (set, frozenset)):
+        for item in sorted(value, key=repr):
+            _fingerprint(item, sha, visited)
+    elif isinstance(value, om.OptionsDictionary):
+        for key, val in value.items():
+            _fingerprint(key, sha, visited)
+            _fingerprint(val, sha, visited)
+    elif hasattr(value, '__dict__'):
+        _fingerprint(vars(value), sha, visited)
+    else:
+        # without a way to look inside, only the same object gives the same fingerprint
+        sha.update(f'{value!r}'.encode())
+
+    sha.update(b');')
+
+
+def fingerprint(*values):
+    """
+    Return a hash of the contents of the given values.
+
+    Containers, numpy arrays, OpenMDAO options and the attributes of objects are hashed by
+    value, so two AviaryValues or ODEs with the same contents give the same fingerprint.
+    Functions, and objects whose contents cannot be inspected, are hashed by identity.
+    """
+    sha = hashlib.sha256()
+    _fingerprint(values, sha, {})
+
+    return sha.hexdigest()
+
+
+def _problem_key(ode, aviary_options, meta_data, force_alloc_complex):
+    """Return the key of the cached problems that can be used for an ODE."""
+    meta_data = meta_data if aviary_options else None
+
+    return (
+        type(ode),
+        fingerprint(ode.options, aviary_options, meta_data),
+        force_alloc_complex,
+    )
+
+
+def _lease_cached_problem(key, holder):
+    """Lease an idle cached problem with the given key to holder, if there is one."""
+    for entry in _problem_cache.get(key, []):
+        if entry.idle:
+            entry.lease(holder)
+            return entry
+
+    return None
+
+
+def _add_cached_problem(key, holder, prob, ode):
+    """Add a newly set-up problem, leased to holder, to the cache and return its entry."""
+    new_entry = _CachedProblem(prob, ode)
+    new_entry.lease(holder)
+    _problem_cache.setdefault(key, []).append(new_entry)
+
+    idle = sorted(
+        (
+            (entry.last_lease, key, entry)
+            for key, entries in _problem_cache.items()
+            for entry in entries
+            if entry.idle
+        ),
+        key=lambda item: item[0],
+    )
+
+    for _, key, entry in idle[: max(len(idle) - MAX_IDLE_PROBLEMS, 0)]:
+        _problem_cache[key].remove(entry)
+        if not _problem_cache[key]:
+            del _problem_cache[key]
+
+    return new_entry
+
+
+def clear_problem_cache():
+    """Remove all set-up ODE problems from the cache shared by SimuPyProblems."""
+    _problem_cache.clear()
+
+
 class SimuPyProblem(SimulationMixin):
     """Subproblem used as a basis for forward in time integration phases."""
 
@@ -93,8 +266,12 @@ class SimuPyProblem(SimulationMixin):
         verbosity=Verbosity.QUIET,
         max_allowable_time=1_000_000,
         adjoint_int_opts=DEFAULT_INTEGRATOR_OPTIONS.copy(),
+        force_alloc_complex=False,
+        cache_problem=True,
     ):
         """
+        Set up the ODE problem of a phase, or reuse a cached one.
+
         states: a dictionary of the form {state_name:{'units':unit, 'rate':state_rate_name, 'rate_units':state_rate_units}}
         alternate_state_names: a dictionary of the form {state_to_replace:new_state_name}
         blocked_state_names: a list of the form [state_name_to_block]
@@ -105,6 +282,12 @@ class SimuPyProblem(SimulationMixin):
         include_state_outputs : automatically add the state to the input
         works well for auto-parsed naming, does not check for duplication before adding
         states, parameters, outputs, and controls can also be input as a list of keys for the dictionary.
+        force_alloc_complex : allocate complex vectors in the ODE problem, so the whole ODE
+        can be complex stepped, e.g. to check its totals with method='cs'. Components that
+        declare complex step partials get complex vectors either way
+        cache_problem : reuse a set-up problem with the same ODE class and options from the
+        cache, once the SimuPyProblem that used it has released it or been garbage
+        collected, instead of setting up a new one
         """
         default_om_list_args = dict(prom_name=True, val=False, out_stream=None, units=True)
 
@@ -115,31 +298,58 @@ class SimuPyProblem(SimulationMixin):
         self.adjoint_int_opts['name'] = 'dop853'
 
         self.dt = 0.0
-        prob = om.Problem()
-        if aviary_options:
-            from aviary.interface.methods_for_level2 import AviaryGroup
-
-            prob.model = AviaryGroup(aviary_options=aviary_options, aviary_metadata=meta_data)
-        prob.model.add_subsystem(
-            'ODE_group',
-            ode,
-            promotes=['*'],
-        )
-        self.ode = ode
 
-        self.prob = prob
-        setup_model_options(prob, aviary_inputs=aviary_options)
-        prob.setup(check=False, force_alloc_complex=True)
+        if aviary_options is None:
+            # the options can also be given to the ODE only
+            try:
+                aviary_options = ode.options['aviary_options']
+            except (KeyError, RuntimeError):
+                aviary_options = None
+            model_options = None
+        else:
+            model_options = aviary_options
+
+        cache_key = None
+        cached = None
+        if cache_problem:
+            cache_key = _problem_key(ode, model_options, meta_data, force_alloc_complex)
+            cached = _lease_cached_problem(cache_key, self)
+        self._cache_entry = cached
+
+        if cached is not None:
+            prob = cached.prob
+            ode = cached.ode
+        else:
+            prob = om.Problem()
+            if model_options:
+                from aviary.interface.methods_for_level2 import AviaryGroup
+
+                prob.model = AviaryGroup(aviary_options=model_options, aviary_metadata=meta_data)
+            prob.model.add_subsystem(
+                'ODE_group',
+                ode,
+                promotes=['*'],
+            )
+
+            if aviary_options is not None:
+                setup_model_options(prob, aviary_inputs=aviary_options)
+            prob.setup(check=False, force_alloc_complex=force_alloc_complex)
+
+            # TODO - This is a hack to mimic the behavior of the old paramport, which
+            # contains some initial default values. It is unclear how actual "parameter"
+            # values are supposed to propagate from the pre-mission and top ivcs into
+            # the SGM phases.
+            from aviary.mission.gasp_based.ode.params import set_params_for_unit_tests
 
-        # TODO - This is a hack to mimic the behavior of the old paramport, which
-        # contains some initial default values. It is unclear how actual "parameter"
-        # values are supposed to propagate from the pre-mission and top ivcs into
-        # the SGM phases.
-        from aviary.mission.gasp_based.ode.params import set_params_for_unit_tests
+            set_params_for_unit_tests(prob)
 
-        set_params_for_unit_tests(prob)
+            prob.final_setup()
 
-        prob.final_setup()
+            if cache_problem:
+                self._cache_entry = _add_cached_problem(cache_key, self, prob, ode)
+
+        self.ode = ode
+        self.prob = prob
 
         if triggers is None:
             triggers = []
@@ -262,6 +472,11 @@ class SimuPyProblem(SimulationMixin):
         self.dim_parameters = len(parameters)
         # TODO: add defensive checks to make sure dimensions match in both setup and
         # calls
+
+        profiler = get_active_profiler()
+        if profiler is not None:
+            profiler.instrument_simupy_problem(self, problem_name)
+
         if verbosity >= Verbosity.VERBOSE:
             if problem_name:
                 problem_name = '_' + problem_name
@@ -276,6 +491,18 @@ class SimuPyProblem(SimulationMixin):
         self.parameters[name] = units
         self.dim_parameters = len(self.parameters)
 
+    def release(self):
+        """
+        Return the set-up problem to the cache, so another SimuPyProblem can reuse it.
+
+        This problem cannot be evaluated afterwards.
+        """
+        if self._cache_entry is not None:
+            self._cache_entry.release(self)
+            self._cache_entry = None
+
+        self.prob = None
+
     @property
     def time(self):
         return self.prob.get_val(self.t_name)[0]
@@ -465,6 +692,15 @@ class SGMTrajBase(om.ExplicitComponent):
         # needs to get passed to each ODE
         # TODO: param_dict
         self.options.declare('param_dict', default=ParamPort.param_data)
+        self.options.declare(
+            'integrator',
+            default='simupy',
+            values=['aviary', 'aviary_radau', 'simupy'],
+            desc='Integrator used for the phases and the adjoint. "simupy" uses the simupy '
+            'block diagram simulation, "aviary" the explicit Runge-Kutta integrator in '
+            'runge_kutta.py and "aviary_radau" its implicit Radau IIA method, for stiff '
+            'phases.',
+        )
         self.verbosity = verbosity
         self.max_allowable_time = 1_000_000
         self.adjoint_int_opts = DEFAULT_INTEGRATOR_OPTIONS.copy()
@@ -475,6 +711,19 @@ class SGMTrajBase(om.ExplicitComponent):
     def add_parameter(self, name, units=None, **kwargs):
         self.additional_parameters['parameters:' + name] = {'units': units}
 
+    def release_problems(self, keep=()):
+        """
+        Return the set-up problems of the phases to the cache shared by SimuPyProblems.
+
+        Parameters
+        ----------
+        keep : list of SimuPyProblem
+            Phases that are still used, and keep their problems.
+        """
+        for ode in getattr(self, 'ODEs', []):
+            if ode not in keep:
+                ode.release()
+
     def setup_params(
         self,
         ODEs,
@@ -514,6 +763,9 @@ class SGMTrajBase(om.ExplicitComponent):
         if traj_event_trigger_input is None:
             traj_event_trigger_input = []
 
+        # phases that are not used anymore return their problems to the cache
+        self.release_problems(keep=ODEs)
+
         self.phase_names = [ode.phase_name for ode in ODEs]
 
         if promote_all_auto_ivc:
@@ -683,9 +935,16 @@ class SGMTrajBase(om.ExplicitComponent):
             current_problem = sim_problems[-1]
             current_problem.initial_condition = state
 
-            sim_result = current_problem.simulate(
-                (t, self.max_allowable_time),
-            )
+            if self.options['integrator'] in _RUNGE_KUTTA_METHODS:
+                sim_result = runge_kutta.simulate(
+                    current_problem,
+                    (t, self.max_allowable_time),
+                    integrator_options={'method': _RUNGE_KUTTA_METHODS[self.options['integrator']]},
+                )
+            else:
+                sim_result = current_problem.simulate(
+                    (t, self.max_allowable_time),
+                )
             if sim_result.t.shape[0] == 2:
                 print('\n' * 3, 'IMMEDIATE PHASE TERMINATION', current_problem, '\n' * 2)
             sim_results.append(sim_result)
@@ -813,6 +1072,9 @@ class SGMTrajBase(om.ExplicitComponent):
             costate_ics.append(costate)
 
         # pre-compute data for adjoint
+        # NOTE: the ODE is evaluated again at every stored point of the forward
+        # trajectory, to linearize it there. The Jacobians are not saved during the
+        # forward integration.
         for phase_idx, res, prob in zip(
             range(len(self.sim_results), 0, -1),
             self.sim_results[::-1],
@@ -1092,13 +1354,25 @@ class SGMTrajBase(om.ExplicitComponent):
                 if self.verbosity >= Verbosity.VERBOSE:
                     print('dim_state:', prob.dim_state, 'ic:', costate)
 
-                costate_sys = DynamicalSystem(
-                    state_equation_function=co_state_rate, dim_state=prob.dim_state
-                )
-                costate_sys.initial_condition = costate
-
                 # simulate co-state system
-                co_res = costate_sys.simulate((t0, tf), integrator_options=self.adjoint_int_opts)
+                if self.options['integrator'] in _RUNGE_KUTTA_METHODS:
+                    co_res = runge_kutta.integrate(
+                        co_state_rate,
+                        (t0, tf),
+                        costate,
+                        integrator_options=dict(
+                            self.adjoint_int_opts,
+                            method=_RUNGE_KUTTA_METHODS[self.options['integrator']],
+                        ),
+                    )
+                else:
+                    costate_sys = DynamicalSystem(
+                        state_equation_function=co_state_rate, dim_state=prob.dim_state
+                    )
+                    costate_sys.initial_condition = costate
+                    co_res = costate_sys.simulate(
+                        (t0, tf), integrator_options=self.adjoint_int_opts
+                    )
                 costate_reses[output].append(co_res)
 
                 if param_dict:
@@ -148,10 +148,36 @@ class AccelPhaseOptions(AviaryOptionsDictionary):
 
         self.declare(
             name='order',
-            types=int,
+            types=(int, list),
             default=3,
             desc='The order of polynomials for interpolation in the transcription '
-            'created in Dymos. The default value is 3.',
+            'created in Dymos, either one for all segments or a list with one per segment. '
+            'The default value is 3.',
+        )
+
+        self.declare(
+            name='segment_ends',
+            types=list,
+            default=None,
+            desc='Locations of the segment boundaries in the transcription created in Dymos, '
+            'normalized to the range [-1, 1]. If None, the default spacing is used.',
+        )
+
+        self.declare(
+            name='transcription',
+            values=['radau', 'gauss-lobatto', 'birkhoff'],
+            default='radau',
+            desc='The transcription created in Dymos: Radau pseudospectral (the default), '
+            'Gauss-Lobatto, or Birkhoff. The Birkhoff transcription uses a single segment '
+            'with num_segments * order + 1 nodes unless transcription_options says otherwise.',
+        )
+
+        self.declare(
+            name='transcription_options',
+            types=dict,
+            default=None,
+            desc='Options passed to the transcription created in Dymos, which override the '
+            "ones set from the other user_options, such as {'grid_type': 'lgl'} for Birkhoff.",
         )
 
 
@@ -276,6 +276,12 @@ class SGMAscentCombined(SGMAscent):
         for ode in self.odes:
             ode.set_val(*args, **kwargs)
 
+    def release(self):
+        for ode in self.odes:
+            ode.release()
+
+        super().release()
+
     def compute_alpha(self, ode, t, x):
         return ode.output_equation_function(t, x)[
             list(ode.outputs.keys()).index(Dynamic.Vehicle.ANGLE_OF_ATTACK)
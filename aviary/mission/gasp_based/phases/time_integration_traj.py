@@ -33,6 +33,9 @@ class FlexibleTraj(TimeIntegrationTrajBase):
         self.options.declare('traj_event_trigger_input', default=None)
 
     def setup(self):
+        # the phases are built again, so the problems of the previous ones can be reused
+        self.release_problems()
+
         ODEs = []
         for phase_name, phase_info in self.options['Phases'].items():
             kwargs = phase_info.get('kwargs', {})
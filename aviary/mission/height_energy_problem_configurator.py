@@ -3,6 +3,7 @@ import openmdao.api as om
 from dymos.transcriptions.transcription_base import TranscriptionBase
 
 from aviary.mission.flight_phase_builder import FlightPhaseOptions
+from aviary.mission.flops_based.phases.breguet_cruise_phase import BreguetCruisePhase
 from aviary.mission.flops_based.phases.build_landing import Landing
 from aviary.mission.flops_based.phases.build_takeoff import Takeoff
 from aviary.mission.flops_based.phases.energy_phase import EnergyPhase
@@ -176,6 +177,8 @@ class HeightEnergyProblemConfigurator(ProblemConfiguratorBase):
                     'phase_builder for the phase called '
                     '{phase_name} must be a PhaseBuilderBase object.'
                 )
+        elif phase_options['user_options'].get('analytic', False):
+            phase_builder = BreguetCruisePhase
         else:
             phase_builder = EnergyPhase
 
@@ -200,6 +203,23 @@ class HeightEnergyProblemConfigurator(ProblemConfiguratorBase):
         user_options : dict
             Subdictionary "user_options" from the phase_info.
         """
+        if prob.phase_info[phase_name]['user_options'].get('analytic', False):
+            # Time here is really the independent variable through which we are integrating.
+            # In the case of the Breguet cruise ODE, it's mass.
+            # We rely on mass being monotonically non-increasing across the phase.
+            phase.set_time_options(
+                name='mass',
+                fix_initial=False,
+                fix_duration=False,
+                units='lbm',
+                targets='mass',
+                initial_bounds=(0.0, 1.0e7),
+                initial_ref=100.0e3,
+                duration_bounds=(-1.0e7, -1),
+                duration_ref=50000,
+            )
+            return
+
         try:
             fix_initial = user_options.get_val('fix_initial')
         except KeyError:
@@ -283,44 +303,90 @@ class HeightEnergyProblemConfigurator(ProblemConfiguratorBase):
             handled by constraints if `phases` is a parallel group under MPI.
         """
         # connect regular_phases with each other if you are optimizing alt or mach
-        prob._link_phases_helper_with_options(
-            prob.regular_phases,
-            'optimize_altitude',
-            Dynamic.Mission.ALTITUDE,
-            ref=1.0e4,
-        )
-        prob._link_phases_helper_with_options(
-            prob.regular_phases, 'optimize_mach', Dynamic.Atmosphere.MACH
-        )
+        for collocated_phases in self._collocated_runs(prob, prob.regular_phases):
+            prob._link_phases_helper_with_options(
+                collocated_phases,
+                'optimize_altitude',
+                Dynamic.Mission.ALTITUDE,
+                ref=1.0e4,
+            )
+            prob._link_phases_helper_with_options(
+                collocated_phases, 'optimize_mach', Dynamic.Atmosphere.MACH
+            )
 
         # connect reserve phases with each other if you are optimizing alt or mach
-        prob._link_phases_helper_with_options(
-            prob.reserve_phases,
-            'optimize_altitude',
-            Dynamic.Mission.ALTITUDE,
-            ref=1.0e4,
-        )
-        prob._link_phases_helper_with_options(
-            prob.reserve_phases, 'optimize_mach', Dynamic.Atmosphere.MACH
-        )
+        for collocated_phases in self._collocated_runs(prob, prob.reserve_phases):
+            prob._link_phases_helper_with_options(
+                collocated_phases,
+                'optimize_altitude',
+                Dynamic.Mission.ALTITUDE,
+                ref=1.0e4,
+            )
+            prob._link_phases_helper_with_options(
+                collocated_phases, 'optimize_mach', Dynamic.Atmosphere.MACH
+            )
 
         # connect mass and distance between all phases regardless of reserve /
         # non-reserve status
-        prob.traj.link_phases(
-            phases, ['time'], ref=None if connect_directly else 1e3, connected=connect_directly
-        )
-        prob.traj.link_phases(
-            phases,
-            [Dynamic.Vehicle.MASS],
-            ref=None if connect_directly else 1e6,
-            connected=connect_directly,
-        )
-        prob.traj.link_phases(
-            phases,
-            [Dynamic.Mission.DISTANCE],
-            ref=None if connect_directly else 1e3,
-            connected=connect_directly,
-        )
+        for collocated_phases in self._collocated_runs(prob, phases):
+            if len(collocated_phases) < 2:
+                continue
+
+            prob.traj.link_phases(
+                collocated_phases,
+                ['time'],
+                ref=None if connect_directly else 1e3,
+                connected=connect_directly,
+            )
+            prob.traj.link_phases(
+                collocated_phases,
+                [Dynamic.Vehicle.MASS],
+                ref=None if connect_directly else 1e6,
+                connected=connect_directly,
+            )
+            prob.traj.link_phases(
+                collocated_phases,
+                [Dynamic.Mission.DISTANCE],
+                ref=None if connect_directly else 1e3,
+                connected=connect_directly,
+            )
+
+        # analytic phases have no states, so they need linkage constraints
+        phase_objects = {phase_object.name: phase_object for phase_object in prob.phase_objects}
+
+        for phase1, phase2 in zip(phases[:-1], phases[1:]):
+            analytic1 = prob.phase_info[phase1]['user_options'].get('analytic', False)
+            analytic2 = prob.phase_info[phase2]['user_options'].get('analytic', False)
+
+            if not (analytic1 or analytic2):
+                continue
+
+            # analytic phases use the prefix "initial" for time and distance,
+            # but not mass
+            if analytic2:
+                prefix = 'initial_'
+            else:
+                prefix = ''
+
+            prob.traj.add_linkage_constraint(
+                phase1, phase2, 'time', prefix + 'time', connected=True
+            )
+            prob.traj.add_linkage_constraint(
+                phase1, phase2, 'distance', prefix + 'distance', connected=True
+            )
+            prob.traj.add_linkage_constraint(
+                phase1, phase2, 'mass', 'mass', connected=False, units='lbm', ref=1.0e5
+            )
+
+            # the altitude and Mach number of analytic phases follow from their user_options,
+            # so the neighbouring phases must start and end at the same values
+            for var, units, ref in (
+                (Dynamic.Mission.ALTITUDE, 'ft', 1.0e4),
+                (Dynamic.Atmosphere.MACH, None, None),
+            ):
+                self._link_analytic_boundary(
+                    prob, phase_objects[phase1], phase_objects[phase2], var, units, ref
+                )
 
         prob.model.connect(
             f'traj.{prob.regular_phases[-1]}.timeseries.distance',
@@ -329,6 +395,89 @@ class HeightEnergyProblemConfigurator(ProblemConfiguratorBase):
             flat_src_indices=True,
         )
 
+    def _link_analytic_boundary(self, prob, phase1, phase2, var, units, ref):
+        """
+        Make altitude or Mach number agree at the interface of two phases, one analytic.
+
+        When either phase optimizes the variable, the interface is enforced with a linkage
+        constraint. Otherwise both values are fixed by the user_options, which are checked
+        to agree here.
+
+        Parameters
+        ----------
+        prob : AviaryProblem
+            Problem that owns this builder.
+        phase1 : PhaseBuilderBase
+            Builder of the phase that ends at the interface.
+        phase2 : PhaseBuilderBase
+            Builder of the phase that starts at the interface.
+        var : str
+            Name of the variable, Dynamic.Mission.ALTITUDE or Dynamic.Atmosphere.MACH.
+        units : str or None
+            Units of the variable in the user_options, or None for unitless options.
+        ref : float or None
+            Scaling of the linkage constraint.
+        """
+        optimize_option = f'optimize_{var}'
+
+        if any(
+            prob.phase_info[phase.name]['user_options'].get(optimize_option, False)
+            for phase in (phase1, phase2)
+        ):
+            prob.traj.add_linkage_constraint(
+                phase1.name, phase2.name, var, var, connected=False, units=units, ref=ref
+            )
+            return
+
+        if f'final_{var}' not in phase1.user_options or f'initial_{var}' not in phase2.user_options:
+            return
+
+        if units is None:
+            final_val = phase1.user_options[f'final_{var}']
+            initial_val = phase2.user_options[f'initial_{var}']
+        else:
+            final_val = phase1.user_options.get_val(f'final_{var}', units)
+            initial_val = phase2.user_options.get_val(f'initial_{var}', units)
+
+        if final_val is None or initial_val is None:
+            return
+
+        if not np.isclose(final_val, initial_val, rtol=1.0e-6, atol=1.0e-10):
+            units_str = '' if units is None else f' {units}'
+            raise ValueError(
+                f'Phase "{phase1.name}" ends at {var} {final_val}{units_str}, but phase '
+                f'"{phase2.name}" starts at {var} {initial_val}{units_str}. The {var} of '
+                'analytic phases is fixed by their user_options, so the final_'
+                f'{var} and initial_{var} of neighbouring phases must agree, or '
+                f'one of them must set {optimize_option} to True.'
+            )
+
+    def _collocated_runs(self, prob, phases):
+        """
+        Split phases into the runs of consecutive phases that are not analytic.
+
+        Parameters
+        ----------
+        prob : AviaryProblem
+            Problem that owns this builder.
+        phases : list of str
+            Names of the phases, in order.
+
+        Returns
+        -------
+        list of list of str
+            Runs of consecutive collocated phases.
+        """
+        runs = [[]]
+
+        for phase_name in phases:
+            if prob.phase_info[phase_name]['user_options'].get('analytic', False):
+                runs.append([])
+            else:
+                runs[-1].append(phase_name)
+
+        return [run for run in runs if run]
+
     def add_post_mission_systems(self, prob, include_landing=True):
         """
         Add any post mission systems.
@@ -368,8 +517,9 @@ class HeightEnergyProblemConfigurator(ProblemConfiguratorBase):
                 'mass', eq_units='lbm', normalize=False, ref=100000.0, add_constraint=True
             )
 
+            # the timeseries is used because the states are inputs in some transcriptions
             prob.model.connect(
-                f'traj.{first_flight_phase_name}.states:mass',
+                f'traj.{first_flight_phase_name}.timeseries.mass',
                 f'link_{first_flight_phase_name}_mass.lhs:mass',
                 src_indices=[0],
                 flat_src_indices=True,
@@ -481,7 +631,7 @@ class HeightEnergyProblemConfigurator(ProblemConfiguratorBase):
 
         last_regular_phase = prob.regular_phases[-1]
         prob.model.connect(
-            f'traj.{last_regular_phase}.states:mass',
+            f'traj.{last_regular_phase}.timeseries.mass',
             Mission.Landing.TOUCHDOWN_MASS,
             src_indices=[-1],
         )
@@ -524,6 +674,40 @@ class HeightEnergyProblemConfigurator(ProblemConfiguratorBase):
         parent_prefix : str
             Location of this trajectory in the hierarchy.
         """
+        # Handle Analytic Phase
+        if prob.phase_info[phase_name]['user_options'].get('analytic', False):
+            guesses = dict(guesses)
+
+            if 'mass' not in guesses:
+                initial_mass = prob.aviary_inputs.get_val(Mission.Design.GROSS_MASS, units='lbm')
+                final_mass = prob.initialization_guesses['cruise_mass_final']
+                guesses['mass'] = ([initial_mass, final_mass - initial_mass], 'lbm')
+
+            for guess_key, guess_data in guesses.items():
+                val, units = guess_data
+
+                if 'mass' == guess_key:
+                    # Set initial and duration mass for the analytic cruise phase.
+                    # Note we are integrating over mass, not time for this phase.
+                    target_prob.set_val(
+                        parent_prefix + f'traj.{phase_name}.t_initial', val[0], units=units
+                    )
+                    target_prob.set_val(
+                        parent_prefix + f'traj.{phase_name}.t_duration', val[1], units=units
+                    )
+
+                else:
+                    # Otherwise, set the value of the parameter in the trajectory
+                    # phase
+                    target_prob.set_val(
+                        parent_prefix + f'traj.{phase_name}.parameters:{guess_key}',
+                        val,
+                        units=units,
+                    )
+
+            # Analytic phase should have nothing else to set.
+            return
+
         control_keys = ['mach', 'altitude']
         state_keys = ['mass', Dynamic.Mission.DISTANCE]
 
@@ -614,8 +798,11 @@ class HeightEnergyProblemConfigurator(ProblemConfiguratorBase):
 
                 # Set initial guess for state variables
                 elif guess_key in state_keys:
-                    target_prob.set_val(
-                        parent_prefix + f'traj.{phase_name}.states:{guess_key}',
+                    self.set_state_guess(
+                        target_prob,
+                        parent_prefix + f'traj.{phase_name}',
+                        phase,
+                        guess_key,
                         prob._process_guess_var(val, guess_key, phase),
                         units=units,
                     )
@@ -639,6 +826,6 @@ class HeightEnergyProblemConfigurator(ProblemConfiguratorBase):
             mass_guess = prob.aviary_inputs.get_val(Mission.Design.GROSS_MASS, units='lbm')
 
             # Set the mass guess as the initial value for the mass state variable
-            target_prob.set_val(
-                parent_prefix + f'traj.{phase_name}.states:mass', mass_guess, units='lbm'
+            self.set_state_guess(
+                target_prob, parent_prefix + f'traj.{phase_name}', phase, 'mass', mass_guess, 'lbm'
             )
@@ -18,6 +18,9 @@ from aviary.utils.aviary_values import AviaryValues, get_keys
 from aviary.variable_info.variable_meta_data import _MetaData
 from aviary.variable_info.variables import Dynamic
 
+# transcriptions that can be selected with the 'transcription' user option
+_TRANSCRIPTIONS = {'radau': dm.Radau, 'gauss-lobatto': dm.GaussLobatto, 'birkhoff': dm.Birkhoff}
+
 _require_new_initial_guesses_meta_data_class_attr_ = namedtuple(
     '_require_new_initial_guesses_meta_data_class_attr_', ()
 )
@@ -215,14 +218,56 @@ class PhaseBuilderBase(ABC):
 
     def make_default_transcription(self):
         """Return a transcription object to be used by default in build_phase."""
+        return self._make_transcription()
+
+    def _make_transcription(self, lgl_segment_ends=False):
+        """
+        Return the transcription selected in the user_options, on the grid given there.
+
+        Parameters
+        ----------
+        lgl_segment_ends : bool
+            If True, the segment ends default to the Legendre-Gauss-Lobatto nodes instead of
+            being evenly spaced.
+        """
         user_options = self.user_options
 
         num_segments = user_options['num_segments']
         order = user_options['order']
+        segment_ends = None
+        method = 'radau'
+        transcription_options = None
+
+        if 'segment_ends' in user_options:
+            segment_ends = user_options['segment_ends']
+
+        if 'transcription' in user_options:
+            method = user_options['transcription']
+            transcription_options = user_options['transcription_options']
+
+        if transcription_options is None:
+            transcription_options = {}
+
+        if method == 'birkhoff':
+            # A single global polynomial, by default with as many nodes as the state
+            # discretization of the segmented grid.
+            num_nodes = num_segments * order + 1 if isinstance(order, int) else sum(order) + 1
+            kwargs = {'num_nodes': num_nodes}
+
+        else:
+            if segment_ends is None and lgl_segment_ends:
+                segment_ends, _ = dm.utils.lgl.lgl(num_segments + 1)
+
+            kwargs = {
+                'num_segments': num_segments,
+                'order': order,
+                'segment_ends': segment_ends,
+                'compressed': True,
+            }
 
-        transcription = dm.Radau(num_segments=num_segments, order=order, compressed=True)
+        kwargs.update(transcription_options)
 
-        return transcription
+        return _TRANSCRIPTIONS[method](**kwargs)
 
     def validate_initial_guesses(self):
         """
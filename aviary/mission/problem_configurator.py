@@ -1,4 +1,6 @@
 # TODO: This is very much a conceptual prototype, and needs fine tuning.
+import dymos as dm
+import numpy as np
 
 
 class ProblemConfiguratorBase:
@@ -182,3 +184,33 @@ class ProblemConfiguratorBase:
             Location of this trajectory in the hierarchy.
         """
         pass
+
+    def set_state_guess(self, target_prob, path, phase, name, val, units=None):
+        """
+        Set the initial guess of a state of a phase.
+
+        The Birkhoff transcription has separate design variables for the values of the
+        states at the ends of the phase, which are set from the first and last values of
+        the guess.
+
+        Parameters
+        ----------
+        target_prob : Problem
+            Problem instance to apply the guess.
+        path : str
+            Path of the phase in the problem.
+        phase : Phase
+            The phase object that owns the state.
+        name : str
+            Name of the state.
+        val : float or ndarray
+            Guess of the state at the nodes of the phase.
+        units : str or None
+            Units of the guess.
+        """
+        target_prob.set_val(f'{path}.states:{name}', val, units=units)
+
+        if isinstance(phase.options['transcription'], dm.Birkhoff):
+            val = np.ravel(val)
+            target_prob.set_val(f'{path}.initial_states:{name}', val[0], units=units)
+            target_prob.set_val(f'{path}.final_states:{name}', val[-1], units=units)
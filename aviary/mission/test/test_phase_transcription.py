@@ -0,0 +1,78 @@
+import unittest
+from copy import deepcopy
+
+import dymos as dm
+from numpy.testing import assert_almost_equal
+
+from aviary.interface.default_phase_info.height_energy import phase_info
+from aviary.interface.default_phase_info.two_dof import phase_info as two_dof_phase_info
+from aviary.mission.flops_based.phases.energy_phase import EnergyPhase
+from aviary.mission.gasp_based.phases.climb_phase import ClimbPhase
+
+
+class PhaseTranscriptionTest(unittest.TestCase):
+    def test_default_grid(self):
+        builder = EnergyPhase.from_phase_info('climb', deepcopy(phase_info['climb']))
+        transcription = builder.make_default_transcription()
+
+        self.assertIsInstance(transcription, dm.Radau)
+        self.assertEqual(transcription.options['num_segments'], 5)
+        self.assertEqual(transcription.options['order'], 3)
+        # segment ends default to the LGL nodes
+        assert_almost_equal(transcription.options['segment_ends'][1], -0.76505532)
+
+    def test_user_grid(self):
+        info = deepcopy(phase_info['climb'])
+        info['user_options'].update(
+            {'num_segments': 2, 'order': [3, 5], 'segment_ends': [-1.0, 0.5, 1.0]}
+        )
+
+        builder = EnergyPhase.from_phase_info('climb', info)
+        transcription = builder.make_default_transcription()
+
+        self.assertEqual(transcription.options['num_segments'], 2)
+        self.assertEqual(transcription.options['order'], [3, 5])
+        self.assertEqual(transcription.options['segment_ends'], [-1.0, 0.5, 1.0])
+
+    def test_gauss_lobatto(self):
+        info = deepcopy(phase_info['cruise'])
+        info['user_options']['transcription'] = 'gauss-lobatto'
+        info['user_options']['transcription_options'] = {'compressed': False}
+
+        builder = EnergyPhase.from_phase_info('cruise', info)
+        transcription = builder.make_default_transcription()
+
+        self.assertIsInstance(transcription, dm.GaussLobatto)
+        self.assertEqual(transcription.options['num_segments'], 5)
+        self.assertFalse(transcription.options['compressed'])
+
+    def test_birkhoff(self):
+        info = deepcopy(two_dof_phase_info['climb1'])
+        info['user_options']['transcription'] = 'birkhoff'
+
+        builder = ClimbPhase.from_phase_info('climb1', info)
+        transcription = builder.make_default_transcription()
+
+        num_segments = builder.user_options['num_segments']
+        order = builder.user_options['order']
+
+        self.assertIsInstance(transcription, dm.Birkhoff)
+        self.assertEqual(transcription.options['num_nodes'], num_segments * order + 1)
+
+        info['user_options']['transcription_options'] = {'num_nodes': 20, 'grid_type': 'lgl'}
+        builder = ClimbPhase.from_phase_info('climb1', info)
+        transcription = builder.make_default_transcription()
+
+        self.assertEqual(transcription.options['num_nodes'], 20)
+        self.assertEqual(transcription.options['grid_type'], 'lgl')
+
+    def test_invalid_transcription(self):
+        info = deepcopy(phase_info['cruise'])
+        info['user_options']['transcription'] = 'trapezoidal'
+
+        with self.assertRaises(ValueError):
+            EnergyPhase.from_phase_info('cruise', info)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -533,8 +533,9 @@ class TwoDOFProblemConfigurator(ProblemConfiguratorBase):
                 'mass', eq_units='lbm', normalize=False, ref=10000.0, add_constraint=True
             )
             prob.model.connect('taxi.mass', 'taxi_groundroll_mass_constraint.rhs:mass')
+            # the timeseries is used because the states are inputs in some transcriptions
             prob.model.connect(
-                'traj.groundroll.states:mass',
+                'traj.groundroll.timeseries.mass',
                 'taxi_groundroll_mass_constraint.lhs:mass',
                 src_indices=[0],
                 flat_src_indices=True,
@@ -544,7 +545,7 @@ class TwoDOFProblemConfigurator(ProblemConfiguratorBase):
             prob.model.connect('traj.ascent.timeseries.altitude', 'h_fit.h_cp')
 
             prob.model.connect(
-                f'traj.{prob.regular_phases[-1]}.states:mass',
+                f'traj.{prob.regular_phases[-1]}.timeseries.mass',
                 Mission.Landing.TOUCHDOWN_MASS,
                 src_indices=[-1],
             )
@@ -601,7 +602,7 @@ class TwoDOFProblemConfigurator(ProblemConfiguratorBase):
         )
         prob.model.connect(Mission.Takeoff.ROTATION_VELOCITY, 'groundroll_boundary.rhs:velocity')
         prob.model.connect(
-            'traj.groundroll.states:velocity',
+            'traj.groundroll.timeseries.velocity',
             'groundroll_boundary.lhs:velocity',
             src_indices=[-1],
             flat_src_indices=True,
@@ -664,14 +665,11 @@ class TwoDOFProblemConfigurator(ProblemConfiguratorBase):
             promotes_outputs=['mission:*'],
         )
 
-        prob.model.connect(
-            'pre_mission.interference_independent_of_shielded_area',
-            'landing.interference_independent_of_shielded_area',
-        )
-        prob.model.connect(
-            'pre_mission.drag_loss_due_to_shielded_wing_area',
-            'landing.drag_loss_due_to_shielded_wing_area',
-        )
+        # landing aero uses the same pre-mission aero outputs as the phases
+        aero_bus_variables = prob.core_subsystems['aerodynamics'].get_bus_variables()
+        for bus_variable, variable_data in aero_bus_variables.items():
+            for mission_var_name in variable_data['mission_name']:
+                prob.model.connect(f'pre_mission.{bus_variable}', f'landing.{mission_var_name}')
 
     def add_objective(self, prob):
         """
@@ -801,8 +799,11 @@ class TwoDOFProblemConfigurator(ProblemConfiguratorBase):
 
                 # Set initial guess for state variables
                 elif guess_key in state_keys:
-                    target_prob.set_val(
-                        parent_prefix + f'traj.{phase_name}.states:{guess_key}',
+                    self.set_state_guess(
+                        target_prob,
+                        parent_prefix + f'traj.{phase_name}',
+                        phase,
+                        guess_key,
                         prob._process_guess_var(val, guess_key, phase),
                         units=units,
                     )
@@ -838,8 +839,8 @@ class TwoDOFProblemConfigurator(ProblemConfiguratorBase):
                 mass_guess = 0.9 * prob.cruise_mass_final
 
             # Set the mass guess as the initial value for the mass state variable
-            target_prob.set_val(
-                parent_prefix + f'traj.{phase_name}.states:mass', mass_guess, units='lbm'
+            self.set_state_guess(
+                target_prob, parent_prefix + f'traj.{phase_name}', phase, 'mass', mass_guess, 'lbm'
             )
 
         if 'time' not in guesses:
@@ -868,7 +869,10 @@ class TwoDOFProblemConfigurator(ProblemConfiguratorBase):
                 ys = [prob.target_range * 0.99, prob.target_range]
             # Set the distance guesses as the initial values for the distance state
             # variable
-            target_prob.set_val(
-                parent_prefix + f'traj.{phase_name}.states:distance',
+            self.set_state_guess(
+                target_prob,
+                parent_prefix + f'traj.{phase_name}',
+                phase,
+                Dynamic.Mission.DISTANCE,
                 phase.interp(Dynamic.Mission.DISTANCE, ys=ys),
             )
@@ -18,7 +18,11 @@ from aviary.subsystems.aerodynamics.flops_based.design import Design
 from aviary.subsystems.aerodynamics.flops_based.solved_alpha_group import SolvedAlphaGroup
 from aviary.subsystems.aerodynamics.flops_based.tabular_aero_group import TabularAeroGroup
 from aviary.subsystems.aerodynamics.flops_based.takeoff_aero_group import TakeoffAeroGroup
-from aviary.subsystems.aerodynamics.gasp_based.gaspaero import CruiseAero, LowSpeedAero
+from aviary.subsystems.aerodynamics.gasp_based.gaspaero import (
+    PREMISSION_GEOMETRY_OUTPUTS,
+    CruiseAero,
+    LowSpeedAero,
+)
 from aviary.subsystems.aerodynamics.gasp_based.premission_aero import PreMissionAero
 from aviary.subsystems.aerodynamics.gasp_based.table_based import (
     TabularCruiseAero,
@@ -83,7 +87,7 @@ class CoreAerodynamicsBuilder(AerodynamicsBuilderBase):
         Generate the report for Aviary core aerodynamics analysis.
     """
 
-    def __init__(self, name=None, meta_data=None, code_origin=None):
+    def __init__(self, name=None, meta_data=None, code_origin=None, premission_geometry=False):
         if name is None:
             name = 'core_aerodynamics'
 
@@ -92,6 +96,12 @@ class CoreAerodynamicsBuilder(AerodynamicsBuilderBase):
 
         self.code_origin = code_origin
 
+        # GASP-based only: compute the flight-condition-independent aero geometry once in
+        # pre-mission and pass it to the phases as bus variables, instead of computing it
+        # inside every mission aero group. Requires the pre-mission system of this
+        # builder to be connected to every mission system it builds.
+        self.premission_geometry = premission_geometry
+
         super().__init__(name=name, meta_data=meta_data)
 
     def build_pre_mission(self, aviary_inputs, **kwargs):
@@ -105,7 +115,7 @@ class CoreAerodynamicsBuilder(AerodynamicsBuilderBase):
             return None
 
         if code_origin is GASP:
-            return PreMissionAero()
+            return PreMissionAero(premission_geometry=self.premission_geometry)
 
         elif code_origin is FLOPS:
             return Design()
@@ -157,7 +167,9 @@ class CoreAerodynamicsBuilder(AerodynamicsBuilderBase):
 
         elif self.code_origin is GASP:
             if method is None:
-                aero_group = CruiseAero(num_nodes=num_nodes)
+                aero_group = CruiseAero(
+                    num_nodes=num_nodes, premission_geometry=self.premission_geometry
+                )
 
             elif method == 'cruise':
                 if 'aero_data' in kwargs:
@@ -168,7 +180,11 @@ class CoreAerodynamicsBuilder(AerodynamicsBuilderBase):
                         **kwargs,
                     )
                 else:
-                    aero_group = CruiseAero(num_nodes=num_nodes, **kwargs)
+                    aero_group = CruiseAero(
+                        num_nodes=num_nodes,
+                        premission_geometry=self.premission_geometry,
+                        **kwargs,
+                    )
 
             elif method == 'low_speed':
                 # all three data types are needed to use tabular aero
@@ -190,7 +206,11 @@ class CoreAerodynamicsBuilder(AerodynamicsBuilderBase):
                         'this data set was not provided.'
                     )
                 else:
-                    aero_group = LowSpeedAero(num_nodes=num_nodes, **kwargs)
+                    aero_group = LowSpeedAero(
+                        num_nodes=num_nodes,
+                        premission_geometry=self.premission_geometry,
+                        **kwargs,
+                    )
 
             else:
                 raise ValueError(
@@ -557,6 +577,9 @@ class CoreAerodynamicsBuilder(AerodynamicsBuilderBase):
             else:
                 all_vars = (AERO_2DOF_INPUTS, AERO_CLEAN_2DOF_INPUTS)
 
+            if not self.premission_geometry:
+                all_vars += (AERO_2DOF_GEOMETRY_INPUTS,)
+
             for var in chain.from_iterable(all_vars):
                 meta = _MetaData[var]
 
@@ -577,6 +600,13 @@ class CoreAerodynamicsBuilder(AerodynamicsBuilderBase):
 
     def get_bus_variables(self):
         if self.code_origin is GASP:
+            if self.premission_geometry:
+                # the shielded area interference terms are consumed in pre-mission
+                return {
+                    name: {'mission_name': [name], 'units': units}
+                    for name, units in PREMISSION_GEOMETRY_OUTPUTS.items()
+                }
+
             return {
                 'interference_independent_of_shielded_area': {
                     'mission_name': ['interference_independent_of_shielded_area'],
@@ -676,6 +706,18 @@ ENGINE_SIZED_INPUTS = [
 ]
 
 AERO_2DOF_INPUTS = [
+    Aircraft.HorizontalTail.SWEEP,
+    Aircraft.HorizontalTail.VERTICAL_TAIL_FRACTION,
+    Aircraft.Wing.AREA,
+    Aircraft.Wing.ASPECT_RATIO,
+    Aircraft.Wing.FORM_FACTOR,
+    Aircraft.Wing.SWEEP,
+    Aircraft.Wing.ZERO_LIFT_ANGLE,
+]
+
+# Only needed by the mission aero when the flight-condition-independent geometry is not
+# computed in pre-mission.
+AERO_2DOF_GEOMETRY_INPUTS = [
     Aircraft.Design.CG_DELTA,
     Aircraft.Design.DRAG_COEFFICIENT_INCREMENT,  # drag increment?
     Aircraft.Design.STATIC_MARGIN,
@@ -689,8 +731,6 @@ AERO_2DOF_INPUTS = [
     Aircraft.HorizontalTail.FORM_FACTOR,
     Aircraft.HorizontalTail.MOMENT_RATIO,
     Aircraft.HorizontalTail.SPAN,
-    Aircraft.HorizontalTail.SWEEP,
-    Aircraft.HorizontalTail.VERTICAL_TAIL_FRACTION,
     Aircraft.Nacelle.AVG_LENGTH,
     Aircraft.Nacelle.FORM_FACTOR,
     Aircraft.Nacelle.SURFACE_AREA,
@@ -702,27 +742,25 @@ AERO_2DOF_INPUTS = [
     Aircraft.VerticalTail.FORM_FACTOR,
     Aircraft.VerticalTail.SPAN,
     Aircraft.Wing.AVERAGE_CHORD,
-    Aircraft.Wing.AREA,
-    Aircraft.Wing.ASPECT_RATIO,
-    Aircraft.Wing.FORM_FACTOR,
     Aircraft.Wing.FUSELAGE_INTERFERENCE_FACTOR,
     Aircraft.Wing.MAX_THICKNESS_LOCATION,
     Aircraft.Wing.MIN_PRESSURE_LOCATION,
     Aircraft.Wing.SPAN,
-    Aircraft.Wing.SWEEP,
     Aircraft.Wing.TAPER_RATIO,
     Aircraft.Wing.THICKNESS_TO_CHORD_ROOT,
     Aircraft.Wing.THICKNESS_TO_CHORD_UNWEIGHTED,
     Aircraft.Wing.VERTICAL_MOUNT_LOCATION,
-    Aircraft.Wing.ZERO_LIFT_ANGLE,
 ]
 
 AERO_LS_2DOF_INPUTS = [
     Mission.Takeoff.DRAG_COEFFICIENT_FLAP_INCREMENT,
     Mission.Takeoff.LIFT_COEFFICIENT_FLAP_INCREMENT,
     Mission.Takeoff.LIFT_COEFFICIENT_MAX,
+    Aircraft.Wing.AVERAGE_CHORD,
     Aircraft.Wing.HEIGHT,
     Aircraft.Wing.FLAP_CHORD_RATIO,
+    Aircraft.Wing.SPAN,
+    Aircraft.Wing.TAPER_RATIO,
     Mission.Design.GROSS_MASS,
 ]
 
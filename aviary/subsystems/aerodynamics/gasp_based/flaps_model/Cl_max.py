@@ -1,3 +1,4 @@
+import numpy as np
 import openmdao.api as om
 
 from aviary.variable_info.functions import add_aviary_input
@@ -168,9 +169,6 @@ class CLmaxCalculation(om.ExplicitComponent):
                 'VLAM14',
                 'fus_lift',
             ],
-            dependent=True,
-            method='cs',
-            step=1e-8,
         )
         self.declare_partials(
             Dynamic.Atmosphere.MACH,
@@ -196,9 +194,6 @@ class CLmaxCalculation(om.ExplicitComponent):
                 'VLAM14',
                 'fus_lift',
             ],
-            dependent=True,
-            method='cs',
-            step=1e-8,
         )
         self.declare_partials(
             'reynolds',
@@ -227,9 +222,6 @@ class CLmaxCalculation(om.ExplicitComponent):
                 'VLAM14',
                 'fus_lift',
             ],
-            dependent=True,
-            method='cs',
-            step=1e-8,
         )
 
     def compute(self, inputs, outputs):
@@ -272,3 +264,98 @@ class CLmaxCalculation(om.ExplicitComponent):
 
         VK = mach * sos
         outputs['reynolds'] = (avg_chord * VK / kinematic_viscosity) / 100000
+
+    def compute_partials(self, inputs, J):
+        VLAM1 = inputs['VLAM1']
+        VLAM2 = inputs['VLAM2']
+        VLAM3 = inputs['VLAM3']
+        VLAM4 = inputs['VLAM4']
+        VLAM5 = inputs['VLAM5']
+        VLAM6 = inputs['VLAM6']
+        VLAM7 = inputs['VLAM7']
+        VLAM8 = inputs['VLAM8']
+        VLAM9 = inputs['VLAM9']
+        VLAM10 = inputs['VLAM10']
+        VLAM11 = inputs['VLAM11']
+        VLAM12 = inputs['VLAM12']
+        VLAM13 = inputs['VLAM13']
+        VLAM14 = inputs['VLAM14']
+
+        sos = inputs[Dynamic.Atmosphere.SPEED_OF_SOUND]
+        wing_loading = inputs[Aircraft.Wing.LOADING]
+        P = inputs[Dynamic.Atmosphere.STATIC_PRESSURE]
+        avg_chord = inputs[Aircraft.Wing.AVERAGE_CHORD]
+        kinematic_viscosity = inputs[Dynamic.Atmosphere.KINEMATIC_VISCOSITY]
+        max_lift_reference = inputs[Aircraft.Wing.MAX_LIFT_REF]
+        leading_lift_increment = inputs[Aircraft.Wing.SLAT_LIFT_INCREMENT_OPTIMUM]
+        fus_lift = inputs['fus_lift']
+        trailing_lift_increment = inputs[Aircraft.Wing.FLAP_LIFT_INCREMENT_OPTIMUM]
+
+        clean = max_lift_reference * VLAM1 * VLAM2
+        trailing = trailing_lift_increment * VLAM3 * VLAM4 * VLAM5 * VLAM6 * VLAM7 * VLAM8
+        leading = leading_lift_increment * VLAM9 * VLAM10 * VLAM11 * VLAM12
+        corrections = VLAM13 * VLAM14
+        CL_max = (clean + trailing + leading) * corrections + fus_lift
+
+        mach = (wing_loading / CL_max / 0.7 / P) ** 0.5
+        reynolds = (avg_chord * mach * sos / kinematic_viscosity) / 100000
+
+        # each term of CL_max is a product of its factors, so the derivative with respect
+        # to a factor is the product of all the others
+        def product_partials(factors):
+            return [
+                np.prod([f for j, f in enumerate(factors) if j != i], axis=0)
+                for i in range(len(factors))
+            ]
+
+        dCL_max = {}
+        for names, factors in [
+            (
+                [Aircraft.Wing.MAX_LIFT_REF, 'VLAM1', 'VLAM2'],
+                [max_lift_reference, VLAM1, VLAM2],
+            ),
+            (
+                [
+                    Aircraft.Wing.FLAP_LIFT_INCREMENT_OPTIMUM,
+                    'VLAM3',
+                    'VLAM4',
+                    'VLAM5',
+                    'VLAM6',
+                    'VLAM7',
+                    'VLAM8',
+                ],
+                [trailing_lift_increment, VLAM3, VLAM4, VLAM5, VLAM6, VLAM7, VLAM8],
+            ),
+            (
+                [Aircraft.Wing.SLAT_LIFT_INCREMENT_OPTIMUM, 'VLAM9', 'VLAM10', 'VLAM11', 'VLAM12'],
+                [leading_lift_increment, VLAM9, VLAM10, VLAM11, VLAM12],
+            ),
+        ]:
+            for name, deriv in zip(names, product_partials(factors)):
+                dCL_max[name] = deriv * corrections
+
+        dCL_max['VLAM13'] = (clean + trailing + leading) * VLAM14
+        dCL_max['VLAM14'] = (clean + trailing + leading) * VLAM13
+        dCL_max['fus_lift'] = 1.0
+
+        dmach_dCL_max = -0.5 * mach / CL_max
+        dreynolds_dmach = avg_chord * sos / kinematic_viscosity / 100000
+
+        for name, deriv in dCL_max.items():
+            J['CL_max', name] = deriv
+            J[Dynamic.Atmosphere.MACH, name] = dmach_dCL_max * deriv
+            J['reynolds', name] = dreynolds_dmach * dmach_dCL_max * deriv
+
+        dmach_dloading = 0.5 * mach / wing_loading
+        dmach_dP = -0.5 * mach / P
+
+        J[Dynamic.Atmosphere.MACH, Aircraft.Wing.LOADING] = dmach_dloading
+        J[Dynamic.Atmosphere.MACH, Dynamic.Atmosphere.STATIC_PRESSURE] = dmach_dP
+
+        J['reynolds', Aircraft.Wing.LOADING] = dreynolds_dmach * dmach_dloading
+        J['reynolds', Dynamic.Atmosphere.STATIC_PRESSURE] = dreynolds_dmach * dmach_dP
+        J['reynolds', Dynamic.Atmosphere.KINEMATIC_VISCOSITY] = -reynolds / kinematic_viscosity
+        J['reynolds', Dynamic.Atmosphere.SPEED_OF_SOUND] = (
+            avg_chord * mach / kinematic_viscosity / 100000
+        )
+        J['reynolds', Aircraft.Wing.AVERAGE_CHORD] = mach * sos / kinematic_viscosity / 100000
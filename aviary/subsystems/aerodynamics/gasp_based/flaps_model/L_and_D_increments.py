@@ -1,3 +1,4 @@
+import numpy as np
 import openmdao.api as om
 
 from aviary.variable_info.functions import add_aviary_input
@@ -111,9 +112,6 @@ class LiftAndDragIncrements(om.ExplicitComponent):
                 'VDEL4',
                 'VDEL5',
             ],
-            dependent=True,
-            method='cs',
-            step=1e-8,
         )
         self.declare_partials(
             'delta_CL',
@@ -128,9 +126,6 @@ class LiftAndDragIncrements(om.ExplicitComponent):
                 'VLAM13',
                 'VLAM14',
             ],
-            dependent=True,
-            method='cs',
-            step=1e-8,
         )
 
     def compute(self, inputs, outputs):
@@ -162,3 +157,38 @@ class LiftAndDragIncrements(om.ExplicitComponent):
             * VLAM13
             * VLAM14
         )
+
+    def compute_partials(self, inputs, J):
+        # both increments are products of their factors, so the derivative with respect to
+        # a factor is the product of all the others
+        for output, names in [
+            (
+                'delta_CD',
+                [
+                    Aircraft.Wing.FLAP_DRAG_INCREMENT_OPTIMUM,
+                    'VDEL1',
+                    'VDEL2',
+                    'VDEL3',
+                    'VDEL4',
+                    'VDEL5',
+                ],
+            ),
+            (
+                'delta_CL',
+                [
+                    Aircraft.Wing.FLAP_LIFT_INCREMENT_OPTIMUM,
+                    'VLAM3',
+                    'VLAM4',
+                    'VLAM5',
+                    'VLAM6',
+                    'VLAM7',
+                    'VLAM8',
+                    'VLAM13',
+                    'VLAM14',
+                ],
+            ),
+        ]:
+            for name in names:
+                J[output, name] = np.prod(
+                    [inputs[other] for other in names if other != name], axis=0
+                )
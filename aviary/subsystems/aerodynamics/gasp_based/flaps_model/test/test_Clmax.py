@@ -17,7 +17,7 @@ class CLmaxCalculationTestCase(unittest.TestCase):
 
         self.prob.model.add_subsystem('CLmC', CLmaxCalculation(), promotes=['*'])
 
-        self.prob.setup()
+        self.prob.setup(force_alloc_complex=True)
 
         # initial conditions
         self.prob.set_val('VLAM1', 0.97217)
@@ -63,10 +63,8 @@ class CLmaxCalculationTestCase(unittest.TestCase):
         ans = self.prob['reynolds']
         assert_near_equal(ans, reg_data, tol)
 
-        data = self.prob.check_partials(out_stream=None, method='fd')
-        assert_check_partials(
-            data, atol=6400, rtol=0.007
-        )  # large to account for large magnitude value, discrepancies are acceptable
+        data = self.prob.check_partials(out_stream=None, method='cs')
+        assert_check_partials(data, atol=1e-12, rtol=1e-12)
 
 
 if __name__ == '__main__':
@@ -4,7 +4,7 @@ from openmdao.utils import cs_safe as cs
 
 from aviary.constants import GRAV_ENGLISH_LBM
 from aviary.subsystems.aerodynamics.gasp_based.common import AeroForces, CLFromLift, TanhRampComp
-from aviary.utils.functions import sigmoidX
+from aviary.utils.functions import dSigmoidXdx, sigmoidX
 from aviary.variable_info.functions import add_aviary_input, add_aviary_option, add_aviary_output
 from aviary.variable_info.variables import Aircraft, Dynamic, Mission
 
@@ -128,6 +128,37 @@ def cla(ar, sweep, mach):
     )
 
 
+def dcla(ar, sweep, mach):
+    """Partial derivatives of the Seckel lift-curve slope.
+
+    Parameters
+    ----------
+    ar : float
+        Aspect ratio
+    sweep : float
+        Quarter-chord sweep angle, in radians
+    mach : float
+        Mach number.
+
+    Returns
+    -------
+    tuple
+        Derivatives of cla with respect to aspect ratio, sweep (per radian) and Mach
+        number.
+    """
+    cos_sweep = np.cos(sweep)
+    k2 = (ar / (2 * cos_sweep)) ** 2
+    q = 1 - (mach * cos_sweep) ** 2
+    root = np.sqrt(1 + k2 * q)
+    dcla_droot = -np.pi * ar / (1 + root) ** 2
+
+    dcla_dar = np.pi / (1 + root) + dcla_droot * k2 * q / (ar * root)
+    dcla_dsweep = dcla_droot * k2 * (q * np.tan(sweep) + mach**2 * cos_sweep * np.sin(sweep)) / root
+    dcla_dmach = -dcla_droot * k2 * mach * cos_sweep**2 / root
+
+    return dcla_dar, dcla_dsweep, dcla_dmach
+
+
 class WingTailRatios(om.ExplicitComponent):
     """Pre-mission calculation of ratios between tail and wing parameters."""
 
@@ -179,18 +210,11 @@ class WingTailRatios(om.ExplicitComponent):
                 Aircraft.Wing.SPAN,
                 Aircraft.Wing.TAPER_RATIO,
             ],
-            method='cs',
-        )
-        self.declare_partials(
-            'bbar', [Aircraft.HorizontalTail.SPAN, Aircraft.Wing.SPAN], method='cs'
         )
+        self.declare_partials('bbar', [Aircraft.HorizontalTail.SPAN, Aircraft.Wing.SPAN])
+        self.declare_partials('sbar', [Aircraft.HorizontalTail.AREA, Aircraft.Wing.AREA])
         self.declare_partials(
-            'sbar', [Aircraft.HorizontalTail.AREA, Aircraft.Wing.AREA], method='cs'
-        )
-        self.declare_partials(
-            'cbar',
-            [Aircraft.HorizontalTail.AVERAGE_CHORD, Aircraft.Wing.AVERAGE_CHORD],
-            method='cs',
+            'cbar', [Aircraft.HorizontalTail.AVERAGE_CHORD, Aircraft.Wing.AVERAGE_CHORD]
         )
 
     def compute(self, inputs, outputs):
@@ -216,35 +240,67 @@ class WingTailRatios(om.ExplicitComponent):
         outputs['sbar'] = htail_area / wing_area
         outputs['cbar'] = htail_chord / avg_chord
 
+    def compute_partials(self, inputs, J):
+        (
+            wing_area,
+            wingspan,
+            avg_chord,
+            taper_ratio,
+            tc_ratio_root,
+            wing_loc,
+            htail_loc,
+            span_htail,
+            span_vtail,
+            htail_area,
+            htail_chord,
+            cabin_width,
+        ) = inputs.values()
 
-class Xlifts(om.ExplicitComponent):
-    """Compute lift ratio and lift-curve slope for given stability margin."""
+        trtw = tc_ratio_root * 2 * wing_area / wingspan / (1 + taper_ratio)
+        gap = htail_loc * span_vtail - 0.5 * (cabin_width - trtw) * (2 * wing_loc - 1)
+        hgap = np.abs(gap)
+        # derivative of cs.abs, which is +1 at zero
+        dhbar_dgap = np.where(gap >= 0.0, 1.0, -1.0) / wingspan
+        dgap_dtrtw = 0.5 * (2 * wing_loc - 1)
+
+        J['hbar', Aircraft.HorizontalTail.VERTICAL_TAIL_FRACTION] = dhbar_dgap * span_vtail
+        J['hbar', Aircraft.VerticalTail.SPAN] = dhbar_dgap * htail_loc
+        J['hbar', Aircraft.Fuselage.AVG_DIAMETER] = -dhbar_dgap * 0.5 * (2 * wing_loc - 1)
+        J['hbar', Aircraft.Wing.VERTICAL_MOUNT_LOCATION] = -dhbar_dgap * (cabin_width - trtw)
+        J['hbar', Aircraft.Wing.THICKNESS_TO_CHORD_ROOT] = (
+            dhbar_dgap * dgap_dtrtw * 2 * wing_area / wingspan / (1 + taper_ratio)
+        )
+        J['hbar', Aircraft.Wing.AREA] = (
+            dhbar_dgap * dgap_dtrtw * tc_ratio_root * 2 / wingspan / (1 + taper_ratio)
+        )
+        J['hbar', Aircraft.Wing.SPAN] = (
+            -dhbar_dgap * dgap_dtrtw * trtw / wingspan - hgap / wingspan**2
+        )
+        J['hbar', Aircraft.Wing.TAPER_RATIO] = -dhbar_dgap * dgap_dtrtw * trtw / (1 + taper_ratio)
 
-    def initialize(self):
-        self.options.declare('num_nodes', default=1, types=int)
+        J['bbar', Aircraft.HorizontalTail.SPAN] = 1 / wingspan
+        J['bbar', Aircraft.Wing.SPAN] = -span_htail / wingspan**2
+        J['sbar', Aircraft.HorizontalTail.AREA] = 1 / wing_area
+        J['sbar', Aircraft.Wing.AREA] = -htail_area / wing_area**2
+        J['cbar', Aircraft.HorizontalTail.AVERAGE_CHORD] = 1 / avg_chord
+        J['cbar', Aircraft.Wing.AVERAGE_CHORD] = -htail_chord / avg_chord**2
 
-    def setup(self):
-        nn = self.options['num_nodes']
 
-        # mission inputs
-        add_aviary_input(self, Dynamic.Atmosphere.MACH, shape=nn, units='unitless')
+class XliftsPremission(om.ExplicitComponent):
+    """Pre-mission calculation of the geometry-only terms of the lift ratio.
 
-        # stability inputs
+    The lift ratio offset from the stability margin and the downwash factors from the
+    Hayes reverse flow theorem do not depend on flight condition, so they are computed
+    once here and passed to Xlifts.
+    """
 
+    def setup(self):
         add_aviary_input(self, Aircraft.Design.STATIC_MARGIN, units='unitless')
 
         add_aviary_input(self, Aircraft.Design.CG_DELTA, units='unitless')
 
-        # geometry inputs
-
         add_aviary_input(self, Aircraft.Wing.ASPECT_RATIO, units='unitless')
 
-        add_aviary_input(self, Aircraft.Wing.SWEEP, units='deg')
-
-        add_aviary_input(self, Aircraft.HorizontalTail.VERTICAL_TAIL_FRACTION, units='unitless')
-
-        add_aviary_input(self, Aircraft.HorizontalTail.SWEEP, units='deg')
-
         add_aviary_input(self, Aircraft.HorizontalTail.MOMENT_RATIO, units='unitless')
 
         # geometry from wing-tail ratios
@@ -253,43 +309,61 @@ class Xlifts(om.ExplicitComponent):
         self.add_input('hbar', units='unitless', desc='HBAR: Ratio of HGAP(?) to wing span')
         self.add_input('bbar', units='unitless', desc='BBAR: Ratio of H tail area to wing area')
 
-        self.add_output('lift_curve_slope', units='unitless', shape=nn, desc='Lift-curve slope')
-        self.add_output('lift_ratio', units='unitless', shape=nn, desc='Lift ratio')
+        self.add_output(
+            'stability_delta',
+            units='unitless',
+            desc='DELTA: Lift ratio offset due to static margin and CG shift',
+        )
+        self.add_output(
+            'htail_effective_aspect_ratio',
+            units='unitless',
+            desc='ART: Effective aspect ratio of the horizontal tail',
+        )
+        self.add_output(
+            'wing_downwash_sum',
+            units='unitless',
+            desc='EPS1 + EPS2 + EPS3: Downwash factor acting on the wing',
+        )
+        self.add_output(
+            'htail_downwash_sum',
+            units='unitless',
+            desc='EPS4 - EPS5 - CBAR * EPS1: Downwash factor acting on the horizontal tail',
+        )
 
     def setup_partials(self):
-        ar = np.arange(self.options['num_nodes'])
-
-        self.declare_partials('lift_ratio', '*', method='cs')
-        self.declare_partials('lift_ratio', Dynamic.Atmosphere.MACH, rows=ar, cols=ar, method='cs')
-        self.declare_partials('lift_curve_slope', '*', method='cs')
         self.declare_partials(
-            'lift_curve_slope',
+            'stability_delta',
+            [
+                Aircraft.Design.STATIC_MARGIN,
+                Aircraft.Design.CG_DELTA,
+                Aircraft.HorizontalTail.MOMENT_RATIO,
+            ],
+        )
+        self.declare_partials(
+            'htail_effective_aspect_ratio',
+            [Aircraft.Wing.ASPECT_RATIO, 'sbar', 'bbar'],
+        )
+        self.declare_partials(
+            'wing_downwash_sum',
+            [Aircraft.Wing.ASPECT_RATIO, Aircraft.HorizontalTail.MOMENT_RATIO, 'hbar'],
+        )
+        self.declare_partials(
+            'htail_downwash_sum',
             [
                 Aircraft.Wing.ASPECT_RATIO,
-                Aircraft.Wing.SWEEP,
-                Aircraft.HorizontalTail.VERTICAL_TAIL_FRACTION,
-                Aircraft.HorizontalTail.SWEEP,
                 Aircraft.HorizontalTail.MOMENT_RATIO,
                 'sbar',
                 'cbar',
                 'hbar',
                 'bbar',
             ],
-            method='cs',
-        )
-        self.declare_partials(
-            'lift_curve_slope', Dynamic.Atmosphere.MACH, rows=ar, cols=ar, method='cs'
         )
 
     def compute(self, inputs, outputs):
         (
-            mach,
             static_margin,
             delta_cg,
             AR,
-            sweep_c4,
-            htail_loc,
-            htail_sweep,
             h_tail_moment,
             sbar,
             cbar,
@@ -305,10 +379,6 @@ class Xlifts(om.ExplicitComponent):
         art = AR * bbar**2 / sbar
         h = hbar * AR
 
-        # stability contribution from each surface
-        claw0 = cla(AR, deg2rad(sweep_c4), mach)
-        clat0 = cla(art, deg2rad(htail_sweep), mach) * (0.9 + 0.1 * htail_loc)
-
         # Hayes reverse flow theorem to estimate downwash effects on wing and canard
         eps1 = 1 / (4 * np.pi * np.sqrt(xt**2 + h**2))
         eps2 = 1 / np.pi / AR
@@ -316,13 +386,178 @@ class Xlifts(om.ExplicitComponent):
         eps4 = 1 / np.pi / art
         eps5 = cs.abs(xt) / (np.pi * art * np.sqrt(xt**2 + h**2 + art**2 * cbar**2 / 4))
 
-        claw = (
-            claw0
-            * (1 - clat0 * (eps4 - eps5 - cbar * eps1))
-            / (1 - clat0 * claw0 * (eps1 + eps2 + eps3) * (eps4 - eps5 - cbar * eps1))
+        outputs['stability_delta'] = delta
+        outputs['htail_effective_aspect_ratio'] = art
+        outputs['wing_downwash_sum'] = eps1 + eps2 + eps3
+        outputs['htail_downwash_sum'] = eps4 - eps5 - cbar * eps1
+
+    def compute_partials(self, inputs, J):
+        (
+            static_margin,
+            delta_cg,
+            AR,
+            h_tail_moment,
+            sbar,
+            cbar,
+            hbar,
+            bbar,
+        ) = inputs.values()
+
+        xt = 1 / h_tail_moment
+        art = AR * bbar**2 / sbar
+        h = hbar * AR
+        abs_xt = np.abs(xt)
+        sign_xt = np.where(xt >= 0.0, 1.0, -1.0)
+
+        r1 = np.sqrt(xt**2 + h**2)
+        r3 = np.sqrt(xt**2 + h**2 + AR**2 / 4)
+        r5 = np.sqrt(xt**2 + h**2 + art**2 * cbar**2 / 4)
+        eps1 = 1 / (4 * np.pi * r1)
+        eps3 = abs_xt / (np.pi * AR * r3)
+        eps5 = abs_xt / (np.pi * art * r5)
+
+        # partials of each downwash factor with respect to xt, h, AR, art and cbar
+        deps1_dxt = -eps1 * xt / r1**2
+        deps1_dh = -eps1 * h / r1**2
+        deps2_dAR = -1 / (np.pi * AR**2)
+        deps3_dxt = sign_xt / (np.pi * AR * r3) - eps3 * xt / r3**2
+        deps3_dh = -eps3 * h / r3**2
+        deps3_dAR = -eps3 / AR - eps3 * AR / (4 * r3**2)
+        deps4_dart = -1 / (np.pi * art**2)
+        deps5_dxt = sign_xt / (np.pi * art * r5) - eps5 * xt / r5**2
+        deps5_dh = -eps5 * h / r5**2
+        deps5_dart = -eps5 / art - eps5 * art * cbar**2 / (4 * r5**2)
+        deps5_dcbar = -eps5 * art**2 * cbar / (4 * r5**2)
+
+        dwing_dxt = deps1_dxt + deps3_dxt
+        dwing_dh = deps1_dh + deps3_dh
+        dhtail_dxt = -deps5_dxt - cbar * deps1_dxt
+        dhtail_dh = -deps5_dh - cbar * deps1_dh
+        dhtail_dart = deps4_dart - deps5_dart
+
+        dxt_dmoment = -(xt**2)
+        dart_dAR = bbar**2 / sbar
+        dart_dsbar = -art / sbar
+        dart_dbbar = 2 * AR * bbar / sbar
+
+        J['stability_delta', Aircraft.Design.STATIC_MARGIN] = h_tail_moment
+        J['stability_delta', Aircraft.Design.CG_DELTA] = h_tail_moment
+        J['stability_delta', Aircraft.HorizontalTail.MOMENT_RATIO] = static_margin + delta_cg
+
+        J['htail_effective_aspect_ratio', Aircraft.Wing.ASPECT_RATIO] = dart_dAR
+        J['htail_effective_aspect_ratio', 'sbar'] = dart_dsbar
+        J['htail_effective_aspect_ratio', 'bbar'] = dart_dbbar
+
+        J['wing_downwash_sum', Aircraft.Wing.ASPECT_RATIO] = dwing_dh * hbar + deps2_dAR + deps3_dAR
+        J['wing_downwash_sum', Aircraft.HorizontalTail.MOMENT_RATIO] = dwing_dxt * dxt_dmoment
+        J['wing_downwash_sum', 'hbar'] = dwing_dh * AR
+
+        J['htail_downwash_sum', Aircraft.Wing.ASPECT_RATIO] = (
+            dhtail_dh * hbar + dhtail_dart * dart_dAR
         )
+        J['htail_downwash_sum', Aircraft.HorizontalTail.MOMENT_RATIO] = dhtail_dxt * dxt_dmoment
+        J['htail_downwash_sum', 'sbar'] = dhtail_dart * dart_dsbar
+        J['htail_downwash_sum', 'cbar'] = -deps5_dcbar - eps1
+        J['htail_downwash_sum', 'hbar'] = dhtail_dh * AR
+        J['htail_downwash_sum', 'bbar'] = dhtail_dart * dart_dbbar
+
+
+class Xlifts(om.ExplicitComponent):
+    """Compute lift ratio and lift-curve slope for given stability margin.
+
+    Only the Mach-dependent lift-curve slopes are computed here, the geometry-only terms
+    come from XliftsPremission.
+    """
+
+    def initialize(self):
+        self.options.declare('num_nodes', default=1, types=int)
 
-        clat = clat0 * (1 - claw * (eps1 + eps2 + eps3))
+    def setup(self):
+        nn = self.options['num_nodes']
+
+        # mission inputs
+        add_aviary_input(self, Dynamic.Atmosphere.MACH, shape=nn, units='unitless')
+
+        # geometry inputs
+
+        add_aviary_input(self, Aircraft.Wing.ASPECT_RATIO, units='unitless')
+
+        add_aviary_input(self, Aircraft.Wing.SWEEP, units='deg')
+
+        add_aviary_input(self, Aircraft.HorizontalTail.VERTICAL_TAIL_FRACTION, units='unitless')
+
+        add_aviary_input(self, Aircraft.HorizontalTail.SWEEP, units='deg')
+
+        self.add_input('sbar', units='unitless', desc='SBAR: Ratio of H tail area to wing area')
+
+        # geometry-only terms from XliftsPremission
+        self.add_input(
+            'stability_delta',
+            units='unitless',
+            desc='DELTA: Lift ratio offset due to static margin and CG shift',
+        )
+        self.add_input(
+            'htail_effective_aspect_ratio',
+            units='unitless',
+            desc='ART: Effective aspect ratio of the horizontal tail',
+        )
+        self.add_input(
+            'wing_downwash_sum',
+            units='unitless',
+            desc='EPS1 + EPS2 + EPS3: Downwash factor acting on the wing',
+        )
+        self.add_input(
+            'htail_downwash_sum',
+            units='unitless',
+            desc='EPS4 - EPS5 - CBAR * EPS1: Downwash factor acting on the horizontal tail',
+        )
+
+        self.add_output('lift_curve_slope', units='unitless', shape=nn, desc='Lift-curve slope')
+        self.add_output('lift_ratio', units='unitless', shape=nn, desc='Lift ratio')
+
+    def setup_partials(self):
+        nn = self.options['num_nodes']
+        ar = np.arange(nn)
+        zeros = np.zeros(nn, dtype=int)
+
+        geometry = [
+            Aircraft.Wing.ASPECT_RATIO,
+            Aircraft.Wing.SWEEP,
+            Aircraft.HorizontalTail.VERTICAL_TAIL_FRACTION,
+            Aircraft.HorizontalTail.SWEEP,
+            'htail_effective_aspect_ratio',
+            'wing_downwash_sum',
+            'htail_downwash_sum',
+        ]
+
+        self.declare_partials('lift_ratio', Dynamic.Atmosphere.MACH, rows=ar, cols=ar)
+        self.declare_partials(
+            'lift_ratio', geometry + ['sbar', 'stability_delta'], rows=ar, cols=zeros
+        )
+        self.declare_partials('lift_curve_slope', Dynamic.Atmosphere.MACH, rows=ar, cols=ar)
+        self.declare_partials('lift_curve_slope', geometry, rows=ar, cols=zeros)
+
+    def compute(self, inputs, outputs):
+        (
+            mach,
+            AR,
+            sweep_c4,
+            htail_loc,
+            htail_sweep,
+            sbar,
+            delta,
+            art,
+            eps_wing,
+            eps_htail,
+        ) = inputs.values()
+
+        # stability contribution from each surface
+        claw0 = cla(AR, deg2rad(sweep_c4), mach)
+        clat0 = cla(art, deg2rad(htail_sweep), mach) * (0.9 + 0.1 * htail_loc)
+
+        claw = claw0 * (1 - clat0 * eps_htail) / (1 - clat0 * claw0 * eps_wing * eps_htail)
+
+        clat = clat0 * (1 - claw * eps_wing)
 
         abar = clat / claw
         c = 1 / (1 + 1 / abar / sbar)
@@ -331,30 +566,93 @@ class Xlifts(om.ExplicitComponent):
         outputs['lift_curve_slope'] = claw
         outputs['lift_ratio'] = lift_ratio
 
+    def compute_partials(self, inputs, J):
+        (
+            mach,
+            AR,
+            sweep_c4,
+            htail_loc,
+            htail_sweep,
+            sbar,
+            delta,
+            art,
+            eps_wing,
+            eps_htail,
+        ) = inputs.values()
 
-class AeroGeom(om.ExplicitComponent):
-    """Compute drag parameters from cruise conditions and geometric parameters.
-
-    This corresponds to the AERO subroutine in GASP. The primary outputs are parameters
-    SA* which build up the total aircraft drag coefficient.
+        tail_factor = 0.9 + 0.1 * htail_loc
+        claw0 = cla(AR, deg2rad(sweep_c4), mach)
+        clat_base = cla(art, deg2rad(htail_sweep), mach)
+        clat0 = clat_base * tail_factor
+        dclaw0_dAR, dclaw0_dsweep, dclaw0_dmach = dcla(AR, deg2rad(sweep_c4), mach)
+        dclat_dart, dclat_dsweep, dclat_dmach = dcla(art, deg2rad(htail_sweep), mach)
+
+        num = 1 - clat0 * eps_htail
+        den = 1 - clat0 * claw0 * eps_wing * eps_htail
+        claw = claw0 * num / den
+        clat = clat0 * (1 - claw * eps_wing)
+        abar = clat / claw
+        c = 1 / (1 + 1 / abar / sbar)
+        denom_lr = 1 + delta - c
+
+        dclaw_dclaw0 = num / den + claw * clat0 * eps_wing * eps_htail / den
+        dclaw_dclat0 = -claw0 * eps_htail / den + claw * claw0 * eps_wing * eps_htail / den
+        dclaw_deps_wing = claw * clat0 * claw0 * eps_htail / den
+        dclaw_deps_htail = -claw0 * clat0 / den + claw * clat0 * claw0 * eps_wing / den
+
+        dc_dabar = sbar / (abar * sbar + 1) ** 2
+        dlr_dc = 1 / denom_lr**2
+
+        def lift_partials(dclaw0, dclat0, deps_wing=0.0, deps_htail=0.0):
+            dclaw = (
+                dclaw_dclaw0 * dclaw0
+                + dclaw_dclat0 * dclat0
+                + dclaw_deps_wing * deps_wing
+                + dclaw_deps_htail * deps_htail
+            )
+            dclat = (
+                (1 - claw * eps_wing) * dclat0 - clat0 * eps_wing * dclaw - clat0 * claw * deps_wing
+            )
+            dabar = (dclat - abar * dclaw) / claw
+            return dclaw, dlr_dc * dc_dabar * dabar
+
+        d2r = np.pi / 180.0
+        wrt = {
+            Dynamic.Atmosphere.MACH: (dclaw0_dmach, dclat_dmach * tail_factor),
+            Aircraft.Wing.ASPECT_RATIO: (dclaw0_dAR, 0.0),
+            Aircraft.Wing.SWEEP: (dclaw0_dsweep * d2r, 0.0),
+            Aircraft.HorizontalTail.VERTICAL_TAIL_FRACTION: (0.0, 0.1 * clat_base),
+            Aircraft.HorizontalTail.SWEEP: (0.0, dclat_dsweep * tail_factor * d2r),
+            'htail_effective_aspect_ratio': (0.0, dclat_dart * tail_factor),
+            'wing_downwash_sum': (0.0, 0.0, 1.0, 0.0),
+            'htail_downwash_sum': (0.0, 0.0, 0.0, 1.0),
+        }
+        for name, args in wrt.items():
+            J['lift_curve_slope', name], J['lift_ratio', name] = lift_partials(*args)
+
+        J['lift_ratio', 'sbar'] = dlr_dc * abar / (abar * sbar + 1) ** 2
+        J['lift_ratio', 'stability_delta'] = -dlr_dc
+
+
+class AeroGeomPremission(om.ExplicitComponent):
+    """Pre-mission calculation of the geometry-only terms of the drag parameters.
+
+    This is the part of the AERO subroutine in GASP that does not depend on flight
+    condition. The flat plate equivalent areas of the aircraft components are scaled by
+    skin friction and Reynolds number corrections at each node in AeroGeom, so they are
+    output here as profile drag coefficients (normalized by wing area) along with the
+    reference lengths used for their Reynolds number corrections.
+
+    The components are ordered as fuselage, wing, vertical tail, horizontal tail, strut
+    and then one entry per engine type for the nacelles.
     """
 
     def initialize(self):
-        self.options.declare('num_nodes', default=1, types=int)
         add_aviary_option(self, Aircraft.Engine.NUM_ENGINES)
-        add_aviary_option(self, Aircraft.Wing.HAS_STRUT)
 
     def setup(self):
-        nn = self.options['num_nodes']
         num_engine_type = len(self.options[Aircraft.Engine.NUM_ENGINES])
-
-        add_aviary_input(self, Dynamic.Atmosphere.MACH, shape=nn, units='unitless')
-        add_aviary_input(self, Dynamic.Atmosphere.SPEED_OF_SOUND, shape=nn, units='ft/s')
-        add_aviary_input(
-            self, Dynamic.Atmosphere.KINEMATIC_VISCOSITY, val=1.0, shape=nn, units='ft**2/s'
-        )
-
-        self.add_input('ufac', units='unitless', shape=nn, desc='UFAC')
+        num_components = 5 + num_engine_type
 
         # form factors
         # user could input these directly or use functions to estimate from geometry
@@ -407,7 +705,7 @@ class AeroGeom(om.ExplicitComponent):
 
         add_aviary_input(self, Aircraft.Fuselage.LENGTH, units='ft')
 
-        add_aviary_input(self, Aircraft.Nacelle.AVG_LENGTH, shape=num_engine_type)
+        add_aviary_input(self, Aircraft.Nacelle.AVG_LENGTH, shape=num_engine_type, units='ft')
 
         add_aviary_input(self, Aircraft.HorizontalTail.AREA, units='ft**2')
 
@@ -429,24 +727,47 @@ class AeroGeom(om.ExplicitComponent):
         self.add_input('drag_loss_due_to_shielded_wing_area', units='unitless')
 
         # outputs
-        for i in range(7):
-            name = f'SA{i + 1}'
-            self.add_output(name, units='unitless', shape=nn, desc=f'{name}: Drag param')
-
         self.add_output(
-            'cf',
+            'compressibility_drag_params',
             units='unitless',
-            shape=nn,
-            desc='CFIN: Skin friction coefficient at Re=1e7',
+            shape=4,
+            desc='SA1-SA4: Compressibility drag params',
+        )
+        self.add_output(
+            'reynolds_ref_lengths',
+            units='ft',
+            shape=num_components,
+            desc='Reference lengths for the Reynolds number correction of each component',
+        )
+        self.add_output(
+            'profile_drag_coeffs',
+            units='unitless',
+            shape=num_components,
+            desc='Profile drag of each component per unit skin friction coefficient and '
+            'Reynolds number correction, normalized by wing area',
+        )
+        self.add_output(
+            'profile_drag_increment',
+            units='unitless',
+            desc='Profile drag that is not scaled by skin friction, normalized by wing area',
+        )
+        self.add_output(
+            'induced_drag_coeff',
+            units='unitless',
+            desc='1 / (pi * AR * SIWB): Induced drag param from wing-body interference',
+        )
+        self.add_output(
+            'sweep_drag_factor',
+            units='unitless',
+            desc='1 / cos(DLMC4)**2: Sweep factor on wing profile drag in induced drag',
         )
 
     def setup_partials(self):
-        # self.declare_coloring(method="cs", show_summary=False)
-        self.declare_partials('*', '*', dependent=False)
-        ar = np.arange(self.options['num_nodes'])
+        num_engine_type = len(self.options[Aircraft.Engine.NUM_ENGINES])
+        eng = np.arange(num_engine_type)
 
         self.declare_partials(
-            'SA1',
+            'compressibility_drag_params',
             [
                 Aircraft.Wing.MIN_PRESSURE_LOCATION,
                 Aircraft.Wing.MAX_THICKNESS_LOCATION,
@@ -455,112 +776,76 @@ class AeroGeom(om.ExplicitComponent):
                 Aircraft.Wing.TAPER_RATIO,
                 Aircraft.Wing.THICKNESS_TO_CHORD_UNWEIGHTED,
             ],
-            method='cs',
         )
-        self.declare_partials(
-            'SA2',
+
+        # reference lengths are passed through
+        for idx, name in enumerate(
             [
-                Aircraft.Wing.MIN_PRESSURE_LOCATION,
-                Aircraft.Wing.MAX_THICKNESS_LOCATION,
-                Aircraft.Wing.ASPECT_RATIO,
-                Aircraft.Wing.SWEEP,
-                Aircraft.Wing.TAPER_RATIO,
-            ],
-            method='cs',
-        )
+                Aircraft.Fuselage.LENGTH,
+                Aircraft.Wing.AVERAGE_CHORD,
+                Aircraft.VerticalTail.AVERAGE_CHORD,
+                Aircraft.HorizontalTail.AVERAGE_CHORD,
+                Aircraft.Strut.CHORD,
+            ]
+        ):
+            self.declare_partials('reynolds_ref_lengths', name, rows=[idx], cols=[0], val=1.0)
         self.declare_partials(
-            'SA3',
-            [
-                Aircraft.Wing.ASPECT_RATIO,
-                Aircraft.Wing.SWEEP,
-                Aircraft.Wing.TAPER_RATIO,
-                Aircraft.Wing.THICKNESS_TO_CHORD_UNWEIGHTED,
-            ],
-            method='cs',
+            'reynolds_ref_lengths',
+            Aircraft.Nacelle.AVG_LENGTH,
+            rows=5 + eng,
+            cols=eng,
+            val=1.0,
         )
-        self.declare_partials('SA4', [Aircraft.Wing.THICKNESS_TO_CHORD_UNWEIGHTED], method='cs')
-        self.declare_partials('cf', [Dynamic.Atmosphere.MACH], rows=ar, cols=ar, method='cs')
 
-        # diag partials for SA5-SA7
+        # each component's profile drag only depends on its own form factor and areas
+        for name, row in [
+            (Aircraft.Fuselage.FORM_FACTOR, 0),
+            (Aircraft.Fuselage.LENGTH, 0),
+            (Aircraft.Fuselage.WETTED_AREA, 0),
+            (Aircraft.Fuselage.AVG_DIAMETER, 0),
+            (Aircraft.Wing.FORM_FACTOR, 1),
+            (Aircraft.Wing.FUSELAGE_INTERFERENCE_FACTOR, 1),
+            ('drag_loss_due_to_shielded_wing_area', 1),
+            (Aircraft.VerticalTail.FORM_FACTOR, 2),
+            (Aircraft.VerticalTail.AREA, 2),
+            (Aircraft.HorizontalTail.FORM_FACTOR, 3),
+            (Aircraft.HorizontalTail.AREA, 3),
+            (Aircraft.Strut.FUSELAGE_INTERFERENCE_FACTOR, 4),
+            (Aircraft.Strut.AREA_RATIO, 4),
+        ]:
+            self.declare_partials('profile_drag_coeffs', name, rows=[row], cols=[0])
         self.declare_partials(
-            'SA5',
-            [
-                Dynamic.Atmosphere.MACH,
-                Dynamic.Atmosphere.SPEED_OF_SOUND,
-                Dynamic.Atmosphere.KINEMATIC_VISCOSITY,
-            ],
-            rows=ar,
-            cols=ar,
-            method='cs',
+            'profile_drag_coeffs',
+            [Aircraft.Nacelle.FORM_FACTOR, Aircraft.Nacelle.SURFACE_AREA],
+            rows=5 + eng,
+            cols=eng,
         )
+        # the strut area is proportional to the wing area, so it does not depend on it
         self.declare_partials(
-            'SA6',
-            [
-                Dynamic.Atmosphere.MACH,
-                Dynamic.Atmosphere.SPEED_OF_SOUND,
-                Dynamic.Atmosphere.KINEMATIC_VISCOSITY,
-            ],
-            rows=ar,
-            cols=ar,
-            method='cs',
+            'profile_drag_coeffs',
+            Aircraft.Wing.AREA,
+            rows=[0, 1, 2, 3, *(5 + eng)],
+            cols=np.zeros(4 + num_engine_type, dtype=int),
         )
+
         self.declare_partials(
-            'SA7',
+            'profile_drag_increment',
             [
-                Dynamic.Atmosphere.MACH,
-                Dynamic.Atmosphere.SPEED_OF_SOUND,
-                Dynamic.Atmosphere.KINEMATIC_VISCOSITY,
-                'ufac',
+                Aircraft.Wing.FUSELAGE_INTERFERENCE_FACTOR,
+                Aircraft.Design.DRAG_COEFFICIENT_INCREMENT,
+                Aircraft.Fuselage.FLAT_PLATE_AREA_INCREMENT,
+                Aircraft.Wing.AREA,
+                'interference_independent_of_shielded_area',
             ],
-            rows=ar,
-            cols=ar,
-            method='cs',
-        )
-
-        # dense partials for SA5-SA7
-        most_params = [
-            Aircraft.Wing.FORM_FACTOR,
-            Aircraft.Fuselage.FORM_FACTOR,
-            Aircraft.Nacelle.FORM_FACTOR,
-            Aircraft.VerticalTail.FORM_FACTOR,
-            Aircraft.HorizontalTail.FORM_FACTOR,
-            Aircraft.Wing.FUSELAGE_INTERFERENCE_FACTOR,
-            Aircraft.Strut.FUSELAGE_INTERFERENCE_FACTOR,
-            Aircraft.Design.DRAG_COEFFICIENT_INCREMENT,
-            Aircraft.Fuselage.FLAT_PLATE_AREA_INCREMENT,
-            Aircraft.Wing.TAPER_RATIO,
-            Aircraft.Strut.AREA_RATIO,
-            Aircraft.Wing.SPAN,
-            Aircraft.Wing.AVERAGE_CHORD,
-            Aircraft.HorizontalTail.AVERAGE_CHORD,
-            Aircraft.VerticalTail.AVERAGE_CHORD,
-            Aircraft.Fuselage.LENGTH,
-            Aircraft.Nacelle.AVG_LENGTH,
-            Aircraft.HorizontalTail.AREA,
-            Aircraft.Fuselage.WETTED_AREA,
-            Aircraft.Nacelle.SURFACE_AREA,
-            Aircraft.Wing.AREA,
-            Aircraft.Fuselage.AVG_DIAMETER,
-            Aircraft.VerticalTail.AREA,
-            'interference_independent_of_shielded_area',
-            'drag_loss_due_to_shielded_wing_area',
-        ]
-        self.declare_partials('SA5', most_params, method='cs')
-        self.declare_partials(
-            'SA6', [Aircraft.Wing.FORM_FACTOR, Aircraft.Wing.AVERAGE_CHORD], method='cs'
         )
         self.declare_partials(
-            'SA7',
-            most_params + [Aircraft.Wing.ASPECT_RATIO, Aircraft.Wing.SWEEP],
-            method='cs',
+            'induced_drag_coeff',
+            [Aircraft.Wing.ASPECT_RATIO, Aircraft.Wing.SPAN, Aircraft.Fuselage.AVG_DIAMETER],
         )
+        self.declare_partials('sweep_drag_factor', Aircraft.Wing.SWEEP)
 
     def compute(self, inputs, outputs):
         (
-            mach,
-            sos,
-            nu,
-            ufac,
             ff_wing,
             ff_fus,
             ff_nac,
@@ -593,107 +878,571 @@ class AeroGeom(om.ExplicitComponent):
             feintwf,
             areashieldwf,
         ) = inputs.values()
+
+        t = cs.abs(np.tan(deg2rad(sweep_c4)))
+        yale05 = (1 - taper_ratio) / (1 + taper_ratio)
+        # sweep angle to min pressure point
+        dlmps = rad2deg(cs.arctan2(AR * t - 4 * (wing_min_pressure_loc - 0.25) * yale05, AR))
+        # sweep angle to max thickness point
+        dlmtcx = rad2deg(cs.arctan2(AR * t - 4 * (wing_max_thickness_loc - 0.25) * yale05, AR))
+        # sweep angle of the leading edge
+        rlmle = cs.arctan2(AR * t + yale05, AR)
+        fk = 1 / (1 + yale05 / AR * 4 * taper_ratio**2)
+
+        # fuselage form drag factor
+        fffus = 1 + 1.5 * (cabin_width / fus_len) ** 1.5 + 7 * (cabin_width / fus_len) ** 3
+
+        # flat plate equivalent areas per unit skin friction coefficient and Reynolds
+        # number correction: fuselage, wing, vtail, htail, strut, nacelles
+        # the wing entry is only the wing-fuselage interference drag due to shielded
+        # area, the wing profile drag itself is carried separately by SA6
+        # TODO replace 2 with num_engines
+        fe_coeffs = [
+            ff_fus * fus_SA * fffus,
+            -wing_fus_intf * areashieldwf * ff_wing,
+            ff_vtail * vtail_area,
+            ff_htail * htail_area,
+            strut_fus_intf * strut_wing_area_ratio * wing_area,
+            2 * ff_nac * nacelle_area,
+        ]
+
+        wfob = cabin_width / wingspan
+        siwb = 1 - 0.0088 * wfob - 1.7364 * wfob**2 - 2.303 * wfob**3 + 6.0606 * wfob**4
+
+        # compressibility drag parameters
+        sa1 = (1 + 0.0033 * (4 * dlmps - 3 * dlmtcx)) * (
+            1 - 1.4 * tc_ratio - 0.06 * (1 - wing_min_pressure_loc)
+        ) - 0.0368
+        sa2 = -0.33 * (0.65 - wing_min_pressure_loc) * (1 + 0.0033 * (4 * dlmps - 3 * dlmtcx))
+        sa3 = (1.5 - 2 * fk**2 * np.sin(rlmle) ** 2) * tc_ratio ** (5 / 3.0)
+        sa4 = 0.75 * tc_ratio
+
+        outputs['compressibility_drag_params'] = np.concatenate([sa1, sa2, sa3, sa4])
+        outputs['reynolds_ref_lengths'] = np.concatenate(
+            [fus_len, avg_chord, vtail_chord, htail_chord, strut_chord, nac_len]
+        )
+        outputs['profile_drag_coeffs'] = np.concatenate(fe_coeffs) / wing_area
+        outputs['profile_drag_increment'] = (
+            fe_fus_inc + wing_fus_intf * feintwf
+        ) / wing_area + cd0_inc
+        outputs['induced_drag_coeff'] = 1.0 / (np.pi * AR * siwb)
+        outputs['sweep_drag_factor'] = 1.0 / np.cos(deg2rad(sweep_c4)) ** 2
+
+    def compute_partials(self, inputs, J):
+        (
+            ff_wing,
+            ff_fus,
+            ff_nac,
+            ff_vtail,
+            ff_htail,
+            wing_fus_intf,
+            strut_fus_intf,
+            cd0_inc,
+            fe_fus_inc,
+            wing_min_pressure_loc,
+            wing_max_thickness_loc,
+            AR,
+            sweep_c4,
+            taper_ratio,
+            strut_wing_area_ratio,
+            wingspan,
+            avg_chord,
+            htail_chord,
+            vtail_chord,
+            fus_len,
+            nac_len,
+            htail_area,
+            fus_SA,
+            nacelle_area,
+            wing_area,
+            cabin_width,
+            vtail_area,
+            tc_ratio,
+            strut_chord,
+            feintwf,
+            areashieldwf,
+        ) = inputs.values()
+
+        # the compressibility drag parameters are differentiated with respect to the
+        # vector of inputs (min pressure loc, max thickness loc, AR, sweep, taper, t/c)
+        dmin_pressure_loc, dmax_thickness_loc, dAR, dsweep, dtaper, dtc = np.eye(6)
+        d2r = np.pi / 180.0
+        sweep_rad = deg2rad(sweep_c4)
+        t = np.abs(np.tan(sweep_rad))
+        dt = np.sign(np.tan(sweep_rad)) * d2r / np.cos(sweep_rad) ** 2 * dsweep
+        yale05 = (1 - taper_ratio) / (1 + taper_ratio)
+        dyale05 = -2 / (1 + taper_ratio) ** 2 * dtaper
+
+        def darctan2(num, dnum):
+            # derivative of arctan2(num, AR)
+            return (AR * dnum - num * dAR) / (num**2 + AR**2)
+
+        num_ps = AR * t - 4 * (wing_min_pressure_loc - 0.25) * yale05
+        dnum_ps = (
+            t * dAR
+            + AR * dt
+            - 4 * yale05 * dmin_pressure_loc
+            - 4 * (wing_min_pressure_loc - 0.25) * dyale05
+        )
+        ddlmps = darctan2(num_ps, dnum_ps) / d2r
+
+        num_tcx = AR * t - 4 * (wing_max_thickness_loc - 0.25) * yale05
+        dnum_tcx = (
+            t * dAR
+            + AR * dt
+            - 4 * yale05 * dmax_thickness_loc
+            - 4 * (wing_max_thickness_loc - 0.25) * dyale05
+        )
+        ddlmtcx = darctan2(num_tcx, dnum_tcx) / d2r
+
+        num_le = AR * t + yale05
+        rlmle = np.arctan2(num_le, AR)
+        drlmle = darctan2(num_le, t * dAR + AR * dt + dyale05)
+
+        dlmps = np.arctan2(num_ps, AR) / d2r
+        dlmtcx = np.arctan2(num_tcx, AR) / d2r
+        g = yale05 / AR * 4 * taper_ratio**2
+        dg = (
+            4 * taper_ratio**2 / AR * dyale05
+            - g / AR * dAR
+            + 8 * yale05 * taper_ratio / AR * dtaper
+        )
+        fk = 1 / (1 + g)
+        dfk = -(fk**2) * dg
+
+        sweep_term = 1 + 0.0033 * (4 * dlmps - 3 * dlmtcx)
+        dsweep_term = 0.0033 * (4 * ddlmps - 3 * ddlmtcx)
+        thickness_term = 1 - 1.4 * tc_ratio - 0.06 * (1 - wing_min_pressure_loc)
+        dthickness_term = -1.4 * dtc + 0.06 * dmin_pressure_loc
+        sin_le = np.sin(rlmle)
+
+        dsa1 = dsweep_term * thickness_term + sweep_term * dthickness_term
+        dsa2 = -0.33 * (0.65 - wing_min_pressure_loc) * dsweep_term + (
+            0.33 * sweep_term * dmin_pressure_loc
+        )
+        dsa3 = (
+            -4 * fk * sin_le**2 * dfk - 4 * fk**2 * sin_le * np.cos(rlmle) * drlmle
+        ) * tc_ratio ** (5 / 3.0) + (1.5 - 2 * fk**2 * sin_le**2) * (5 / 3.0) * tc_ratio ** (
+            2 / 3.0
+        ) * dtc
+        dsa4 = 0.75 * dtc
+
+        dsa = np.array([dsa1, dsa2, dsa3, dsa4])
+        for idx, name in enumerate(
+            [
+                Aircraft.Wing.MIN_PRESSURE_LOCATION,
+                Aircraft.Wing.MAX_THICKNESS_LOCATION,
+                Aircraft.Wing.ASPECT_RATIO,
+                Aircraft.Wing.SWEEP,
+                Aircraft.Wing.TAPER_RATIO,
+                Aircraft.Wing.THICKNESS_TO_CHORD_UNWEIGHTED,
+            ]
+        ):
+            J['compressibility_drag_params', name] = dsa[:, idx]
+
+        # profile drag coefficients
+        width_ratio = cabin_width / fus_len
+        fffus = 1 + 1.5 * width_ratio**1.5 + 7 * width_ratio**3
+        dfffus_dratio = 2.25 * width_ratio**0.5 + 21 * width_ratio**2
+
+        J['profile_drag_coeffs', Aircraft.Fuselage.FORM_FACTOR] = fus_SA * fffus / wing_area
+        J['profile_drag_coeffs', Aircraft.Fuselage.WETTED_AREA] = ff_fus * fffus / wing_area
+        J['profile_drag_coeffs', Aircraft.Fuselage.LENGTH] = (
+            -ff_fus * fus_SA * dfffus_dratio * width_ratio / fus_len / wing_area
+        )
+        J['profile_drag_coeffs', Aircraft.Fuselage.AVG_DIAMETER] = (
+            ff_fus * fus_SA * dfffus_dratio / fus_len / wing_area
+        )
+        J['profile_drag_coeffs', Aircraft.Wing.FORM_FACTOR] = (
+            -wing_fus_intf * areashieldwf / wing_area
+        )
+        J['profile_drag_coeffs', Aircraft.Wing.FUSELAGE_INTERFERENCE_FACTOR] = (
+            -areashieldwf * ff_wing / wing_area
+        )
+        J['profile_drag_coeffs', 'drag_loss_due_to_shielded_wing_area'] = (
+            -wing_fus_intf * ff_wing / wing_area
+        )
+        J['profile_drag_coeffs', Aircraft.VerticalTail.FORM_FACTOR] = vtail_area / wing_area
+        J['profile_drag_coeffs', Aircraft.VerticalTail.AREA] = ff_vtail / wing_area
+        J['profile_drag_coeffs', Aircraft.HorizontalTail.FORM_FACTOR] = htail_area / wing_area
+        J['profile_drag_coeffs', Aircraft.HorizontalTail.AREA] = ff_htail / wing_area
+        J['profile_drag_coeffs', Aircraft.Strut.FUSELAGE_INTERFERENCE_FACTOR] = (
+            strut_wing_area_ratio
+        )
+        J['profile_drag_coeffs', Aircraft.Strut.AREA_RATIO] = strut_fus_intf
+        J['profile_drag_coeffs', Aircraft.Nacelle.FORM_FACTOR] = 2 * nacelle_area / wing_area
+        J['profile_drag_coeffs', Aircraft.Nacelle.SURFACE_AREA] = 2 * ff_nac / wing_area
+        J['profile_drag_coeffs', Aircraft.Wing.AREA] = (
+            -np.concatenate(
+                [
+                    ff_fus * fus_SA * fffus,
+                    -wing_fus_intf * areashieldwf * ff_wing,
+                    ff_vtail * vtail_area,
+                    ff_htail * htail_area,
+                    2 * ff_nac * nacelle_area,
+                ]
+            )
+            / wing_area**2
+        )
+
+        J['profile_drag_increment', Aircraft.Wing.FUSELAGE_INTERFERENCE_FACTOR] = (
+            feintwf / wing_area
+        )
+        J['profile_drag_increment', Aircraft.Design.DRAG_COEFFICIENT_INCREMENT] = 1.0
+        J['profile_drag_increment', Aircraft.Fuselage.FLAT_PLATE_AREA_INCREMENT] = 1 / wing_area
+        J['profile_drag_increment', Aircraft.Wing.AREA] = (
+            -(fe_fus_inc + wing_fus_intf * feintwf) / wing_area**2
+        )
+        J['profile_drag_increment', 'interference_independent_of_shielded_area'] = (
+            wing_fus_intf / wing_area
+        )
+
+        wfob = cabin_width / wingspan
+        siwb = 1 - 0.0088 * wfob - 1.7364 * wfob**2 - 2.303 * wfob**3 + 6.0606 * wfob**4
+        dsiwb_dwfob = -0.0088 - 3.4728 * wfob - 6.909 * wfob**2 + 24.2424 * wfob**3
+        cdi_coeff = 1.0 / (np.pi * AR * siwb)
+        dcdi_dwfob = -cdi_coeff / siwb * dsiwb_dwfob
+
+        J['induced_drag_coeff', Aircraft.Wing.ASPECT_RATIO] = -cdi_coeff / AR
+        J['induced_drag_coeff', Aircraft.Wing.SPAN] = -dcdi_dwfob * wfob / wingspan
+        J['induced_drag_coeff', Aircraft.Fuselage.AVG_DIAMETER] = dcdi_dwfob / wingspan
+
+        J['sweep_drag_factor', Aircraft.Wing.SWEEP] = (
+            2 * np.tan(sweep_rad) / np.cos(sweep_rad) ** 2 * d2r
+        )
+
+
+class AeroGeom(om.ExplicitComponent):
+    """Compute drag parameters from cruise conditions and geometric parameters.
+
+    This corresponds to the AERO subroutine in GASP. The primary outputs are parameters
+    SA* which build up the total aircraft drag coefficient. Only the skin friction and
+    Reynolds number corrections are computed here, the geometry-only terms come from
+    AeroGeomPremission.
+    """
+
+    def initialize(self):
+        self.options.declare('num_nodes', default=1, types=int)
+        add_aviary_option(self, Aircraft.Engine.NUM_ENGINES)
+        add_aviary_option(self, Aircraft.Wing.HAS_STRUT)
+
+    def setup(self):
+        nn = self.options['num_nodes']
+        num_engine_type = len(self.options[Aircraft.Engine.NUM_ENGINES])
+        num_components = 5 + num_engine_type
+
+        add_aviary_input(self, Dynamic.Atmosphere.MACH, shape=nn, units='unitless')
+        add_aviary_input(self, Dynamic.Atmosphere.SPEED_OF_SOUND, shape=nn, units='ft/s')
+        add_aviary_input(
+            self, Dynamic.Atmosphere.KINEMATIC_VISCOSITY, val=1.0, shape=nn, units='ft**2/s'
+        )
+
+        self.add_input('ufac', units='unitless', shape=nn, desc='UFAC')
+
+        add_aviary_input(self, Aircraft.Wing.FORM_FACTOR, units='unitless')
+
+        # geometry-only terms from AeroGeomPremission
+        self.add_input(
+            'compressibility_drag_params',
+            units='unitless',
+            shape=4,
+            desc='SA1-SA4: Compressibility drag params',
+        )
+        self.add_input(
+            'reynolds_ref_lengths',
+            val=1.0,
+            units='ft',
+            shape=num_components,
+            desc='Reference lengths for the Reynolds number correction of each component',
+        )
+        self.add_input(
+            'profile_drag_coeffs',
+            units='unitless',
+            shape=num_components,
+            desc='Profile drag of each component per unit skin friction coefficient and '
+            'Reynolds number correction, normalized by wing area',
+        )
+        self.add_input(
+            'profile_drag_increment',
+            units='unitless',
+            desc='Profile drag that is not scaled by skin friction, normalized by wing area',
+        )
+        self.add_input(
+            'induced_drag_coeff',
+            units='unitless',
+            desc='1 / (pi * AR * SIWB): Induced drag param from wing-body interference',
+        )
+        self.add_input(
+            'sweep_drag_factor',
+            val=1.0,
+            units='unitless',
+            desc='1 / cos(DLMC4)**2: Sweep factor on wing profile drag in induced drag',
+        )
+
+        # outputs
+        for i in range(7):
+            name = f'SA{i + 1}'
+            self.add_output(name, units='unitless', shape=nn, desc=f'{name}: Drag param')
+
+        self.add_output(
+            'cf',
+            units='unitless',
+            shape=nn,
+            desc='CFIN: Skin friction coefficient at Re=1e7',
+        )
+
+    def setup_partials(self):
+        nn = self.options['num_nodes']
+        ar = np.arange(nn)
+
+        # sa1--4 are static, depending only on geometry
+        for i in range(4):
+            self.declare_partials(
+                f'SA{i + 1}',
+                'compressibility_drag_params',
+                rows=ar,
+                cols=np.full(nn, i),
+                val=1.0,
+            )
+
+        self.declare_partials('cf', [Dynamic.Atmosphere.MACH], rows=ar, cols=ar)
+
+        # diag partials for SA5-SA7
+        flight_condition = [
+            Dynamic.Atmosphere.MACH,
+            Dynamic.Atmosphere.SPEED_OF_SOUND,
+            Dynamic.Atmosphere.KINEMATIC_VISCOSITY,
+        ]
+        self.declare_partials('SA5', flight_condition, rows=ar, cols=ar)
+        self.declare_partials('SA6', flight_condition, rows=ar, cols=ar)
+        self.declare_partials('SA7', flight_condition + ['ufac'], rows=ar, cols=ar)
+
+        # scalar parameters are shared by all nodes
+        zeros = np.zeros(nn, dtype=int)
+        self.declare_partials('SA5', 'profile_drag_increment', rows=ar, cols=zeros, val=1.0)
+        self.declare_partials('SA6', Aircraft.Wing.FORM_FACTOR, rows=ar, cols=zeros)
+        self.declare_partials(
+            'SA7',
+            [
+                'profile_drag_increment',
+                Aircraft.Wing.FORM_FACTOR,
+                'induced_drag_coeff',
+                'sweep_drag_factor',
+            ],
+            rows=ar,
+            cols=zeros,
+        )
+
+        # dense partials with respect to the per-component parameters, only the wing
+        # reference length affects SA6
+        self.declare_partials('SA5', ['reynolds_ref_lengths', 'profile_drag_coeffs'])
+        self.declare_partials('SA6', 'reynolds_ref_lengths', rows=ar, cols=np.ones(nn, dtype=int))
+        self.declare_partials('SA7', ['reynolds_ref_lengths', 'profile_drag_coeffs'])
+
+    def compute(self, inputs, outputs):
+        (
+            mach,
+            sos,
+            nu,
+            ufac,
+            ff_wing,
+            sa_static,
+            ref_lengths,
+            fe_coeffs,
+            cdpo_inc,
+            cdi_coeff,
+            sweep_factor,
+        ) = inputs.values()
+        nn = self.options['num_nodes']
+
         # skin friction coeff at Re = 10**7
         cf = 0.455 / 7**2.58 / (1 + 0.144 * mach**2) ** 0.65
 
-        t = cs.abs(np.tan(deg2rad(sweep_c4)))
-        yale05 = (1 - taper_ratio) / (1 + taper_ratio)
-        # sweep angle to min pressure point
-        dlmps = rad2deg(cs.arctan2(AR * t - 4 * (wing_min_pressure_loc - 0.25) * yale05, AR))
-        # sweep angle to max thickness point
-        dlmtcx = rad2deg(cs.arctan2(AR * t - 4 * (wing_max_thickness_loc - 0.25) * yale05, AR))
-        # sweep angle of the leading edge
-        rlmle = cs.arctan2(AR * t + yale05, AR)
-        fk = 1 / (1 + yale05 / AR * 4 * taper_ratio**2)
-
         # Reynolds number per foot
         # here we make a smooth transition between a minimum reli (approximately
         # corresponding to Mach 0.1 at SLS) to help with takeoff. GASP doesn't call AERO
         # before takeoff, so the RELI used corresponds to the cruise point, and this
         # isn't a problem.
-        reli_y1 = 700000 * np.ones(self.options['num_nodes'])
+        reli_y1 = 700000 * np.ones(nn)
         reli_y2 = sos * mach / nu
         sig = sigmoidX(mach, 0.1, alpha=0.005)
         reli = (1 - sig) * reli_y1 + sig * reli_y2
 
-        # Re correction factors: fuselage, wing, nacelle, vtail, htail, strut, tip tank
+        # Re correction factors: fuselage, wing, vtail, htail, strut, nacelles
         # protect against Mach 0, any other small Mach should be ok
         dtype = complex if self.under_complex_step else float
-        ffre, fwre, fnre, fvtre, fhtre, fstrtre = np.ones(
-            (6, self.options['num_nodes']), dtype=dtype
-        )
+        fre = np.ones((nn, ref_lengths.size), dtype=dtype)
         if self.under_complex_step:
             good_mask = reli.real > 1
         else:
             good_mask = reli > 1
-        ffre[good_mask] = (np.log10(reli[good_mask] * fus_len) / 7) ** -2.6
-        fwre[good_mask] = (np.log10(reli[good_mask] * avg_chord) / 7) ** -2.6
-        fnre[good_mask] = (np.log10(reli[good_mask] * nac_len) / 7) ** -2.6
-        fvtre[good_mask] = (np.log10(reli[good_mask] * vtail_chord) / 7) ** -2.6
-        fhtre[good_mask] = (np.log10(reli[good_mask] * htail_chord) / 7) ** -2.6
-        include_strut = self.options[Aircraft.Wing.HAS_STRUT]
-        if include_strut:
-            fstrtre = (np.log10(reli[good_mask] * strut_chord) / 7) ** -2.6
-
-        # fuselage form drag factor
-        fffus = 1 + 1.5 * (cabin_width / fus_len) ** 1.5 + 7 * (cabin_width / fus_len) ** 3
-
-        # flat plate equivalent areas
-        fef = ff_fus * fus_SA * cf * ffre * fffus + fe_fus_inc
-        few = ff_wing * wing_area * cf * fwre
-        # TODO replace 2 with num_engines
-        fen = 2 * ff_nac * nacelle_area * cf * fnre
-        fevt = ff_vtail * vtail_area * cf * fvtre
-        feht = ff_htail * htail_area * cf * fhtre
-        festrt = strut_fus_intf * strut_wing_area_ratio * wing_area * cf * fstrtre
-
-        # begin INTERFERENCE - get flat plate equivalent for wing-fuselage interference
-        # wing profile drag coefficient
-        cdw0 = few / wing_area
-        # interference drag independent of shielded area
-        feshieldwf = cdw0 * areashieldwf
-        feiwf = wing_fus_intf * (feintwf - feshieldwf)
-        # end INTERFERENCE
-
-        # total flat plate equivalent area
-        fe = few + fef + fevt + feht + fen + feiwf + festrt + cd0_inc * wing_area
 
-        wfob = cabin_width / wingspan
-        siwb = 1 - 0.0088 * wfob - 1.7364 * wfob**2 - 2.303 * wfob**3 + 6.0606 * wfob**4
+        # strut correction is only applied when the aircraft has one
+        cols = np.ones(ref_lengths.size, dtype=bool)
+        if not self.options[Aircraft.Wing.HAS_STRUT]:
+            cols[4] = False
 
-        # wing-free profile drag coefficient
-        cdpo = (fe - few) / wing_area
-
-        # Oswald efficiency
-        see = 1.0 / (
-            (1 / ufac / siwb) + 1.1938 * AR * (cdw0 / (np.cos(deg2rad(sweep_c4))) ** 2 + cdpo)
-        )
+        fre[np.ix_(good_mask, cols)] = (
+            np.log10(np.outer(reli[good_mask], ref_lengths[cols])) / 7
+        ) ** -2.6
 
-        # compressibility drag parameters
-        # sa1--4 are static, depending only on geometry
-        sa1 = (1 + 0.0033 * (4 * dlmps - 3 * dlmtcx)) * (
-            1 - 1.4 * tc_ratio - 0.06 * (1 - wing_min_pressure_loc)
-        ) - 0.0368
-        sa2 = -0.33 * (0.65 - wing_min_pressure_loc) * (1 + 0.0033 * (4 * dlmps - 3 * dlmtcx))
-        sa3 = (1.5 - 2 * fk**2 * np.sin(rlmle) ** 2) * tc_ratio ** (5 / 3.0)
-        sa4 = 0.75 * tc_ratio
+        # wing profile drag
+        sa6 = ff_wing * fre[:, 1]
 
         # profile drag of everything but the wing
-        sa5 = cdpo
-        # wing profile drag
-        sa6 = ff_wing * fwre
-        # induced drag
-        sa7 = 1.0 / (np.pi * see * AR)
+        cdpo = cdpo_inc + cf * (fre @ fe_coeffs)
 
-        outputs['SA1'] = sa1
-        outputs['SA2'] = sa2
-        outputs['SA3'] = sa3
-        outputs['SA4'] = sa4
-        outputs['SA5'] = sa5
+        # induced drag
+        # 1 / (pi * see * AR), with the Oswald efficiency see computed from UFAC, the
+        # wing-body interference and the profile drag
+        sa7 = cdi_coeff / ufac + 1.1938 / np.pi * (cf * sa6 * sweep_factor + cdpo)
+
+        outputs['SA1'] = sa_static[0]
+        outputs['SA2'] = sa_static[1]
+        outputs['SA3'] = sa_static[2]
+        outputs['SA4'] = sa_static[3]
+        outputs['SA5'] = cdpo
         outputs['SA6'] = sa6
         outputs['SA7'] = sa7
         outputs['cf'] = cf
 
+    def compute_partials(self, inputs, J):
+        (
+            mach,
+            sos,
+            nu,
+            ufac,
+            ff_wing,
+            sa_static,
+            ref_lengths,
+            fe_coeffs,
+            cdpo_inc,
+            cdi_coeff,
+            sweep_factor,
+        ) = inputs.values()
+        nn = self.options['num_nodes']
+
+        cf = 0.455 / 7**2.58 / (1 + 0.144 * mach**2) ** 0.65
+        dcf_dmach = -0.65 * cf * 0.288 * mach / (1 + 0.144 * mach**2)
+
+        reli_y2 = sos * mach / nu
+        sig = sigmoidX(mach, 0.1, alpha=0.005)
+        dsig_dmach = dSigmoidXdx(mach, 0.1, alpha=0.005)
+        reli = (1 - sig) * 700000 + sig * reli_y2
+        dreli_dmach = dsig_dmach * (reli_y2 - 700000) + sig * sos / nu
+        dreli_dsos = sig * mach / nu
+        dreli_dnu = -sig * reli_y2 / nu
+
+        # Re correction factors and their derivatives with respect to the log of
+        # Reynolds number, which is the same for reli and the reference lengths
+        fre = np.ones((nn, ref_lengths.size))
+        dfre_dlog = np.zeros((nn, ref_lengths.size))
+        good_mask = reli > 1
+        cols = np.ones(ref_lengths.size, dtype=bool)
+        if not self.options[Aircraft.Wing.HAS_STRUT]:
+            cols[4] = False
+
+        log_re = np.log10(np.outer(reli[good_mask], ref_lengths[cols])) / 7
+        fre[np.ix_(good_mask, cols)] = log_re**-2.6
+        dfre_dlog[np.ix_(good_mask, cols)] = -2.6 * log_re**-3.6 / (7 * np.log(10))
+
+        # unused reference lengths (e.g. the strut chord without a strut) may be zero
+        dfre_dreli = dfre_dlog / reli[:, np.newaxis]
+        dfre_dlength = np.zeros_like(dfre_dlog)
+        dfre_dlength[:, cols] = dfre_dlog[:, cols] / ref_lengths[cols]
+
+        sa6 = ff_wing * fre[:, 1]
+        fe_sum = fre @ fe_coeffs
+        k = 1.1938 / np.pi
+
+        dsa6_dreli = ff_wing * dfre_dreli[:, 1]
+        dcdpo_dreli = cf * (dfre_dreli @ fe_coeffs)
+        dsa7_dreli = k * (cf * sweep_factor * dsa6_dreli + dcdpo_dreli)
+
+        dcdpo_dmach = dcf_dmach * fe_sum + dcdpo_dreli * dreli_dmach
+        dsa6_dmach = dsa6_dreli * dreli_dmach
+        dsa7_dmach = k * (
+            dcf_dmach * sa6 * sweep_factor + cf * sweep_factor * dsa6_dmach + dcdpo_dmach
+        )
+
+        J['cf', Dynamic.Atmosphere.MACH] = dcf_dmach
+
+        J['SA5', Dynamic.Atmosphere.MACH] = dcdpo_dmach
+        J['SA5', Dynamic.Atmosphere.SPEED_OF_SOUND] = dcdpo_dreli * dreli_dsos
+        J['SA5', Dynamic.Atmosphere.KINEMATIC_VISCOSITY] = dcdpo_dreli * dreli_dnu
+        J['SA6', Dynamic.Atmosphere.MACH] = dsa6_dmach
+        J['SA6', Dynamic.Atmosphere.SPEED_OF_SOUND] = dsa6_dreli * dreli_dsos
+        J['SA6', Dynamic.Atmosphere.KINEMATIC_VISCOSITY] = dsa6_dreli * dreli_dnu
+        J['SA7', Dynamic.Atmosphere.MACH] = dsa7_dmach
+        J['SA7', Dynamic.Atmosphere.SPEED_OF_SOUND] = dsa7_dreli * dreli_dsos
+        J['SA7', Dynamic.Atmosphere.KINEMATIC_VISCOSITY] = dsa7_dreli * dreli_dnu
+        J['SA7', 'ufac'] = -cdi_coeff / ufac**2
+
+        J['SA6', Aircraft.Wing.FORM_FACTOR] = fre[:, 1]
+        J['SA7', 'profile_drag_increment'] = k
+        J['SA7', Aircraft.Wing.FORM_FACTOR] = k * cf * sweep_factor * fre[:, 1]
+        J['SA7', 'induced_drag_coeff'] = 1 / ufac
+        J['SA7', 'sweep_drag_factor'] = k * cf * sa6
+
+        dcdpo_dlength = cf[:, np.newaxis] * dfre_dlength * fe_coeffs
+        dsa6_dlength = ff_wing * dfre_dlength[:, 1]
+        dsa7_dlength = k * dcdpo_dlength
+        dsa7_dlength[:, 1] += k * cf * sweep_factor * dsa6_dlength
+
+        J['SA5', 'reynolds_ref_lengths'] = dcdpo_dlength
+        J['SA5', 'profile_drag_coeffs'] = cf[:, np.newaxis] * fre
+        J['SA6', 'reynolds_ref_lengths'] = dsa6_dlength
+        J['SA7', 'reynolds_ref_lengths'] = dsa7_dlength
+        J['SA7', 'profile_drag_coeffs'] = k * cf[:, np.newaxis] * fre
+
+
+class AeroSetupPremission(om.Group):
+    """Calculations for setting up aero that only depend on the sized aircraft.
+
+    These are computed once in pre-mission when the aero builder is configured for it,
+    otherwise AeroSetup includes this group.
+    """
+
+    def setup(self):
+        self.add_subsystem(
+            'ratios', WingTailRatios(), promotes_inputs=['*'], promotes_outputs=['*']
+        )
+        self.add_subsystem(
+            'xlifts', XliftsPremission(), promotes_inputs=['*'], promotes_outputs=['*']
+        )
+
+        # implements EAERO
+        interp = om.MetaModelStructuredComp(method='2D-slinear')
+        interp.add_input('bbar', 0.0, units='unitless', training_data=xbbar)
+        interp.add_input('hbar', 0.0, units='unitless', training_data=xhbar)
+        interp.add_output('sigma', 0.0, units='unitless', training_data=sig1)
+        interp.add_output('sigstr', 0.0, units='unitless', training_data=sig2)
+        self.add_subsystem('interp', interp, promotes_inputs=['*'], promotes_outputs=['*'])
+
+        self.add_subsystem(
+            'geom', AeroGeomPremission(), promotes_inputs=['*'], promotes_outputs=['*']
+        )
+
+
+# outputs of AeroSetupPremission that are inputs to AeroSetup when the geometry is
+# computed in pre-mission, with their units
+PREMISSION_GEOMETRY_OUTPUTS = {
+    'bbar': 'unitless',
+    'sbar': 'unitless',
+    'sigma': 'unitless',
+    'sigstr': 'unitless',
+    'stability_delta': 'unitless',
+    'htail_effective_aspect_ratio': 'unitless',
+    'wing_downwash_sum': 'unitless',
+    'htail_downwash_sum': 'unitless',
+    'compressibility_drag_params': 'unitless',
+    'reynolds_ref_lengths': 'ft',
+    'profile_drag_coeffs': 'unitless',
+    'profile_drag_increment': 'unitless',
+    'induced_drag_coeff': 'unitless',
+    'sweep_drag_factor': 'unitless',
+}
+
 
 class AeroSetup(om.Group):
     """Calculations for setting up aero."""
@@ -707,20 +1456,21 @@ class AeroSetup(om.Group):
             desc='Directly input speed of sound and kinematic viscosity instead of '
             'computing them with an atmospherics component. For testing.',
         )
+        self.options.declare(
+            'premission_geometry',
+            default=False,
+            types=bool,
+            desc='If True, the outputs of AeroSetupPremission are inputs to this group '
+            'and must be connected from pre-mission. If False, they are computed here.',
+        )
 
     def setup(self):
         nn = self.options['num_nodes']
 
-        self.add_subsystem('ratios', WingTailRatios(), promotes=['*'])
-        self.add_subsystem('xlifts', Xlifts(num_nodes=nn), promotes=['*'])
+        if not self.options['premission_geometry']:
+            self.add_subsystem('premission', AeroSetupPremission(), promotes=['*'])
 
-        # implements EAERO
-        interp = om.MetaModelStructuredComp(method='2D-slinear')
-        interp.add_input('bbar', 0.0, units='unitless', training_data=xbbar)
-        interp.add_input('hbar', 0.0, units='unitless', training_data=xhbar)
-        interp.add_output('sigma', 0.0, units='unitless', training_data=sig1)
-        interp.add_output('sigstr', 0.0, units='unitless', training_data=sig2)
-        self.add_subsystem('interp', interp, promotes=['*'])
+        self.add_subsystem('xlifts', Xlifts(num_nodes=nn), promotes=['*'])
 
         self.add_subsystem(
             'ufac_calc',
@@ -854,26 +1604,40 @@ class DragCoef(om.ExplicitComponent):
     def setup_partials(self):
         # self.declare_coloring(method="cs", show_summary=False)
         self.declare_partials('*', '*', dependent=False)
-        ar = np.arange(self.options['num_nodes'])
+        nn = self.options['num_nodes']
+        ar = np.arange(nn)
+        zeros = np.zeros(nn, dtype=int)
 
-        self.declare_partials('CD_base', ['*'], method='cs')
+        self.declare_partials(
+            'CD_base',
+            [
+                'flap_defl',
+                Aircraft.Wing.HEIGHT,
+                'airport_alt',
+                Aircraft.Wing.FLAP_CHORD_RATIO,
+                'dCL_flaps_model',
+                'dCL_flaps_coef',
+                'CDI_factor',
+                Aircraft.Wing.AVERAGE_CHORD,
+                Aircraft.Wing.SPAN,
+            ],
+            rows=ar,
+            cols=zeros,
+        )
         self.declare_partials(
             'CD_base',
             [Dynamic.Mission.ALTITUDE, 'CL', 'cf', 'SA5', 'SA6', 'SA7'],
             rows=ar,
             cols=ar,
-            method='cs',
         )
-        # self.declare_partials(
-        #     "CD_base", [Mission.Design.GROSS_MASS, "dCD_flaps_model", "wing_area"], val=0
-        # )
 
         self.declare_partials('dCD_flaps_full', ['dCD_flaps_model'], val=1)
 
         self.declare_partials(
             'dCD_gear_full',
             [Mission.Design.GROSS_MASS, Aircraft.Wing.AREA, 'flap_defl'],
-            method='cs',
+            rows=ar,
+            cols=zeros,
         )
 
     def compute(self, inputs, outputs):
@@ -921,6 +1685,79 @@ class DragCoef(om.ExplicitComponent):
         outputs['dCD_flaps_full'] = dCD_flaps_model
         outputs['dCD_gear_full'] = dcd_gear
 
+    def compute_partials(self, inputs, J):
+        (
+            alt,
+            CL,
+            gross_mass_initial,
+            flap_defl,
+            wing_height,
+            airport_alt,
+            flap_chord_ratio,
+            dCL_flaps_model,
+            dCD_flaps_model,
+            dCL_flaps_coef,
+            CDI_factor,
+            avg_chord,
+            wingspan,
+            wing_area,
+            cf,
+            SA5,
+            SA6,
+            SA7,
+        ) = inputs.values()
+        gross_wt_initial = gross_mass_initial * GRAV_ENGLISH_LBM
+        d2r = np.pi / 180.0
+
+        CL_wing = CL - dCL_flaps_coef * dCL_flaps_model
+        cdi = SA7 * CL_wing**2 / CDI_factor
+
+        hac = wing_height + alt - airport_alt
+        flap_sin = np.sin(deg2rad(flap_defl))
+        heff = 2 * hac - flap_sin * flap_chord_ratio * avg_chord
+        hob = heff / wingspan
+        sig = np.exp(-2.48 * hob**0.768)
+        betag = np.sqrt(1 + hob**2) - hob
+        c1 = betag * CL / (12.5664 * hac)
+
+        # CD_base = SA5 + SA6 * cf * (1 - c1) + cdi * (1 - (sig - c1) / (1 - c1))
+        dCD_dcdi = 1 - (sig - c1) / (1 - c1)
+        dCD_dsig = -cdi / (1 - c1)
+        dCD_dc1 = -SA6 * cf - cdi * (sig - 1) / (1 - c1) ** 2
+
+        dsig_dhob = sig * -2.48 * 0.768 * hob**-0.232
+        dbetag_dhob = hob / np.sqrt(1 + hob**2) - 1
+        dCD_dhob = dCD_dsig * dsig_dhob + dCD_dc1 * CL / (12.5664 * hac) * dbetag_dhob
+        dCD_dheff = dCD_dhob / wingspan
+        dCD_dhac = 2 * dCD_dheff - dCD_dc1 * c1 / hac
+
+        dcdi_dCL_wing = 2 * SA7 * CL_wing / CDI_factor
+
+        J['CD_base', Dynamic.Mission.ALTITUDE] = dCD_dhac
+        J['CD_base', Aircraft.Wing.HEIGHT] = dCD_dhac
+        J['CD_base', 'airport_alt'] = -dCD_dhac
+        J['CD_base', 'CL'] = dCD_dcdi * dcdi_dCL_wing + dCD_dc1 * betag / (12.5664 * hac)
+        J['CD_base', 'flap_defl'] = (
+            -dCD_dheff * np.cos(deg2rad(flap_defl)) * d2r * flap_chord_ratio * avg_chord
+        )
+        J['CD_base', Aircraft.Wing.FLAP_CHORD_RATIO] = -dCD_dheff * flap_sin * avg_chord
+        J['CD_base', Aircraft.Wing.AVERAGE_CHORD] = -dCD_dheff * flap_sin * flap_chord_ratio
+        J['CD_base', Aircraft.Wing.SPAN] = -dCD_dhob * hob / wingspan
+        J['CD_base', 'dCL_flaps_model'] = -dCD_dcdi * dcdi_dCL_wing * dCL_flaps_coef
+        J['CD_base', 'dCL_flaps_coef'] = -dCD_dcdi * dcdi_dCL_wing * dCL_flaps_model
+        J['CD_base', 'CDI_factor'] = -dCD_dcdi * cdi / CDI_factor
+        J['CD_base', 'SA5'] = 1.0
+        J['CD_base', 'SA6'] = cf * (1 - c1)
+        J['CD_base', 'SA7'] = dCD_dcdi * CL_wing**2 / CDI_factor
+        J['CD_base', 'cf'] = SA6 * (1 - c1)
+
+        grfe = 0.0033 * gross_wt_initial**0.785
+        dcd_gear = (grfe / wing_area) * (1 - 0.454545 * flap_defl / 50)
+
+        J['dCD_gear_full', Mission.Design.GROSS_MASS] = 0.785 * dcd_gear / gross_mass_initial
+        J['dCD_gear_full', Aircraft.Wing.AREA] = -dcd_gear / wing_area
+        J['dCD_gear_full', 'flap_defl'] = -(grfe / wing_area) * 0.454545 / 50
+
 
 class DragCoefClean(om.ExplicitComponent):
     """Clean drag coefficient for high-speed flight."""
@@ -958,16 +1795,27 @@ class DragCoefClean(om.ExplicitComponent):
         self.add_output('CD', units='unitless', shape=nn, desc='Drag coefficient')
 
     def setup_partials(self):
-        ar = np.arange(self.options['num_nodes'])
+        nn = self.options['num_nodes']
+        ar = np.arange(nn)
 
         self.declare_partials(
             'CD',
             [Dynamic.Atmosphere.MACH, 'CL', 'cf', 'SA1', 'SA2', 'SA5', 'SA6', 'SA7'],
             rows=ar,
             cols=ar,
-            method='cs',
         )
-        self.declare_partials('CD', [Aircraft.Design.SUPERCRITICAL_DIVERGENCE_SHIFT], method='cs')
+        self.declare_partials(
+            'CD',
+            [
+                Aircraft.Design.SUPERCRITICAL_DIVERGENCE_SHIFT,
+                Aircraft.Design.SUBSONIC_DRAG_COEFF_FACTOR,
+                Aircraft.Design.SUPERSONIC_DRAG_COEFF_FACTOR,
+                Aircraft.Design.LIFT_DEPENDENT_DRAG_COEFF_FACTOR,
+                Aircraft.Design.ZERO_LIFT_DRAG_COEFF_FACTOR,
+            ],
+            rows=ar,
+            cols=np.zeros(nn, dtype=int),
+        )
 
     def compute(self, inputs, outputs):
         (
@@ -1009,6 +1857,53 @@ class DragCoefClean(om.ExplicitComponent):
 
         outputs['CD'] = CD_scaled
 
+    def compute_partials(self, inputs, J):
+        (
+            mach,
+            CL,
+            div_drag_supercrit,
+            subsonic_factor,
+            supersonic_factor,
+            lift_factor,
+            zero_lift_factor,
+            cf,
+            SA1,
+            SA2,
+            SA5,
+            SA6,
+            SA7,
+        ) = inputs.values()
+
+        mach_div = SA1 + SA2 * CL + div_drag_supercrit
+
+        sig = sigmoidX(mach, mach_div, alpha=0.005)
+        dsig = dSigmoidXdx(mach, mach_div, alpha=0.005)
+        delcdm = sig * (10 * (mach - mach_div) ** 3)
+        ddelcdm_dmach = dsig * (10 * (mach - mach_div) ** 3) + sig * 30 * (mach - mach_div) ** 2
+
+        cd0 = SA5 + SA6 * cf
+        cdi = SA7 * CL**2
+        CD = cd0 * zero_lift_factor + cdi * lift_factor + delcdm
+
+        supersonic = mach >= 1.0
+        scale = np.where(supersonic, supersonic_factor, subsonic_factor)
+
+        # the drag divergence Mach number enters delcdm only through (mach - mach_div)
+        J['CD', Dynamic.Atmosphere.MACH] = scale * ddelcdm_dmach
+        J['CD', 'CL'] = scale * (2 * SA7 * CL * lift_factor - ddelcdm_dmach * SA2)
+        J['CD', 'SA1'] = -scale * ddelcdm_dmach
+        J['CD', 'SA2'] = -scale * ddelcdm_dmach * CL
+        J['CD', Aircraft.Design.SUPERCRITICAL_DIVERGENCE_SHIFT] = -scale * ddelcdm_dmach
+        J['CD', 'SA5'] = scale * zero_lift_factor
+        J['CD', 'SA6'] = scale * cf * zero_lift_factor
+        J['CD', 'cf'] = scale * SA6 * zero_lift_factor
+        J['CD', 'SA7'] = scale * CL**2 * lift_factor
+
+        J['CD', Aircraft.Design.SUBSONIC_DRAG_COEFF_FACTOR] = np.where(supersonic, 0.0, CD)
+        J['CD', Aircraft.Design.SUPERSONIC_DRAG_COEFF_FACTOR] = np.where(supersonic, CD, 0.0)
+        J['CD', Aircraft.Design.LIFT_DEPENDENT_DRAG_COEFF_FACTOR] = scale * cdi
+        J['CD', Aircraft.Design.ZERO_LIFT_DRAG_COEFF_FACTOR] = scale * cd0
+
 
 class LiftCoeff(om.ExplicitComponent):
     """GASP lift coefficient calculation for low-speed near-ground flight."""
@@ -1084,17 +1979,38 @@ class LiftCoeff(om.ExplicitComponent):
             'lift_ratio',
         ]
 
-        self.declare_partials('CL_base', ['*'], method='cs')
-        self.declare_partials('CL_base', dynvars, rows=ar, cols=ar, method='cs')
+        # scalar parameters are shared by all nodes
+        zeros = np.zeros(self.options['num_nodes'], dtype=int)
+        params = [
+            Aircraft.Wing.ZERO_LIFT_ANGLE,
+            Aircraft.Wing.SWEEP,
+            Aircraft.Wing.ASPECT_RATIO,
+            Aircraft.Wing.HEIGHT,
+            'airport_alt',
+            'flap_defl',
+            Aircraft.Wing.FLAP_CHORD_RATIO,
+            Aircraft.Wing.TAPER_RATIO,
+            'dCL_flaps_model',
+            Aircraft.Wing.AVERAGE_CHORD,
+            Aircraft.Wing.SPAN,
+        ]
+
+        self.declare_partials('CL_base', params, rows=ar, cols=zeros)
+        self.declare_partials('CL_base', dynvars, rows=ar, cols=ar)
 
-        self.declare_partials('dCL_flaps_full', ['dCL_flaps_model'], method='cs')
-        self.declare_partials('dCL_flaps_full', ['lift_ratio'], rows=ar, cols=ar, method='cs')
+        self.declare_partials('dCL_flaps_full', ['dCL_flaps_model'], rows=ar, cols=zeros)
+        self.declare_partials('dCL_flaps_full', ['lift_ratio'], rows=ar, cols=ar)
 
-        self.declare_partials('alpha_stall', ['*'], method='cs')
-        self.declare_partials('alpha_stall', dynvars, rows=ar, cols=ar, method='cs')
+        self.declare_partials('alpha_stall', params + ['CL_max_flaps'], rows=ar, cols=zeros)
+        self.declare_partials(
+            'alpha_stall',
+            [Dynamic.Vehicle.ANGLE_OF_ATTACK, Dynamic.Mission.ALTITUDE, 'lift_curve_slope'],
+            rows=ar,
+            cols=ar,
+        )
 
-        self.declare_partials('CL_max', ['CL_max_flaps'], method='cs')
-        self.declare_partials('CL_max', ['lift_ratio'], rows=ar, cols=ar, method='cs')
+        self.declare_partials('CL_max', ['CL_max_flaps'], rows=ar, cols=zeros)
+        self.declare_partials('CL_max', ['lift_ratio'], rows=ar, cols=ar)
 
     def compute(self, inputs, outputs):
         (
@@ -1143,6 +2059,122 @@ class LiftCoeff(om.ExplicitComponent):
         )
         outputs['CL_max'] = CL_max_flaps * (1 + lift_ratio)
 
+    def compute_partials(self, inputs, J):
+        (
+            alpha,
+            alt,
+            lift_curve_slope,
+            lift_ratio,
+            alpha0,
+            sweep_c4,
+            AR,
+            wing_height,
+            airport_alt,
+            flap_defl,
+            flap_chord_ratio,
+            taper_ratio,
+            CL_max_flaps,
+            dCL_flaps_model,
+            avg_chord,
+            wingspan,
+        ) = inputs.values()
+        d2r = np.pi / 180.0
+
+        hac = wing_height + alt - airport_alt
+        flap_sin = np.sin(deg2rad(flap_defl))
+        heff = 2 * hac - flap_sin * flap_chord_ratio * avg_chord
+        hob = heff / wingspan
+        sig = np.exp(-2.48 * hob**0.768)
+        betag = (1 + hob**2) ** 0.5 - hob
+        yale05 = (1 - taper_ratio) / (1 + taper_ratio)
+        tan_sweep = np.tan(deg2rad(sweep_c4))
+        num = AR * tan_sweep - yale05
+        rlmc2 = np.arctan2(num, AR)
+        cos_c2 = np.cos(rlmc2)
+        root = np.sqrt(AR**2 + (2 * cos_c2) ** 2)
+        c3 = 2 * cos_c2 + root
+        c4 = betag / (12.5664 * hac / avg_chord)
+        alpha_rad = deg2rad(alpha - alpha0)
+        cloge = lift_curve_slope * alpha_rad + dCL_flaps_model
+        ground_term = cloge - lift_curve_slope / (16 * hac / avg_chord)
+        sweep_term = AR * cos_c2 / c3
+        kclge = 1 + sig - sig * sweep_term - c4 * ground_term
+        # the ground effect factor is clipped at 1
+        unclipped = kclge > 1.0
+        kclge = np.clip(kclge, 1.0, None)
+
+        # partials of the ground effect factor
+        dk_dsig = 1 - sweep_term
+        dk_dc4 = -ground_term
+        dk_dground = -c4
+
+        dsig_dhob = sig * -2.48 * 0.768 * hob**-0.232
+        dbetag_dhob = hob / np.sqrt(1 + hob**2) - 1
+        dk_dhob = dk_dsig * dsig_dhob + dk_dc4 * avg_chord / (12.5664 * hac) * dbetag_dhob
+        dk_dheff = dk_dhob / wingspan
+        dk_dhac = (
+            2 * dk_dheff
+            - dk_dc4 * c4 / hac
+            + dk_dground * lift_curve_slope * avg_chord / (16 * hac**2)
+        )
+
+        dc3_dcos = 2 + 4 * cos_c2 / root
+        dsweep_dcos = AR / c3 - sweep_term / c3 * dc3_dcos
+        # derivatives of the mid-chord sweep with respect to the numerator of its arctan2
+        # and to AR
+        dk_dnum = -sig * dsweep_dcos * -np.sin(rlmc2) * AR / (num**2 + AR**2)
+        dk_dAR = -sig * (cos_c2 / c3 - sweep_term / c3 * AR / root) + dk_dnum * (yale05 / AR)
+        dheff_dflap_defl = -np.cos(deg2rad(flap_defl)) * d2r * flap_chord_ratio * avg_chord
+        dk_dalpha = dk_dground * lift_curve_slope * d2r
+
+        dk = {
+            Dynamic.Vehicle.ANGLE_OF_ATTACK: dk_dalpha,
+            Dynamic.Mission.ALTITUDE: dk_dhac,
+            'lift_curve_slope': dk_dground * (alpha_rad - avg_chord / (16 * hac)),
+            Aircraft.Wing.ZERO_LIFT_ANGLE: -dk_dalpha,
+            Aircraft.Wing.SWEEP: dk_dnum * AR * d2r / np.cos(deg2rad(sweep_c4)) ** 2,
+            Aircraft.Wing.ASPECT_RATIO: dk_dAR,
+            Aircraft.Wing.HEIGHT: dk_dhac,
+            'airport_alt': -dk_dhac,
+            'flap_defl': dk_dheff * dheff_dflap_defl,
+            Aircraft.Wing.FLAP_CHORD_RATIO: -dk_dheff * flap_sin * avg_chord,
+            Aircraft.Wing.TAPER_RATIO: dk_dnum * 2 / (1 + taper_ratio) ** 2,
+            'dCL_flaps_model': dk_dground,
+            Aircraft.Wing.AVERAGE_CHORD: -dk_dheff * flap_sin * flap_chord_ratio
+            + dk_dc4 * c4 / avg_chord
+            - dk_dground * lift_curve_slope / (16 * hac),
+            Aircraft.Wing.SPAN: -dk_dhob * hob / wingspan,
+        }
+
+        CL_clean = lift_curve_slope * alpha_rad * (1 + lift_ratio)
+        stall_num = CL_max_flaps - dCL_flaps_model
+        stall = stall_num / (kclge * lift_curve_slope)
+
+        for name, dk_dx in dk.items():
+            dk_dx = np.where(unclipped, dk_dx, 0.0)
+            J['CL_base', name] = CL_clean * dk_dx
+            J['alpha_stall', name] = -stall / kclge * dk_dx / d2r
+
+        J['CL_base', Dynamic.Vehicle.ANGLE_OF_ATTACK] += (
+            kclge * lift_curve_slope * d2r * (1 + lift_ratio)
+        )
+        J['CL_base', Aircraft.Wing.ZERO_LIFT_ANGLE] -= (
+            kclge * lift_curve_slope * d2r * (1 + lift_ratio)
+        )
+        J['CL_base', 'lift_curve_slope'] += kclge * alpha_rad * (1 + lift_ratio)
+        J['CL_base', 'lift_ratio'] = kclge * lift_curve_slope * alpha_rad
+
+        J['alpha_stall', 'lift_curve_slope'] += -stall / lift_curve_slope / d2r
+        J['alpha_stall', 'CL_max_flaps'] = 1 / (kclge * lift_curve_slope) / d2r
+        J['alpha_stall', 'dCL_flaps_model'] -= 1 / (kclge * lift_curve_slope) / d2r
+        J['alpha_stall', Aircraft.Wing.ZERO_LIFT_ANGLE] += 1.0
+
+        J['dCL_flaps_full', 'dCL_flaps_model'] = 1 + lift_ratio
+        J['dCL_flaps_full', 'lift_ratio'] = dCL_flaps_model
+
+        J['CL_max', 'CL_max_flaps'] = 1 + lift_ratio
+        J['CL_max', 'lift_ratio'] = CL_max_flaps
+
 
 class LiftCoeffClean(om.ExplicitComponent):
     """Clean wing lift coefficient for high-speed flight."""
@@ -1181,18 +2213,21 @@ class LiftCoeffClean(om.ExplicitComponent):
         self.declare_partials('*', '*', dependent=False)
         ar = np.arange(self.options['num_nodes'])
 
+        zeros = np.zeros(self.options['num_nodes'], dtype=int)
+
         if self.options['output_alpha']:
             self.declare_partials(
                 Dynamic.Vehicle.ANGLE_OF_ATTACK,
                 ['CL', 'lift_ratio', 'lift_curve_slope'],
                 rows=ar,
                 cols=ar,
-                method='cs',
             )
             self.declare_partials(
                 Dynamic.Vehicle.ANGLE_OF_ATTACK,
                 [Aircraft.Wing.ZERO_LIFT_ANGLE],
-                method='cs',
+                rows=ar,
+                cols=zeros,
+                val=1.0,
             )
         else:
             self.declare_partials(
@@ -1200,22 +2235,21 @@ class LiftCoeffClean(om.ExplicitComponent):
                 ['lift_curve_slope', Dynamic.Vehicle.ANGLE_OF_ATTACK, 'lift_ratio'],
                 rows=ar,
                 cols=ar,
-                method='cs',
             )
-            self.declare_partials('CL', [Aircraft.Wing.ZERO_LIFT_ANGLE], method='cs')
+            self.declare_partials('CL', [Aircraft.Wing.ZERO_LIFT_ANGLE], rows=ar, cols=zeros)
 
-        self.declare_partials('alpha_stall', ['lift_curve_slope'], rows=ar, cols=ar, method='cs')
+        self.declare_partials('alpha_stall', ['lift_curve_slope'], rows=ar, cols=ar)
         self.declare_partials(
-            'alpha_stall',
-            [
-                Mission.Design.LIFT_COEFFICIENT_MAX_FLAPS_UP,
-                Aircraft.Wing.ZERO_LIFT_ANGLE,
-            ],
-            method='cs',
+            'alpha_stall', [Mission.Design.LIFT_COEFFICIENT_MAX_FLAPS_UP], rows=ar, cols=zeros
+        )
+        self.declare_partials(
+            'alpha_stall', [Aircraft.Wing.ZERO_LIFT_ANGLE], rows=ar, cols=zeros, val=1.0
         )
 
-        self.declare_partials('CL_max', ['lift_ratio'], rows=ar, cols=ar, method='cs')
-        self.declare_partials('CL_max', [Mission.Design.LIFT_COEFFICIENT_MAX_FLAPS_UP], method='cs')
+        self.declare_partials('CL_max', ['lift_ratio'], rows=ar, cols=ar)
+        self.declare_partials(
+            'CL_max', [Mission.Design.LIFT_COEFFICIENT_MAX_FLAPS_UP], rows=ar, cols=zeros
+        )
 
     def compute(self, inputs, outputs):
         _, lift_curve_slope, lift_ratio, alpha0, CL_max_flaps = inputs.values()
@@ -1230,6 +2264,33 @@ class LiftCoeffClean(om.ExplicitComponent):
         outputs['alpha_stall'] = rad2deg(CL_max_flaps / lift_curve_slope) + alpha0
         outputs['CL_max'] = CL_max_flaps * (1 + lift_ratio)
 
+    def compute_partials(self, inputs, J):
+        _, lift_curve_slope, lift_ratio, alpha0, CL_max_flaps = inputs.values()
+        if self.options['output_alpha']:
+            CL = inputs['CL']
+            dalpha_dclw = rad2deg(1 / ((1 + lift_ratio) * lift_curve_slope))
+            alpha_clean = rad2deg(CL / (1 + lift_ratio) / lift_curve_slope)
+
+            J[Dynamic.Vehicle.ANGLE_OF_ATTACK, 'CL'] = dalpha_dclw
+            J[Dynamic.Vehicle.ANGLE_OF_ATTACK, 'lift_ratio'] = -alpha_clean / (1 + lift_ratio)
+            J[Dynamic.Vehicle.ANGLE_OF_ATTACK, 'lift_curve_slope'] = -alpha_clean / lift_curve_slope
+        else:
+            alpha = inputs[Dynamic.Vehicle.ANGLE_OF_ATTACK]
+            dCL_dalpha = lift_curve_slope * deg2rad(1.0) * (1 + lift_ratio)
+
+            J['CL', 'lift_curve_slope'] = deg2rad(alpha - alpha0) * (1 + lift_ratio)
+            J['CL', Dynamic.Vehicle.ANGLE_OF_ATTACK] = dCL_dalpha
+            J['CL', 'lift_ratio'] = lift_curve_slope * deg2rad(alpha - alpha0)
+            J['CL', Aircraft.Wing.ZERO_LIFT_ANGLE] = -dCL_dalpha
+
+        J['alpha_stall', 'lift_curve_slope'] = -rad2deg(CL_max_flaps / lift_curve_slope**2)
+        J['alpha_stall', Mission.Design.LIFT_COEFFICIENT_MAX_FLAPS_UP] = rad2deg(
+            1 / lift_curve_slope
+        )
+
+        J['CL_max', 'lift_ratio'] = CL_max_flaps
+        J['CL_max', Mission.Design.LIFT_COEFFICIENT_MAX_FLAPS_UP] = 1 + lift_ratio
+
 
 class CruiseAero(om.Group):
     """Top-level aerodynamics group for cruise (no flaps, no landing gear)."""
@@ -1250,6 +2311,13 @@ class CruiseAero(om.Group):
             desc='Directly input speed of sound and kinematic viscosity instead of '
             'computing them with an atmospherics component. For testing.',
         )
+        self.options.declare(
+            'premission_geometry',
+            default=False,
+            types=bool,
+            desc='If True, the flight-condition-independent aero geometry is computed in '
+            'pre-mission and must be connected as inputs.',
+        )
 
     def setup(self):
         nn = self.options['num_nodes']
@@ -1258,6 +2326,7 @@ class CruiseAero(om.Group):
             AeroSetup(
                 num_nodes=nn,
                 input_atmos=self.options['input_atmos'],
+                premission_geometry=self.options['premission_geometry'],
             ),
             promotes=['*'],
         )
@@ -1304,6 +2373,13 @@ class LowSpeedAero(om.Group):
             desc='Directly input speed of sound and kinematic viscosity instead of '
             'computing them with an atmospherics component. For testing.',
         )
+        self.options.declare(
+            'premission_geometry',
+            default=False,
+            types=bool,
+            desc='If True, the flight-condition-independent aero geometry is computed in '
+            'pre-mission and must be connected as inputs.',
+        )
 
     def setup(self):
         nn = self.options['num_nodes']
@@ -1313,6 +2389,7 @@ class LowSpeedAero(om.Group):
             AeroSetup(
                 num_nodes=nn,
                 input_atmos=self.options['input_atmos'],
+                premission_geometry=self.options['premission_geometry'],
             ),
             promotes=['*'],
         )
@@ -8,6 +8,10 @@ import openmdao.api as om
 
 from aviary.subsystems.aerodynamics.gasp_based.flaps_model import FlapsGroup
 from aviary.subsystems.aerodynamics.gasp_based.gasp_aero_coeffs import AeroFormfactors
+from aviary.subsystems.aerodynamics.gasp_based.gaspaero import (
+    PREMISSION_GEOMETRY_OUTPUTS,
+    AeroSetupPremission,
+)
 from aviary.subsystems.aerodynamics.gasp_based.interference import (
     WingFuselageInterferencePremission,
 )
@@ -22,6 +26,15 @@ from aviary.variable_info.variables import Aircraft, Dynamic, Mission
 class PreMissionAero(om.Group):
     """Takeoff and landing flaps modeling."""
 
+    def initialize(self):
+        self.options.declare(
+            'premission_geometry',
+            default=False,
+            types=bool,
+            desc='If True, also compute the flight-condition-independent aero geometry '
+            'used by the mission aero.',
+        )
+
     def setup(self):
         self.add_subsystem(
             'wing_fus_interference_premission',
@@ -115,6 +128,18 @@ class PreMissionAero(om.Group):
             ],
         )
 
+        if self.options['premission_geometry']:
+            self.add_subsystem(
+                'aero_setup',
+                AeroSetupPremission(),
+                promotes_inputs=[
+                    'aircraft:*',
+                    'interference_independent_of_shielded_area',
+                    'drag_loss_due_to_shielded_wing_area',
+                ],
+                promotes_outputs=list(PREMISSION_GEOMETRY_OUTPUTS),
+            )
+
         self.set_input_defaults('alt_flaps', 0)
         self.set_input_defaults('flap_defl_up', 0)
         self.set_input_defaults('slat_defl_up', 0)
@@ -7,7 +7,11 @@ import openmdao.api as om
 import pandas as pd
 from openmdao.utils.assert_utils import assert_check_partials, assert_near_equal
 
-from aviary.subsystems.aerodynamics.gasp_based.gaspaero import CruiseAero, LowSpeedAero
+from aviary.subsystems.aerodynamics.gasp_based.gaspaero import (
+    AeroSetupPremission,
+    CruiseAero,
+    LowSpeedAero,
+)
 from aviary.utils.aviary_values import AviaryValues
 from aviary.variable_info.functions import setup_model_options
 from aviary.variable_info.variables import Aircraft, Dynamic, Mission
@@ -61,9 +65,8 @@ class GASPAeroTest(unittest.TestCase):
                 assert_near_equal(prob['CL'][0], row['cl'], tolerance=self.cruise_tol)
                 assert_near_equal(prob['CD'][0], row['cd'], tolerance=self.cruise_tol)
 
-                # some partials are computed using "cs" method. So, use "fd" here. computation is not as good as "cs".
-                partial_data = prob.check_partials(method='fd', out_stream=None)
-                assert_check_partials(partial_data, atol=0.8, rtol=0.002)
+                partial_data = prob.check_partials(method='cs', out_stream=None)
+                assert_check_partials(partial_data, atol=1e-10, rtol=1e-10)
 
     def test_ground(self):
         prob = om.Problem()
@@ -125,8 +128,8 @@ class GASPAeroTest(unittest.TestCase):
                 assert_near_equal(prob['CL'][0], row['cl'], tolerance=self.ground_tol)
                 assert_near_equal(prob['CD'][0], row['cd'], tolerance=self.ground_tol)
 
-                partial_data = prob.check_partials(method='fd', out_stream=None)
-                assert_check_partials(partial_data, atol=4.5, rtol=5e-3)
+                partial_data = prob.check_partials(method='cs', out_stream=None)
+                assert_check_partials(partial_data, atol=1e-10, rtol=1e-10)
 
     def test_ground_alpha_out(self):
         # Test that drag output matches between both CL computation methods
@@ -165,8 +168,55 @@ class GASPAeroTest(unittest.TestCase):
 
         assert_near_equal(prob['lift_from_aoa.drag'], prob['lift_required.drag'], tolerance=1e-6)
 
-        partial_data = prob.check_partials(method='fd', out_stream=None)
-        assert_check_partials(partial_data, atol=0.02, rtol=1e-4)
+        partial_data = prob.check_partials(method='cs', out_stream=None)
+        assert_check_partials(partial_data, atol=1e-10, rtol=1e-10)
+
+    def test_premission_geometry(self):
+        # geometry computed once in pre-mission must match the geometry computed in the
+        # mission aero
+        prob = om.Problem()
+        prob.model.add_subsystem('premission', AeroSetupPremission(), promotes=['*'])
+        prob.model.add_subsystem(
+            'aero',
+            CruiseAero(num_nodes=2, input_atmos=True, premission_geometry=True),
+            promotes=['*'],
+        )
+        prob.model.add_subsystem(
+            'aero_ref',
+            CruiseAero(num_nodes=2, input_atmos=True),
+            promotes_inputs=[
+                'aircraft:*',
+                'mission:*',
+                '*_shielded_*',
+                Dynamic.Atmosphere.MACH,
+                Dynamic.Atmosphere.SPEED_OF_SOUND,
+                Dynamic.Atmosphere.KINEMATIC_VISCOSITY,
+                Dynamic.Vehicle.ANGLE_OF_ATTACK,
+            ],
+        )
+
+        setup_model_options(prob, AviaryValues({Aircraft.Engine.NUM_ENGINES: ([2], 'unitless')}))
+
+        prob.setup(check=False, force_alloc_complex=True)
+
+        _init_geom(prob)
+
+        prob.set_val(Mission.Design.LIFT_COEFFICIENT_MAX_FLAPS_UP, setup_data['clmwfu'])
+        prob.set_val(Aircraft.Design.SUPERCRITICAL_DIVERGENCE_SHIFT, setup_data['scfac'])
+        prob.set_val(Dynamic.Atmosphere.MACH, [0.3, 0.8])
+        prob.set_val(Dynamic.Vehicle.ANGLE_OF_ATTACK, [2.0, 4.0])
+        prob.set_val(Dynamic.Atmosphere.SPEED_OF_SOUND, [1100.0, 970.0])
+        prob.set_val(Dynamic.Atmosphere.KINEMATIC_VISCOSITY, [1.6e-4, 4.0e-4])
+
+        prob.run_model()
+
+        for name in ['CL', 'CD', 'SA5', 'SA7', 'ufac', 'lift_ratio']:
+            assert_near_equal(prob.get_val(name), prob.get_val(f'aero_ref.{name}'), 1e-12)
+
+        partial_data = prob.check_partials(
+            method='cs', includes=['premission.*', 'aero.*'], out_stream=None
+        )
+        assert_check_partials(partial_data, atol=1e-10, rtol=1e-10)
 
 
 def _init_geom(prob):
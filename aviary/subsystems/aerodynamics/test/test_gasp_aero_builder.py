@@ -22,5 +22,16 @@ class TestAeroBuilder(av.TestSubsystemBuilderBase):
         self.aviary_values.set_val(Aircraft.Engine.NUM_ENGINES, [1], units='unitless')
 
 
+class TestAeroBuilderPremissionGeometry(av.TestSubsystemBuilderBase):
+    """Test the builder with the mission-invariant aero geometry computed in pre-mission."""
+
+    def setUp(self):
+        self.subsystem_builder = CoreAerodynamicsBuilder(
+            'core_aerodynamics', BaseMetaData, GASP, premission_geometry=True
+        )
+        self.aviary_values = av.AviaryValues()
+        self.aviary_values.set_val(Aircraft.Engine.NUM_ENGINES, [1], units='unitless')
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -1,9 +1,10 @@
 import openmdao.api as om
-from dymos.models.atmosphere.atmos_1976 import USatm1976Comp
 
 from aviary.subsystems.atmosphere.flight_conditions import FlightConditions
+from aviary.subsystems.atmosphere.standard_atmosphere import StandardAtmosphere
 from aviary.variable_info.enums import SpeedType
-from aviary.variable_info.variables import Dynamic
+from aviary.variable_info.functions import add_aviary_option
+from aviary.variable_info.variables import Dynamic, Mission
 
 
 class Atmosphere(om.Group):
@@ -40,15 +41,23 @@ class Atmosphere(om.Group):
             desc='defines input airspeed as equivalent airspeed, true airspeed, or mach number',
         )
 
+        add_aviary_option(self, Mission.Summary.TEMPERATURE_OFFSET, units='degR')
+
     def setup(self):
         nn = self.options['num_nodes']
         speed_type = self.options['input_speed_type']
         h_def = self.options['h_def']
         output_dsos_dh = self.options['output_dsos_dh']
+        delta_T, _ = self.options[Mission.Summary.TEMPERATURE_OFFSET]
 
         self.add_subsystem(
             name='standard_atmosphere',
-            subsys=USatm1976Comp(num_nodes=nn, h_def=h_def, output_dsos_dh=output_dsos_dh),
+            subsys=StandardAtmosphere(
+                num_nodes=nn,
+                h_def=h_def,
+                output_dsos_dh=output_dsos_dh,
+                delta_T=delta_T,
+            ),
             promotes_inputs=[('h', Dynamic.Mission.ALTITUDE)],
             promotes_outputs=[
                 '*',
@@ -0,0 +1,255 @@
+"""
+US 1976 standard atmosphere evaluated from precomputed spline tables.
+
+The Akima spline coefficients of the temperature, pressure, density and viscosity tables
+(and of the derivatives of density and temperature) are stacked into a single read-only
+array once per process, so every property and its derivative with respect to altitude is
+evaluated with one table lookup. A constant offset of the temperature from the standard
+day (hot or cold day) can be applied: pressure is unchanged at a given altitude, density
+follows from the ideal gas law, and viscosity from Sutherland's law.
+"""
+
+import numpy as np
+import openmdao.api as om
+from dymos.models.atmosphere.atmos_1976 import USatm1976Data
+
+# ratio of specific heats and gas constant, in (ft*lbf)/(slug*degR), as used by dymos
+GAMMA = 1.4
+GAS_CONSTANT = 1716.49
+
+# Sutherland's constant for air, in degR
+SUTHERLAND_CONSTANT = 198.72
+
+# radius of the Earth from the original standard, in ft
+_R0 = 6_356_766 / 0.3048
+
+_K = GAMMA * GAS_CONSTANT
+
+# columns of the stacked coefficient table; the derivatives of temperature and density are
+# always needed, so they come first
+_TEMP, _RHO, _PRES, _VISCOSITY, _DTEMP, _DRHO = range(6)
+
+_TABLE_ALT = USatm1976Data.alt
+_BIN_LEFT = np.hstack((_TABLE_ALT[0], _TABLE_ALT))
+
+# spline coefficients, indexed by (power of the offset in the bin, altitude bin, property)
+_COEFFS = (
+    np.stack(
+        (
+            USatm1976Data.akima_T,
+            USatm1976Data.akima_rho,
+            USatm1976Data.akima_P,
+            USatm1976Data.akima_viscosity,
+            USatm1976Data.akima_dT,
+            USatm1976Data.akima_drho,
+        ),
+        axis=-1,
+    )
+    .transpose(1, 0, 2)
+    .copy()
+)
+_COEFFS.flags.writeable = False
+
+
+def _sutherland(temp):
+    """Return the temperature dependence of viscosity from Sutherland's law."""
+    return temp**1.5 / (temp + SUTHERLAND_CONSTANT)
+
+
+def _dlog_sutherland(temp):
+    """Return the derivative of the log of _sutherland with respect to temperature."""
+    return 1.5 / temp - 1.0 / (temp + SUTHERLAND_CONSTANT)
+
+
+def standard_atmosphere(h, delta_T=0.0, h_def='geodetic', partials=False):
+    """
+    Return atmospheric properties at the given altitudes.
+
+    With no temperature offset, the results are identical to those of dymos'
+    USatm1976Comp. The derivatives of 'drhos_dh' and 'dsos_dh' with respect to geodetic
+    altitude differ: they are multiplied by dz/dh once, where dymos squares it.
+
+    Parameters
+    ----------
+    h : ndarray
+        Altitudes, in ft.
+    delta_T : float
+        Offset of the temperature from the standard day, in degR.
+    h_def : str
+        Definition of h, either 'geodetic' or 'geopotential'.
+    partials : bool
+        If True, also return the derivatives of the properties with respect to h.
+
+    Returns
+    -------
+    values : dict
+        Temperature 'temp' (degR), pressure 'pres' (psi), density 'rho' (slug/ft**3),
+        'viscosity' (lbf*s/ft**2), speed of sound 'sos' (ft/s), and the derivatives of
+        density 'drhos_dh' (slug/ft**4) and speed of sound 'dsos_dh' (1/s) with respect to
+        geopotential altitude.
+    derivatives : dict
+        Only returned if partials is True. Derivatives of each entry of values with
+        respect to h.
+    """
+    h = np.asarray(h)
+
+    if h_def == 'geodetic':
+        # Equation 19 from the original standard
+        dz_dh = (_R0 / (_R0 + h)) ** 2
+        z = h / (_R0 + h) * _R0
+    else:
+        dz_dh = 1.0
+        z = h
+
+    idx = np.searchsorted(_TABLE_ALT, z, side='left')
+    dx = (z - _BIN_LEFT[idx])[..., np.newaxis]
+
+    # all properties in one evaluation of the splines
+    c0, c1, c2, c3 = _COEFFS.take(idx, axis=1)
+    val = c0 + dx * (c1 + dx * (c2 + dx * c3))
+
+    if not partials:
+        c1, c2, c3 = c1[..., :2], c2[..., :2], c3[..., :2]
+
+    der = c1 + dx * (2.0 * c2 + 3.0 * c3 * dx)
+
+    dtemp_std = der[..., _TEMP]
+    drho_std = der[..., _RHO]
+    temp_std = val[..., _TEMP]
+    rho_std = val[..., _RHO]
+    viscosity_std = val[..., _VISCOSITY]
+    dtemp_table = val[..., _DTEMP]
+
+    if delta_T:
+        temp = temp_std + delta_T
+
+        # pressure is unchanged, so density scales with 1 / temperature
+        ratio = temp_std / temp
+        dratio = dtemp_std * delta_T / temp**2
+        rho = rho_std * ratio
+        drhos_dh = drho_std * ratio + rho_std * dratio
+
+        viscosity_ratio = _sutherland(temp) / _sutherland(temp_std)
+        dviscosity_ratio = (
+            viscosity_ratio * dtemp_std * (_dlog_sutherland(temp) - _dlog_sutherland(temp_std))
+        )
+        viscosity = viscosity_std * viscosity_ratio
+    else:
+        temp = temp_std
+        rho = rho_std
+        drhos_dh = drho_std
+        viscosity = viscosity_std
+
+    sos = np.sqrt(_K * temp)
+
+    values = {
+        'temp': temp,
+        'pres': val[..., _PRES],
+        'rho': rho,
+        'viscosity': viscosity,
+        'drhos_dh': drhos_dh,
+        'sos': sos,
+        'dsos_dh': 0.5 / sos * dtemp_table * _K,
+    }
+
+    if not partials:
+        return values
+
+    d2rho_std = der[..., _DRHO]
+    d2temp = der[..., _DTEMP]
+
+    if delta_T:
+        d2ratio = delta_T * (d2temp / temp**2 - 2.0 * dtemp_std**2 / temp**3)
+        drho_dz = drhos_dh
+        d2rho_dz2 = d2rho_std * ratio + 2.0 * drho_std * dratio + rho_std * d2ratio
+        dviscosity_dz = der[..., _VISCOSITY] * viscosity_ratio + viscosity_std * dviscosity_ratio
+    else:
+        drho_dz = drho_std
+        d2rho_dz2 = d2rho_std
+        dviscosity_dz = der[..., _VISCOSITY]
+
+    dsos_dz = 0.5 * _K / sos * dtemp_std
+    d2sos_dz2 = 0.5 * np.sqrt(_K / temp) * (d2temp - 0.5 * dtemp_std**2 / temp)
+
+    derivatives = {
+        'temp': dtemp_std * dz_dh,
+        'pres': der[..., _PRES] * dz_dh,
+        'rho': drho_dz * dz_dh,
+        'viscosity': dviscosity_dz * dz_dh,
+        'drhos_dh': d2rho_dz2 * dz_dh,
+        'sos': dsos_dz * dz_dh,
+        'dsos_dh': d2sos_dz2 * dz_dh,
+    }
+
+    return values, derivatives
+
+
+class StandardAtmosphere(om.ExplicitComponent):
+    """
+    US 1976 standard atmosphere, with an optional temperature offset from the standard
+    day. A drop-in replacement for dymos' USatm1976Comp.
+    """
+
+    def initialize(self):
+        self.options.declare(
+            'num_nodes', types=int, desc='Number of nodes to be evaluated in the RHS'
+        )
+
+        self.options.declare(
+            'h_def',
+            values=('geopotential', 'geodetic'),
+            default='geopotential',
+            desc='The definition of altitude provided as input to the component. If '
+            '"geodetic", it will be converted to geopotential based on Equation 19 in '
+            'the original standard.',
+        )
+
+        self.options.declare(
+            'output_dsos_dh',
+            types=bool,
+            default=False,
+            desc='If true, the derivative of the speed of sound will be added as an output',
+        )
+
+        self.options.declare(
+            'delta_T',
+            types=(int, float),
+            default=0.0,
+            desc='Offset of the temperature from the standard day in degR, positive for a hot day',
+        )
+
+    def setup(self):
+        nn = self.options['num_nodes']
+        output_dsos_dh = self.options['output_dsos_dh']
+
+        self.add_input('h', val=np.ones(nn), units='ft')
+
+        self.add_output('temp', val=np.ones(nn), units='degR')
+        self.add_output('pres', val=np.ones(nn), units='psi')
+        self.add_output('rho', val=np.ones(nn), units='slug/ft**3')
+        self.add_output('viscosity', val=np.ones(nn), units='lbf*s/ft**2')
+        self.add_output('drhos_dh', val=np.ones(nn), units='slug/ft**4')
+        self.add_output('sos', val=np.ones(nn), units='ft/s')
+
+        self._output_names = ['temp', 'pres', 'rho', 'viscosity', 'drhos_dh', 'sos']
+
+        if output_dsos_dh:
+            self.add_output('dsos_dh', val=np.ones(nn), units='1/s')
+            self._output_names.append('dsos_dh')
+
+        arange = np.arange(nn)
+        self.declare_partials(self._output_names, 'h', rows=arange, cols=arange)
+
+    def compute(self, inputs, outputs):
+        values = standard_atmosphere(inputs['h'], self.options['delta_T'], self.options['h_def'])
+
+        for name in self._output_names:
+            outputs[name] = values[name]
+
+    def compute_partials(self, inputs, partials):
+        _, derivatives = standard_atmosphere(
+            inputs['h'], self.options['delta_T'], self.options['h_def'], partials=True
+        )
+
+        for name in self._output_names:
+            partials[name, 'h'] = derivatives[name]
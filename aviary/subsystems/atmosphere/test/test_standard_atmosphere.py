@@ -0,0 +1,114 @@
+import unittest
+
+import numpy as np
+import openmdao.api as om
+from dymos.models.atmosphere.atmos_1976 import USatm1976Comp
+from openmdao.utils.assert_utils import assert_check_partials, assert_near_equal
+
+from aviary.subsystems.atmosphere.atmosphere import Atmosphere
+from aviary.subsystems.atmosphere.standard_atmosphere import StandardAtmosphere
+from aviary.variable_info.variables import Dynamic, Mission
+
+OUTPUTS = ['temp', 'pres', 'rho', 'viscosity', 'drhos_dh', 'sos', 'dsos_dh']
+
+
+def _atmosphere_problem(comp, altitude):
+    prob = om.Problem()
+    prob.model.add_subsystem('atmos', comp, promotes=['*'])
+    prob.setup(force_alloc_complex=True)
+    prob.set_val('h', altitude, units='ft')
+    prob.run_model()
+
+    return prob
+
+
+class StandardAtmosphereTest(unittest.TestCase):
+    def setUp(self):
+        # includes points below sea level and above the top of the tables
+        self.altitude = np.linspace(-1000.0, 300_000.0, 41)
+
+    def test_standard_day(self):
+        for h_def in ('geodetic', 'geopotential'):
+            with self.subTest(h_def=h_def):
+                kwargs = dict(num_nodes=41, h_def=h_def, output_dsos_dh=True)
+                expected = _atmosphere_problem(USatm1976Comp(**kwargs), self.altitude)
+                actual = _atmosphere_problem(StandardAtmosphere(**kwargs), self.altitude)
+
+                for name in OUTPUTS:
+                    assert_near_equal(actual.get_val(name), expected.get_val(name), 1e-15)
+
+                expected_totals = expected.compute_totals(OUTPUTS, ['h'])
+                actual_totals = actual.compute_totals(OUTPUTS, ['h'])
+
+                for key, val in expected_totals.items():
+                    # dymos multiplies the partials of the derivative outputs by the square
+                    # of dz/dh; see test_geodetic_partials
+                    if h_def == 'geodetic' and key[0] in ('drhos_dh', 'dsos_dh'):
+                        continue
+                    assert_near_equal(actual_totals[key], val, 1e-15)
+
+    def test_hot_day(self):
+        altitude = np.linspace(0.0, 45_000.0, 10)
+        standard = _atmosphere_problem(StandardAtmosphere(num_nodes=10), altitude)
+        hot = _atmosphere_problem(StandardAtmosphere(num_nodes=10, delta_T=27.0), altitude)
+
+        temp = standard.get_val('temp')
+        assert_near_equal(hot.get_val('temp'), temp + 27.0, 1e-15)
+        assert_near_equal(hot.get_val('pres'), standard.get_val('pres'), 1e-15)
+        assert_near_equal(hot.get_val('rho'), standard.get_val('rho') * temp / (temp + 27.0))
+        assert_near_equal(hot.get_val('sos'), np.sqrt(1.4 * 1716.49 * (temp + 27.0)), 1e-12)
+
+        # viscosity increases with temperature
+        self.assertTrue(np.all(hot.get_val('viscosity') > standard.get_val('viscosity')))
+
+        # as in dymos, the partials of the derivative outputs come from separate tables of
+        # derivatives, so they don't match complex step exactly
+        partial_data = hot.check_partials(out_stream=None, method='cs')
+        for key in [('drhos_dh', 'h'), ('dsos_dh', 'h')]:
+            partial_data['atmos'].pop(key, None)
+        assert_check_partials(partial_data, atol=1e-10, rtol=1e-10)
+
+    def test_geodetic_partials(self):
+        altitude = np.linspace(0.0, 45_000.0, 10)
+        kwargs = dict(num_nodes=10, output_dsos_dh=True, delta_T=27.0)
+        geodetic = _atmosphere_problem(StandardAtmosphere(h_def='geodetic', **kwargs), altitude)
+
+        partial_data = geodetic.check_partials(out_stream=None, method='cs')
+        for key in [('drhos_dh', 'h'), ('dsos_dh', 'h')]:
+            partial_data['atmos'].pop(key, None)
+        assert_check_partials(partial_data, atol=1e-10, rtol=1e-10)
+
+        # the derivative outputs are with respect to geopotential altitude z, so their
+        # partials with respect to geodetic altitude h only pick up one factor of dz/dh
+        r0 = 6_356_766 / 0.3048
+        z = altitude / (r0 + altitude) * r0
+        dz_dh = (r0 / (r0 + altitude)) ** 2
+        geopotential = _atmosphere_problem(StandardAtmosphere(**kwargs), z)
+
+        of = ['drhos_dh', 'dsos_dh']
+        totals = geodetic.compute_totals(of, ['h'])
+        geopotential_totals = geopotential.compute_totals(of, ['h'])
+
+        for name in of:
+            assert_near_equal(
+                np.diag(totals[name, 'h']),
+                np.diag(geopotential_totals[name, 'h']) * dz_dh,
+                1e-12,
+            )
+
+    def test_atmosphere_group(self):
+        prob = om.Problem()
+        prob.model.add_subsystem('atmos', Atmosphere(num_nodes=2), promotes=['*'])
+        prob.model_options['*'] = {Mission.Summary.TEMPERATURE_OFFSET: (-10.0, 'degK')}
+        prob.setup()
+        prob.set_val(Dynamic.Mission.ALTITUDE, [0.0, 10_000.0], units='ft')
+        prob.set_val(Dynamic.Mission.VELOCITY, [100.0, 200.0], units='kn')
+        prob.run_model()
+
+        assert_near_equal(
+            prob.get_val(Dynamic.Atmosphere.TEMPERATURE, units='degR')[0], 518.67 - 18.0, 1e-6
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -5,7 +5,7 @@ import openmdao.api as om
 from openmdao.utils.assert_utils import assert_near_equal
 
 from aviary.interface.methods_for_level2 import AviaryGroup
-from aviary.subsystems.aerodynamics.gasp_based.gaspaero import AeroGeom
+from aviary.subsystems.aerodynamics.gasp_based.gaspaero import AeroGeomPremission
 from aviary.subsystems.premission import CorePreMission
 from aviary.subsystems.propulsion.utils import build_engine_deck
 from aviary.utils.preprocessors import preprocess_propulsion
@@ -117,7 +117,7 @@ class GASPOverrideTestCase(unittest.TestCase):
         Also checks non-overriden (wing) and default (strut).
         """
         prob = self.prob
-        prob.model.add_subsystem('geom', AeroGeom(), promotes=['*'])
+        prob.model.add_subsystem('geom', AeroGeomPremission(), promotes=['*'])
         self.aviary_inputs.set_val(Aircraft.HorizontalTail.FORM_FACTOR, val=1.5)
 
         setup_model_options(prob, self.aviary_inputs)
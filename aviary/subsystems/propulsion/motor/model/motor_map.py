@@ -1,5 +1,6 @@
 import numpy as np
 import openmdao.api as om
+from openmdao.components.interp_util.interp import InterpND
 
 from aviary.variable_info.variables import Aircraft, Dynamic
 
@@ -26,9 +27,118 @@ motor_map = np.array([
     [.795,    .796,    .877,   .907,  .923, .933,   .939,   .944,  .948,   .950,   .952,  .953,   .954]  # 1.000
 ]).T
 # fmt: on
+# the map is shared by every MotorMap in the process and must never be modified
+motor_map.flags.writeable = False
+
+# Map breakpoints
+# fmt: off
+rpm_vals = np.array(
+    [
+        0, .083333, .16667, .25, .33333, .41667, .5, .58333, .66667, .75, .83333, .91667, 1.
+    ]
+) * 6000
+torque_vals = np.array(
+    [
+        0.0, 0.040, 0.104, 0.168, 0.232, 0.296, 0.360, 0.424, 0.488,
+        0.552, 0.616, 0.680,  0.744, 0.808, 0.872, 0.936, 1.000
+    ]
+) * 1800
+# fmt: on
+rpm_vals.flags.writeable = False
+torque_vals.flags.writeable = False
+
+# max unscaled torque of the motor map, N*m
+MAX_TORQUE = torque_vals[-1]
+
+# motor efficiency interpolants, keyed by interpolation method
+_efficiency_interps = {}
+
+
+def get_motor_efficiency_interp(method='akima'):
+    """
+    Return the motor efficiency interpolant, which is built the first time it is requested
+    and then shared by every motor model in the process.
+
+    Parameters
+    ----------
+    method : str
+        Interpolation method through the motor map, 'akima' (a smooth, C1 spline) or
+        'slinear' (piecewise linear).
+
+    Returns
+    -------
+    InterpND
+        Interpolant of motor efficiency wrt RPM and unscaled torque.
+    """
+    if method not in _efficiency_interps:
+        _efficiency_interps[method] = InterpND(
+            method=method,
+            points=(rpm_vals, torque_vals),
+            values=motor_map,
+            extrapolate=True,
+        )
+
+    return _efficiency_interps[method]
 
 
-class MotorMap(om.Group):
+def motor_efficiency(rpm, torque_unscaled, method='akima'):
+    """
+    Evaluate motor efficiency and its partials for vectors of RPM and unscaled torque.
+
+    Parameters
+    ----------
+    rpm : ndarray
+        Motor RPM (rpm).
+    torque_unscaled : ndarray
+        Motor torque before scaling by the engine scale factor (N*m).
+    method : str
+        Interpolation method through the motor map, 'akima' or 'slinear'.
+
+    Returns
+    -------
+    efficiency : ndarray
+        Motor efficiency (unitless).
+    d_efficiency : ndarray
+        Partials of efficiency, shape (n, 2). Column 0 is wrt RPM, column 1 is wrt unscaled
+        torque.
+    """
+    x = np.stack(np.broadcast_arrays(rpm, torque_unscaled), axis=-1)
+    return get_motor_efficiency_interp(method).interpolate(x, compute_derivative=True)
+
+
+def torque_from_shaft_power(shaft_power, rpm, scale_factor=1.0):
+    """
+    Inverse motor map: the unscaled torque and throttle needed to produce a required shaft
+    power at a given RPM.
+
+    Because shaft power = torque * angular speed, the inverse lookup is exact and does not
+    require iteration, so a motor that must deliver a required shaft power needs no solver
+    balancing its throttle.
+
+    Parameters
+    ----------
+    shaft_power : ndarray
+        Required shaft power (kW).
+    rpm : ndarray
+        Motor RPM (rpm).
+    scale_factor : float
+        Motor scale factor (unitless).
+
+    Returns
+    -------
+    torque_unscaled : ndarray
+        Unscaled torque on the motor map (N*m).
+    throttle : ndarray
+        Fraction of max torque (unitless).
+    """
+    # rpm -> rad/s, kW -> W. Guard against zero RPM, where any torque gives zero power
+    omega = np.maximum(rpm * np.pi / 30.0, 1.0e-10)
+    torque_unscaled = shaft_power * 1000.0 / (omega * scale_factor)
+
+    return torque_unscaled, torque_unscaled / MAX_TORQUE
+
+
+class MotorMap(om.ExplicitComponent):
     """
     This function takes in 0-1 values for electric motor throttle,
     scales those values into 0 to max_torque on the motor map
@@ -41,6 +151,12 @@ class MotorMap(om.Group):
     https://ntrs.nasa.gov/api/citations/20230016987/downloads/TTBW_SciTech_2024_Final_12_5_2023.pdf
     The map is shown in Figure 4.
 
+    Efficiency is interpolated through the map with a smooth Akima spline that is shared by
+    all MotorMap components (see get_motor_efficiency_interp()), with exact partials. The
+    spline reproduces the map points; between them it differs from the piecewise linear
+    surface of the map by up to 1.4% (below 500 rpm), and 0.03% typically. Set the
+    interpolation_method option to 'slinear' for the piecewise linear surface.
+
     Inputs
     ----------
     Dynamic.Vehicle.Propulsion.THROTTLE : float (unitless) (0 to 1)
@@ -57,83 +173,190 @@ class MotorMap(om.Group):
 
     def initialize(self):
         self.options.declare('num_nodes', types=int)
+        self.options.declare(
+            'interpolation_method',
+            default='akima',
+            values=('akima', 'slinear'),
+            desc='interpolation method of the efficiency through the motor map',
+        )
 
     def setup(self):
         n = self.options['num_nodes']
 
-        # Training data
-        # fmt: off
-        rpm_vals = np.array(
-            [
-                0, .083333, .16667, .25, .33333, .41667, .5, .58333, .66667, .75, .83333, .91667, 1.
-            ]
-        ) * 6000
-        torque_vals = np.array(
-            [
-                0.0, 0.040, 0.104, 0.168, 0.232, 0.296, 0.360, 0.424, 0.488,
-                0.552, 0.616, 0.680,  0.744, 0.808, 0.872, 0.936, 1.000
-            ]
-        ) * 1800
-        # fmt: on
-        # Create a structured metamodel to compute motor efficiency from rpm
-        motor = om.MetaModelStructuredComp(method='slinear', vec_size=n, extrapolate=True)
-        motor.add_input(
-            Dynamic.Vehicle.Propulsion.RPM,
-            val=np.ones(n),
-            training_data=rpm_vals,
-            units='rpm',
-        )
-        motor.add_input(
-            'torque_unscaled',
-            val=np.ones(n),  # unscaled torque
-            training_data=torque_vals,
-            units='N*m',
+        self.add_input(Dynamic.Vehicle.Propulsion.THROTTLE, val=np.ones(n), units='unitless')
+        self.add_input(Dynamic.Vehicle.Propulsion.RPM, val=np.ones(n), units='rpm')
+        self.add_input(Aircraft.Engine.SCALE_FACTOR, val=1.0, units='unitless')
+
+        self.add_output(Dynamic.Vehicle.Propulsion.TORQUE, val=np.ones(n), units='N*m')
+        self.add_output('motor_efficiency', val=np.ones(n), units='unitless')
+
+    def setup_partials(self):
+        arange = np.arange(self.options['num_nodes'])
+
+        self.declare_partials(
+            Dynamic.Vehicle.Propulsion.TORQUE,
+            Dynamic.Vehicle.Propulsion.THROTTLE,
+            rows=arange,
+            cols=arange,
         )
-        motor.add_output(
+        self.declare_partials(Dynamic.Vehicle.Propulsion.TORQUE, Aircraft.Engine.SCALE_FACTOR)
+        self.declare_partials(
             'motor_efficiency',
-            val=np.ones(n),
-            training_data=motor_map,
-            units='unitless',
+            [Dynamic.Vehicle.Propulsion.THROTTLE, Dynamic.Vehicle.Propulsion.RPM],
+            rows=arange,
+            cols=arange,
         )
 
-        self.add_subsystem(
-            'throttle_to_torque',
-            om.ExecComp(
-                'torque_unscaled = torque_max * throttle',
-                torque_unscaled={'val': np.ones(n), 'units': 'N*m'},
-                torque_max={'val': torque_vals[-1], 'units': 'N*m'},
-                throttle={'val': np.ones(n), 'units': 'unitless'},
-                has_diag_partials=True,
-            ),
-            promotes=[('throttle', Dynamic.Vehicle.Propulsion.THROTTLE)],
-        )
+    def compute(self, inputs, outputs):
+        throttle = inputs[Dynamic.Vehicle.Propulsion.THROTTLE]
+        rpm = inputs[Dynamic.Vehicle.Propulsion.RPM]
+        scale_factor = inputs[Aircraft.Engine.SCALE_FACTOR]
 
-        self.add_subsystem(
-            name='motor_efficiency',
-            subsys=motor,
-            promotes_inputs=[Dynamic.Vehicle.Propulsion.RPM],
-            promotes_outputs=['motor_efficiency'],
-        )
+        torque_unscaled = MAX_TORQUE * throttle
+        efficiency, _ = motor_efficiency(rpm, torque_unscaled, self.options['interpolation_method'])
 
         # Now that we know the efficiency, scale up the torque correctly for the engine
         #   size selected
         # Note: This allows the optimizer to optimize the motor size if desired
-        self.add_subsystem(
-            'scale_motor_torque',
-            om.ExecComp(
-                'torque = torque_unscaled * scale_factor',
-                torque={'val': np.ones(n), 'units': 'N*m'},
-                torque_unscaled={'val': np.ones(n), 'units': 'N*m'},
-                scale_factor={'val': 1.0, 'units': 'unitless'},
-                has_diag_partials=True,
-            ),
-            promotes=[
-                ('torque', Dynamic.Vehicle.Propulsion.TORQUE),
-                ('scale_factor', Aircraft.Engine.SCALE_FACTOR),
+        outputs[Dynamic.Vehicle.Propulsion.TORQUE] = torque_unscaled * scale_factor
+        outputs['motor_efficiency'] = efficiency
+
+    def compute_partials(self, inputs, J):
+        throttle = inputs[Dynamic.Vehicle.Propulsion.THROTTLE]
+        rpm = inputs[Dynamic.Vehicle.Propulsion.RPM]
+        scale_factor = inputs[Aircraft.Engine.SCALE_FACTOR]
+
+        torque_unscaled = MAX_TORQUE * throttle
+        _, d_efficiency = motor_efficiency(
+            rpm, torque_unscaled, self.options['interpolation_method']
+        )
+
+        J[Dynamic.Vehicle.Propulsion.TORQUE, Dynamic.Vehicle.Propulsion.THROTTLE] = (
+            MAX_TORQUE * scale_factor
+        )
+        J[Dynamic.Vehicle.Propulsion.TORQUE, Aircraft.Engine.SCALE_FACTOR] = torque_unscaled
+        J['motor_efficiency', Dynamic.Vehicle.Propulsion.RPM] = d_efficiency[:, 0]
+        J['motor_efficiency', Dynamic.Vehicle.Propulsion.THROTTLE] = d_efficiency[:, 1] * MAX_TORQUE
+
+
+class MotorMapInverse(om.ExplicitComponent):
+    """
+    Inverse of MotorMap: computes the throttle, torque, motor efficiency and electric power
+    needed to deliver a required shaft power at a given RPM, without a solver.
+
+    Inputs
+    ----------
+    Dynamic.Vehicle.Propulsion.SHAFT_POWER : float (kW) (positive)
+        Required shaft power
+    Aircraft.Engine.SCALE_FACTOR : float (unitless) (positive)
+    Aircraft.Motor.RPM : float (rpm) (0 to 6000)
+
+    Outputs
+    ----------
+    Dynamic.Vehicle.Propulsion.THROTTLE : float (unitless)
+    Dynamic.Vehicle.Propulsion.TORQUE : float (positive)
+    Dynamic.Mission.Motor.EFFICIENCY : float (positive)
+    Dynamic.Vehicle.Propulsion.ELECTRIC_POWER_IN : float (positive)
+    """
+
+    def initialize(self):
+        self.options.declare('num_nodes', types=int)
+        self.options.declare(
+            'interpolation_method',
+            default='akima',
+            values=('akima', 'slinear'),
+            desc='interpolation method of the efficiency through the motor map',
+        )
+
+    def setup(self):
+        n = self.options['num_nodes']
+
+        self.add_input(Dynamic.Vehicle.Propulsion.SHAFT_POWER, val=np.ones(n), units='kW')
+        self.add_input(Dynamic.Vehicle.Propulsion.RPM, val=np.ones(n), units='rpm')
+        self.add_input(Aircraft.Engine.SCALE_FACTOR, val=1.0, units='unitless')
+
+        self.add_output(Dynamic.Vehicle.Propulsion.THROTTLE, val=np.ones(n), units='unitless')
+        self.add_output(Dynamic.Vehicle.Propulsion.TORQUE, val=np.ones(n), units='N*m')
+        self.add_output('motor_efficiency', val=np.ones(n), units='unitless')
+        self.add_output(Dynamic.Vehicle.Propulsion.ELECTRIC_POWER_IN, val=np.ones(n), units='kW')
+
+    def setup_partials(self):
+        arange = np.arange(self.options['num_nodes'])
+
+        self.declare_partials(
+            '*',
+            [Dynamic.Vehicle.Propulsion.SHAFT_POWER, Dynamic.Vehicle.Propulsion.RPM],
+            rows=arange,
+            cols=arange,
+        )
+        self.declare_partials(
+            [
+                Dynamic.Vehicle.Propulsion.THROTTLE,
+                'motor_efficiency',
+                Dynamic.Vehicle.Propulsion.ELECTRIC_POWER_IN,
             ],
+            Aircraft.Engine.SCALE_FACTOR,
+        )
+        # torque = shaft_power / omega, independent of motor scale
+        self.declare_partials(
+            Dynamic.Vehicle.Propulsion.TORQUE, Aircraft.Engine.SCALE_FACTOR, dependent=False
         )
 
-        self.connect(
-            'throttle_to_torque.torque_unscaled',
-            ['motor_efficiency.torque_unscaled', 'scale_motor_torque.torque_unscaled'],
+    def compute(self, inputs, outputs):
+        shaft_power = inputs[Dynamic.Vehicle.Propulsion.SHAFT_POWER]
+        rpm = inputs[Dynamic.Vehicle.Propulsion.RPM]
+        scale_factor = inputs[Aircraft.Engine.SCALE_FACTOR]
+
+        torque_unscaled, throttle = torque_from_shaft_power(shaft_power, rpm, scale_factor)
+        efficiency, _ = motor_efficiency(rpm, torque_unscaled, self.options['interpolation_method'])
+
+        outputs[Dynamic.Vehicle.Propulsion.THROTTLE] = throttle
+        outputs[Dynamic.Vehicle.Propulsion.TORQUE] = torque_unscaled * scale_factor
+        outputs['motor_efficiency'] = efficiency
+        outputs[Dynamic.Vehicle.Propulsion.ELECTRIC_POWER_IN] = shaft_power / efficiency
+
+    def compute_partials(self, inputs, J):
+        shaft_power = inputs[Dynamic.Vehicle.Propulsion.SHAFT_POWER]
+        rpm = inputs[Dynamic.Vehicle.Propulsion.RPM]
+        scale_factor = inputs[Aircraft.Engine.SCALE_FACTOR]
+
+        torque_unscaled, throttle = torque_from_shaft_power(shaft_power, rpm, scale_factor)
+        efficiency, d_efficiency = motor_efficiency(
+            rpm, torque_unscaled, self.options['interpolation_method']
         )
+
+        omega_raw = rpm * np.pi / 30.0
+        omega = np.maximum(omega_raw, 1.0e-10)
+        domega_drpm = np.where(omega_raw > 1.0e-10, np.pi / 30.0, 0.0)
+
+        # partials of unscaled torque
+        dtu_dp = 1000.0 / (omega * scale_factor)
+        dtu_drpm = -torque_unscaled / omega * domega_drpm
+        dtu_dscale = -torque_unscaled / scale_factor
+
+        # partials of efficiency
+        deff_dp = d_efficiency[:, 1] * dtu_dp
+        deff_drpm = d_efficiency[:, 0] + d_efficiency[:, 1] * dtu_drpm
+        deff_dscale = d_efficiency[:, 1] * dtu_dscale
+
+        throttle_name = Dynamic.Vehicle.Propulsion.THROTTLE
+        torque_name = Dynamic.Vehicle.Propulsion.TORQUE
+        power_name = Dynamic.Vehicle.Propulsion.ELECTRIC_POWER_IN
+        shp_name = Dynamic.Vehicle.Propulsion.SHAFT_POWER
+        rpm_name = Dynamic.Vehicle.Propulsion.RPM
+        scale_name = Aircraft.Engine.SCALE_FACTOR
+
+        J[throttle_name, shp_name] = dtu_dp / MAX_TORQUE
+        J[throttle_name, rpm_name] = dtu_drpm / MAX_TORQUE
+        J[throttle_name, scale_name] = dtu_dscale / MAX_TORQUE
+
+        J[torque_name, shp_name] = dtu_dp * scale_factor
+        J[torque_name, rpm_name] = dtu_drpm * scale_factor
+
+        J['motor_efficiency', shp_name] = deff_dp
+        J['motor_efficiency', rpm_name] = deff_drpm
+        J['motor_efficiency', scale_name] = deff_dscale
+
+        J[power_name, shp_name] = 1.0 / efficiency - shaft_power / efficiency**2 * deff_dp
+        J[power_name, rpm_name] = -shaft_power / efficiency**2 * deff_drpm
+        J[power_name, scale_name] = -shaft_power / efficiency**2 * deff_dscale
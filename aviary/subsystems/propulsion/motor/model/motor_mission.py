@@ -1,13 +1,20 @@
 import numpy as np
 import openmdao.api as om
 
-from aviary.subsystems.propulsion.motor.model.motor_map import MotorMap
+from aviary.subsystems.propulsion.motor.model.motor_map import MotorMap, MotorMapInverse
 from aviary.utils.aviary_values import AviaryValues
 from aviary.variable_info.variables import Aircraft, Dynamic
 
 
 class MotorMission(om.Group):
-    """Calculates the mission performance (ODE) of a single electric motor."""
+    """
+    Calculates the mission performance (ODE) of a single electric motor.
+
+    By default the motor is throttle driven. With input_shaft_power, the motor must deliver
+    a required shaft power instead, and its throttle, torque, efficiency and electric power
+    come from the inverse motor map, so no solver has to balance the throttle against the
+    power requirement.
+    """
 
     def initialize(self):
         self.options.declare('num_nodes', types=int)
@@ -17,6 +24,13 @@ class MotorMission(om.Group):
             desc='collection of Aircraft/Mission specific options',
             default=None,
         )
+        self.options.declare(
+            'input_shaft_power',
+            types=bool,
+            default=False,
+            desc='If True, the required shaft power is an input and the throttle is an '
+            'output computed with the inverse motor map.',
+        )
         self.name = 'motor_mission'
 
     def setup(self):
@@ -27,6 +41,67 @@ class MotorMission(om.Group):
 
         self.add_subsystem('ivc', ivc, promotes=['*'])
 
+        if self.options['input_shaft_power']:
+            self.add_subsystem(
+                'motor_group',
+                MotorMapInverse(num_nodes=nn),
+                promotes_inputs=['*'],
+                promotes_outputs=['*'],
+            )
+        else:
+            self._add_throttle_driven_motor(nn)
+
+        # Determine the maximum power available at this flight condition
+        # this is used for excess power constraints
+        motor_group_max = om.Group()
+
+        # these two groups are the same as those above
+        motor_group_max.add_subsystem(
+            'motor_map_max',
+            MotorMap(num_nodes=nn),
+            promotes_inputs=[
+                (Dynamic.Vehicle.Propulsion.THROTTLE, 'max_throttle'),
+                Aircraft.Engine.SCALE_FACTOR,
+                Dynamic.Vehicle.Propulsion.RPM,
+            ],
+            promotes_outputs=[
+                (
+                    Dynamic.Vehicle.Propulsion.TORQUE,
+                    Dynamic.Vehicle.Propulsion.TORQUE_MAX,
+                ),
+                'motor_efficiency',
+            ],
+        )
+
+        motor_group_max.add_subsystem(
+            'power_comp_max',
+            om.ExecComp(
+                'max_power = max_torque * pi * RPM / 30',
+                max_power={'val': np.ones(nn), 'units': 'kW'},
+                max_torque={'val': np.ones(nn), 'units': 'kN*m'},
+                RPM={'val': np.ones(nn), 'units': 'rpm'},
+                has_diag_partials=True,
+            ),
+            promotes_inputs=[
+                ('max_torque', Dynamic.Vehicle.Propulsion.TORQUE_MAX),
+                ('RPM', Dynamic.Vehicle.Propulsion.RPM),
+            ],
+            promotes_outputs=[('max_power', Dynamic.Vehicle.Propulsion.SHAFT_POWER_MAX)],
+        )
+
+        self.add_subsystem(
+            'motor_group_max',
+            motor_group_max,
+            promotes_inputs=['*', 'max_throttle'],
+            promotes_outputs=[
+                Dynamic.Vehicle.Propulsion.SHAFT_POWER_MAX,
+                Dynamic.Vehicle.Propulsion.TORQUE_MAX,
+            ],
+        )
+
+        self.set_input_defaults(Dynamic.Vehicle.Propulsion.RPM, val=np.ones(nn), units='rpm')
+
+    def _add_throttle_driven_motor(self, nn):
         motor_group = om.Group()
 
         motor_group.add_subsystem(
@@ -80,53 +155,3 @@ class MotorMission(om.Group):
         self.add_subsystem(
             'motor_group', motor_group, promotes_inputs=['*'], promotes_outputs=['*']
         )
-
-        # Determine the maximum power available at this flight condition
-        # this is used for excess power constraints
-        motor_group_max = om.Group()
-
-        # these two groups are the same as those above
-        motor_group_max.add_subsystem(
-            'motor_map_max',
-            MotorMap(num_nodes=nn),
-            promotes_inputs=[
-                (Dynamic.Vehicle.Propulsion.THROTTLE, 'max_throttle'),
-                Aircraft.Engine.SCALE_FACTOR,
-                Dynamic.Vehicle.Propulsion.RPM,
-            ],
-            promotes_outputs=[
-                (
-                    Dynamic.Vehicle.Propulsion.TORQUE,
-                    Dynamic.Vehicle.Propulsion.TORQUE_MAX,
-                ),
-                'motor_efficiency',
-            ],
-        )
-
-        motor_group_max.add_subsystem(
-            'power_comp_max',
-            om.ExecComp(
-                'max_power = max_torque * pi * RPM / 30',
-                max_power={'val': np.ones(nn), 'units': 'kW'},
-                max_torque={'val': np.ones(nn), 'units': 'kN*m'},
-                RPM={'val': np.ones(nn), 'units': 'rpm'},
-                has_diag_partials=True,
-            ),
-            promotes_inputs=[
-                ('max_torque', Dynamic.Vehicle.Propulsion.TORQUE_MAX),
-                ('RPM', Dynamic.Vehicle.Propulsion.RPM),
-            ],
-            promotes_outputs=[('max_power', Dynamic.Vehicle.Propulsion.SHAFT_POWER_MAX)],
-        )
-
-        self.add_subsystem(
-            'motor_group_max',
-            motor_group_max,
-            promotes_inputs=['*', 'max_throttle'],
-            promotes_outputs=[
-                Dynamic.Vehicle.Propulsion.SHAFT_POWER_MAX,
-                Dynamic.Vehicle.Propulsion.TORQUE_MAX,
-            ],
-        )
-
-        self.set_input_defaults(Dynamic.Vehicle.Propulsion.RPM, val=np.ones(nn), units='rpm')
@@ -21,10 +21,13 @@ class MotorBuilder(SubsystemBuilderBase):
     ----------
     name : str ('motor')
         object label
+    input_shaft_power : bool (False)
+        If True, the motor delivers a required shaft power, and its throttle comes from
+        the inverse motor map (see MotorMission).
 
     Methods
     -------
-    __init__(self, name='motor'):
+    __init__(self, name='motor', input_shaft_power=False):
         Initializes the MotorBuilder object with a given name.
     get_states(self) -> dict:
         Returns a dictionary of the subsystem's states, where the keys are the names of
@@ -64,15 +67,20 @@ class MotorBuilder(SubsystemBuilderBase):
         No preprocessing needed for the motor subsystem.
     """
 
-    def __init__(self, name='motor'):  # , include_constraints=True):
+    def __init__(self, name='motor', input_shaft_power=False):  # , include_constraints=True):
         # self.include_constraints = include_constraints
+        self.input_shaft_power = input_shaft_power
         super().__init__(name)
 
     def build_pre_mission(self, aviary_inputs):
         return MotorPreMission(aviary_inputs=aviary_inputs)  # , simple_mass=True)
 
     def build_mission(self, num_nodes, aviary_inputs):
-        return MotorMission(num_nodes=num_nodes, aviary_inputs=aviary_inputs)
+        return MotorMission(
+            num_nodes=num_nodes,
+            aviary_inputs=aviary_inputs,
+            input_shaft_power=self.input_shaft_power,
+        )
 
     # def get_constraints(self):
     #     if self.include_constraints:
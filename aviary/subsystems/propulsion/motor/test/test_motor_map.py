@@ -5,7 +5,7 @@ import openmdao.api as om
 from openmdao.utils.assert_utils import assert_check_partials, assert_near_equal
 from openmdao.utils.testing_utils import use_tempdirs
 
-from aviary.subsystems.propulsion.motor.model.motor_map import MotorMap
+from aviary.subsystems.propulsion.motor.model.motor_map import MotorMap, MotorMapInverse
 from aviary.variable_info.variables import Aircraft, Dynamic
 
 
@@ -30,13 +30,87 @@ class TestGearbox(unittest.TestCase):
         efficiency = prob.get_val('motor_efficiency')
 
         torque_expected = np.array([0.0, 900.0, 1800.0]) * 1.12
-        eff_expected = [0.871, 0.958625, 0.954]
+        # map points are matched exactly, the midpoint comes from the smooth spline
+        eff_expected = [0.871, 0.9586773681640625, 0.954]
         assert_near_equal(torque, torque_expected, tolerance=1e-9)
         assert_near_equal(efficiency, eff_expected, tolerance=1e-9)
 
         partial_data = prob.check_partials(out_stream=None, method='cs')
         assert_check_partials(partial_data, atol=1e-12, rtol=1e-12)
 
+    @use_tempdirs
+    def test_motor_map_slinear(self):
+        nn = 3
+
+        prob = om.Problem()
+
+        prob.model.add_subsystem(
+            'motor_map', MotorMap(num_nodes=nn, interpolation_method='slinear'), promotes=['*']
+        )
+
+        prob.setup(force_alloc_complex=True)
+
+        prob.set_val(Dynamic.Vehicle.Propulsion.THROTTLE, np.linspace(0, 1, nn))
+        prob.set_val(Dynamic.Vehicle.Propulsion.RPM, np.linspace(0, 6000, nn))
+        prob.set_val(Aircraft.Engine.SCALE_FACTOR, 1.12)
+
+        prob.run_model()
+
+        eff_expected = [0.871, 0.958625, 0.954]
+        assert_near_equal(prob.get_val('motor_efficiency'), eff_expected, tolerance=1e-9)
+
+        partial_data = prob.check_partials(out_stream=None, method='cs')
+        assert_check_partials(partial_data, atol=1e-12, rtol=1e-12)
+
+    @use_tempdirs
+    def test_motor_map_inverse(self):
+        nn = 3
+
+        prob = om.Problem()
+
+        prob.model.add_subsystem('motor_map', MotorMap(num_nodes=nn), promotes=['*'])
+        prob.model.add_subsystem('inverse', MotorMapInverse(num_nodes=nn))
+
+        prob.setup(force_alloc_complex=True)
+
+        throttle = np.array([0.1, 0.5, 0.9])
+        rpm = np.array([1000.0, 3500.0, 6000.0])
+        prob.set_val(Dynamic.Vehicle.Propulsion.THROTTLE, throttle)
+        prob.set_val(Dynamic.Vehicle.Propulsion.RPM, rpm)
+        prob.set_val(Aircraft.Engine.SCALE_FACTOR, 1.12)
+
+        prob.run_model()
+
+        torque = prob.get_val(Dynamic.Vehicle.Propulsion.TORQUE, units='N*m')
+        shaft_power = torque * rpm * np.pi / 30.0 / 1000.0
+
+        prob.set_val('inverse.' + Dynamic.Vehicle.Propulsion.SHAFT_POWER, shaft_power, units='kW')
+        prob.set_val('inverse.' + Dynamic.Vehicle.Propulsion.RPM, rpm)
+        prob.set_val('inverse.' + Aircraft.Engine.SCALE_FACTOR, 1.12)
+
+        prob.run_model()
+
+        # the inverse map must recover the throttle, torque and efficiency of the forward map
+        assert_near_equal(
+            prob.get_val('inverse.' + Dynamic.Vehicle.Propulsion.THROTTLE), throttle, 1e-12
+        )
+        assert_near_equal(
+            prob.get_val('inverse.' + Dynamic.Vehicle.Propulsion.TORQUE, units='N*m'),
+            torque,
+            1e-12,
+        )
+        assert_near_equal(
+            prob.get_val('inverse.motor_efficiency'), prob.get_val('motor_efficiency'), 1e-12
+        )
+        assert_near_equal(
+            prob.get_val('inverse.' + Dynamic.Vehicle.Propulsion.ELECTRIC_POWER_IN, units='kW'),
+            shaft_power / prob.get_val('motor_efficiency'),
+            1e-12,
+        )
+
+        partial_data = prob.check_partials(out_stream=None, method='cs')
+        assert_check_partials(partial_data, atol=1e-10, rtol=1e-10)
+
 
 if __name__ == '__main__':
     unittest.main()
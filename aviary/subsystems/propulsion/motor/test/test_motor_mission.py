@@ -36,10 +36,10 @@ class TestMotorMission(unittest.TestCase):
 
         torque_expected = np.array([0.0, 900.0, 1800.0]) * 1.12
         max_torque_expected = [2016, 2016, 2016]
-        eff_expected = [0.871, 0.958625, 0.954]
+        eff_expected = [0.871, 0.9586773681640625, 0.954]
         shp_expected = [0.0, 316.67253948185123, 1266.690157927405]
         max_shp_expected = [0.0, 633.3450789637025, 1266.690157927405]
-        power = [0.0, 330.3403723894654, 1327.7674611398375]
+        power = [0.0, 330.3223274043721, 1327.7674611398375]
 
         assert_near_equal(torque, torque_expected, tolerance=1e-9)
         assert_near_equal(max_torque, max_torque_expected, tolerance=1e-9)
@@ -51,6 +51,49 @@ class TestMotorMission(unittest.TestCase):
         partial_data = prob.check_partials(out_stream=None, method='cs')
         assert_check_partials(partial_data, atol=1e-12, rtol=1e-12)
 
+    @use_tempdirs
+    def test_input_shaft_power(self):
+        nn = 3
+
+        prob = om.Problem()
+
+        prob.model.add_subsystem(
+            'motor', MotorMission(num_nodes=nn, input_shaft_power=True), promotes=['*']
+        )
+
+        prob.setup(force_alloc_complex=True)
+
+        prob.set_val(
+            Dynamic.Vehicle.Propulsion.SHAFT_POWER,
+            [0.0, 316.67253948185123, 1266.690157927405],
+            units='kW',
+        )
+        prob.set_val(Dynamic.Vehicle.Propulsion.RPM, [1000.0, 3000.0, 6000.0])
+        prob.set_val(Aircraft.Engine.SCALE_FACTOR, 1.12)
+
+        prob.run_model()
+
+        # these are the shaft powers of test_motor_map, at throttles of 0, 0.5 and 1. The
+        # throttle delivering them comes from the inverse map, without a solver
+        throttle_expected = [0.0, 0.5, 1.0]
+        torque_expected = np.array([0.0, 900.0, 1800.0]) * 1.12
+
+        assert_near_equal(
+            prob.get_val(Dynamic.Vehicle.Propulsion.THROTTLE), throttle_expected, 1e-9
+        )
+        assert_near_equal(
+            prob.get_val(Dynamic.Vehicle.Propulsion.TORQUE, 'N*m'), torque_expected, 1e-9
+        )
+        assert_near_equal(
+            prob.get_val(Dynamic.Vehicle.Propulsion.ELECTRIC_POWER_IN, 'kW'),
+            prob.get_val(Dynamic.Vehicle.Propulsion.SHAFT_POWER, 'kW')
+            / prob.get_val('motor_efficiency'),
+            1e-12,
+        )
+
+        partial_data = prob.check_partials(out_stream=None, method='cs')
+        assert_check_partials(partial_data, atol=1e-10, rtol=1e-10)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -636,7 +636,31 @@ class HamiltonStandard(om.ExplicitComponent):
         # propeller tip compressibility loss factor
         self.add_output('comp_tip_loss_factor', val=np.zeros(nn), units='unitless')
 
-        self.declare_partials('*', '*', method='fd', form='forward')
+    def setup_partials(self):
+        arange = np.arange(self.options['num_nodes'])
+
+        # The table lookups are differentiated with complex step. Each node is computed
+        # independently, so partials wrt the vectorized inputs are diagonal.
+        self.declare_partials(
+            ['thrust_coefficient', 'comp_tip_loss_factor'],
+            [
+                'power_coefficient',
+                'advance_ratio',
+                Dynamic.Atmosphere.MACH,
+                'tip_mach',
+            ],
+            rows=arange,
+            cols=arange,
+            method='cs',
+        )
+        self.declare_partials(
+            ['thrust_coefficient', 'comp_tip_loss_factor'],
+            [
+                Aircraft.Engine.Propeller.ACTIVITY_FACTOR,
+                Aircraft.Engine.Propeller.INTEGRATED_LIFT_COEFFICIENT,
+            ],
+            method='cs',
+        )
 
     def compute(self, inputs, outputs):
         verbosity = self.options[Settings.VERBOSITY]
@@ -655,22 +679,25 @@ class HamiltonStandard(om.ExplicitComponent):
         else:
             num_blades = int(num_blades[0])
 
+        # work arrays are complex when the partials are computed with complex step
+        dtype = inputs['power_coefficient'].dtype
+
         for i_node in range(self.options['num_nodes']):
             ichck = 0
             run_flag = 0
             xft = 1.0
-            AF_adj_CP = np.zeros(7)  # AFCP: an AF adjustment of CP to be assigned
-            AF_adj_CT = np.zeros(7)  # AFCT: an AF adjustment of CT to be assigned
-            CTT = np.zeros(7)
-            BLL = np.zeros(7)
-            BLLL = np.zeros(7)
-            PXCLI = np.zeros(7)
-            XFFT = np.zeros(6)
-            CTG = np.zeros(11)
-            CTG1 = np.zeros(11)
-            TXCLI = np.zeros(6)
-            CTTT = np.zeros(4)
-            XXXFT = np.zeros(4)
+            AF_adj_CP = np.zeros(7, dtype=dtype)  # AFCP: an AF adjustment of CP to be assigned
+            AF_adj_CT = np.zeros(7, dtype=dtype)  # AFCT: an AF adjustment of CT to be assigned
+            CTT = np.zeros(7, dtype=dtype)
+            BLL = np.zeros(7, dtype=dtype)
+            BLLL = np.zeros(7, dtype=dtype)
+            PXCLI = np.zeros(7, dtype=dtype)
+            XFFT = np.zeros(6, dtype=dtype)
+            CTG = np.zeros(11, dtype=dtype)
+            CTG1 = np.zeros(11, dtype=dtype)
+            TXCLI = np.zeros(6, dtype=dtype)
+            CTTT = np.zeros(4, dtype=dtype)
+            XXXFT = np.zeros(4, dtype=dtype)
 
             for k in range(2):
                 AF_adj_CP[k], run_flag = _unint(Act_Factor_arr, AFCPC[k], act_factor)
@@ -1,3 +1,6 @@
+import numpy as np
+
+from aviary.subsystems.propulsion.propeller.propeller_map import PropellerMap
 from aviary.subsystems.propulsion.propeller.propeller_performance import PropellerPerformance
 from aviary.subsystems.subsystem_builder_base import SubsystemBuilderBase
 from aviary.variable_info.variables import Aircraft, Dynamic, Mission
@@ -17,13 +20,39 @@ class PropellerBuilder(SubsystemBuilderBase):
         """Initializes the PropellerBuilder object with a given name."""
         super().__init__(name)
 
+        # propeller maps already read from file, keyed by data file. Every mission model
+        # built by this builder shares them instead of re-reading the data each phase
+        self._propeller_maps = {}
+
+    def _get_propeller_map(self, aviary_inputs):
+        """Return the PropellerMap for the data file in aviary_inputs, reading it only once."""
+        try:
+            data_file = aviary_inputs.get_val(Aircraft.Engine.Propeller.DATA_FILE)
+        except KeyError:
+            return None
+        if isinstance(data_file, (list, np.ndarray)):
+            data_file = data_file[0]
+        if data_file is None:
+            return None
+
+        if data_file not in self._propeller_maps:
+            prop_map = PropellerMap('prop', aviary_inputs)
+            prop_map.read_and_set_mach_type(data_file)
+            self._propeller_maps[data_file] = prop_map
+
+        return self._propeller_maps[data_file]
+
     def build_pre_mission(self, aviary_inputs):
         """Builds an OpenMDAO system for the pre-mission computations of the subsystem."""
         return
 
     def build_mission(self, num_nodes, aviary_inputs):
         """Builds an OpenMDAO system for the mission computations of the subsystem."""
-        return PropellerPerformance(num_nodes=num_nodes, aviary_options=aviary_inputs)
+        return PropellerPerformance(
+            num_nodes=num_nodes,
+            aviary_options=aviary_inputs,
+            propeller_map=self._get_propeller_map(aviary_inputs),
+        )
 
     def get_design_vars(self):
         """
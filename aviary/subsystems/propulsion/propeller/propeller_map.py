@@ -39,6 +39,7 @@ class PropellerMap(om.ExplicitComponent):
     data : NamedVaues (<empty>), optional
         propeller map data.
     mach_type: OutMachType (MACH or HELICAL_MACH)
+        Type of Mach number used by the map. None until read_and_set_mach_type() is called.
     """
 
     def __init__(self, name='propeller', options: AviaryValues = None, data: NamedValues = None):
@@ -50,6 +51,8 @@ class PropellerMap(om.ExplicitComponent):
         # Create dict for variables present in propeller data with associated units
         self.propeller_variables = {}
 
+        self.mach_type = None
+
         data_file = options.get_val(Aircraft.Engine.Propeller.DATA_FILE)
         self._read_data(data_file)
 
@@ -112,10 +115,17 @@ class PropellerMap(om.ExplicitComponent):
         if not m_type_define:
             warnings.warn("String 'mach_type' is not defined. Assume freestream Mach in the table.")
 
-        return OutMachType.get_element_by_value(m_type)
+        self.mach_type = OutMachType.get_element_by_value(m_type)
+
+        return self.mach_type
 
     def build_propeller_interpolator(self, num_nodes, options=None):
-        """Builds the OpenMDAO metamodel component for the propeller map."""
+        """
+        Builds the OpenMDAO metamodel component for the propeller map.
+
+        The training data arrays are shared (not copied) between every interpolator built
+        from the same PropellerMap, so a single map can serve any number of mission models.
+        """
         interp_method = options.get_val(Aircraft.Engine.INTERPOLATION_METHOD)
         # interpolator object for propeller data
         propeller = om.MetaModelSemiStructuredComp(
@@ -681,6 +681,14 @@ class PropellerPerformance(om.Group):
             desc='collection of Aircraft/Mission specific options',
         )
 
+        self.options.declare(
+            'propeller_map',
+            types=PropellerMap,
+            default=None,
+            allow_none=True,
+            desc='previously loaded propeller map to use instead of reading DATA_FILE again',
+        )
+
         add_aviary_option(self, Aircraft.Engine.Propeller.COMPUTE_INSTALLATION_LOSS)
         add_aviary_option(self, Aircraft.Engine.Propeller.DATA_FILE)
 
@@ -743,8 +751,12 @@ class PropellerPerformance(om.Group):
         )
 
         if prop_file_path is not None:
-            prop_model = PropellerMap('prop', aviary_options)
-            mach_type = prop_model.read_and_set_mach_type(prop_file_path)
+            prop_model = options['propeller_map']
+            if prop_model is None:
+                prop_model = PropellerMap('prop', aviary_options)
+            mach_type = prop_model.mach_type
+            if mach_type is None:
+                mach_type = prop_model.read_and_set_mach_type(prop_file_path)
             if mach_type == OutMachType.HELICAL_MACH:
                 self.add_subsystem(
                     name='selectedMach',
@@ -4,6 +4,7 @@ import numpy as np
 from openmdao.components.interp_util.interp_semi import InterpNDSemi
 from openmdao.utils.assert_utils import assert_near_equal
 
+from aviary.subsystems.propulsion.propeller.propeller_builder import PropellerBuilder
 from aviary.subsystems.propulsion.propeller.propeller_map import PropellerMap
 from aviary.subsystems.propulsion.utils import PropellerModelVariables as keys
 from aviary.variable_info.enums import OutMachType
@@ -80,6 +81,25 @@ class PropellerMapTest(unittest.TestCase):
         prop_model = PropellerMap('prop', aviary_options)
         out_mach_type = prop_model.read_and_set_mach_type(prop_file_path)
         self.assertEqual(out_mach_type, OutMachType.HELICAL_MACH)
+        self.assertEqual(prop_model.mach_type, OutMachType.HELICAL_MACH)
+
+    def test_builder_shares_map(self):
+        # Test that a propeller map is read once and shared by all mission models.
+        aviary_options = get_option_defaults()
+        prop_file_path = 'models/engines/propellers/general_aviation.prop'
+        aviary_options.set_val(
+            Aircraft.Engine.Propeller.DATA_FILE, val=prop_file_path, units='unitless'
+        )
+        aviary_options.set_val(
+            Aircraft.Engine.INTERPOLATION_METHOD, val='slinear', units='unitless'
+        )
+        builder = PropellerBuilder()
+        prop_1 = builder.build_mission(3, aviary_options)
+        prop_2 = builder.build_mission(5, aviary_options)
+
+        prop_map = prop_1.options['propeller_map']
+        self.assertIs(prop_map, prop_2.options['propeller_map'])
+        self.assertEqual(prop_map.mach_type, OutMachType.HELICAL_MACH)
 
 
 if __name__ == '__main__':
@@ -7,6 +7,31 @@ from aviary.utils.aviary_values import AviaryValues
 from aviary.variable_info.functions import add_aviary_option
 from aviary.variable_info.variables import Aircraft, Dynamic, Settings
 
+# engine outputs vectorized across engine models, with their units
+MUX_OUTPUTS = {
+    Dynamic.Vehicle.Propulsion.ELECTRIC_POWER_IN: 'kW',
+    Dynamic.Vehicle.Propulsion.FUEL_FLOW_RATE_NEGATIVE: 'lbm/h',
+    Dynamic.Vehicle.Propulsion.NOX_RATE: 'lbm/h',
+    Dynamic.Vehicle.Propulsion.SHAFT_POWER: 'hp',
+    Dynamic.Vehicle.Propulsion.SHAFT_POWER_MAX: 'hp',
+    Dynamic.Vehicle.Propulsion.TEMPERATURE_T4: 'degR',
+    Dynamic.Vehicle.Propulsion.THRUST: 'lbf',
+    Dynamic.Vehicle.Propulsion.THRUST_MAX: 'lbf',
+}
+
+# aircraft-total outputs of the vectorized engine outputs that are summed
+TOTAL_OUTPUTS = {
+    Dynamic.Vehicle.Propulsion.ELECTRIC_POWER_IN: (
+        Dynamic.Vehicle.Propulsion.ELECTRIC_POWER_IN_TOTAL
+    ),
+    Dynamic.Vehicle.Propulsion.FUEL_FLOW_RATE_NEGATIVE: (
+        Dynamic.Vehicle.Propulsion.FUEL_FLOW_RATE_NEGATIVE_TOTAL
+    ),
+    Dynamic.Vehicle.Propulsion.NOX_RATE: Dynamic.Vehicle.Propulsion.NOX_RATE_TOTAL,
+    Dynamic.Vehicle.Propulsion.THRUST: Dynamic.Vehicle.Propulsion.THRUST_TOTAL,
+    Dynamic.Vehicle.Propulsion.THRUST_MAX: Dynamic.Vehicle.Propulsion.THRUST_MAX_TOTAL,
+}
+
 
 class PropulsionMission(om.Group):
     """
@@ -42,51 +67,20 @@ class PropulsionMission(om.Group):
         num_engine_type = len(engine_models)
 
         if num_engine_type > 1:
-            # We need a component to add parameters to problem. Dymos can't find it when
-            # it is already sliced across several components.
-            # TODO is this problem fixable from dymos end (introspection includes parameters)?
-
-            # create set of params
+            # Parameters are vectorized across engine types: each engine model takes its own
+            # slice of the phase parameter through the promotion of its input, without a
+            # passthrough component in between.
             # TODO get_parameters() should have access to aviary options + phase info
             param_dict = {}
-            # save parameters for use in configure()
-            parameters = self.parameters = set()
             for engine in engine_models:
-                eng_params = engine.get_parameters()
-                param_dict.update(eng_params)
-
-            parameters.update(param_dict.keys())
-
-            # if params exist, create execcomp, fill with placeholder equations
-            if len(parameters) != 0:
-                comp = om.ExecComp(has_diag_partials=True)
-
-                for i, param in enumerate(parameters):
-                    # try to find units information
-                    try:
-                        units = param_dict[param]['units']
-                    except KeyError:
-                        units = 'unitless'
-
-                    attrs = {
-                        f'x_{i}': {
-                            'val': np.ones(num_engine_type),
-                            'units': units,
-                        },
-                        f'y_{i}': {
-                            'val': np.ones(num_engine_type),
-                            'units': units,
-                        },
-                    }
-                    comp.add_expr(
-                        f'y_{i}=x_{i}',
-                        **attrs,
-                    )
+                param_dict.update(engine.get_parameters())
 
-            self.add_subsystem(
-                'parameter_passthrough',
-                comp,
-            )
+            for param, meta in param_dict.items():
+                self.set_input_defaults(
+                    param,
+                    val=np.full(num_engine_type, meta.get('val', 1.0), dtype=float),
+                    units=meta.get('units', 'unitless'),
+                )
 
             for i, engine in enumerate(engine_models):
                 kwargs = {}
@@ -110,8 +104,9 @@ class PropulsionMission(om.Group):
                 for param in params:
                     self.promotes(
                         engine.name,
-                        inputs=[(param, param + '_passthrough')],
+                        inputs=[param],
                         src_indices=om.slicer[i],
+                        src_shape=num_engine_type,
                     )
 
                 # TODO if only some engine use hybrid throttle, source vector will have an
@@ -122,6 +117,15 @@ class PropulsionMission(om.Group):
                         inputs=[Dynamic.Vehicle.Propulsion.HYBRID_THROTTLE],
                         src_indices=om.slicer[:, i],
                     )
+
+            if param_dict:
+                # added after the engine models, as dymos takes the shape of a parameter from
+                # the last of its targets
+                self.add_subsystem(
+                    'propulsion_parameters',
+                    PropulsionParameters(parameters=param_dict, num_engine_types=num_engine_type),
+                    promotes_inputs=['*'],
+                )
         else:
             engine = engine_models[0]
             kwargs = {}
@@ -138,95 +142,21 @@ class PropulsionMission(om.Group):
             if engine.use_hybrid_throttle:
                 self.promotes(engine.name, inputs=[Dynamic.Vehicle.Propulsion.HYBRID_THROTTLE])
 
-        # TODO might be able to avoid hardcoding using propulsion Enums
-        # mux component to vectorize individual engine outputs into 2d arrays
-        perf_mux = om.MuxComp(vec_size=num_engine_type)
-        # add each engine data variable to mux component
-        perf_mux.add_var(Dynamic.Vehicle.Propulsion.THRUST, val=0, shape=(nn,), axis=1, units='lbf')
-        perf_mux.add_var(
-            Dynamic.Vehicle.Propulsion.THRUST_MAX,
-            val=0,
-            shape=(nn,),
-            axis=1,
-            units='lbf',
-        )
-        perf_mux.add_var(
-            Dynamic.Vehicle.Propulsion.FUEL_FLOW_RATE_NEGATIVE,
-            val=0,
-            shape=(nn,),
-            axis=1,
-            units='lbm/h',
-        )
-        perf_mux.add_var(
-            Dynamic.Vehicle.Propulsion.ELECTRIC_POWER_IN,
-            val=0,
-            shape=(nn,),
-            axis=1,
-            units='kW',
-        )
-        perf_mux.add_var(
-            Dynamic.Vehicle.Propulsion.NOX_RATE,
-            val=0,
-            shape=(nn,),
-            axis=1,
-            units='lb/h',
-        )
-        perf_mux.add_var(
-            Dynamic.Vehicle.Propulsion.TEMPERATURE_T4,
-            val=0,
-            shape=(nn,),
-            axis=1,
-            units='degR',
-        )
-        perf_mux.add_var(
-            Dynamic.Vehicle.Propulsion.SHAFT_POWER,
-            val=0,
-            shape=(nn,),
-            axis=1,
-            units='hp',
-        )
-        perf_mux.add_var(
-            Dynamic.Vehicle.Propulsion.SHAFT_POWER_MAX,
-            val=0,
-            shape=(nn,),
-            axis=1,
-            units='hp',
-        )
-        # perf_mux.add_var(
-        #     'exit_area_unscaled',
-        #     shape=(nn,),
-        #     axis=1,
-        #     units='ft**2')
-
-        self.add_subsystem('vectorize_performance', subsys=perf_mux, promotes_outputs=['*'])
-
+        # vectorize the outputs of the individual engines into 2d arrays, and sum them
         self.add_subsystem(
-            'propulsion_sum',
-            subsys=PropulsionSum(num_nodes=nn),
-            promotes_inputs=['*'],
-            promotes_outputs=['*'],
+            'propulsion_sum', subsys=PropulsionMuxSum(num_nodes=nn), promotes_outputs=['*']
         )
 
     def configure(self):
         # Special configure step needed to handle multiple, unique engine models.
         # Handle checking each EngineModel for compatible outputs with
-        # vectorize_performance component and connecting those outputs
+        # propulsion_sum component and connecting those outputs
 
         # TODO this list shouldn't be hardcoded so it can be extended by users
-        supported_outputs = [
-            Dynamic.Vehicle.Propulsion.ELECTRIC_POWER_IN,
-            Dynamic.Vehicle.Propulsion.FUEL_FLOW_RATE_NEGATIVE,
-            Dynamic.Vehicle.Propulsion.NOX_RATE,
-            Dynamic.Vehicle.Propulsion.SHAFT_POWER,
-            Dynamic.Vehicle.Propulsion.SHAFT_POWER_MAX,
-            Dynamic.Vehicle.Propulsion.TEMPERATURE_T4,
-            Dynamic.Vehicle.Propulsion.THRUST,
-            Dynamic.Vehicle.Propulsion.THRUST_MAX,
-        ]
+        supported_outputs = MUX_OUTPUTS
 
         engine_models = self.options['engine_models']
         engine_names = [engine.name for engine in engine_models]
-        num_engine_type = len(engine_models)
 
         # determine if openMDAO messages and warnings should be suppressed
         verbosity = self.options['aviary_options'].get_val(Settings.VERBOSITY)
@@ -266,57 +196,57 @@ class PropulsionMission(om.Group):
                 ]
             )
 
-        # add variables to the mux component and make connections to individual
-        # component outputs
+        # connect individual component outputs to the inputs of the mux component
         # if num_engine_type > 1:
         for output in unique_outputs:
             if output in supported_outputs:
-                # self.vectorize_performance.add_var(output, units=unique_outputs[output])
                 # promote/alias outputs for each comp that has relevant outputs
                 for i, comp in enumerate(output_dict):
                     if output in output_dict[comp]:
                         # if this component provides the output, connect it to the correct mux input
                         self.connect(
                             comp + '.' + output,
-                            'vectorize_performance.' + output + '_' + str(i),
+                            'propulsion_sum.' + output + '_' + str(i),
                         )
             # TODO handle setting of other variables from engine outputs (e.g. Aircraft.Engine.****)
 
-        if num_engine_type > 1:
-            # commented out block of code is for experimenting with automatically finding
-            # inputs that need a passthrough, rather than relying on get_parameters()
-            # being properly set up
-
-            # custom promote parameters with aliasing to connect to passthrough component
-            # for engine in engine_models:
-            # get inputs to engine model
-            # engine_comp = self._get_subsystem(engine.name)
-            # input_dict = engine_comp.list_inputs(
-            #     return_format='dict', units=True, out_stream=None, all_procs=True
-            # )
-            # # TODO this catches not fully promoted variables are caught - is this
-            # #      wanted?
-            # input_list = list(
-            #     set(
-            #         input_dict[key]['prom_name']
-            #         for key in input_dict
-            #         if '.' not in input_dict[key]['prom_name']
-            #     )
-            # )
-            # promotions = []
-            for i, param in enumerate(self.parameters):
-                self.promotes(
-                    'parameter_passthrough',
-                    inputs=[(f'x_{i}', param)],
-                    outputs=[(f'y_{i}', param + '_passthrough')],
-                )
-                #     if param in input_dict:
-                #         promotions.append((param, param + '_passthrough'))
-                # self.promotes(engine.name, inputs=promotions)
 
+class PropulsionParameters(om.ExplicitComponent):
+    """
+    Declares the parameters of the engine models, vectorized across engine types.
+
+    Each engine model takes its own slice of a parameter directly, so this component has no
+    outputs and does no computation. Its inputs give the promoted parameters the shape of
+    the whole vector, which dymos needs to connect the phase parameters to them.
+    """
+
+    def initialize(self):
+        self.options.declare(
+            'parameters', types=dict, desc='metadata of each parameter, keyed by name'
+        )
+        self.options.declare('num_engine_types', types=int, lower=1)
+
+    def setup(self):
+        num_engine_type = self.options['num_engine_types']
+
+        for param, meta in self.options['parameters'].items():
+            self.add_input(
+                param,
+                val=np.full(num_engine_type, meta.get('val', 1.0), dtype=float),
+                units=meta.get('units', 'unitless'),
+                tags=['dymos.static_target'],
+            )
+
+
+class PropulsionMuxSum(om.ExplicitComponent):
+    """
+    Vectorizes the performance outputs of the individual engine models, and calculates
+    propulsion system level sums of them.
 
-class PropulsionSum(om.ExplicitComponent):
-    """Calculates propulsion system level sums of individual engine performance parameters."""
+    Input "<output>_<i>" of engine model i is written to column i of the 2d output, and is
+    counted once per engine of that type in the aircraft total. All partials are constant
+    and sparse.
+    """
 
     def initialize(self):
         self.options.declare('num_nodes', types=int, lower=0)
@@ -324,111 +254,38 @@ class PropulsionSum(om.ExplicitComponent):
 
     def setup(self):
         nn = self.options['num_nodes']
-        num_engine_type = len(self.options[Aircraft.Engine.NUM_ENGINES])
+        num_engines = self.options[Aircraft.Engine.NUM_ENGINES]
+        num_engine_type = len(num_engines)
 
-        self.add_input(
-            Dynamic.Vehicle.Propulsion.THRUST,
-            val=np.zeros((nn, num_engine_type)),
-            units='lbf',
-        )
-        self.add_input(
-            Dynamic.Vehicle.Propulsion.THRUST_MAX,
-            val=np.zeros((nn, num_engine_type)),
-            units='lbf',
-        )
-        self.add_input(
-            Dynamic.Vehicle.Propulsion.FUEL_FLOW_RATE_NEGATIVE,
-            val=np.zeros((nn, num_engine_type)),
-            units='lbm/h',
-        )
-        self.add_input(
-            Dynamic.Vehicle.Propulsion.ELECTRIC_POWER_IN,
-            val=np.zeros((nn, num_engine_type)),
-            units='kW',
-        )
-        self.add_input(
-            Dynamic.Vehicle.Propulsion.NOX_RATE,
-            val=np.zeros((nn, num_engine_type)),
-            units='lbm/h',
-        )
+        arange = np.arange(nn)
 
-        self.add_output(Dynamic.Vehicle.Propulsion.THRUST_TOTAL, val=np.zeros(nn), units='lbf')
-        self.add_output(
-            Dynamic.Vehicle.Propulsion.THRUST_MAX_TOTAL,
-            val=np.zeros(nn),
-            units='lbf',
-        )
-        self.add_output(
-            Dynamic.Vehicle.Propulsion.FUEL_FLOW_RATE_NEGATIVE_TOTAL,
-            val=np.zeros(nn),
-            units='lbm/h',
-        )
-        self.add_output(
-            Dynamic.Vehicle.Propulsion.ELECTRIC_POWER_IN_TOTAL,
-            val=np.zeros(nn),
-            units='kW',
-        )
-        self.add_output(Dynamic.Vehicle.Propulsion.NOX_RATE_TOTAL, val=np.zeros(nn), units='lbm/h')
+        for output, units in MUX_OUTPUTS.items():
+            self.add_output(output, val=np.zeros((nn, num_engine_type)), units=units)
 
-    def setup_partials(self):
-        nn = self.options['num_nodes']
-        num_engines = self.options[Aircraft.Engine.NUM_ENGINES]
+            total = TOTAL_OUTPUTS.get(output)
+            if total is not None:
+                self.add_output(total, val=np.zeros(nn), units=units)
 
-        num_engine_type = len(num_engines)
-        deriv = np.tile(num_engines, nn)
+            for i in range(num_engine_type):
+                name = f'{output}_{i}'
+                self.add_input(name, val=np.zeros(nn), units=units)
 
-        r = np.repeat(np.arange(nn, dtype=int), num_engine_type)
-        c = np.arange(nn * num_engine_type, dtype=int)
+                self.declare_partials(
+                    output, name, rows=arange * num_engine_type + i, cols=arange, val=1.0
+                )
 
-        self.declare_partials(
-            Dynamic.Vehicle.Propulsion.THRUST_TOTAL,
-            Dynamic.Vehicle.Propulsion.THRUST,
-            val=deriv,
-            rows=r,
-            cols=c,
-        )
-        self.declare_partials(
-            Dynamic.Vehicle.Propulsion.THRUST_MAX_TOTAL,
-            Dynamic.Vehicle.Propulsion.THRUST_MAX,
-            val=deriv,
-            rows=r,
-            cols=c,
-        )
-        self.declare_partials(
-            Dynamic.Vehicle.Propulsion.FUEL_FLOW_RATE_NEGATIVE_TOTAL,
-            Dynamic.Vehicle.Propulsion.FUEL_FLOW_RATE_NEGATIVE,
-            val=deriv,
-            rows=r,
-            cols=c,
-        )
-        self.declare_partials(
-            Dynamic.Vehicle.Propulsion.ELECTRIC_POWER_IN_TOTAL,
-            Dynamic.Vehicle.Propulsion.ELECTRIC_POWER_IN,
-            val=deriv,
-            rows=r,
-            cols=c,
-        )
-        self.declare_partials(
-            Dynamic.Vehicle.Propulsion.NOX_RATE_TOTAL,
-            Dynamic.Vehicle.Propulsion.NOX_RATE,
-            val=deriv,
-            rows=r,
-            cols=c,
-        )
+                if total is not None:
+                    self.declare_partials(total, name, rows=arange, cols=arange, val=num_engines[i])
 
     def compute(self, inputs, outputs):
         num_engines = self.options[Aircraft.Engine.NUM_ENGINES]
 
-        thrust = inputs[Dynamic.Vehicle.Propulsion.THRUST]
-        thrust_max = inputs[Dynamic.Vehicle.Propulsion.THRUST_MAX]
-        fuel_flow = inputs[Dynamic.Vehicle.Propulsion.FUEL_FLOW_RATE_NEGATIVE]
-        electric = inputs[Dynamic.Vehicle.Propulsion.ELECTRIC_POWER_IN]
-        nox = inputs[Dynamic.Vehicle.Propulsion.NOX_RATE]
+        for output in MUX_OUTPUTS:
+            vals = outputs[output]
 
-        outputs[Dynamic.Vehicle.Propulsion.THRUST_TOTAL] = np.dot(thrust, num_engines)
-        outputs[Dynamic.Vehicle.Propulsion.THRUST_MAX_TOTAL] = np.dot(thrust_max, num_engines)
-        outputs[Dynamic.Vehicle.Propulsion.FUEL_FLOW_RATE_NEGATIVE_TOTAL] = np.dot(
-            fuel_flow, num_engines
-        )
-        outputs[Dynamic.Vehicle.Propulsion.ELECTRIC_POWER_IN_TOTAL] = np.dot(electric, num_engines)
-        outputs[Dynamic.Vehicle.Propulsion.NOX_RATE_TOTAL] = np.dot(nox, num_engines)
+            for i in range(len(num_engines)):
+                vals[:, i] = inputs[f'{output}_{i}']
+
+            total = TOTAL_OUTPUTS.get(output)
+            if total is not None:
+                outputs[total] = np.dot(vals, num_engines)
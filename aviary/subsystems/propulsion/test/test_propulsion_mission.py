@@ -7,7 +7,7 @@ from openmdao.utils.assert_utils import assert_check_partials, assert_near_equal
 from packaging import version
 
 from aviary.subsystems.propulsion.engine_deck import EngineDeck
-from aviary.subsystems.propulsion.propulsion_mission import PropulsionMission, PropulsionSum
+from aviary.subsystems.propulsion.propulsion_mission import PropulsionMission, PropulsionMuxSum
 from aviary.subsystems.propulsion.utils import build_engine_deck
 from aviary.utils.aviary_values import AviaryValues
 from aviary.utils.functions import get_path
@@ -148,28 +148,24 @@ class PropulsionMissionTest(unittest.TestCase):
         }
         self.prob.model = om.Group()
         self.prob.model.add_subsystem(
-            'propsum', PropulsionSum(num_nodes=nn, **options), promotes=['*']
+            'propsum', PropulsionMuxSum(num_nodes=nn, **options), promotes=['*']
         )
 
         self.prob.setup(force_alloc_complex=True)
 
-        self.prob.set_val(
-            Dynamic.Vehicle.Propulsion.THRUST, np.array([[500.4, 423.001], [325, 6780]])
-        )
-        self.prob.set_val(
-            Dynamic.Vehicle.Propulsion.THRUST_MAX,
-            np.array([[602.11, 3554], [100, 9000]]),
-        )
-        self.prob.set_val(
-            Dynamic.Vehicle.Propulsion.FUEL_FLOW_RATE_NEGATIVE,
-            np.array([[123, -221.44], [-765.2, -1]]),
-        )
-        self.prob.set_val(
-            Dynamic.Vehicle.Propulsion.ELECTRIC_POWER_IN, np.array([[3.01, -12], [484.2, 8123]])
-        )
-        self.prob.set_val(
-            Dynamic.Vehicle.Propulsion.NOX_RATE, np.array([[322, 4610], [1.54, 2.844]])
-        )
+        # values of each engine type, one column per type
+        engine_vals = {
+            Dynamic.Vehicle.Propulsion.THRUST: np.array([[500.4, 423.001], [325, 6780]]),
+            Dynamic.Vehicle.Propulsion.THRUST_MAX: np.array([[602.11, 3554], [100, 9000]]),
+            Dynamic.Vehicle.Propulsion.FUEL_FLOW_RATE_NEGATIVE: np.array(
+                [[123, -221.44], [-765.2, -1]]
+            ),
+            Dynamic.Vehicle.Propulsion.ELECTRIC_POWER_IN: np.array([[3.01, -12], [484.2, 8123]]),
+            Dynamic.Vehicle.Propulsion.NOX_RATE: np.array([[322, 4610], [1.54, 2.844]]),
+        }
+        for name, vals in engine_vals.items():
+            for i in range(2):
+                self.prob.set_val(f'{name}_{i}', vals[:, i])
 
         self.prob.run_model()
 
@@ -198,6 +194,46 @@ class PropulsionMissionTest(unittest.TestCase):
         partial_data = self.prob.check_partials(out_stream=None, method='cs')
         assert_check_partials(partial_data, atol=1e-10, rtol=1e-10)
 
+    def test_propulsion_mux_sum(self):
+        nn = 2
+        options = {
+            Aircraft.Engine.NUM_ENGINES: np.array([3, 2]),
+        }
+        self.prob.model.add_subsystem(
+            'propsum', PropulsionMuxSum(num_nodes=nn, **options), promotes=['*']
+        )
+
+        self.prob.setup(force_alloc_complex=True)
+
+        self.prob.set_val(Dynamic.Vehicle.Propulsion.THRUST + '_0', np.array([500.4, 325]))
+        self.prob.set_val(Dynamic.Vehicle.Propulsion.THRUST + '_1', np.array([423.001, 6780]))
+        self.prob.set_val(
+            Dynamic.Vehicle.Propulsion.FUEL_FLOW_RATE_NEGATIVE + '_0', np.array([123, -765.2])
+        )
+        self.prob.set_val(
+            Dynamic.Vehicle.Propulsion.FUEL_FLOW_RATE_NEGATIVE + '_1', np.array([-221.44, -1])
+        )
+        self.prob.set_val(Dynamic.Vehicle.Propulsion.TEMPERATURE_T4 + '_1', np.array([2400, 3000]))
+
+        self.prob.run_model()
+
+        thrust = self.prob.get_val(Dynamic.Vehicle.Propulsion.THRUST, units='lbf')
+        thrust_total = self.prob.get_val(Dynamic.Vehicle.Propulsion.THRUST_TOTAL, units='lbf')
+        fuel_flow = self.prob.get_val(
+            Dynamic.Vehicle.Propulsion.FUEL_FLOW_RATE_NEGATIVE_TOTAL, units='lb/h'
+        )
+        t4 = self.prob.get_val(Dynamic.Vehicle.Propulsion.TEMPERATURE_T4, units='degR')
+        nox = self.prob.get_val(Dynamic.Vehicle.Propulsion.NOX_RATE_TOTAL, units='lb/h')
+
+        assert_near_equal(thrust, np.array([[500.4, 423.001], [325, 6780]]), tolerance=1e-12)
+        assert_near_equal(thrust_total, np.array([2347.202, 14535]), tolerance=1e-12)
+        assert_near_equal(fuel_flow, np.array([-73.88, -2297.6]), tolerance=1e-12)
+        assert_near_equal(t4, np.array([[0, 2400], [0, 3000]]), tolerance=1e-12)
+        assert_near_equal(nox, np.zeros(nn), tolerance=1e-12)
+
+        partial_data = self.prob.check_partials(out_stream=None, method='cs')
+        assert_check_partials(partial_data, atol=1e-10, rtol=1e-10)
+
     def test_case_multiengine(self):
         # takes the large single aisle 2 test case and add a second set of engines to test summation
         nn = 20
@@ -291,6 +327,25 @@ class PropulsionMissionTest(unittest.TestCase):
         partial_data = self.prob.check_partials(out_stream=None, method='cs')
         assert_check_partials(partial_data, atol=1e-10, rtol=1e-10)
 
+        # each engine model takes its own slice of the vectorized parameter
+        self.prob.set_val(Aircraft.Engine.SCALE_FACTOR, [0.975, 0.5], units='unitless')
+        self.prob.run_model()
+
+        for engine_model, scale_factor in ((engine, 0.975), (engine2, 0.5)):
+            path = f'core_propulsion.{engine_model.name}'
+            assert_near_equal(
+                self.prob.get_val(f'{path}.engine_scaling.{Aircraft.Engine.SCALE_FACTOR}'),
+                [scale_factor],
+            )
+
+        thrust_1 = self.prob.get_val(
+            f'core_propulsion.{engine.name}.{Dynamic.Vehicle.Propulsion.THRUST}', units='lbf'
+        )
+        thrust_2 = self.prob.get_val(
+            f'core_propulsion.{engine2.name}.{Dynamic.Vehicle.Propulsion.THRUST}', units='lbf'
+        )
+        assert_near_equal(thrust_2 / thrust_1, np.full(nn, 0.5 / 0.975), tolerance=1e-10)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -9,7 +9,7 @@ from openmdao.utils.testing_utils import use_tempdirs
 from aviary.subsystems.atmosphere.atmosphere import Atmosphere
 from aviary.subsystems.propulsion.motor.motor_builder import MotorBuilder
 from aviary.subsystems.propulsion.propeller.propeller_performance import PropellerPerformance
-from aviary.subsystems.propulsion.turboprop_model import TurbopropModel
+from aviary.subsystems.propulsion.turboprop_model import BaseMaxSplit, BaseMaxStack, TurbopropModel
 from aviary.subsystems.subsystem_builder_base import SubsystemBuilderBase
 from aviary.utils.functions import get_path
 from aviary.utils.preprocessors import preprocess_propulsion
@@ -233,6 +233,14 @@ class TurbopropMissionTest(unittest.TestCase):
         assert_near_equal(results[1], truth_vals[1], tolerance=1.5e-12)
         assert_near_equal(results[2], truth_vals[2], tolerance=1.5e-12)
 
+        # the other propeller outputs are promoted at the shaft power operating point
+        assert_near_equal(
+            self.prob.get_val('advance_ratio'), [4.38419747e-03, 0.0, 2.39408421], 1e-8
+        )
+        assert_near_equal(
+            self.prob.get_val('thrust_coefficient'), [0.03594646, 0.23824442, 0.08104764], 1e-7
+        )
+
         partial_data = self.prob.check_partials(out_stream=None, form='central')
         assert_check_partials(partial_data, atol=0.15, rtol=0.15)
 
@@ -315,7 +323,7 @@ class TurbopropMissionTest(unittest.TestCase):
             2083.253331913252,
             184.38117745374652,
         ]
-        electric_power_expected = [0.0, 303.31014553, 303.31014553]
+        electric_power_expected = [0.0, 302.97943718, 302.97943718]
 
         shp = self.prob.get_val(Dynamic.Vehicle.Propulsion.SHAFT_POWER, units='hp')
         total_thrust = self.prob.get_val(Dynamic.Vehicle.Propulsion.THRUST, units='lbf')
@@ -333,6 +341,51 @@ class TurbopropMissionTest(unittest.TestCase):
         assert_check_partials(partial_data, atol=1e10, rtol=1e-3)
 
 
+class BaseMaxStackSplitTest(unittest.TestCase):
+    def test_stack_split(self):
+        nn = 3
+        prob = om.Problem()
+        prob.model.add_subsystem(
+            'stack',
+            BaseMaxStack(
+                num_nodes=nn,
+                shared_vars={Dynamic.Atmosphere.MACH: 'unitless'},
+                paired_vars={Dynamic.Vehicle.Propulsion.SHAFT_POWER: 'hp'},
+            ),
+            promotes_inputs=['*'],
+        )
+        prob.model.add_subsystem(
+            'split',
+            BaseMaxSplit(num_nodes=nn, paired_vars={Dynamic.Vehicle.Propulsion.SHAFT_POWER: 'hp'}),
+        )
+        prob.model.connect(
+            'stack.' + Dynamic.Vehicle.Propulsion.SHAFT_POWER + '_stacked',
+            'split.' + Dynamic.Vehicle.Propulsion.SHAFT_POWER + '_stacked',
+        )
+        prob.setup(force_alloc_complex=True)
+
+        prob.set_val(Dynamic.Atmosphere.MACH, [0.1, 0.2, 0.3])
+        prob.set_val(Dynamic.Vehicle.Propulsion.SHAFT_POWER, [100.0, 200.0, 300.0], units='hp')
+        prob.set_val(Dynamic.Vehicle.Propulsion.SHAFT_POWER_MAX, [400.0, 500.0, 600.0], units='hp')
+        prob.run_model()
+
+        assert_near_equal(
+            prob.get_val('stack.' + Dynamic.Atmosphere.MACH + '_stacked'),
+            [0.1, 0.2, 0.3, 0.1, 0.2, 0.3],
+        )
+        assert_near_equal(
+            prob.get_val('split.' + Dynamic.Vehicle.Propulsion.SHAFT_POWER, units='hp'),
+            [100.0, 200.0, 300.0],
+        )
+        assert_near_equal(
+            prob.get_val('split.' + Dynamic.Vehicle.Propulsion.SHAFT_POWER_MAX, units='hp'),
+            [400.0, 500.0, 600.0],
+        )
+
+        partial_data = prob.check_partials(out_stream=None, method='cs')
+        assert_check_partials(partial_data, atol=1e-12, rtol=1e-12)
+
+
 class ExamplePropModel(SubsystemBuilderBase):
     def build_mission(self, num_nodes, aviary_inputs, **kwargs):
         prop_group = om.Group()
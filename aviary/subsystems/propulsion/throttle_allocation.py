@@ -74,24 +74,28 @@ class ThrottleAllocator(om.ExplicitComponent):
             cols=cols,
         )
 
+        # each throttle but the last one only depends on its own allocation, while the last
+        # one depends on all of them
+        num_alloc = num_engine_type - 1
+        node = np.repeat(np.arange(nn), 2 * num_alloc)
+        alloc = np.arange(num_alloc)
+        rows = np.tile(np.hstack((alloc, np.full(num_alloc, num_alloc))), nn)
+        rows += num_engine_type * node
+        cols = np.tile(np.hstack((alloc, alloc)), nn)
+
         if alloc_mode == ThrottleAllocation.DYNAMIC:
-            a = num_engine_type
-            b = a - 1
-            row = np.arange(a)
-            col = np.arange(b)
-            rows = np.repeat(row, b)
-            cols = np.tile(col, num_engine_type)
-            all_rows = np.tile(rows, nn) + a * np.repeat(np.arange(nn), a * b)
-            all_cols = np.tile(cols, nn) + b * np.repeat(np.arange(nn), a * b)
-            self.declare_partials(
-                of=[Dynamic.Vehicle.Propulsion.THROTTLE],
-                wrt=['throttle_allocations'],
-                rows=all_rows,
-                cols=all_cols,
-            )
+            cols = cols + num_alloc * node
 
-            rows = np.repeat(np.arange(nn), b)
-            cols = np.arange(nn * b)
+        self.declare_partials(
+            of=[Dynamic.Vehicle.Propulsion.THROTTLE],
+            wrt=['throttle_allocations'],
+            rows=rows,
+            cols=cols,
+        )
+
+        if alloc_mode == ThrottleAllocation.DYNAMIC:
+            rows = np.repeat(np.arange(nn), num_alloc)
+            cols = np.arange(nn * num_alloc)
             self.declare_partials(
                 of=['throttle_allocation_sum'],
                 wrt=['throttle_allocations'],
@@ -100,9 +104,6 @@ class ThrottleAllocator(om.ExplicitComponent):
                 val=1.0,
             )
         else:
-            self.declare_partials(
-                of=[Dynamic.Vehicle.Propulsion.THROTTLE], wrt=['throttle_allocations']
-            )
             self.declare_partials(
                 of=['throttle_allocation_sum'], wrt=['throttle_allocations'], val=1.0
             )
@@ -131,7 +132,7 @@ class ThrottleAllocator(om.ExplicitComponent):
     def compute_partials(self, inputs, partials, discrete_inputs=None):
         nn = self.options['num_nodes']
         alloc_mode = self.options['throttle_allocation']
-        num_engine_type = len(self.options[Aircraft.Engine.NUM_ENGINES])
+        num_alloc = len(self.options[Aircraft.Engine.NUM_ENGINES]) - 1
 
         agg_throttle = inputs['aggregate_throttle']
         allocation = inputs['throttle_allocations']
@@ -140,15 +141,6 @@ class ThrottleAllocator(om.ExplicitComponent):
             sum_alloc = np.sum(allocation, axis=1)
             allocs = np.vstack((allocation.T, 1.0 - sum_alloc))
             partials[Dynamic.Vehicle.Propulsion.THROTTLE, 'aggregate_throttle'] = allocs.T.ravel()
-
-            ne = num_engine_type - 1
-            mask1 = np.eye(ne)
-            mask2 = -np.ones(ne)
-            mask = np.vstack((mask1, mask2)).ravel()
-
-            deriv = np.outer(agg_throttle, mask).reshape((nn * (ne + 1), ne))
-            partials[Dynamic.Vehicle.Propulsion.THROTTLE, 'throttle_allocations'] = deriv.ravel()
-
         else:
             sum_alloc = np.sum(allocation)
             allocs = np.hstack((allocation, 1.0 - sum_alloc))
@@ -156,16 +148,8 @@ class ThrottleAllocator(om.ExplicitComponent):
                 allocs, nn
             )
 
-            ne = num_engine_type - 1
-            mask1 = np.eye(ne)
-            mask2 = -np.ones(ne)
-            mask = np.vstack((mask1, mask2)).ravel()
-
-            deriv = np.outer(agg_throttle, mask).reshape((nn * (ne + 1), ne))
-            partials[Dynamic.Vehicle.Propulsion.THROTTLE, 'throttle_allocations'] = deriv
-
-        # sum_alloc = np.sum(allocation)
-
-        # outputs[Dynamic.Vehicle.Propulsion.THROTTLE][:, -1] = agg_throttle * (1.0 - sum_alloc)
-
-        # outputs["throttle_allocation_sum"] = sum_alloc
+        # derivatives of the first throttles, then of the last one, at each node
+        sign = np.hstack((np.ones(num_alloc), -np.ones(num_alloc)))
+        partials[Dynamic.Vehicle.Propulsion.THROTTLE, 'throttle_allocations'] = np.outer(
+            agg_throttle, sign
+        ).ravel()
@@ -244,59 +244,78 @@ class TurbopropMission(om.Group):
         except (AttributeError, KeyError):
             propeller_kwargs = {}
 
-        propeller_group = om.Group()
-        propeller_model_mission = propeller_model.build_mission(
-            num_nodes, aviary_inputs, **propeller_kwargs
-        )
-
         if isinstance(propeller_model, PropellerBuilder):
-            # use the Hamilton Standard model
-            # only promote top-level inputs to avoid conflicts with max group
+            # Use the Aviary propeller model (Hamilton Standard or propeller map). The
+            # operating points at shaft power and max shaft power are stacked into a single
+            # vector of length 2 * num_nodes and evaluated by one propeller model, instead
+            # of building and evaluating two identical propeller models.
+            # Only promote top-level inputs.
             prop_inputs = [
-                Dynamic.Atmosphere.MACH,
                 Aircraft.Engine.Propeller.TIP_SPEED_MAX,
                 Aircraft.Engine.Propeller.TIP_MACH_MAX,
-                Dynamic.Atmosphere.DENSITY,
-                Dynamic.Mission.VELOCITY,
                 Aircraft.Engine.Propeller.DIAMETER,
                 Aircraft.Engine.Propeller.ACTIVITY_FACTOR,
                 Aircraft.Engine.Propeller.INTEGRATED_LIFT_COEFFICIENT,
                 Aircraft.Nacelle.AVG_DIAMETER,
-                Dynamic.Atmosphere.SPEED_OF_SOUND,
-                Dynamic.Vehicle.Propulsion.RPM,
             ]
-            try:
-                propeller_kwargs = kwargs['hamilton_standard']
-            except KeyError:
-                propeller_kwargs = {}
+            # inputs shared by both operating points
+            shared_inputs = {
+                Dynamic.Atmosphere.MACH: 'unitless',
+                Dynamic.Atmosphere.DENSITY: 'slug/ft**3',
+                Dynamic.Mission.VELOCITY: 'ft/s',
+                Dynamic.Atmosphere.SPEED_OF_SOUND: 'ft/s',
+                Dynamic.Vehicle.Propulsion.RPM: 'rpm',
+            }
+            # inputs that differ between operating points (var & var + "_max")
+            paired_inputs = {Dynamic.Vehicle.Propulsion.SHAFT_POWER: 'hp'}
+            # outputs that are split back into base (var) and max (var + "_max") values. The
+            # base values of every other output of the propeller model are also split out
+            # (see BaseMaxPropellerGroup).
+            paired_outputs = {Dynamic.Vehicle.Propulsion.THRUST: 'lbf'}
+
+            propeller_group = BaseMaxPropellerGroup()
 
             propeller_group.add_subsystem(
-                'propeller_model_base',
-                propeller_model_mission,
-                promotes=['*'],
+                'stack_operating_points',
+                BaseMaxStack(
+                    num_nodes=num_nodes,
+                    shared_vars=shared_inputs,
+                    paired_vars=paired_inputs,
+                ),
+                promotes_inputs=['*'],
             )
 
-            propeller_model_mission_max = propeller_model.build_mission(
-                num_nodes, aviary_inputs, **propeller_kwargs
+            propeller_model_mission = propeller_model.build_mission(
+                2 * num_nodes, aviary_inputs, **propeller_kwargs
             )
             propeller_group.add_subsystem(
-                'propeller_model_max',
-                propeller_model_mission_max,
-                promotes_inputs=[
-                    *prop_inputs,
-                    (
-                        Dynamic.Vehicle.Propulsion.SHAFT_POWER,
-                        Dynamic.Vehicle.Propulsion.SHAFT_POWER_MAX,
-                    ),
-                ],
-                promotes_outputs=[
-                    (Dynamic.Vehicle.Propulsion.THRUST, Dynamic.Vehicle.Propulsion.THRUST_MAX)
-                ],
+                'propeller_performance',
+                propeller_model_mission,
+                promotes_inputs=prop_inputs,
+            )
+
+            propeller_group.add_subsystem(
+                'split_operating_points',
+                BaseMaxSplit(num_nodes=num_nodes, paired_vars=paired_outputs),
+                promotes_outputs=['*'],
             )
 
+            for var in [*shared_inputs, *paired_inputs]:
+                propeller_group.connect(
+                    f'stack_operating_points.{var}_stacked', f'propeller_performance.{var}'
+                )
+            for var in paired_outputs:
+                propeller_group.connect(
+                    f'propeller_performance.{var}', f'split_operating_points.{var}_stacked'
+                )
+
             self.add_subsystem('propeller_model', propeller_group)
 
         else:
+            propeller_group = om.Group()
+            propeller_model_mission = propeller_model.build_mission(
+                num_nodes, aviary_inputs, **propeller_kwargs
+            )
             if propeller_model_mission is not None:
                 propeller_group.add_subsystem(
                     propeller_model.name + '_base',
@@ -616,3 +635,163 @@ class TurbopropMission(om.Group):
             self.promotes(gearbox_model.name, inputs=gearbox_inputs, outputs=gearbox_outputs)
 
         self.promotes(propeller_model_name, inputs=propeller_inputs, outputs=propeller_outputs)
+
+
+class BaseMaxStack(om.ExplicitComponent):
+    """
+    Stacks the base (shaft power) and max (max shaft power) operating points of a
+    turboprop into vectors of length 2 * num_nodes so a single propeller model can evaluate
+    both at once. The first num_nodes entries of each stacked output are the base operating
+    point, the last num_nodes entries are the max operating point.
+    """
+
+    def initialize(self):
+        self.options.declare(
+            'num_nodes', types=int, desc='Number of nodes to be evaluated in the RHS'
+        )
+        self.options.declare(
+            'shared_vars',
+            types=dict,
+            default={},
+            desc='dictionary of variable names and units that are the same for both operating '
+            'points, and are repeated in the stacked output',
+        )
+        self.options.declare(
+            'paired_vars',
+            types=dict,
+            default={},
+            desc='dictionary of variable names and units where "<name>" is the base value and '
+            '"<name>_max" the max value',
+        )
+
+    def setup(self):
+        nn = self.options['num_nodes']
+
+        for var, units in self.options['shared_vars'].items():
+            self.add_input(var, val=np.zeros(nn), units=units)
+            self.add_output(var + '_stacked', val=np.zeros(2 * nn), units=units)
+
+        for var, units in self.options['paired_vars'].items():
+            self.add_input(var, val=np.zeros(nn), units=units)
+            self.add_input(var + '_max', val=np.zeros(nn), units=units)
+            self.add_output(var + '_stacked', val=np.zeros(2 * nn), units=units)
+
+    def setup_partials(self):
+        nn = self.options['num_nodes']
+        arange = np.arange(nn)
+
+        for var in self.options['shared_vars']:
+            self.declare_partials(
+                var + '_stacked',
+                var,
+                rows=np.arange(2 * nn),
+                cols=np.tile(arange, 2),
+                val=1.0,
+            )
+
+        for var in self.options['paired_vars']:
+            self.declare_partials(var + '_stacked', var, rows=arange, cols=arange, val=1.0)
+            self.declare_partials(
+                var + '_stacked', var + '_max', rows=arange + nn, cols=arange, val=1.0
+            )
+
+    def compute(self, inputs, outputs):
+        for var in self.options['shared_vars']:
+            outputs[var + '_stacked'] = np.tile(inputs[var], 2)
+
+        for var in self.options['paired_vars']:
+            outputs[var + '_stacked'] = np.concatenate((inputs[var], inputs[var + '_max']))
+
+
+class BaseMaxPropellerGroup(om.Group):
+    """
+    Group that evaluates a propeller model at the stacked base and max operating points (see
+    BaseMaxStack). The base values of every output of the propeller model that is not split
+    into base and max values are split out under the name of that output, so they are
+    promoted the same way as those of a propeller model evaluated at the base operating point
+    only.
+    """
+
+    def configure(self):
+        split = self._get_subsystem('split_operating_points')
+        num_nodes = split.options['num_nodes']
+        paired_vars = split.options['paired_vars']
+
+        outputs = self._get_subsystem('propeller_performance').get_io_metadata(
+            iotypes='output', metadata_keys=['shape', 'units']
+        )
+        for meta in outputs.values():
+            name = meta['prom_name']
+            if '.' in name or name in paired_vars or meta['shape'] != (2 * num_nodes,):
+                continue
+
+            split.add_base_var(name, meta['units'])
+            self.connect(f'propeller_performance.{name}', f'split_operating_points.{name}_stacked')
+
+
+class BaseMaxSplit(om.ExplicitComponent):
+    """
+    Splits stacked propeller outputs of length 2 * num_nodes (see BaseMaxStack) back into
+    base ("<name>") and max ("<name>_max") values. Variables added with add_base_var are
+    only split into their base values.
+    """
+
+    def initialize(self):
+        self.options.declare(
+            'num_nodes', types=int, desc='Number of nodes to be evaluated in the RHS'
+        )
+        self.options.declare(
+            'paired_vars',
+            types=dict,
+            default={},
+            desc='dictionary of variable names and units to split',
+        )
+
+    def setup(self):
+        nn = self.options['num_nodes']
+        self._base_vars = []
+
+        for var, units in self.options['paired_vars'].items():
+            self.add_input(var + '_stacked', val=np.zeros(2 * nn), units=units)
+            self.add_output(var, val=np.zeros(nn), units=units)
+            self.add_output(var + '_max', val=np.zeros(nn), units=units)
+
+    def add_base_var(self, name, units):
+        """
+        Add a stacked variable of which only the base values are output.
+
+        Parameters
+        ----------
+        name : str
+            Name of the output. The stacked input is named "<name>_stacked".
+        units : str or None
+            Units of the variable.
+        """
+        nn = self.options['num_nodes']
+
+        self.add_input(name + '_stacked', val=np.zeros(2 * nn), units=units)
+        self.add_output(name, val=np.zeros(nn), units=units)
+        self._base_vars.append(name)
+
+    def setup_partials(self):
+        nn = self.options['num_nodes']
+        arange = np.arange(nn)
+
+        for var in self.options['paired_vars']:
+            self.declare_partials(var, var + '_stacked', rows=arange, cols=arange, val=1.0)
+            self.declare_partials(
+                var + '_max', var + '_stacked', rows=arange, cols=arange + nn, val=1.0
+            )
+
+        for var in self._base_vars:
+            self.declare_partials(var, var + '_stacked', rows=arange, cols=arange, val=1.0)
+
+    def compute(self, inputs, outputs):
+        nn = self.options['num_nodes']
+
+        for var in self.options['paired_vars']:
+            outputs[var] = inputs[var + '_stacked'][:nn]
+            outputs[var + '_max'] = inputs[var + '_stacked'][nn:]
+
+        for var in self._base_vars:
+            outputs[var] = inputs[var + '_stacked'][:nn]
@@ -17,6 +17,8 @@ class AviaryValues
     define a collection of named values with associated units
 """
 
+import functools
+
 from openmdao.utils.units import convert_units as _convert_units
 
 from aviary.utils.named_values import NamedValues, get_items, get_keys, get_values
@@ -30,6 +32,23 @@ get_keys = get_keys
 get_values = get_values
 
 
+@functools.lru_cache(maxsize=None)
+def _units_conversion_error(expected_units, units):
+    """
+    Return the type of error raised by OpenMDAO when converting between two units, or None
+    if they are compatible. Results are cached, as the same pairs of units are checked for
+    every value that is set.
+    """
+    try:
+        # NOTE the value here is unimportant, we only care if OpenMDAO will
+        # convert the units
+        _convert_units(10, expected_units, units)
+    except (ValueError, TypeError) as err:
+        return type(err)
+
+    return None
+
+
 class AviaryValues(NamedValues):
     """Define a collection of aviary values with associated units and aviary tests."""
 
@@ -72,18 +91,17 @@ class AviaryValues(NamedValues):
         expected_units = meta_data[key]['units']
 
         try:
-            # NOTE the value here is unimportant, we only care if OpenMDAO will
-            # convert the units
-            _convert_units(10, expected_units, units)
-        except ValueError:
+            error = _units_conversion_error(expected_units, units)
+        except BaseException:
+            raise KeyError('There is an unknown error with your units.')
+
+        if error is ValueError:
             raise ValueError(f'The units {units} which you have provided for {key} are invalid.')
-        except TypeError:
+        elif error is TypeError:
             raise TypeError(
                 f'The base units of {key} are {expected_units}, and you have tried to '
                 f'set {key} with units of {units}, which are not compatible.'
             )
-        except BaseException:
-            raise KeyError('There is an unknown error with your units.')
 
     def items(self):
         """
@@ -0,0 +1,319 @@
+"""
+Conversion of whole libraries of legacy decks to Aviary format.
+
+Vehicle decks (fortran_to_aviary), engine decks (convert_engine) and aero tables
+(convert_aero_table) are converted in parallel worker processes. Each converted file is
+recorded in a manifest in the output directory along with a hash of the deck it was
+converted from, so decks that have not changed since the last conversion are skipped.
+
+Usage::
+
+    aviary convert_batch fortran_to_aviary -f GASP -o converted models/*/*.dat
+    aviary convert_batch engine -f GASP -o converted engines/
+"""
+
+import glob
+import hashlib
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import aviary
+from aviary.utils.aero_table_conversion import AeroDataConverter, CodeOrigin
+from aviary.utils.engine_deck_conversion import EngineDeckConverter, EngineDeckType
+from aviary.utils.fortran_to_aviary import fortran_to_aviary
+from aviary.variable_info.enums import LegacyCode, Verbosity
+
+MANIFEST_NAME = 'conversion_manifest.json'
+
+# converter name: (type of data_format, default output suffix)
+converters = {
+    'fortran_to_aviary': (LegacyCode, '.csv'),
+    'engine': (EngineDeckType, '.deck'),
+    'aero': (CodeOrigin, None),
+}
+
+
+def find_decks(paths, pattern='*'):
+    """
+    Return the files matched by a list of files, directories and glob patterns.
+
+    Directories are searched (not recursively) for files matching pattern. Each file is
+    only returned once, in the order it was first found.
+
+    Parameters
+    ----------
+    paths : list of (str, Path)
+        Files, directories or glob patterns.
+    pattern : str
+        Glob pattern for the files searched for in directories.
+
+    Returns
+    -------
+    list of Path
+    """
+    decks = []
+
+    for path in paths:
+        path = Path(path)
+
+        if path.is_dir():
+            found = sorted(file for file in path.glob(pattern) if file.is_file())
+        elif path.is_file():
+            found = [path]
+        else:
+            found = sorted(Path(file) for file in glob.glob(str(path)) if os.path.isfile(file))
+
+            if not found:
+                raise FileNotFoundError(f'No decks were found matching "{path}"')
+
+        for file in found:
+            if file not in decks:
+                decks.append(file)
+
+    return decks
+
+
+def output_files(converter, data_format, input_file, out_dir):
+    """
+    Return the files a converter writes for an input file.
+
+    Parameters
+    ----------
+    converter : str
+        Name of the converter, one of the keys of converters.
+    data_format : (LegacyCode, EngineDeckType, CodeOrigin)
+        Format of the input file.
+    input_file : Path
+        Deck being converted.
+    out_dir : Path
+        Directory the converted files are written to.
+
+    Returns
+    -------
+    list of Path
+        The converted files. FLOPS aero tables are split into a lift-dependent drag file
+        and a zero-lift drag file, all other decks convert to a single file.
+    """
+    suffix = converters[converter][1]
+    input_file = Path(input_file)
+
+    if suffix is not None:
+        return [Path(out_dir, input_file.stem + suffix)]
+
+    name = input_file.stem + '_aviary'
+    suffix = input_file.suffix
+
+    if data_format is CodeOrigin.FLOPS:
+        return [Path(out_dir, name + '_CDi' + suffix), Path(out_dir, name + '_CD0' + suffix)]
+
+    return [Path(out_dir, name + suffix)]
+
+
+def deck_hash(input_file, converter, data_format):
+    """
+    Return the hash identifying a conversion of a deck.
+
+    The hash covers the contents of the deck, the converter and format used, and the
+    version of Aviary, so a deck is converted again if any of them change.
+    """
+    sha = hashlib.sha256()
+    sha.update(f'{converter}:{data_format.value}:{aviary.__version__}\n'.encode())
+    sha.update(Path(input_file).read_bytes())
+
+    return sha.hexdigest()
+
+
+def _convert(converter, data_format, input_file, out_files):
+    """Convert a single deck. This runs in the worker processes."""
+    try:
+        if converter == 'fortran_to_aviary':
+            fortran_to_aviary(
+                input_file, data_format, out_files[0], force=True, verbosity=Verbosity.QUIET
+            )
+        elif converter == 'engine':
+            EngineDeckConverter(input_file, out_files[0], data_format)
+        else:
+            AeroDataConverter(input_file, out_files[0], data_format)
+    except Exception as err:
+        return f'{type(err).__name__}: {err}'
+
+    return None
+
+
+def convert_batch(
+    converter,
+    data_format,
+    decks,
+    out_dir,
+    max_workers=None,
+    force=False,
+    verbosity=Verbosity.BRIEF,
+):
+    """
+    Convert a library of legacy decks to Aviary format.
+
+    Decks are converted in parallel worker processes. Decks whose contents, converter and
+    format are unchanged since they were last converted into out_dir, and whose converted
+    files still exist, are skipped.
+
+    Parameters
+    ----------
+    converter : str
+        Name of the converter: 'fortran_to_aviary', 'engine' or 'aero'.
+    data_format : (str, LegacyCode, EngineDeckType, CodeOrigin)
+        Format of the decks, which must be valid for the converter.
+    decks : list of (str, Path)
+        Files, directories or glob patterns of the decks to convert.
+    out_dir : (str, Path)
+        Directory the converted files are written to.
+    max_workers : int
+        Number of worker processes. If 1, decks are converted in this process. Defaults to
+        the number of processors.
+    force : bool
+        If True, convert all decks even if they are unchanged.
+    verbosity : Verbosity
+        Sets level of printouts for this function.
+
+    Returns
+    -------
+    list of dict
+        For each deck, its path, the converted files and the status of the conversion
+        ('converted', 'skipped' or 'failed'). Failed conversions also hold the error.
+    """
+    if converter not in converters:
+        raise ValueError(
+            f'"{converter}" is not a valid converter. Valid converters are {", ".join(converters)}'
+        )
+
+    data_format = converters[converter][0](data_format)
+    verbosity = Verbosity(verbosity)
+
+    # fortran_to_aviary places relative output paths next to the deck
+    out_dir = Path(out_dir).resolve()
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    manifest_file = out_dir / MANIFEST_NAME
+    manifest = json.loads(manifest_file.read_text()) if manifest_file.is_file() else {}
+
+    results = []
+    pending = []
+
+    for deck in find_decks(decks):
+        out_files = output_files(converter, data_format, deck, out_dir)
+        digest = deck_hash(deck, converter, data_format)
+        result = {'deck': deck, 'files': out_files, 'hash': digest}
+
+        names = [file.name for file in out_files]
+        previous = manifest.get(names[0])
+
+        if (
+            not force
+            and previous is not None
+            and previous['hash'] == digest
+            and all(file.is_file() for file in out_files)
+        ):
+            result['status'] = 'skipped'
+        else:
+            if any(name in pending_names for _, pending_names in pending for name in names):
+                raise ValueError(f'More than one deck converts to {names[0]} in {out_dir}')
+
+            pending.append((result, names))
+
+        results.append(result)
+
+    jobs = [(converter, data_format, result['deck'], result['files']) for result, _ in pending]
+
+    if max_workers == 1 or len(jobs) < 2:
+        errors = [_convert(*job) for job in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            errors = list(executor.map(_convert, *zip(*jobs)))
+
+    for (result, names), error in zip(pending, errors):
+        if error is None:
+            result['status'] = 'converted'
+            manifest[names[0]] = {
+                'deck': str(result['deck']),
+                'hash': result['hash'],
+                'files': names,
+            }
+        else:
+            result['status'] = 'failed'
+            result['error'] = error
+            manifest.pop(names[0], None)
+
+    manifest_file.write_text(json.dumps(manifest, indent=2, sort_keys=True))
+
+    if verbosity >= Verbosity.BRIEF:
+        counts = {
+            status: sum(result['status'] == status for result in results)
+            for status in ('converted', 'skipped', 'failed')
+        }
+        print(
+            f'{counts["converted"]} converted, {counts["skipped"]} unchanged, '
+            f'{counts["failed"]} failed'
+        )
+
+        for result in results:
+            if result['status'] == 'failed':
+                print(f'{result["deck"]}: {result["error"]}')
+
+    return results
+
+
+def _setup_batch_parser(parser):
+    """
+    Set up the subparser for the batch conversion tool.
+
+    Parameters
+    ----------
+    parser : argparse subparser
+        The parser we're adding options to.
+    """
+    parser.add_argument(
+        'converter', choices=list(converters), help='Type of the decks to be converted'
+    )
+    parser.add_argument(
+        'decks', nargs='+', help='Files, directories or glob patterns of the decks to convert'
+    )
+    parser.add_argument(
+        '-f',
+        '--data_format',
+        required=True,
+        help='Data format used by the decks (FLOPS, GASP, or GASP_TS for turboshaft engines)',
+    )
+    parser.add_argument(
+        '-o', '--out_dir', default='.', help='Directory the converted decks are written to'
+    )
+    parser.add_argument(
+        '-n',
+        '--max_workers',
+        type=int,
+        default=None,
+        help='Number of worker processes. Defaults to the number of processors',
+    )
+    parser.add_argument(
+        '--force', action='store_true', help='Convert all decks, including unchanged ones'
+    )
+    parser.add_argument(
+        '-v',
+        '--verbosity',
+        type=int,
+        choices=Verbosity.values(),
+        default=1,
+        help='Set level of print statements',
+    )
+
+
+def _exec_batch(args, user_args):
+    convert_batch(
+        args.converter,
+        args.data_format,
+        args.decks,
+        args.out_dir,
+        max_workers=args.max_workers,
+        force=args.force,
+        verbosity=args.verbosity,
+    )
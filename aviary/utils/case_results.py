@@ -0,0 +1,224 @@
+"""
+Read-once access to the results stored in a case recorder file.
+
+Opening a CaseReader is the expensive part of post-processing a recorded problem, so
+read_case_results keeps one CaseResults object per file, shared by every report and by
+the dashboard, until the file changes. For each case, the index of the recorded outputs
+(promoted names and units) is built once, while the values themselves are only loaded
+when they are requested, and then cached.
+"""
+
+import os
+from collections import defaultdict
+
+import openmdao.api as om
+
+# CaseResults of every case recorder file read so far, keyed by absolute path
+_results_cache = {}
+
+
+def _file_stamp(path):
+    stat = os.stat(path)
+    return stat.st_mtime_ns, stat.st_size
+
+
+def read_case_results(filename):
+    """
+    Return the CaseResults of a case recorder file, reading the file only once.
+
+    The same object is returned for the same file until the file is modified.
+
+    Parameters
+    ----------
+    filename : str or Path
+        Path to the case recorder file.
+
+    Returns
+    -------
+    CaseResults
+        Results stored in the file.
+    """
+    path = os.path.abspath(filename)
+    results = _results_cache.get(path)
+
+    if results is None or results.stamp != _file_stamp(path):
+        results = _results_cache[path] = CaseResults(path)
+
+    return results
+
+
+def clear_case_results_cache():
+    """Forget the results of every case recorder file read so far."""
+    _results_cache.clear()
+
+
+def group_timeseries(names, traj_name='traj'):
+    """
+    Sort the promoted names of timeseries outputs by phase and variable.
+
+    Parameters
+    ----------
+    names : iterable of str
+        Promoted names of outputs. Names that are not of the form
+        "<traj_name>.<phase>.timeseries.<variable>" are skipped.
+    traj_name : str
+        Name of the trajectory.
+
+    Returns
+    -------
+    dict
+        Promoted name of each timeseries output, keyed by phase name and then by
+        variable name.
+    """
+    timeseries = defaultdict(dict)
+
+    for name in names:
+        parts = name.split('.')
+        if len(parts) == 4 and parts[0] == traj_name and parts[2] == 'timeseries':
+            timeseries[parts[1]][parts[3]] = name
+
+    return dict(timeseries)
+
+
+class CaseResults:
+    """
+    Results stored in a case recorder file.
+
+    The CaseReader is only created when first needed. Cases, the index of the outputs of
+    each case and the requested values are cached, so each of them is read from the file
+    at most once.
+
+    Parameters
+    ----------
+    filename : str
+        Path to the case recorder file.
+
+    Attributes
+    ----------
+    filename : str
+        Path to the case recorder file.
+    stamp : tuple
+        Modification time and size of the file when it was read.
+    """
+
+    def __init__(self, filename):
+        self.filename = filename
+        self.stamp = _file_stamp(filename)
+
+        self._reader = None
+        self._case_names = {}
+        self._cases = {}
+        self._outputs = {}
+        self._values = {}
+
+    @property
+    def reader(self):
+        """The CaseReader of the file."""
+        if self._reader is None:
+            self._reader = om.CaseReader(self.filename)
+        return self._reader
+
+    @property
+    def problem_metadata(self):
+        """Metadata of the recorded problem, including its hierarchy and connections."""
+        return self.reader.problem_metadata
+
+    def list_cases(self, source=None):
+        """
+        Return the names of the cases recorded by the given source.
+
+        Parameters
+        ----------
+        source : str, optional
+            'problem', 'driver', or the pathname of a system or solver. By default, the
+            cases recorded by every source are returned.
+
+        Returns
+        -------
+        list of str
+            Names of the cases.
+        """
+        if source not in self._case_names:
+            self._case_names[source] = self.reader.list_cases(source, out_stream=None)
+        return self._case_names[source]
+
+    def has_case(self, case_name):
+        """Return True if the file contains a case with the given name."""
+        return case_name in self.list_cases()
+
+    def get_case(self, case_name='final'):
+        """Return the case with the given name."""
+        if case_name not in self._cases:
+            self._cases[case_name] = self.reader.get_case(case_name)
+        return self._cases[case_name]
+
+    def list_outputs(self, case_name='final'):
+        """
+        Return the index of the outputs of a case, without their values.
+
+        Parameters
+        ----------
+        case_name : str
+            Name of the case.
+
+        Returns
+        -------
+        dict
+            Promoted name and units of each output, keyed by absolute name.
+        """
+        if case_name not in self._outputs:
+            self._outputs[case_name] = self.get_case(case_name).list_outputs(
+                val=False,
+                prom_name=True,
+                units=True,
+                hierarchical=False,
+                out_stream=None,
+                return_format='dict',
+            )
+        return self._outputs[case_name]
+
+    def get_val(self, name, units=None, case_name='final'):
+        """
+        Return the value of a variable in a case, read from the file only once.
+
+        Parameters
+        ----------
+        name : str
+            Promoted or absolute name of the variable.
+        units : str, optional
+            Units of the returned value. Defaults to the units of the variable.
+        case_name : str
+            Name of the case.
+
+        Returns
+        -------
+        ndarray
+            Value of the variable. It is shared by every caller, so it must not be
+            modified.
+        """
+        key = (case_name, name, units)
+
+        if key not in self._values:
+            self._values[key] = self.get_case(case_name).get_val(name, units=units)
+
+        return self._values[key]
+
+    def get_timeseries(self, traj_name='traj', case_name='final'):
+        """
+        Return the promoted names of the timeseries outputs of a trajectory in a case.
+
+        Parameters
+        ----------
+        traj_name : str
+            Name of the trajectory.
+        case_name : str
+            Name of the case.
+
+        Returns
+        -------
+        dict
+            Promoted name of each timeseries output, keyed by phase name and then by
+            variable name.
+        """
+        outputs = self.list_outputs(case_name)
+        return group_timeseries((meta['prom_name'] for meta in outputs.values()), traj_name)
@@ -1,3 +1,14 @@
+# Number of changes made to metadata dictionaries by add_meta_data and update_meta_data.
+# Anything cached from the contents of a metadata dictionary (see get_metadata_index) is only
+# valid for the version it was built at.
+_metadata_version = 0
+
+
+def get_metadata_version():
+    """Return the number of changes made to metadata by add_meta_data and update_meta_data."""
+    return _metadata_version
+
+
 def add_meta_data(
     key: str,
     meta_data: dict,
@@ -119,6 +130,9 @@ def add_meta_data(
         'multivalue': multivalue,
     }
 
+    global _metadata_version
+    _metadata_version += 1
+
 
 def update_meta_data(
     key: str,
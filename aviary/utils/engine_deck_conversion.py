@@ -9,8 +9,9 @@ from enum import Enum
 import numpy as np
 import openmdao.api as om
 from openmdao.components.interp_util.interp import InterpND
+from openmdao.utils.units import convert_units
 
-from aviary.subsystems.atmosphere.atmosphere import Atmosphere
+from aviary.subsystems.atmosphere.standard_atmosphere import standard_atmosphere
 from aviary.subsystems.propulsion.engine_deck import normalize
 from aviary.subsystems.propulsion.utils import EngineModelVariables, default_units
 from aviary.utils.conversion_utils import _parse, _read_map, _rep
@@ -210,45 +211,8 @@ def EngineDeckConverter(input_file, output_file, data_format: EngineDeckType):
 
         if compute_T4:
             # compute T4 using atmospheric model
-            prob = om.Problem()
-
-            prob.model.add_subsystem(
-                'T4T2', om.IndepVarComp('T4:T2', T4T2, units='unitless'), promotes=['*']
-            )
-
-            prob.model.add_subsystem(
-                Dynamic.Atmosphere.MACH,
-                om.IndepVarComp(Dynamic.Atmosphere.MACH, data[MACH], units='unitless'),
-                promotes=['*'],
-            )
-
-            prob.model.add_subsystem(
-                Dynamic.Mission.ALTITUDE,
-                om.IndepVarComp(Dynamic.Mission.ALTITUDE, data[ALTITUDE], units='ft'),
-                promotes=['*'],
-            )
-
-            prob.model.add_subsystem(
-                name='atmosphere',
-                subsys=Atmosphere(num_nodes=len(data[MACH])),
-                promotes_inputs=[Dynamic.Mission.ALTITUDE],
-                promotes_outputs=[Dynamic.Atmosphere.TEMPERATURE],
-            )
-
-            prob.model.add_subsystem(
-                name='conversion',
-                subsys=AtmosCalc(num_nodes=len(data[MACH])),
-                promotes_inputs=[
-                    Dynamic.Atmosphere.MACH,
-                    Dynamic.Atmosphere.TEMPERATURE,
-                ],
-                promotes_outputs=['t2'],
-            )
-
-            prob.setup()
-            prob.run_model()
-
-            T2 = prob.get_val('t2')
+            temperature, _ = _standard_atmosphere(data[ALTITUDE])
+            T2, _ = _inlet_conditions(data[MACH], temperature)
             T4 = T2 * T4T2
             data[TEMPERATURE] = T4
             # Throttle is T4 normalized from 0 to 1 (T4max)
@@ -541,57 +505,12 @@ def _generate_flight_idle(data, T4T2, ref_sls_airflow, ref_sfn_idle):
 
     nn = len(mach_list)
 
-    prob = om.Problem()
-
-    prob.model.add_subsystem(
-        Dynamic.Atmosphere.MACH,
-        om.IndepVarComp(Dynamic.Atmosphere.MACH, mach_list, units='unitless'),
-        promotes=['*'],
-    )
-
-    prob.model.add_subsystem(
-        Dynamic.Mission.ALTITUDE,
-        om.IndepVarComp(Dynamic.Mission.ALTITUDE, alt_list, units='ft'),
-        promotes=['*'],
-    )
-
-    prob.model.add_subsystem(
-        name='atmosphere',
-        subsys=Atmosphere(num_nodes=nn),
-        promotes_inputs=[Dynamic.Mission.ALTITUDE],
-        promotes_outputs=[
-            Dynamic.Atmosphere.TEMPERATURE,
-            Dynamic.Atmosphere.STATIC_PRESSURE,
-        ],
-    )
-
-    prob.model.add_subsystem(
-        name='conversion',
-        subsys=AtmosCalc(num_nodes=nn),
-        promotes_inputs=[
-            Dynamic.Atmosphere.MACH,
-            Dynamic.Atmosphere.TEMPERATURE,
-            Dynamic.Atmosphere.STATIC_PRESSURE,
-        ],
-        promotes_outputs=['t2', 'p2'],
-    )
-
-    prob.model.add_subsystem(
-        name='flight_idle',
-        subsys=CalculateIdle(
-            num_nodes=nn, ref_sfn_idle=ref_sfn_idle, ref_sls_airflow=ref_sls_airflow
-        ),
-        promotes_inputs=['t2', 'p2', 'pct_corr_airflow_idle', 'sfc_idle'],
-        promotes_outputs=['idle_thrust', 'idle_fuelflow'],
+    temperature, pressure = _standard_atmosphere(alt_list)
+    t2, p2 = _inlet_conditions(mach_list, temperature, pressure)
+    idle_thrust, idle_fuelflow = _idle_performance(
+        t2, p2, ref_sls_airflow=ref_sls_airflow, ref_sfn_idle=ref_sfn_idle
     )
 
-    prob.setup()
-
-    prob.run_model()
-
-    idle_thrust = prob.get_val('idle_thrust')
-    idle_fuelflow = prob.get_val('idle_fuelflow')
-
     data[MACH] = np.append(data[MACH], mach_list)
     data[ALTITUDE] = np.append(data[ALTITUDE], alt_list)
     data[THRUST] = np.append(data[THRUST], idle_thrust)
@@ -605,6 +524,45 @@ _PSLS_PSF = 2116.22  # SLS pressure in psf
 _TSLS_DEGR = 518.67  # SLS temperature in deg R
 
 
+def _standard_atmosphere(altitude):
+    """
+    Return the temperature (degR) and static pressure (psf) of the 1976 standard atmosphere
+    at an array of geodetic altitudes (ft).
+
+    This evaluates the same tables as the Atmosphere component, directly on arrays, so
+    converting a deck does not require building and running an OpenMDAO problem.
+    """
+    values = standard_atmosphere(np.asarray(altitude, dtype=float), h_def='geodetic')
+
+    return values['temp'], convert_units(values['pres'], 'psi', 'psf')
+
+
+def _inlet_conditions(mach, temperature, pressure=_PSLS_PSF):
+    """Return the engine inlet total temperature and pressure, T2 and P2."""
+    gamma = 1.4
+    t2 = temperature * (1 + 0.5 * (gamma - 1) * mach**2)
+    p2 = pressure * (t2 / temperature) ** (gamma / (gamma - 1))
+
+    return t2, p2
+
+
+def _idle_performance(
+    t2, p2, ref_sls_airflow=1.0, ref_sfn_idle=1.0, pct_corr_airflow_idle=0.5, sfc_idle=1.0
+):
+    """
+    Return the idle thrust (lbf) and fuel flow (lbm/h) of a GASP engine at the given inlet
+    conditions.
+    """
+    rthet2 = np.sqrt(t2 / _TSLS_DEGR)
+    delta2 = p2 / _PSLS_PSF
+
+    airflow_ref = pct_corr_airflow_idle * ref_sls_airflow  # don't un-correct
+    thrust_ref = airflow_ref * delta2 / rthet2 * ref_sfn_idle
+    fuelflow_ref = thrust_ref * sfc_idle
+
+    return thrust_ref, fuelflow_ref
+
+
 class CalculateIdle(om.ExplicitComponent):
     """
     Calculates idle conditions of a GASP engine at a specified flight condition
@@ -648,19 +606,14 @@ class CalculateIdle(om.ExplicitComponent):
             sfc_idle,
         ) = inputs.values()
 
-        ref_sls_airflow = self.options['ref_sls_airflow']
-        ref_sfn_idle = self.options['ref_sfn_idle']
-
-        rthet2 = np.sqrt(t2 / _TSLS_DEGR)
-        delta2 = p2 / _PSLS_PSF
-
-        airflow_ref = pct_corr_airflow_idle * ref_sls_airflow  # don't un-correct
-        thrust_ref = airflow_ref * delta2 / rthet2 * ref_sfn_idle
-        fuelflow_ref = thrust_ref * sfc_idle
-
-        outputs['idle_thrust'] = thrust_ref
-        # outputs["idle_airflow"] = airflow_ref
-        outputs['idle_fuelflow'] = fuelflow_ref
+        outputs['idle_thrust'], outputs['idle_fuelflow'] = _idle_performance(
+            t2,
+            p2,
+            ref_sls_airflow=self.options['ref_sls_airflow'],
+            ref_sfn_idle=self.options['ref_sfn_idle'],
+            pct_corr_airflow_idle=pct_corr_airflow_idle,
+            sfc_idle=sfc_idle,
+        )
 
 
 class AtmosCalc(om.ExplicitComponent):
@@ -697,12 +650,7 @@ class AtmosCalc(om.ExplicitComponent):
     def compute(self, inputs, outputs):
         mach, T, P = inputs.values()
 
-        gamma = 1.4
-        t2 = T * (1 + 0.5 * (gamma - 1) * mach**2)
-        p2 = P * (t2 / T) ** (gamma / (gamma - 1))
-
-        outputs['t2'] = t2
-        outputs['p2'] = p2
+        outputs['t2'], outputs['p2'] = _inlet_conditions(mach, T, P)
 
 
 def _setup_EDC_parser(parser):
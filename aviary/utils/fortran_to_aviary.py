@@ -17,6 +17,7 @@ ARNGE(1) = 3600 !target range in nautical miles
 """
 
 import csv
+import functools
 import getpass
 import re
 from datetime import datetime
@@ -59,7 +60,7 @@ def fortran_to_aviary(
     vehicle_data = {
         'input_values': NamedValues(),
         'unused_values': NamedValues(),
-        'initialization_guesses': initialization_guesses,
+        'initialization_guesses': dict(initialization_guesses),
     }
 
     fortran_deck: Path = get_path(fortran_deck, verbosity=verbosity)
@@ -432,6 +433,13 @@ def generate_aviary_names(legacy_code):
     Create a dictionary that maps the specified Fortran code to Aviary variable names.
     Each Aviary variable will have a list of matching Fortran names.
     """
+    # The map only depends on the core metadata, so it is built once per legacy code and
+    # copied, which matters when many decks are converted in the same process.
+    return dict(_generate_aviary_names(legacy_code))
+
+
+@functools.lru_cache(maxsize=None)
+def _generate_aviary_names(legacy_code):
     alternate_names = {}
     for key in _MetaData.keys():
         historical_dict = _MetaData[key]['historical_name']
@@ -453,14 +461,15 @@ def update_name(alternate_names, var_name, verbosity=Verbosity.BRIEF):
         var_ind = None
 
     all_equivalent_names = []
+    lower_name = var_name.lower()
     for key, list_of_names in alternate_names.items():
         if list_of_names is not None:
             for altname in list_of_names:
                 altname = altname.lower()
-                if altname.endswith(var_name.lower()):
+                if altname.endswith(lower_name):
                     all_equivalent_names.append(key)
                     continue
-                elif var_ind is not None and altname.endswith(f'{var_name.lower()}({var_ind})'):
+                elif var_ind is not None and altname.endswith(f'{lower_name}({var_ind})'):
                     all_equivalent_names.append(key)
                     var_ind = None
                     continue
@@ -10,7 +10,7 @@ import openmdao.api as om
 
 from aviary.utils.aviary_values import AviaryValues, get_items
 from aviary.variable_info.enums import Verbosity
-from aviary.variable_info.functions import add_aviary_input, add_aviary_output
+from aviary.variable_info.functions import add_aviary_input, add_aviary_output, get_input_default
 from aviary.variable_info.variable_meta_data import _MetaData
 
 
@@ -96,12 +96,7 @@ def set_aviary_input_defaults(model, inputs, aviary_inputs: AviaryValues, meta_d
         metadata by default.
     """
     for key in inputs:
-        if key in aviary_inputs:
-            val, units = aviary_inputs.get_item(key)
-        else:
-            val = meta_data[key]['default_value']
-            units = meta_data[key]['units']
-
+        val, units = get_input_default(key, aviary_inputs, meta_data)
         model.set_input_defaults(key, val=val, units=units)
 
 
@@ -66,7 +66,8 @@ def merge_2_meta_data_dicts(dict1, dict2):
         # check that the metadata in both dictionaries associated with the same key is the same
         value1, value2 = dict1[key], dict2[key]
         # throw an error if the dicts have the same key with different metadata
-        if not almost_equal(value1, value2):
+        # (copies of the core metadata share their entries, which need no comparison)
+        if value1 is not value2 and not almost_equal(value1, value2):
             raise ValueError(
                 f'You have attempted to merge metadata dictionaries that contain the same variable with different metadata. The offending variable present in multiple dictionaries is "{key}".'
             )
@@ -90,6 +90,13 @@ def preprocess_crewpayload(aviary_options: AviaryValues, meta_data=_MetaData, ve
     ):
         design_passenger_count += aviary_options.get_val(key)
 
+    # A flight without passengers is requested by setting the total payload mass to zero,
+    # which keeps zero as-flown passengers from being replaced by the design values
+    no_passengers = (
+        Aircraft.CrewPayload.TOTAL_PAYLOAD_MASS in aviary_options
+        and aviary_options.get_val(Aircraft.CrewPayload.TOTAL_PAYLOAD_MASS, 'lbm') == 0.0
+    )
+
     # Create summary value (num_pax) if it was not assigned by the user
     # or if it was set to it's default value of zero
     if passenger_count != 0 and aviary_options.get_val(Aircraft.CrewPayload.NUM_PASSENGERS) == 0:
@@ -184,7 +191,9 @@ def preprocess_crewpayload(aviary_options: AviaryValues, meta_data=_MetaData, ve
                 'are equal.'
             )
         aviary_options.set_val(Aircraft.CrewPayload.Design.NUM_PASSENGERS, num_pax)
-    elif design_passenger_count != 0 and num_pax == 0 and passenger_count == 0:
+    elif (
+        design_passenger_count != 0 and num_pax == 0 and passenger_count == 0 and not no_passengers
+    ):
         if verbosity >= Verbosity.VERBOSE:
             warnings.warn(
                 'User has specified Design.NUM_* passenger values but CrewPyaload.NUM_* '
@@ -207,7 +216,7 @@ def preprocess_crewpayload(aviary_options: AviaryValues, meta_data=_MetaData, ve
             aviary_options.get_val(Aircraft.CrewPayload.Design.NUM_TOURIST_CLASS),
         )
     # user has not supplied detailed information on design but has supplied summary information on passengers
-    elif design_num_pax != 0 and num_pax == 0:
+    elif design_num_pax != 0 and num_pax == 0 and not no_passengers:
         if verbosity >= Verbosity.VERBOSE:
             warnings.warn(
                 'User has specified Design.NUM_PASSENGERS but '
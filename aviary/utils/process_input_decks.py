@@ -15,6 +15,7 @@ Functions:
     initialization_guessing(aircraft_values): Set initial guesses for aircraft parameters based on problem type and other factors.
 """
 
+import functools
 import warnings
 from operator import eq, ge, gt, le, lt, ne
 
@@ -124,6 +125,58 @@ def create_vehicle(vehicle_deck='', meta_data=_MetaData, verbosity=Verbosity.BRI
     return aircraft_values, initialization_guesses
 
 
+@functools.lru_cache(maxsize=None)
+def _is_units(string):
+    """Return whether a string is a valid unit, caching the result for repeated units."""
+    return valid_units(string)
+
+
+def _tokenize_deck(vehicle_deck):
+    """
+    Split a vehicle deck into its entries in a single pass over the file.
+
+    Parameters
+    ----------
+    vehicle_deck (str): The vehicle deck file path.
+
+    Returns
+    -------
+    list: A tuple of the line number, variable name, list of value strings, units (None if
+    not given) and comment of each entry of the deck.
+    """
+    entries = []
+
+    with open(vehicle_deck, newline='') as f_in:
+        lines = f_in.read().splitlines()
+
+    for line_number, line in enumerate(lines, start=1):
+        tmp = [*line.split('#', 1), '']
+        line, comment = tmp[0], tmp[1]  # anything after the first # is a comment
+
+        data = ''.join(line.rstrip(',').split())  # remove all white space
+
+        if len(data) == 0:
+            continue  # skip line it contained only commas
+
+        # remove any elements that are empty (caused by trailing commas or extra commas)
+        data_list = [dat for dat in data.split(',') if dat != '']
+
+        # continue if there's no data in the line but there are commas
+        # this might occur if someone edits a .csv file in Excel
+        if len(data_list) == 0:
+            continue
+
+        var_name = data_list.pop(0)
+        data_units = None
+        if data_list and _is_units(data_list[-1]):
+            # if the last element is a unit, remove it from the list and update the variable's units
+            data_units = data_list.pop()
+
+        entries.append((line_number, var_name, data_list, data_units, comment))
+
+    return entries
+
+
 def parse_inputs(
     vehicle_deck,
     aircraft_values: AviaryValues = None,
@@ -134,6 +187,9 @@ def parse_inputs(
     Parses the input files and updates the aircraft values and initial guesses. The function reads the
     vehicle deck file, processes each line, and updates the aircraft_values object based on the data found.
 
+    The whole deck is validated before an error is raised, so that every invalid entry is
+    reported at once, with its line number.
+
     Parameters
     ----------
     vehicle_deck (str): The vehicle deck file path.
@@ -150,70 +206,63 @@ def parse_inputs(
     if initialization_guesses is None:
         initialization_guesses = {}
 
-    guess_names = list(initialization_guesses.keys())
+    guess_names = set(initialization_guesses)
+    errors = []
+
+    for line_number, var_name, data_list, data_units, comment in _tokenize_deck(vehicle_deck):
+        if not data_list:
+            if var_name in meta_data:
+                errors.append((line_number, ValueError(f"No value was given for '{var_name}'.")))
+            continue
+
+        meta = meta_data.get(var_name)
+
+        var_value = convert_strings_to_data(data_list)
+        # If var_value is length 1 list and is not supposed to be a list, pull out
+        # individual value. Otherwise, convert list to numpy array
+        if len(var_value) <= 1:
+            if meta is not None and meta['multivalue']:
+                # if data is numeric, convert to numpy array
+                if isinstance(var_value[0], (int, float)):
+                    var_value = np.array(var_value)
+            else:
+                var_value = var_value[0]
 
-    with open(vehicle_deck, newline='') as f_in:
-        for line in f_in:
-            data_units = None
-
-            tmp = [*line.split('#', 1), '']
-            line, comment = tmp[0], tmp[1]  # anything after the first # is a comment
-
-            data = ''.join(line.rstrip(',').split())  # remove all white space
-
-            if len(data) == 0:
-                continue  # skip line it contained only commas
-
-            # remove any elements that are empty (caused by trailing commas or extra commas)
-            data_list = [dat for dat in data.split(',') if dat != '']
-
-            # continue if there's no data in the line but there are commas
-            # this might occur if someone edits a .csv file in Excel
-            if len(data_list) == 0:
-                continue
-            var_name = data_list.pop(0)
-            if valid_units(data_list[-1]):
-                # if the last element is a unit, remove it from the list and update the variable's units
-                data_units = data_list.pop()
-
-            var_value = convert_strings_to_data(data_list)
-            # If var_value is length 1 list and is not supposed to be a list, pull out
-            # individual value. Otherwise, convert list to numpy array
-            if len(var_value) <= 1:
-                if var_name in meta_data and meta_data[var_name]['multivalue']:
-                    # if data is numeric, convert to numpy array
-                    if isinstance(var_value[0], (int, float)):
-                        var_value = np.array(var_value)
-                else:
-                    var_value = var_value[0]
-
-            if var_name in meta_data.keys():
-                if data_units is None:
-                    data_units = meta_data[var_name]['units']
+        if meta is not None:
+            if data_units is None:
+                data_units = meta['units']
+            try:
                 aircraft_values.set_val(var_name, var_value, data_units, meta_data)
-                continue
-
-            elif var_name in guess_names:
-                # all initial guesses take only a single value
-                # get values from supplied dictionary
-                initialization_guesses[var_name] = var_value
-                continue
-
-            elif var_name.startswith('initialization_guesses:'):
-                # get values labeled as initialization_guesses in .csv input file
-                initialization_guesses[var_name.removeprefix('initialization_guesses:')] = var_value
-                continue
-
-            elif ':' in var_name:
-                warnings.warn(
-                    f"Variable '{var_name}' is not in meta_data nor in 'guess_names'. "
-                    'It will be ignored.',
-                    UserWarning,
-                )
-                continue
+            except (TypeError, ValueError, KeyError) as err:
+                errors.append((line_number, err))
+            continue
+
+        elif var_name in guess_names:
+            # all initial guesses take only a single value
+            # get values from supplied dictionary
+            initialization_guesses[var_name] = var_value
+            continue
+
+        elif var_name.startswith('initialization_guesses:'):
+            # get values labeled as initialization_guesses in .csv input file
+            initialization_guesses[var_name.removeprefix('initialization_guesses:')] = var_value
+            continue
+
+        elif ':' in var_name:
+            warnings.warn(
+                f"Variable '{var_name}' is not in meta_data nor in 'guess_names'. "
+                'It will be ignored.',
+                UserWarning,
+            )
+            continue
+
+        if aircraft_values.get_val(Settings.VERBOSITY) >= Verbosity.VERBOSE:
+            print('Unused:', var_name, var_value, comment)
 
-            if aircraft_values.get_val(Settings.VERBOSITY) >= Verbosity.VERBOSE:
-                print('Unused:', var_name, var_value, comment)
+    if errors:
+        # raise the type of the first error, so callers can still catch it as before
+        details = '\n'.join(f'    line {line_number}: {err}' for line_number, err in errors)
+        raise type(errors[0][1])(f'Invalid entries found in {vehicle_deck}:\n{details}')
 
     return aircraft_values, initialization_guesses
 
@@ -0,0 +1,437 @@
+"""
+Lightweight instrumentation of Aviary models to find where time is spent during a run.
+
+When profiling is enabled, the methods that do the actual work in an Aviary model
+(component compute/compute_partials, nonlinear and linear solvers, subsystem builder
+methods and SimuPyProblem right-hand-side calls) are wrapped on each instance with timers
+and counters. Nothing is wrapped when profiling is disabled, so there is no overhead.
+
+Results are grouped by phase (the trajectory phase a system lives in, or the top-level
+group name such as "pre_mission" for systems outside the trajectory).
+"""
+
+import json
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from pathlib import Path
+
+import openmdao.api as om
+from openmdao.utils.mpi import MPI
+
+# Profiler used by objects created outside of an AviaryProblem's model, such as the
+# sub-problems built by SimuPyProblem. None when profiling is disabled.
+_active_profiler = None
+
+
+def get_active_profiler():
+    """Return the currently active AviaryProfiler, or None if profiling is disabled."""
+    return _active_profiler
+
+
+def set_active_profiler(profiler):
+    """
+    Set the AviaryProfiler used by objects that are built outside of the AviaryProblem
+    model. Pass None to disable.
+    """
+    global _active_profiler
+    _active_profiler = profiler
+
+
+@contextmanager
+def active_profiler(profiler):
+    """
+    Make the AviaryProfiler the active one within the context, then restore the one that
+    was active before, even if an exception is raised. Pass None to disable profiling
+    within the context.
+    """
+    previous = get_active_profiler()
+    set_active_profiler(profiler)
+    try:
+        yield profiler
+    finally:
+        set_active_profiler(previous)
+
+
+def _phase_from_pathname(pathname):
+    """Return the name of the phase (or top-level group) that owns a system path."""
+    if not pathname:
+        return 'model'
+
+    parts = pathname.split('.')
+
+    if parts[0] == 'traj' and len(parts) > 1:
+        if parts[1] == 'phases' and len(parts) > 2:
+            return parts[2]
+        return parts[1]
+
+    return parts[0]
+
+
+class _Timing:
+    """Accumulated call count and wall time of one instrumented method."""
+
+    __slots__ = ('calls', 'time')
+
+    def __init__(self):
+        self.calls = 0
+        self.time = 0.0
+
+
+class AviaryProfiler:
+    """
+    Collects call counts and cumulative wall time for an Aviary model.
+
+    Attributes
+    ----------
+    components : dict
+        Timings of component methods, keyed by (phase, component class name, method).
+    nonlinear_solvers : dict
+        Timings of nonlinear solves, keyed by (phase, solver name).
+    nonlinear_iterations : dict
+        Total nonlinear solver iterations, keyed by (phase, solver name).
+    linear_solvers : dict
+        Timings of linear solves and linearizations, keyed by (phase, solver name, method).
+    builders : dict
+        Timings of subsystem builder methods, keyed by (builder name, method).
+    rhs : dict
+        Timings of SimuPyProblem right-hand-side evaluations, keyed by (problem name,
+        method).
+    """
+
+    def __init__(self):
+        self.components = defaultdict(_Timing)
+        self.nonlinear_solvers = defaultdict(_Timing)
+        self.nonlinear_iterations = defaultdict(int)
+        self.linear_solvers = defaultdict(_Timing)
+        self.builders = defaultdict(_Timing)
+        self.rhs = defaultdict(_Timing)
+
+        # ids of objects that have already been wrapped, so nothing is timed twice
+        self._instrumented = set()
+
+    def _wrap(self, obj, method_name, timing, post=None):
+        """Replace obj.method_name with a timed version that accumulates into timing."""
+        method = getattr(obj, method_name)
+
+        def timed(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                timing.time += time.perf_counter() - start
+                timing.calls += 1
+                if post is not None:
+                    post()
+
+        setattr(obj, method_name, timed)
+
+    def instrument_builder(self, builder):
+        """
+        Time the build methods of a subsystem builder.
+
+        Parameters
+        ----------
+        builder : SubsystemBuilderBase
+            Builder to instrument.
+        """
+        if id(builder) in self._instrumented:
+            return
+        self._instrumented.add(id(builder))
+
+        for method_name in ('build_pre_mission', 'build_mission', 'build_post_mission'):
+            if hasattr(builder, method_name):
+                self._wrap(builder, method_name, self.builders[builder.name, method_name])
+
+    def instrument_model(self, model, phase=None):
+        """
+        Time every component and solver in a model that has been set up.
+
+        Parameters
+        ----------
+        model : System
+            Model to instrument, usually Problem.model after setup().
+        phase : str or None
+            If given, all timings are attributed to this phase instead of the phase
+            found from each system's path.
+        """
+        for system in model.system_iter(include_self=True, recurse=True):
+            if id(system) in self._instrumented:
+                continue
+            self._instrumented.add(id(system))
+
+            sys_phase = phase if phase is not None else _phase_from_pathname(system.pathname)
+
+            if isinstance(system, om.ExplicitComponent):
+                cls = type(system)
+                self._wrap(system, 'compute', self.components[sys_phase, cls.__name__, 'compute'])
+                # only wrap partials that are actually provided by the component
+                if cls.compute_partials is not om.ExplicitComponent.compute_partials:
+                    self._wrap(
+                        system,
+                        'compute_partials',
+                        self.components[sys_phase, cls.__name__, 'compute_partials'],
+                    )
+
+            elif isinstance(system, om.ImplicitComponent):
+                cls = type(system)
+                for method_name, category in (
+                    ('apply_nonlinear', 'compute'),
+                    ('solve_nonlinear', 'compute'),
+                    ('linearize', 'compute_partials'),
+                ):
+                    if getattr(cls, method_name) is not getattr(om.ImplicitComponent, method_name):
+                        self._wrap(
+                            system,
+                            method_name,
+                            self.components[sys_phase, cls.__name__, category],
+                        )
+
+            self._instrument_solvers(system, sys_phase)
+
+    def _instrument_solvers(self, system, phase):
+        nl_solver = system.nonlinear_solver
+        if nl_solver is not None and not isinstance(nl_solver, om.NonlinearRunOnce):
+            if id(nl_solver) not in self._instrumented:
+                self._instrumented.add(id(nl_solver))
+                key = (phase, nl_solver.SOLVER)
+
+                def count_iterations(solver=nl_solver, key=key):
+                    self.nonlinear_iterations[key] += solver._iter_count
+
+                # older versions of OpenMDAO call _solve_with_failure_check directly
+                if hasattr(nl_solver, '_solve_with_cache_check'):
+                    method_name = '_solve_with_cache_check'
+                else:
+                    method_name = '_solve_with_failure_check'
+
+                self._wrap(
+                    nl_solver, method_name, self.nonlinear_solvers[key], post=count_iterations
+                )
+
+        ln_solver = system.linear_solver
+        if ln_solver is not None and not isinstance(ln_solver, om.LinearRunOnce):
+            if id(ln_solver) not in self._instrumented:
+                self._instrumented.add(id(ln_solver))
+                self._wrap(
+                    ln_solver, 'solve', self.linear_solvers[phase, ln_solver.SOLVER, 'solve']
+                )
+                # linearize is where direct solvers factor their matrix
+                self._wrap(
+                    ln_solver,
+                    '_linearize',
+                    self.linear_solvers[phase, ln_solver.SOLVER, 'linearize'],
+                )
+
+    def instrument_simupy_problem(self, simupy_problem, problem_name):
+        """
+        Time the right-hand-side calls and the ODE model of a SimuPyProblem.
+
+        Parameters
+        ----------
+        simupy_problem : SimuPyProblem
+            Problem to instrument. Its om.Problem must already be set up.
+        problem_name : str
+            Name used to group the timings, usually the SGM phase name.
+        """
+        if id(simupy_problem) in self._instrumented:
+            return
+        self._instrumented.add(id(simupy_problem))
+
+        problem_name = problem_name or 'simupy'
+
+        for method_name in ('state_equation_function', 'output_equation_function'):
+            self._wrap(simupy_problem, method_name, self.rhs[problem_name, method_name])
+
+        self.instrument_model(simupy_problem.prob.model, phase=problem_name)
+
+    def get_results(self):
+        """
+        Return all collected data as a JSON-serializable dictionary.
+
+        Returns
+        -------
+        dict
+            Per-phase summary and detailed timings.
+        """
+        phases = defaultdict(
+            lambda: {
+                'compute_calls': 0,
+                'compute_time': 0.0,
+                'compute_partials_calls': 0,
+                'compute_partials_time': 0.0,
+                'nonlinear_solves': 0,
+                'nonlinear_iterations': 0,
+                'nonlinear_solve_time': 0.0,
+                'linear_solves': 0,
+                'linear_solve_time': 0.0,
+                'linearize_time': 0.0,
+                'rhs_calls': 0,
+                'rhs_time': 0.0,
+            }
+        )
+
+        components = []
+        for (phase, class_name, method), timing in self.components.items():
+            if timing.calls == 0:
+                continue
+            phases[phase][method + '_calls'] += timing.calls
+            phases[phase][method + '_time'] += timing.time
+            components.append(
+                {
+                    'phase': phase,
+                    'class': class_name,
+                    'method': method,
+                    'calls': timing.calls,
+                    'time': timing.time,
+                }
+            )
+
+        nonlinear_solvers = []
+        for (phase, solver), timing in self.nonlinear_solvers.items():
+            if timing.calls == 0:
+                continue
+            iterations = self.nonlinear_iterations[phase, solver]
+            phases[phase]['nonlinear_solves'] += timing.calls
+            phases[phase]['nonlinear_iterations'] += iterations
+            phases[phase]['nonlinear_solve_time'] += timing.time
+            nonlinear_solvers.append(
+                {
+                    'phase': phase,
+                    'solver': solver,
+                    'solves': timing.calls,
+                    'iterations': iterations,
+                    'time': timing.time,
+                }
+            )
+
+        linear_solvers = []
+        for (phase, solver, method), timing in self.linear_solvers.items():
+            if timing.calls == 0:
+                continue
+            if method == 'solve':
+                phases[phase]['linear_solves'] += timing.calls
+                phases[phase]['linear_solve_time'] += timing.time
+            else:
+                phases[phase]['linearize_time'] += timing.time
+            linear_solvers.append(
+                {
+                    'phase': phase,
+                    'solver': solver,
+                    'method': method,
+                    'calls': timing.calls,
+                    'time': timing.time,
+                }
+            )
+
+        rhs = []
+        for (problem_name, method), timing in self.rhs.items():
+            if timing.calls == 0:
+                continue
+            phases[problem_name]['rhs_calls'] += timing.calls
+            phases[problem_name]['rhs_time'] += timing.time
+            rhs.append(
+                {
+                    'phase': problem_name,
+                    'method': method,
+                    'calls': timing.calls,
+                    'time': timing.time,
+                }
+            )
+
+        builders = [
+            {'builder': name, 'method': method, 'calls': timing.calls, 'time': timing.time}
+            for (name, method), timing in self.builders.items()
+            if timing.calls > 0
+        ]
+
+        def by_time(entry):
+            return -entry['time']
+
+        return {
+            'phases': dict(phases),
+            'components': sorted(components, key=by_time),
+            'nonlinear_solvers': sorted(nonlinear_solvers, key=by_time),
+            'linear_solvers': sorted(linear_solvers, key=by_time),
+            'simupy_rhs': sorted(rhs, key=by_time),
+            'builders': sorted(builders, key=by_time),
+        }
+
+    def write_reports(self, reports_dir, max_components=30):
+        """
+        Write the profiling results to "profile.json" and "profile.md" in reports_dir.
+
+        Parameters
+        ----------
+        reports_dir : str or Path
+            Folder the reports are written to.
+        max_components : int
+            Number of most expensive component methods listed in the markdown report.
+        """
+        if MPI and MPI.COMM_WORLD.rank != 0:
+            return
+
+        reports_dir = Path(reports_dir)
+        reports_dir.mkdir(parents=True, exist_ok=True)
+
+        results = self.get_results()
+
+        with open(reports_dir / 'profile.json', 'w') as f:
+            json.dump(results, f, indent=1)
+            print(file=f)  # avoid 'no newline at end of file' message
+
+        with open(reports_dir / 'profile.md', 'w') as f:
+            f.write('# PROFILE\n')
+            f.write('Times are cumulative wall clock seconds. Solver times include the time ')
+            f.write('spent in the systems they solve.\n')
+
+            f.write('\n## Phases\n')
+            f.write(
+                '| Phase | Compute Calls | Compute Time | Partials Calls | Partials Time '
+                '| Newton/NL Solves | NL Iterations | NL Solve Time | Linear Solves '
+                '| Linear Solve Time | Linearize Time | RHS Calls | RHS Time |\n'
+            )
+            f.write('| :- |' + ' -: |' * 12 + '\n')
+            for phase, data in results['phases'].items():
+                f.write(
+                    f'| {phase} | {data["compute_calls"]} | {data["compute_time"]:.4f} '
+                    f'| {data["compute_partials_calls"]} '
+                    f'| {data["compute_partials_time"]:.4f} '
+                    f'| {data["nonlinear_solves"]} | {data["nonlinear_iterations"]} '
+                    f'| {data["nonlinear_solve_time"]:.4f} | {data["linear_solves"]} '
+                    f'| {data["linear_solve_time"]:.4f} | {data["linearize_time"]:.4f} '
+                    f'| {data["rhs_calls"]} | {data["rhs_time"]:.4f} |\n'
+                )
+
+            f.write('\n## Most Expensive Components\n')
+            f.write('| Phase | Component | Method | Calls | Time |\n')
+            f.write('| :- | :- | :- | -: | -: |\n')
+            for entry in results['components'][:max_components]:
+                f.write(
+                    f'| {entry["phase"]} | {entry["class"]} | {entry["method"]} '
+                    f'| {entry["calls"]} | {entry["time"]:.4f} |\n'
+                )
+
+            f.write('\n## Solvers\n')
+            f.write('| Phase | Solver | Calls | Iterations | Time |\n')
+            f.write('| :- | :- | -: | -: | -: |\n')
+            for entry in results['nonlinear_solvers']:
+                f.write(
+                    f'| {entry["phase"]} | {entry["solver"]} | {entry["solves"]} '
+                    f'| {entry["iterations"]} | {entry["time"]:.4f} |\n'
+                )
+            for entry in results['linear_solvers']:
+                f.write(
+                    f'| {entry["phase"]} | {entry["solver"]} ({entry["method"]}) '
+                    f'| {entry["calls"]} | | {entry["time"]:.4f} |\n'
+                )
+
+            if results['builders']:
+                f.write('\n## Subsystem Builders\n')
+                f.write('| Builder | Method | Calls | Time |\n')
+                f.write('| :- | :- | -: | -: |\n')
+                for entry in results['builders']:
+                    f.write(
+                        f'| {entry["builder"]} | {entry["method"]} | {entry["calls"]} '
+                        f'| {entry["time"]:.4f} |\n'
+                    )
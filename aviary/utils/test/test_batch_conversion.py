@@ -0,0 +1,79 @@
+import shutil
+import unittest
+from pathlib import Path
+
+from openmdao.utils.testing_utils import use_tempdirs
+
+from aviary.utils.batch_conversion import convert_batch
+from aviary.utils.functions import get_path
+from aviary.variable_info.enums import Verbosity
+
+
+@use_tempdirs
+class TestBatchConversion(unittest.TestCase):
+    """Test conversion of a library of decks, and skipping of unchanged decks."""
+
+    def setUp(self):
+        library = Path('library')
+        library.mkdir()
+
+        deck = get_path('utils/test/data/turbofan_23k_1.eng')
+        shutil.copy(deck, library)
+        shutil.copy(deck, library / 'turbofan_23k_2.eng')
+
+    def convert(self, **kwargs):
+        results = convert_batch(
+            'engine',
+            'GASP',
+            ['library'],
+            'converted',
+            verbosity=Verbosity.QUIET,
+            **kwargs,
+        )
+
+        return {result['deck'].name: result['status'] for result in results}
+
+    def test_engine_library(self):
+        status = self.convert()
+        self.assertEqual(
+            status, {'turbofan_23k_1.eng': 'converted', 'turbofan_23k_2.eng': 'converted'}
+        )
+        self.assertTrue(Path('converted', 'turbofan_23k_1.deck').is_file())
+        self.assertTrue(Path('converted', 'turbofan_23k_2.deck').is_file())
+
+        # nothing has changed, so nothing is converted again
+        status = self.convert(max_workers=1)
+        self.assertEqual(set(status.values()), {'skipped'})
+
+        # only the modified deck and the deck whose output was removed are converted
+        with open(Path('library', 'turbofan_23k_1.eng'), 'a') as f:
+            f.write('\n')
+        Path('converted', 'turbofan_23k_2.deck').unlink()
+
+        status = self.convert(max_workers=1)
+        self.assertEqual(set(status.values()), {'converted'})
+
+        status = self.convert(max_workers=1, force=True)
+        self.assertEqual(set(status.values()), {'converted'})
+
+    def test_vehicle_decks(self):
+        deck = get_path('models/small_single_aisle/small_single_aisle_GASP.dat')
+
+        results = convert_batch(
+            'fortran_to_aviary', 'GASP', [deck], 'converted', verbosity=Verbosity.QUIET
+        )
+
+        self.assertEqual(results[0]['status'], 'converted')
+        self.assertTrue(Path('converted', 'small_single_aisle_GASP.csv').is_file())
+
+    def test_invalid_deck(self):
+        Path('library', 'bad.eng').write_text('not an engine deck\n')
+
+        status = self.convert(max_workers=1)
+
+        self.assertEqual(status['bad.eng'], 'failed')
+        self.assertEqual(status['turbofan_23k_1.eng'], 'converted')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,93 @@
+import os
+import unittest
+
+import numpy as np
+import openmdao.api as om
+from openmdao.utils.assert_utils import assert_near_equal
+from openmdao.utils.testing_utils import use_tempdirs
+
+from aviary.utils.case_results import clear_case_results_cache, group_timeseries, read_case_results
+
+
+def _record_problem(filename):
+    # mimics the promotions of a dymos trajectory
+    prob = om.Problem()
+    traj = prob.model.add_subsystem('traj', om.Group())
+    phases = traj.add_subsystem('phases', om.Group(), promotes=['*'])
+
+    for phase_name, altitude in (('climb', [0.0, 100.0]), ('cruise', [100.0, 100.0])):
+        phase = phases.add_subsystem(phase_name, om.Group())
+        timeseries = phase.add_subsystem('timeseries', om.Group())
+        comp = timeseries.add_subsystem('timeseries_comp', om.IndepVarComp(), promotes=['*'])
+        comp.add_output('altitude', val=np.array(altitude), units='m')
+        comp.add_output('time', val=np.array([0.0, 60.0]), units='s')
+
+    prob.model.add_subsystem('comp', om.ExecComp('y = 2.0 * x', y={'units': 'ft'}), promotes=['*'])
+
+    prob.add_recorder(om.SqliteRecorder(filename))
+    prob.setup()
+    prob.set_val('x', 3.0)
+    prob.run_model()
+    prob.record('final')
+    prob.cleanup()
+
+    return str(prob.get_outputs_dir() / filename)
+
+
+@use_tempdirs
+class CaseResultsTest(unittest.TestCase):
+    def setUp(self):
+        clear_case_results_cache()
+        self.filename = _record_problem('cases.db')
+
+    def tearDown(self):
+        clear_case_results_cache()
+
+    def test_read_once(self):
+        results = read_case_results(self.filename)
+        self.assertIs(read_case_results(os.path.relpath(self.filename)), results)
+        self.assertIs(results.reader, results.reader)
+
+        self.assertTrue(results.has_case('final'))
+        self.assertFalse(results.has_case('initial'))
+        self.assertIs(results.get_case(), results.get_case('final'))
+
+        # values are looked up by promoted or absolute name, and cached
+        assert_near_equal(results.get_val('y'), [6.0])
+        assert_near_equal(results.get_val('comp.y', units='inch'), [72.0])
+        self.assertIs(results.get_val('y'), results.get_val('y'))
+
+        outputs = results.list_outputs()
+        self.assertEqual(outputs['comp.y']['units'], 'ft')
+        self.assertNotIn('val', outputs['comp.y'])
+
+        # a modified file is read again
+        stat = os.stat(self.filename)
+        os.utime(self.filename, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        self.assertIsNot(read_case_results(self.filename), results)
+
+    def test_timeseries(self):
+        results = read_case_results(self.filename)
+
+        timeseries = results.get_timeseries()
+        self.assertEqual(
+            timeseries,
+            {
+                'climb': {
+                    'altitude': 'traj.climb.timeseries.altitude',
+                    'time': 'traj.climb.timeseries.time',
+                },
+                'cruise': {
+                    'altitude': 'traj.cruise.timeseries.altitude',
+                    'time': 'traj.cruise.timeseries.time',
+                },
+            },
+        )
+        assert_near_equal(results.get_val(timeseries['climb']['altitude'], units='m'), [0.0, 100.0])
+
+        self.assertEqual(results.get_timeseries('other_traj'), {})
+        self.assertEqual(group_timeseries(['traj.climb.timeseries.rates.x', 'y']), {})
+
+
+if __name__ == '__main__':
+    unittest.main()
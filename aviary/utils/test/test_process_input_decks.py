@@ -44,6 +44,26 @@ class TestCreateVehicle(unittest.TestCase):
         self.assertIsNotNone(aircraft_values)
         self.assertIsNotNone(initialization_guesses)
 
+    def test_invalid_entries(self):
+        # Every invalid entry of the deck is reported at once, with its line number.
+        file_path = 'invalid_aircraft.csv'
+
+        with open(file_path, 'w') as f:
+            f.write('aircraft:wing:area,1370,ft**2\n')
+            f.write('aircraft:wing:span,117.8,1,0,ft\n')
+            f.write('# a comment\n')
+            f.write('aircraft:fuselage:length,129.4,lbm\n')
+            f.write('aircraft:wing:sweep\n')
+
+        with self.assertRaises(TypeError) as cm:
+            create_vehicle(file_path)
+
+        msg = str(cm.exception)
+        self.assertIn('line 2: aircraft:wing:span', msg)
+        self.assertIn('line 4: The base units of aircraft:fuselage:length', msg)
+        self.assertIn("line 5: No value was given for 'aircraft:wing:sweep'", msg)
+        self.assertNotIn('line 1', msg)
+
 
 if __name__ == '__main__':
     unittest.main()
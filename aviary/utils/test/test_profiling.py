@@ -0,0 +1,143 @@
+import json
+import unittest
+from copy import deepcopy
+from pathlib import Path
+
+import openmdao.api as om
+from openmdao.core.problem import _clear_problem_names
+from openmdao.utils.testing_utils import use_tempdirs
+
+from aviary.interface.default_phase_info.height_energy import phase_info
+from aviary.interface.methods_for_level1 import run_aviary
+from aviary.utils.profiling import (
+    AviaryProfiler,
+    _phase_from_pathname,
+    active_profiler,
+    get_active_profiler,
+)
+
+
+class _Quadratic(om.ImplicitComponent):
+    def setup(self):
+        self.add_input('b', val=-3.0)
+        self.add_output('x', val=5.0)
+        self.declare_partials('x', ['x', 'b'])
+
+    def apply_nonlinear(self, inputs, outputs, residuals):
+        residuals['x'] = outputs['x'] ** 2 + inputs['b'] * outputs['x'] + 2.0
+
+    def linearize(self, inputs, outputs, partials):
+        partials['x', 'x'] = 2.0 * outputs['x'] + inputs['b']
+        partials['x', 'b'] = outputs['x']
+
+
+class _Double(om.ExplicitComponent):
+    def setup(self):
+        self.add_input('x', val=1.0)
+        self.add_output('y', val=1.0)
+        self.declare_partials('y', 'x', val=2.0)
+
+    def compute(self, inputs, outputs):
+        outputs['y'] = 2.0 * inputs['x']
+
+
+class ProfilerTest(unittest.TestCase):
+    def test_phase_from_pathname(self):
+        self.assertEqual(_phase_from_pathname('traj.phases.climb.rhs_all.aero'), 'climb')
+        self.assertEqual(_phase_from_pathname('traj.climb.rhs'), 'climb')
+        self.assertEqual(_phase_from_pathname('pre_mission.core_mass'), 'pre_mission')
+        self.assertEqual(_phase_from_pathname(''), 'model')
+
+    def test_active_profiler(self):
+        outer = AviaryProfiler()
+        inner = AviaryProfiler()
+
+        with active_profiler(outer):
+            self.assertIs(get_active_profiler(), outer)
+
+            with self.assertRaises(RuntimeError):
+                with active_profiler(inner):
+                    self.assertIs(get_active_profiler(), inner)
+                    raise RuntimeError('failed run')
+
+            # the profiler active before is restored even when the run fails
+            self.assertIs(get_active_profiler(), outer)
+
+        self.assertIsNone(get_active_profiler())
+
+    def test_instrument_model(self):
+        prob = om.Problem()
+        model = prob.model
+        sub = model.add_subsystem('traj', om.Group(), promotes=['*'])
+        phase = sub.add_subsystem('cruise', om.Group(), promotes=['*'])
+        phase.add_subsystem('quad', _Quadratic(), promotes=['*'])
+        phase.add_subsystem('double', _Double(), promotes=['*'])
+        phase.nonlinear_solver = om.NewtonSolver(solve_subsystems=False, iprint=-1)
+        phase.linear_solver = om.DirectSolver()
+
+        prob.setup()
+
+        profiler = AviaryProfiler()
+        profiler.instrument_model(prob.model)
+        # instrumenting twice must not double count
+        profiler.instrument_model(prob.model)
+
+        prob.run_model()
+        prob.run_model()
+        prob.compute_totals('y', 'b')
+
+        results = profiler.get_results()
+        cruise = results['phases']['cruise']
+
+        self.assertEqual(cruise['nonlinear_solves'], 2)
+        self.assertGreater(cruise['nonlinear_iterations'], 2)
+        self.assertGreater(cruise['compute_calls'], cruise['nonlinear_iterations'])
+        self.assertGreater(cruise['linear_solves'], 0)
+
+        classes = {entry['class'] for entry in results['components']}
+        self.assertIn('_Quadratic', classes)
+        self.assertIn('_Double', classes)
+
+        # no other phase should have been found
+        self.assertEqual(set(results['phases']), {'cruise'})
+
+
+@use_tempdirs
+class ProfileAviaryProblemTest(unittest.TestCase):
+    def setUp(self):
+        om.clear_reports()
+        _clear_problem_names()
+
+    def test_profile_reports(self):
+        local_phase_info = deepcopy(phase_info)
+        prob = run_aviary(
+            'models/test_aircraft/aircraft_for_bench_FwFm.csv',
+            local_phase_info,
+            run_driver=False,
+            optimizer='SLSQP',
+            make_plots=False,
+            profile=True,
+            verbosity=0,
+        )
+
+        reports_dir = Path(prob.get_reports_dir())
+        self.assertTrue((reports_dir / 'profile.md').exists())
+
+        with open(reports_dir / 'profile.json') as f:
+            results = json.load(f)
+
+        for phase in local_phase_info:
+            self.assertIn(phase, results['phases'])
+            self.assertGreater(results['phases'][phase]['compute_calls'], 0)
+
+        self.assertIn('pre_mission', results['phases'])
+
+        builder_names = {entry['builder'] for entry in results['builders']}
+        self.assertIn('core_aerodynamics', builder_names)
+
+        # the problem must not leave profiling on for problems created afterwards
+        self.assertIsNone(get_active_profiler())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -55,7 +55,68 @@ class TestFLOPSBalancedFieldLength(unittest.TestCase):
 
         self._do_run(driver, optimizer)
 
+    def test_engine_out_branch(self):
+        takeoff, takeoff_trajectory_builder = self._build_problem(Driver())
+
+        # the engine-out continued takeoff and the aborted takeoff are separate branches
+        branches = takeoff_trajectory_builder.get_branches()
+        self.assertEqual(
+            branches['takeoff'],
+            [
+                'balanced_brake_release',
+                'balanced_decision_speed',
+                'balanced_rotate',
+                'balanced_liftoff',
+            ],
+        )
+        self.assertEqual(branches['abort'], ['balanced_delayed_brake', 'balanced_abort'])
+
+        # each branch is allocated its own processors
+        proc_info = takeoff.model.traj.phases._proc_info
+        for branch, names in branches.items():
+            for name in names:
+                self.assertEqual(proc_info[name][3], branch)
+
     def _do_run(self, driver: Driver, optimizer, *args):
+        driver.declare_coloring()
+
+        driver.add_recorder(om.SqliteRecorder(f'FLOPS_detailed_takeoff_traj_{optimizer}.sql'))
+
+        driver.recording_options['record_derivatives'] = False
+
+        takeoff, _ = self._build_problem(driver)
+
+        # run the problem
+        dm.run_problem(takeoff, run_driver=True, simulate=True, make_plots=False)
+
+        # takeoff.model.traj.phases.brake_release_to_decision_speed.list_inputs(print_arrays=True)
+        # takeoff.model.list_outputs(print_arrays=True)
+
+        # Field Length
+        # N3CC FLOPS output Line 2282
+        desired = 7032.65
+        actual = takeoff.model.get_val('traj.balanced_liftoff.states:distance', units='ft')[-1]
+        assert_near_equal(actual, desired, 2e-2)
+
+        # Decision Time
+        # N3CC FLOPS output Line 2287
+        desired = 29.52
+        actual = takeoff.model.get_val('traj.balanced_brake_release.t', units='s')[-1]
+        assert_near_equal(actual, desired, 2e-2)
+
+        # Liftoff Time
+        # N3CC FLOPS output Line 2289
+        desired = 36.63
+        actual = takeoff.model.get_val('traj.balanced_rotate.t', units='s')[-1]
+        assert_near_equal(actual, desired, 0.05)
+
+        # Rotation Speed
+        # N3CC FLOPS output Line 2289
+        desired = 156.55
+        actual = takeoff.model.get_val('traj.balanced_rotate.states:velocity', units='kn')[-1]
+        assert_near_equal(actual, desired, 2e-2)
+
+    def _build_problem(self, driver: Driver):
         aviary_options = _inputs.deepcopy()
 
         engine = build_engine_deck(aviary_options)
@@ -67,12 +128,6 @@ class TestFLOPSBalancedFieldLength(unittest.TestCase):
         takeoff = om.Problem()
         takeoff.driver = driver
 
-        driver.declare_coloring()
-
-        driver.add_recorder(om.SqliteRecorder(f'FLOPS_detailed_takeoff_traj_{optimizer}.sql'))
-
-        driver.recording_options['record_derivatives'] = False
-
         default_mission_subsystems = get_default_mission_subsystems('FLOPS', engine)
 
         # Upstream static analysis for aero
@@ -90,8 +145,13 @@ class TestFLOPSBalancedFieldLength(unittest.TestCase):
         traj = dm.Trajectory()
         takeoff.model.add_subsystem('traj', traj)
 
+        # the engine-out continued takeoff and the aborted takeoff are evaluated on
+        # separate processors
         takeoff_trajectory_builder.build_trajectory(
-            aviary_options=aviary_options, model=takeoff.model, traj=traj
+            aviary_options=aviary_options,
+            model=takeoff.model,
+            traj=traj,
+            parallel_branches=True,
         )
 
         distance_max, units = takeoff_liftoff_user_options.get_item('distance_max')
@@ -117,35 +177,7 @@ class TestFLOPSBalancedFieldLength(unittest.TestCase):
 
         takeoff_trajectory_builder.apply_initial_guesses(takeoff, 'traj')
 
-        # run the problem
-        dm.run_problem(takeoff, run_driver=True, simulate=True, make_plots=False)
-
-        # takeoff.model.traj.phases.brake_release_to_decision_speed.list_inputs(print_arrays=True)
-        # takeoff.model.list_outputs(print_arrays=True)
-
-        # Field Length
-        # N3CC FLOPS output Line 2282
-        desired = 7032.65
-        actual = takeoff.model.get_val('traj.balanced_liftoff.states:distance', units='ft')[-1]
-        assert_near_equal(actual, desired, 2e-2)
-
-        # Decision Time
-        # N3CC FLOPS output Line 2287
-        desired = 29.52
-        actual = takeoff.model.get_val('traj.balanced_brake_release.t', units='s')[-1]
-        assert_near_equal(actual, desired, 2e-2)
-
-        # Liftoff Time
-        # N3CC FLOPS output Line 2289
-        desired = 36.63
-        actual = takeoff.model.get_val('traj.balanced_rotate.t', units='s')[-1]
-        assert_near_equal(actual, desired, 0.05)
-
-        # Rotation Speed
-        # N3CC FLOPS output Line 2289
-        desired = 156.55
-        actual = takeoff.model.get_val('traj.balanced_rotate.states:velocity', units='kn')[-1]
-        assert_near_equal(actual, desired, 2e-2)
+        return takeoff, takeoff_trajectory_builder
 
 
 if __name__ == '__main__':
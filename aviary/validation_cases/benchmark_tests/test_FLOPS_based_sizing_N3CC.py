@@ -54,7 +54,8 @@ FLOPS = LegacyCode.FLOPS
 # benchmark for simple sizing problem on the N3CC
 
 
-def run_trajectory(sim=True):
+def setup_trajectory():
+    """Build and set up the N3CC sizing problem, including its initial guesses."""
     prob = om.Problem(model=om.Group())
     if pyoptsparse:
         driver = prob.driver = om.pyOptSparseDriver()
@@ -548,6 +549,12 @@ def run_trajectory(sim=True):
     # Turn off solver printing so that the SNOPT output is readable.
     prob.set_solver_print(level=0)
 
+    return prob
+
+
+def run_trajectory(sim=True):
+    prob = setup_trajectory()
+
     dm.run_problem(
         prob,
         simulate=sim,
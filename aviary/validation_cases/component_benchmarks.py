@@ -0,0 +1,492 @@
+"""
+Micro-benchmarks of the cost of evaluating core mission components.
+
+Each benchmark builds one mission system (an atmosphere, aerodynamics or propulsion group,
+an equation of motion component, ...) for a range of num_nodes, using the aircraft data of
+one of the bundled models. When the system needs sized-aircraft inputs, the core
+pre-mission analysis of the same model is run once beforehand and its outputs are used as
+inputs, so the mission system sees realistic values. Dynamic inputs are swept over a typical mission
+envelope.
+
+For every num_nodes, the time per call of compute (run_solve_nonlinear) and
+compute_partials (run_linearize) is measured for the benchmarked system and for each of
+its direct subsystems. The change of cost with num_nodes is summarized as a scaling
+exponent: close to 0 means the cost is dominated by per-call overhead, close to 1 means it
+grows linearly with the number of nodes, and anything above 1 points at per-node Python
+loops or dense operations that should be vectorized.
+
+Run with ``aviary bench``.
+"""
+
+import json
+import sys
+import time
+import warnings
+
+import numpy as np
+import openmdao.api as om
+
+from aviary.subsystems.atmosphere.atmosphere import Atmosphere
+from aviary.subsystems.premission import CorePreMission
+from aviary.subsystems.propulsion.utils import build_engine_deck
+from aviary.utils.functions import set_aviary_initial_values
+from aviary.utils.preprocessors import preprocess_options
+from aviary.utils.process_input_decks import create_vehicle
+from aviary.utils.test_utils.default_subsystems import (
+    get_default_mission_subsystems,
+    get_default_premission_subsystems,
+)
+from aviary.variable_info.enums import LegacyCode, SpeedType
+from aviary.variable_info.functions import setup_model_options
+from aviary.variable_info.variables import Dynamic, Settings
+
+DEFAULT_NUM_NODES = (1, 10, 100, 1000)
+
+# bundled aircraft models used as the source of realistic inputs
+vehicles = {
+    'FLOPS': 'models/test_aircraft/aircraft_for_bench_FwFm.csv',
+    'GASP': 'models/test_aircraft/aircraft_for_bench_GwGm.csv',
+    'turboprop': 'models/large_turboprop_freighter/large_turboprop_freighter_GASP.csv',
+}
+
+
+def _dynamic_inputs(num_nodes):
+    """Return values of the dynamic variables over a typical climb/cruise envelope."""
+    nn = num_nodes
+    mach = np.linspace(0.2, 0.8, nn)
+    pressure = np.linspace(2116.2, 499.3, nn)
+    temperature = np.linspace(518.7, 394.1, nn)
+    sos = np.linspace(1116.4, 968.1, nn)
+    mass = np.linspace(175000.0, 140000.0, nn)
+    lift = mass.copy()
+    drag = 0.06 * lift
+
+    return {
+        Dynamic.Mission.ALTITUDE: (np.linspace(0.0, 35000.0, nn), 'ft'),
+        Dynamic.Atmosphere.MACH: (mach, 'unitless'),
+        Dynamic.Mission.VELOCITY: (mach * sos, 'ft/s'),
+        Dynamic.Mission.VELOCITY_RATE: (np.linspace(1.0, 0.0, nn), 'ft/s**2'),
+        Dynamic.Mission.FLIGHT_PATH_ANGLE: (np.linspace(0.1, 0.0, nn), 'rad'),
+        Dynamic.Mission.ALTITUDE_RATE: (np.linspace(40.0, 0.0, nn), 'ft/s'),
+        Dynamic.Atmosphere.TEMPERATURE: (temperature, 'degR'),
+        Dynamic.Atmosphere.STATIC_PRESSURE: (pressure, 'lbf/ft**2'),
+        Dynamic.Atmosphere.DENSITY: (pressure / (1716.49 * temperature), 'slug/ft**3'),
+        Dynamic.Atmosphere.SPEED_OF_SOUND: (sos, 'ft/s'),
+        Dynamic.Atmosphere.DYNAMIC_PRESSURE: (0.7 * pressure * mach**2, 'lbf/ft**2'),
+        Dynamic.Vehicle.MASS: (mass, 'lbm'),
+        Dynamic.Vehicle.LIFT: (lift, 'lbf'),
+        Dynamic.Vehicle.DRAG: (drag, 'lbf'),
+        Dynamic.Vehicle.ANGLE_OF_ATTACK: (np.linspace(6.0, 2.0, nn), 'deg'),
+        Dynamic.Vehicle.Propulsion.THROTTLE: (np.linspace(1.0, 0.6, nn), 'unitless'),
+        Dynamic.Vehicle.Propulsion.THRUST_TOTAL: (1.3 * drag, 'lbf'),
+        Dynamic.Vehicle.Propulsion.THRUST_MAX_TOTAL: (1.5 * drag, 'lbf'),
+        Dynamic.Vehicle.Propulsion.FUEL_FLOW_RATE_NEGATIVE_TOTAL: (
+            np.linspace(-6500.0, -5500.0, nn),
+            'lbm/h',
+        ),
+        Dynamic.Vehicle.Propulsion.SHAFT_POWER: (np.linspace(4000.0, 3000.0, nn), 'hp'),
+        Dynamic.Vehicle.Propulsion.RPM: (np.full(nn, 1020.0), 'rpm'),
+    }
+
+
+def _build_atmosphere(num_nodes, aviary_inputs, subsystems):
+    return Atmosphere(num_nodes=num_nodes, input_speed_type=SpeedType.MACH)
+
+
+def _build_aerodynamics(num_nodes, aviary_inputs, subsystems):
+    return subsystems['core_aerodynamics'].build_mission(num_nodes, aviary_inputs)
+
+
+def _build_tabular_aerodynamics(num_nodes, aviary_inputs, subsystems):
+    from aviary.subsystems.aerodynamics.gasp_based.table_based import TabularCruiseAero
+
+    return TabularCruiseAero(
+        num_nodes=num_nodes,
+        aero_data='subsystems/aerodynamics/gasp_based/data/large_single_aisle_1_aero_free.txt',
+    )
+
+
+def _build_propulsion(num_nodes, aviary_inputs, subsystems):
+    return subsystems['core_propulsion'].build_mission(num_nodes, aviary_inputs)
+
+
+def _build_propeller(num_nodes, aviary_inputs, subsystems):
+    from aviary.subsystems.propulsion.propeller.propeller_builder import PropellerBuilder
+
+    return PropellerBuilder('propeller').build_mission(num_nodes, aviary_inputs)
+
+
+def _build_mission_eom(num_nodes, aviary_inputs, subsystems):
+    from aviary.mission.flops_based.ode.mission_EOM import MissionEOM
+
+    return MissionEOM(num_nodes=num_nodes)
+
+
+def _build_climb_eom(num_nodes, aviary_inputs, subsystems):
+    from aviary.mission.gasp_based.ode.climb_eom import ClimbRates
+
+    return ClimbRates(num_nodes=num_nodes)
+
+
+def _build_flight_path_eom(num_nodes, aviary_inputs, subsystems):
+    from aviary.mission.gasp_based.ode.flight_path_eom import FlightPathEOM
+
+    return FlightPathEOM(num_nodes=num_nodes)
+
+
+def _build_breguet_range(num_nodes, aviary_inputs, subsystems):
+    from aviary.mission.gasp_based.ode.breguet_cruise_eom import RangeComp
+
+    return RangeComp(num_nodes=num_nodes)
+
+
+_propulsion_inputs = (
+    Dynamic.Atmosphere.MACH,
+    Dynamic.Mission.ALTITUDE,
+    Dynamic.Vehicle.Propulsion.THROTTLE,
+)
+
+_mission_eom_inputs = (
+    Dynamic.Mission.VELOCITY,
+    Dynamic.Mission.VELOCITY_RATE,
+    Dynamic.Mission.ALTITUDE_RATE,
+    Dynamic.Vehicle.MASS,
+    Dynamic.Vehicle.DRAG,
+)
+
+# name: (code origin, vehicle, build function, whether pre-mission sizing is needed,
+#        inputs that are promoted from several subsystems and need a default value, as
+#        the ODE these systems are normally placed in would provide)
+benchmarks = {
+    'atmosphere': (None, 'FLOPS', _build_atmosphere, False, ()),
+    'FLOPS_aerodynamics': ('FLOPS', 'FLOPS', _build_aerodynamics, True, ()),
+    'FLOPS_propulsion': ('FLOPS', 'FLOPS', _build_propulsion, False, _propulsion_inputs),
+    'FLOPS_mission_eom': ('FLOPS', 'FLOPS', _build_mission_eom, False, _mission_eom_inputs),
+    'GASP_aerodynamics': ('GASP', 'GASP', _build_aerodynamics, True, ()),
+    'GASP_tabular_aerodynamics': ('GASP', 'GASP', _build_tabular_aerodynamics, False, ()),
+    'GASP_propulsion': ('GASP', 'GASP', _build_propulsion, False, _propulsion_inputs),
+    'GASP_climb_eom': ('GASP', 'GASP', _build_climb_eom, False, ()),
+    'GASP_flight_path_eom': ('GASP', 'GASP', _build_flight_path_eom, False, ()),
+    'GASP_propeller': ('GASP', 'turboprop', _build_propeller, False, ()),
+    'GASP_breguet_range': ('GASP', 'GASP', _build_breguet_range, False, ()),
+}
+
+
+_vehicle_cache = {}
+
+
+def _load_vehicle(vehicle):
+    """Return the preprocessed inputs and core subsystem builders of a bundled model."""
+    if vehicle in _vehicle_cache:
+        return _vehicle_cache[vehicle]
+
+    aviary_inputs, _ = create_vehicle(vehicles[vehicle])
+    aviary_inputs.set_val(Settings.VERBOSITY, 0)
+
+    if vehicle == 'turboprop':
+        from aviary.subsystems.propulsion.turboprop_model import TurbopropModel
+
+        engines = [TurbopropModel('turboprop', options=aviary_inputs)]
+        legacy_code = LegacyCode.GASP
+    else:
+        engines = build_engine_deck(aviary_inputs)
+        legacy_code = LegacyCode(vehicle)
+
+    preprocess_options(aviary_inputs, engine_models=engines)
+
+    subsystems = {}
+    for builder in get_default_premission_subsystems(legacy_code, engines):
+        subsystems[builder.name] = builder
+    for builder in get_default_mission_subsystems(legacy_code, engines):
+        subsystems[builder.name] = builder
+
+    _vehicle_cache[vehicle] = (aviary_inputs, subsystems)
+    return aviary_inputs, subsystems
+
+
+_pre_mission_cache = {}
+
+
+def _pre_mission_outputs(vehicle):
+    """
+    Run the core pre-mission analysis of a bundled model once and return the values of
+    its aircraft and mission outputs, as {name: (val, units)}.
+    """
+    if vehicle in _pre_mission_cache:
+        return _pre_mission_cache[vehicle]
+
+    aviary_inputs, subsystems = _load_vehicle(vehicle)
+    premission_subsystems = [
+        subsystems[builder_name]
+        for builder_name in ('core_propulsion', 'core_geometry', 'core_aerodynamics')
+    ]
+
+    prob = om.Problem(reports=False)
+    prob.model.add_subsystem(
+        'pre_mission',
+        CorePreMission(aviary_options=aviary_inputs, subsystems=premission_subsystems),
+        promotes=['*'],
+    )
+    setup_model_options(prob, aviary_inputs)
+
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        prob.setup()
+        set_aviary_initial_values(prob, aviary_inputs)
+        prob.run_model()
+
+    outputs = {}
+    for _, meta in prob.model.list_outputs(
+        prom_name=True, units=True, out_stream=None, return_format='list'
+    ):
+        prom_name = meta['prom_name']
+        if prom_name.startswith(('aircraft:', 'mission:')):
+            outputs[prom_name] = (meta['val'], meta['units'])
+
+    _pre_mission_cache[vehicle] = outputs
+    return outputs
+
+
+def build_benchmark_problem(name, num_nodes):
+    """
+    Build, set up and run once the problem of the named benchmark.
+
+    Parameters
+    ----------
+    name : str
+        Name of the benchmark in benchmarks.
+    num_nodes : int
+        Number of nodes of the benchmarked mission system.
+
+    Returns
+    -------
+    Problem
+        The problem. The benchmarked system is "prob.model.mission".
+    """
+    _, vehicle, build, needs_pre_mission, input_defaults = benchmarks[name]
+    aviary_inputs, subsystems = _load_vehicle(vehicle)
+    dynamic_inputs = _dynamic_inputs(num_nodes)
+
+    prob = om.Problem(reports=False)
+    mission = prob.model.add_subsystem(
+        'mission', build(num_nodes, aviary_inputs, subsystems), promotes=['*']
+    )
+
+    for var_name in input_defaults:
+        val, units = dynamic_inputs[var_name]
+        mission.set_input_defaults(var_name, val, units=units)
+
+    setup_model_options(prob, aviary_inputs)
+
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        prob.setup()
+
+        set_aviary_initial_values(prob, aviary_inputs)
+
+        values = dict(dynamic_inputs)
+        if needs_pre_mission:
+            values.update(_pre_mission_outputs(vehicle))
+
+        for var_name, (val, units) in values.items():
+            try:
+                prob.set_val(var_name, val, units=units)
+            except KeyError:
+                pass
+
+        prob.run_model()
+
+    return prob
+
+
+def _time_per_call(func, min_time):
+    """Return the fastest time per call of func over a few batches of repeated calls."""
+    func()
+
+    # find a number of calls that takes at least min_time
+    count = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(count):
+            func()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time or count >= 2**16:
+            break
+        count *= 2
+
+    best = elapsed / count
+    for _ in range(2):
+        start = time.perf_counter()
+        for _ in range(count):
+            func()
+        best = min(best, (time.perf_counter() - start) / count)
+
+    return best
+
+
+def time_system(system, min_time=0.05):
+    """
+    Return the time per call (s) of compute and compute_partials of a set up system.
+
+    Parameters
+    ----------
+    system : System
+        A system of a problem that has been set up and run.
+    min_time : float
+        Minimum time (s) spent repeating each measurement.
+
+    Returns
+    -------
+    tuple of float
+        Time per call of run_solve_nonlinear and of run_linearize.
+    """
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        compute = _time_per_call(system.run_solve_nonlinear, min_time)
+        compute_partials = _time_per_call(system.run_linearize, min_time)
+
+    return compute, compute_partials
+
+
+def run_benchmark(name, num_nodes=DEFAULT_NUM_NODES, min_time=0.05):
+    """
+    Time the benchmarked system and its direct subsystems for each num_nodes.
+
+    Parameters
+    ----------
+    name : str
+        Name of the benchmark in benchmarks.
+    num_nodes : iterable of int
+        Numbers of nodes at which the systems are timed.
+    min_time : float
+        Minimum time (s) spent repeating each measurement.
+
+    Returns
+    -------
+    dict
+        For each system (the benchmarked system is named after the benchmark, and its
+        subsystems by their path below it): the class name, the num_nodes values and the
+        compute and compute_partials times per call at each of them.
+    """
+    results = {}
+
+    for nn in num_nodes:
+        prob = build_benchmark_problem(name, nn)
+        mission = prob.model.mission
+
+        systems = [(name, mission)]
+        if isinstance(mission, om.Group):
+            systems += [
+                (f'{name}.{subsys.name}', subsys) for subsys in mission.system_iter(recurse=False)
+            ]
+
+        for label, system in systems:
+            compute, compute_partials = time_system(system, min_time)
+
+            entry = results.setdefault(
+                label,
+                {
+                    'class': type(system).__name__,
+                    'num_nodes': [],
+                    'compute': [],
+                    'compute_partials': [],
+                },
+            )
+            entry['num_nodes'].append(nn)
+            entry['compute'].append(compute)
+            entry['compute_partials'].append(compute_partials)
+
+    return results
+
+
+def scaling_exponent(num_nodes, times):
+    """
+    Return the exponent p of times ~ num_nodes**p between the two largest num_nodes.
+
+    Returns None when fewer than two num_nodes were measured.
+    """
+    if len(num_nodes) < 2:
+        return None
+
+    n0, n1 = num_nodes[-2:]
+    t0, t1 = times[-2:]
+
+    return float(np.log(t1 / t0) / np.log(n1 / n0))
+
+
+def print_results(results, out_stream=sys.stdout):
+    """Print a table of benchmark results, with times in microseconds per call."""
+    header = ['system', 'class', 'num_nodes', 'compute (us)', 'partials (us)', 'exponent']
+    print(' | '.join(header), file=out_stream)
+    print(' | '.join('---' for _ in header), file=out_stream)
+
+    for label, entry in results.items():
+        num_nodes = entry['num_nodes']
+        compute_exp = scaling_exponent(num_nodes, entry['compute'])
+        partials_exp = scaling_exponent(num_nodes, entry['compute_partials'])
+
+        for i, nn in enumerate(num_nodes):
+            row = [
+                label if i == 0 else '',
+                entry['class'] if i == 0 else '',
+                str(nn),
+                f'{entry["compute"][i] * 1e6:.1f}',
+                f'{entry["compute_partials"][i] * 1e6:.1f}',
+                '',
+            ]
+            if i == len(num_nodes) - 1 and compute_exp is not None:
+                row[-1] = f'{compute_exp:.2f} / {partials_exp:.2f}'
+            print(' | '.join(row), file=out_stream)
+
+
+def _setup_bench_parser(parser):
+    parser.add_argument(
+        'benchmarks',
+        nargs='*',
+        help=f'Benchmarks to run. Defaults to all: {", ".join(benchmarks)}',
+    )
+    parser.add_argument(
+        '--code_origin',
+        choices=('FLOPS', 'GASP'),
+        default=None,
+        help='Only run the benchmarks of this code origin (plus the shared ones)',
+    )
+    parser.add_argument(
+        '--num_nodes',
+        type=int,
+        nargs='+',
+        default=list(DEFAULT_NUM_NODES),
+        help='Numbers of nodes at which the components are timed',
+    )
+    parser.add_argument(
+        '--min_time',
+        type=float,
+        default=0.05,
+        help='Minimum time (s) spent repeating each measurement',
+    )
+    parser.add_argument('--json', default=None, help='Also write the results to this json file')
+
+
+def _exec_bench(args, user_args):
+    names = args.benchmarks or list(benchmarks)
+
+    for name in names:
+        if name not in benchmarks:
+            raise ValueError(
+                f'Unknown benchmark "{name}". Available benchmarks are: {", ".join(benchmarks)}'
+            )
+
+    if args.code_origin is not None:
+        names = [name for name in names if benchmarks[name][0] in (None, args.code_origin)]
+
+    num_nodes = sorted(args.num_nodes)
+
+    results = {}
+    for name in names:
+        results.update(run_benchmark(name, num_nodes, args.min_time))
+
+    print_results(results)
+
+    if args.json is not None:
+        with open(args.json, 'w') as f:
+            json.dump(results, f, indent=2)
@@ -0,0 +1,104 @@
+"""
+Benchmark of the time taken to load the vehicle input decks of the bundled models.
+
+Each deck is loaded with create_vehicle, the way AviaryProblem.load_inputs reads it, and
+the fastest time per load over a few repetitions is reported, along with the number of
+entries in the deck. Decks that cannot be loaded report the error instead, which lists
+every invalid entry of the deck.
+
+Usage::
+
+    python -m aviary.validation_cases.input_deck_benchmarks
+    python -m aviary.validation_cases.input_deck_benchmarks models/N3CC/N3CC_FLOPS.csv
+"""
+
+import argparse
+import sys
+import time
+import warnings
+from pathlib import Path
+
+from aviary.utils.functions import get_path
+from aviary.utils.process_input_decks import _tokenize_deck, create_vehicle
+from aviary.variable_info.enums import Verbosity
+
+
+def bundled_decks():
+    """Return the paths, relative to the aviary package, of the input decks of the models."""
+    models = get_path('models')
+    package = models.parent
+
+    return sorted(
+        str(path.relative_to(package))
+        for path in models.glob('*/*.csv')
+        if not path.name.startswith('converter_test')
+    )
+
+
+def time_deck(vehicle_deck, repeat=10):
+    """
+    Return the fastest time, in seconds, of loading a vehicle deck with create_vehicle.
+
+    Parameters
+    ----------
+    vehicle_deck : str
+        Path to the vehicle deck.
+    repeat : int
+        Number of times the deck is loaded.
+
+    Returns
+    -------
+    dict
+        Number of entries and time per load (s) of the deck. If the deck could not be
+        loaded, the error instead.
+    """
+    path = get_path(vehicle_deck)
+    result = {'deck': vehicle_deck, 'entries': len(_tokenize_deck(path))}
+
+    best = None
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+
+        for _ in range(repeat):
+            start = time.perf_counter()
+            try:
+                create_vehicle(path, verbosity=Verbosity.QUIET)
+            except Exception as err:
+                result['error'] = f'{type(err).__name__}: {err}'
+                return result
+
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+
+    result['time'] = best
+    return result
+
+
+def print_results(results, out_stream=sys.stdout):
+    """Print a table of deck loading times, in milliseconds per load."""
+    print('deck | entries | time (ms)', file=out_stream)
+    print('--- | --- | ---', file=out_stream)
+
+    for result in results:
+        if 'error' in result:
+            print(f'{result["deck"]} | {result["entries"]} | failed', file=out_stream)
+        else:
+            print(
+                f'{result["deck"]} | {result["entries"]} | {result["time"] * 1e3:.2f}',
+                file=out_stream,
+            )
+
+    for result in results:
+        if 'error' in result:
+            print(f'\n{Path(result["deck"]).name}: {result["error"]}', file=out_stream)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Aviary input deck loading benchmark')
+    parser.add_argument(
+        'decks', nargs='*', help='Vehicle decks to load. Defaults to those of the bundled models'
+    )
+    parser.add_argument('--repeat', type=int, default=10, help='Number of loads of each deck')
+    args = parser.parse_args()
+
+    print_results([time_deck(deck, args.repeat) for deck in args.decks or bundled_decks()])
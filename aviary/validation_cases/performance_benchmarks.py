@@ -0,0 +1,616 @@
+"""
+Performance benchmarks built on the Aviary benchmark models.
+
+Each case is run in its own Python process so that peak memory use and one-time import
+or caching costs are measured in isolation. The wall time of each stage of the run
+(setup, final_setup, coloring, run_model and run_driver) is measured by temporarily
+wrapping the corresponding OpenMDAO methods, so the same measurement works for cases
+built through AviaryProblem and for hand-built problems such as N3CC. Stage times are
+exclusive: time spent in a nested stage (for example total coloring computed inside
+run_driver) is only counted once, against the nested stage.
+
+Results are appended to a history file (one JSON record per line) and can be compared
+against a baseline file to flag regressions.
+
+Usage::
+
+    python -m aviary.validation_cases.performance_benchmarks
+    python -m aviary.validation_cases.performance_benchmarks FwFm GwGm --save-baseline
+    python -m aviary.validation_cases.performance_benchmarks --baseline perf_baseline.json
+"""
+
+import argparse
+import datetime
+import functools
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+from copy import deepcopy
+
+import openmdao.api as om
+import openmdao.utils.coloring as coloring_mod
+from openmdao.core.system import System
+
+import aviary
+
+try:
+    import resource
+except ImportError:
+    # not available on Windows
+    resource = None
+
+try:
+    import pyoptsparse
+except ImportError:
+    pyoptsparse = None
+
+# stages reported for every case, in the order they normally happen
+STAGES = ('setup', 'final_setup', 'coloring', 'run_model', 'run_driver')
+
+# metrics compared against the baseline, and the smallest change in each of them that is
+# considered meaningful (so that timing noise on very fast stages is never flagged)
+COMPARED_METRICS = {
+    'total': 1.0,
+    'setup': 0.5,
+    'final_setup': 0.5,
+    'coloring': 0.5,
+    'run_model': 0.5,
+    'run_driver': 1.0,
+    'driver_iterations': 1,
+    'peak_rss_MB': 50.0,
+}
+
+DEFAULT_HISTORY_FILE = 'aviary_performance_history.jsonl'
+DEFAULT_BASELINE_FILE = 'aviary_performance_baseline.json'
+
+
+def _default_optimizer():
+    return 'IPOPT' if pyoptsparse is not None else 'SLSQP'
+
+
+def _run_FwFm(optimizer, max_iter):
+    from aviary.interface.default_phase_info.height_energy import phase_info
+    from aviary.interface.methods_for_level1 import run_aviary
+
+    return run_aviary(
+        'models/test_aircraft/aircraft_for_bench_FwFm.csv',
+        deepcopy(phase_info),
+        optimizer=optimizer,
+        max_iter=max_iter,
+        make_plots=False,
+        verbosity=0,
+    )
+
+
+def _run_GwGm(optimizer, max_iter):
+    from aviary.interface.default_phase_info.two_dof import phase_info
+    from aviary.interface.methods_for_level1 import run_aviary
+
+    return run_aviary(
+        'models/test_aircraft/aircraft_for_bench_GwGm.csv',
+        deepcopy(phase_info),
+        optimizer=optimizer,
+        max_iter=max_iter,
+        make_plots=False,
+        verbosity=0,
+    )
+
+
+def _run_multiengine(optimizer, max_iter):
+    from aviary.interface.methods_for_level2 import AviaryProblem
+    from aviary.subsystems.propulsion.utils import build_engine_deck
+    from aviary.validation_cases.benchmark_tests.test_bench_multiengine import (
+        engine_1_inputs,
+        engine_2_inputs,
+        inputs,
+        local_phase_info,
+    )
+    from aviary.variable_info.enums import ThrottleAllocation
+
+    phase_info = deepcopy(local_phase_info)
+    for phase_name in ('climb', 'cruise', 'descent'):
+        phase_info[phase_name]['user_options']['throttle_allocation'] = ThrottleAllocation.STATIC
+
+    engine1 = build_engine_deck(engine_1_inputs)[0]
+    engine1.name = 'engine_1'
+    engine2 = build_engine_deck(engine_2_inputs)[0]
+    engine2.name = 'engine_2'
+
+    prob = AviaryProblem(verbosity=0)
+    prob.load_inputs(inputs, phase_info, engine_builders=[engine1, engine2])
+    prob.check_and_preprocess_inputs()
+    prob.add_pre_mission_systems()
+    prob.add_phases()
+    prob.add_post_mission_systems()
+    prob.link_phases()
+    prob.add_driver(optimizer, max_iter=max_iter, use_coloring=True, verbosity=0)
+    prob.add_design_variables()
+    prob.add_objective()
+    prob.setup()
+    prob.set_initial_guesses()
+    prob.run_aviary_problem(make_plots=False)
+
+    return prob
+
+
+def _run_large_turboprop_freighter(optimizer, max_iter):
+    from aviary.interface.methods_for_level2 import AviaryProblem
+    from aviary.models.large_turboprop_freighter.phase_info import two_dof_phase_info
+    from aviary.subsystems.propulsion.turboprop_model import TurbopropModel
+    from aviary.utils.process_input_decks import create_vehicle
+    from aviary.variable_info.variables import Aircraft, Mission
+
+    csv_path = 'models/large_turboprop_freighter/large_turboprop_freighter_GASP.csv'
+    options, _ = create_vehicle(csv_path)
+    turboprop = TurbopropModel('turboprop', options=options)
+
+    prob = AviaryProblem(verbosity=0)
+    prob.load_inputs(csv_path, deepcopy(two_dof_phase_info), engine_builders=[turboprop])
+    prob.aviary_inputs.set_val(Mission.Constraints.MAX_MACH, 0.5)
+    prob.aviary_inputs.set_val(Aircraft.Fuselage.AVG_DIAMETER, 4.125, 'm')
+    prob.check_and_preprocess_inputs()
+    prob.add_pre_mission_systems()
+    prob.add_phases()
+    prob.add_post_mission_systems()
+    prob.link_phases()
+    prob.add_driver(optimizer, max_iter=max_iter, verbosity=0)
+    prob.add_design_variables()
+    prob.add_objective()
+    prob.setup()
+    prob.set_initial_guesses()
+    prob.run_aviary_problem(make_plots=False)
+
+    return prob
+
+
+def _run_N3CC(optimizer, max_iter):
+    # This problem is built by hand and selects its own driver settings.
+    from aviary.validation_cases.benchmark_tests.test_FLOPS_based_sizing_N3CC import run_trajectory
+
+    return run_trajectory(sim=False)
+
+
+def _setup_N3CC(optimizer, max_iter):
+    # Setup only: measures model construction, configure and final_setup.
+    from aviary.validation_cases.benchmark_tests.test_FLOPS_based_sizing_N3CC import (
+        setup_trajectory,
+    )
+
+    prob = setup_trajectory()
+    prob.final_setup()
+
+    return prob
+
+
+# name: (function(optimizer, max_iter) -> problem, whether optimizer/max_iter are used)
+benchmark_cases = {
+    'FwFm': (_run_FwFm, True),
+    'GwGm': (_run_GwGm, True),
+    'multiengine': (_run_multiengine, True),
+    'large_turboprop_freighter': (_run_large_turboprop_freighter, True),
+    'N3CC': (_run_N3CC, False),
+    'N3CC_setup': (_setup_N3CC, False),
+}
+
+
+class StageTimer:
+    """
+    Measures the exclusive wall time of the stages of every Problem run while active.
+
+    Use as a context manager. While active, Problem.setup, Problem.final_setup,
+    Problem.run_model, Problem.run_driver, total coloring and partial coloring are
+    wrapped, as well as AviaryProblem.setup, which does work of its own before calling
+    Problem.setup. When a stage is entered while another one is running, the time of the
+    inner stage is removed from the outer one.
+
+    Attributes
+    ----------
+    times : dict
+        Accumulated exclusive wall time of each stage, in seconds.
+    calls : dict
+        Number of times each stage was entered.
+    driver_iterations : int
+        Sum of the driver iteration counts of every run_driver call.
+    """
+
+    def __init__(self):
+        self.times = {stage: 0.0 for stage in STAGES}
+        self.calls = {stage: 0 for stage in STAGES}
+        self.driver_iterations = 0
+        self._stack = []
+        self._originals = []
+
+    def _timed(self, stage, func, post=None):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            # entry on the stack: [stage, time spent in nested stages]
+            entry = [stage, 0.0]
+            if not self._stack or self._stack[-1][0] != stage:
+                self.calls[stage] += 1
+            self._stack.append(entry)
+            start = time.perf_counter()
+            try:
+                result = func(*args, **kwargs)
+            finally:
+                elapsed = time.perf_counter() - start
+                self._stack.pop()
+                self.times[stage] += elapsed - entry[1]
+                if self._stack:
+                    self._stack[-1][1] += elapsed
+            if post is not None:
+                post(args[0])
+            return result
+
+        return wrapper
+
+    def _count_driver_iterations(self, prob):
+        self.driver_iterations += prob.driver.iter_count
+
+    def _patch(self, owner, name, stage, post=None):
+        original = owner.__dict__[name]
+        self._originals.append((owner, name, original))
+        setattr(owner, name, self._timed(stage, original, post))
+
+    def __enter__(self):
+        from aviary.interface.methods_for_level2 import AviaryProblem
+
+        self._patch(AviaryProblem, 'setup', 'setup')
+        self._patch(om.Problem, 'setup', 'setup')
+        self._patch(om.Problem, 'final_setup', 'final_setup')
+        self._patch(om.Problem, 'run_model', 'run_model')
+        self._patch(om.Problem, 'run_driver', 'run_driver', self._count_driver_iterations)
+        self._patch(coloring_mod, 'dynamic_total_coloring', 'coloring')
+        self._patch(System, '_compute_coloring', 'coloring')
+        return self
+
+    def __exit__(self, *exc):
+        for owner, name, original in reversed(self._originals):
+            setattr(owner, name, original)
+        self._originals = []
+
+
+def _peak_rss_MB():
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is reported in bytes on macOS and in kilobytes elsewhere
+    if sys.platform == 'darwin':
+        return peak / 1024.0**2
+    return peak / 1024.0
+
+
+@contextmanager
+def _working_directory(path):
+    old = os.getcwd()
+    os.chdir(path)
+    try:
+        yield
+    finally:
+        os.chdir(old)
+
+
+def run_case(case_name, optimizer=None, max_iter=None):
+    """
+    Run one benchmark case in the current process and return its measurements.
+
+    Peak memory is that of the whole process, so for meaningful memory numbers each case
+    should be run in a fresh process (as run_benchmarks does).
+
+    Parameters
+    ----------
+    case_name : str
+        Name of the case in benchmark_cases.
+    optimizer : str, optional
+        Optimizer used by the case. Defaults to IPOPT when pyoptsparse is available and
+        SLSQP otherwise.
+    max_iter : int, optional
+        Maximum number of driver iterations. Defaults to 0, which measures one model
+        evaluation of the full problem.
+
+    Returns
+    -------
+    dict
+        Measured stage times (s), driver iterations, peak RSS (MB) and total time (s).
+    """
+    func, uses_driver_options = benchmark_cases[case_name]
+
+    if optimizer is None:
+        optimizer = _default_optimizer()
+    if max_iter is None:
+        max_iter = 0
+
+    with tempfile.TemporaryDirectory() as workdir, _working_directory(workdir):
+        with StageTimer() as timer:
+            start = time.perf_counter()
+            func(optimizer, max_iter)
+            total = time.perf_counter() - start
+
+    result = {
+        'case': case_name,
+        'optimizer': optimizer if uses_driver_options else None,
+        'max_iter': max_iter if uses_driver_options else None,
+        'total': total,
+        'driver_iterations': timer.driver_iterations,
+        'peak_rss_MB': _peak_rss_MB(),
+    }
+    result.update(timer.times)
+
+    return result
+
+
+def _run_case_in_subprocess(case_name, optimizer, max_iter):
+    with tempfile.TemporaryDirectory() as tmpdir:
+        out_file = os.path.join(tmpdir, 'result.json')
+        cmd = [
+            sys.executable,
+            '-m',
+            'aviary.validation_cases.performance_benchmarks',
+            case_name,
+            '--single',
+            out_file,
+        ]
+        if optimizer is not None:
+            cmd += ['--optimizer', optimizer]
+        if max_iter is not None:
+            cmd += ['--max_iter', str(max_iter)]
+
+        # make sure the child process imports this same copy of aviary
+        env = dict(os.environ)
+        package_root = os.path.dirname(os.path.dirname(aviary.__file__))
+        env['PYTHONPATH'] = os.pathsep.join(filter(None, [package_root, env.get('PYTHONPATH')]))
+
+        status = subprocess.run(cmd, env=env)
+
+        if status.returncode != 0:
+            return {'case': case_name, 'error': f'exited with code {status.returncode}'}
+
+        with open(out_file) as f:
+            return json.load(f)
+
+
+def _git_revision():
+    try:
+        status = subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'],
+            cwd=os.path.dirname(aviary.__file__),
+            capture_output=True,
+            text=True,
+        )
+    except OSError:
+        return None
+    if status.returncode != 0:
+        return None
+    return status.stdout.strip()
+
+
+def run_benchmarks(case_names=None, optimizer=None, max_iter=None, repeat=1):
+    """
+    Run benchmark cases, each in a fresh process, and return one record for the session.
+
+    When a case is repeated, the fastest repetition of each time is kept, which is the
+    least noisy estimate of the cost of the code itself.
+
+    Parameters
+    ----------
+    case_names : list of str, optional
+        Cases to run. Defaults to every case in benchmark_cases.
+    optimizer : str, optional
+        Optimizer used by the cases that accept one.
+    max_iter : int, optional
+        Maximum number of driver iterations for the cases that accept it.
+    repeat : int
+        Number of times each case is run.
+
+    Returns
+    -------
+    dict
+        Record with the date, git revision, platform information and per-case results.
+    """
+    if case_names is None:
+        case_names = list(benchmark_cases)
+
+    results = {}
+    for case_name in case_names:
+        if case_name not in benchmark_cases:
+            raise ValueError(
+                f'Unknown benchmark case "{case_name}". Available cases are: '
+                f'{", ".join(benchmark_cases)}'
+            )
+
+        runs = [_run_case_in_subprocess(case_name, optimizer, max_iter) for _ in range(repeat)]
+        good_runs = [run for run in runs if 'error' not in run]
+
+        if not good_runs:
+            results[case_name] = runs[0]
+            continue
+
+        best = dict(good_runs[0])
+        for run in good_runs[1:]:
+            for key in ('total',) + STAGES:
+                best[key] = min(best[key], run[key])
+        results[case_name] = best
+
+    return {
+        'date': datetime.datetime.now().isoformat(timespec='seconds'),
+        'revision': _git_revision(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'results': results,
+    }
+
+
+def append_history(record, history_file=DEFAULT_HISTORY_FILE):
+    """Append a benchmark record as a single line to the JSON lines history file."""
+    with open(history_file, 'a') as f:
+        f.write(json.dumps(record) + '\n')
+
+
+def read_history(history_file=DEFAULT_HISTORY_FILE):
+    """Return the list of benchmark records stored in a history file."""
+    if not os.path.exists(history_file):
+        return []
+
+    with open(history_file) as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def find_regressions(record, baseline, tolerance=0.2):
+    """
+    Compare the results of a benchmark record against a baseline record.
+
+    A metric is flagged when it exceeds the baseline value by more than the relative
+    tolerance and by more than the minimum meaningful change listed in COMPARED_METRICS.
+
+    Parameters
+    ----------
+    record : dict
+        Benchmark record, as returned by run_benchmarks.
+    baseline : dict
+        Benchmark record used as the reference.
+    tolerance : float
+        Allowed relative increase of each metric.
+
+    Returns
+    -------
+    list of tuple
+        (case, metric, baseline value, new value) for each regression found.
+    """
+    regressions = []
+
+    for case_name, result in record['results'].items():
+        if case_name not in baseline['results'] or 'error' in result:
+            continue
+
+        reference = baseline['results'][case_name]
+
+        for metric, min_change in COMPARED_METRICS.items():
+            old = reference.get(metric)
+            new = result.get(metric)
+            if old is None or new is None:
+                continue
+            if new - old > max(tolerance * abs(old), min_change):
+                regressions.append((case_name, metric, old, new))
+
+    return regressions
+
+
+def _format_value(value):
+    if value is None:
+        return '-'
+    if isinstance(value, float):
+        return f'{value:.2f}'
+    return str(value)
+
+
+def print_results(record, baseline=None, out_stream=sys.stdout):
+    """Print a table of the results of a benchmark record, next to the baseline if given."""
+    columns = ('total',) + STAGES + ('driver_iterations', 'peak_rss_MB')
+    header = ['case'] + list(columns)
+    print(' | '.join(header), file=out_stream)
+    print(' | '.join('---' for _ in header), file=out_stream)
+
+    for case_name, result in record['results'].items():
+        if 'error' in result:
+            print(f'{case_name} | {result["error"]}', file=out_stream)
+            continue
+
+        row = [case_name]
+        for column in columns:
+            text = _format_value(result.get(column))
+            if baseline is not None and case_name in baseline['results']:
+                old = baseline['results'][case_name].get(column)
+                if old is not None:
+                    text += f' ({_format_value(old)})'
+            row.append(text)
+        print(' | '.join(row), file=out_stream)
+
+
+def _setup_perf_parser(parser):
+    parser.add_argument(
+        'cases',
+        nargs='*',
+        default=None,
+        help=f'Cases to run. Defaults to all: {", ".join(benchmark_cases)}',
+    )
+    parser.add_argument(
+        '--optimizer',
+        default=None,
+        help='Optimizer used by the cases. Defaults to IPOPT if available, otherwise SLSQP',
+    )
+    parser.add_argument(
+        '--max_iter',
+        type=int,
+        default=None,
+        help='Maximum number of driver iterations. Defaults to 0 (a single model run)',
+    )
+    parser.add_argument('--repeat', type=int, default=1, help='Number of times each case is run')
+    parser.add_argument(
+        '--history',
+        default=DEFAULT_HISTORY_FILE,
+        help='JSON lines file the results are appended to',
+    )
+    parser.add_argument(
+        '--baseline',
+        default=None,
+        help='Baseline file to compare against. Regressions make the command fail',
+    )
+    parser.add_argument(
+        '--save-baseline',
+        nargs='?',
+        const=DEFAULT_BASELINE_FILE,
+        default=None,
+        help='Save the results as the new baseline',
+    )
+    parser.add_argument(
+        '--tolerance',
+        type=float,
+        default=0.2,
+        help='Allowed relative increase of each metric before it is flagged',
+    )
+    parser.add_argument('--single', default=None, help=argparse.SUPPRESS)
+
+
+def _exec_perf(args, user_args=None):
+    if args.single is not None:
+        # internal: run one case in this process and write its result
+        result = run_case(args.cases[0], optimizer=args.optimizer, max_iter=args.max_iter)
+        with open(args.single, 'w') as f:
+            json.dump(result, f)
+        return 0
+
+    record = run_benchmarks(
+        args.cases or None, optimizer=args.optimizer, max_iter=args.max_iter, repeat=args.repeat
+    )
+    append_history(record, args.history)
+
+    baseline = None
+    if args.baseline is not None:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+
+    print_results(record, baseline)
+
+    if args.save_baseline is not None:
+        with open(args.save_baseline, 'w') as f:
+            json.dump(record, f, indent=2)
+
+    if baseline is not None:
+        regressions = find_regressions(record, baseline, args.tolerance)
+        if regressions:
+            print('\nPerformance regressions:')
+            for case_name, metric, old, new in regressions:
+                print(f'  {case_name}: {metric} {_format_value(old)} -> {_format_value(new)}')
+            return 1
+
+    return 0
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Aviary performance benchmarks')
+    _setup_perf_parser(parser)
+    sys.exit(_exec_perf(parser.parse_args()))
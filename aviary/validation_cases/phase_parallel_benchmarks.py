@@ -0,0 +1,262 @@
+"""
+Wall-clock scaling benchmark of the phases of a multi-phase mission under MPI.
+
+The benchmark uses the mission with reserve phases from
+aviary/examples/reserve_missions/run_reserve_mission_multiphase.py. AviaryProblem puts
+its phases in a ParallelGroup, so under MPI they are distributed over the processes and
+linked by constraints instead of connections.
+
+The model evaluation (run_model) and the total derivatives (compute_totals) are timed,
+along with the time spent in each phase. On a single process, the wall-clock time on a
+given number of processes is estimated by distributing the measured phase times the way
+OpenMDAO allocates the phases, and replacing their sum with that of the busiest process.
+Under MPI, the measured time is the parallel time itself. Note that on a single process
+the phases remain connected, which makes the linear solves of the later phases more
+expensive than they are when the phases are linked by constraints.
+
+Usage::
+
+    python -m aviary.validation_cases.phase_parallel_benchmarks --procs 2 4
+    mpirun -n 4 python -m aviary.validation_cases.phase_parallel_benchmarks --repeat 5
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+import warnings
+from copy import deepcopy
+
+import numpy as np
+from openmdao.utils.mpi import MPI
+
+from aviary.validation_cases.performance_benchmarks import _format_value, _working_directory
+from aviary.validation_cases.takeoff_benchmarks import _time_phases
+
+
+def setup_reserve_mission_problem(optimizer='SLSQP', max_iter=0, parallel_phases=True):
+    """
+    Return the multi-phase reserve mission problem, set up with initial guesses applied.
+
+    Parameters
+    ----------
+    optimizer : str
+        Optimizer of the driver.
+    max_iter : int
+        Maximum number of iterations of the driver. The benchmark does not run it.
+    parallel_phases : bool
+        If True, the phases are in a ParallelGroup, so they are distributed over the
+        processes under MPI.
+
+    Returns
+    -------
+    AviaryProblem
+        The set-up problem.
+    """
+    from aviary.examples.reserve_missions.run_reserve_mission_multiphase import phase_info
+    from aviary.interface.methods_for_level2 import AviaryProblem
+
+    prob = AviaryProblem(verbosity=0)
+    prob.load_inputs('models/test_aircraft/aircraft_for_bench_FwFm.csv', deepcopy(phase_info))
+    prob.check_and_preprocess_inputs()
+    prob.add_pre_mission_systems()
+    prob.add_phases(parallel_phases=parallel_phases)
+    prob.add_post_mission_systems()
+    prob.link_phases()
+    prob.add_driver(optimizer, max_iter=max_iter, verbosity=0)
+    prob.add_design_variables()
+    prob.add_objective()
+
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        prob.setup()
+
+    prob.set_initial_guesses()
+    prob.set_solver_print(level=0)
+
+    return prob
+
+
+def allocate_phases(weights, procs):
+    """
+    Distribute phases over processes the way OpenMDAO does when there are more of them.
+
+    Starting from the heaviest phase, each phase is given to the least loaded process.
+
+    Parameters
+    ----------
+    weights : dict
+        Processor weight of each phase, keyed by phase name.
+    procs : int
+        Number of processes.
+
+    Returns
+    -------
+    list of list of str
+        Names of the phases on each process.
+    """
+    names = list(weights)
+    proc_weights = np.array([weights[name] for name in names], dtype=float)
+    proc_weights /= np.sum(proc_weights)
+
+    ranks = [[] for _ in range(procs)]
+    proc_load = np.zeros(procs)
+
+    for isub in np.flipud(np.argsort(proc_weights)):
+        iproc = np.argsort(proc_load)[0]
+        ranks[iproc].append(isub)
+        proc_load[iproc] += proc_weights[isub]
+
+    return [[names[isub] for isub in sorted(rank)] for rank in ranks]
+
+
+def _phase_weights(prob):
+    """Return the processor weight of each phase, keyed by phase name."""
+    proc_info = prob.model.traj.phases._proc_info
+    return {name: proc_info[name][2] for name in prob.model.traj._phases}
+
+
+def _estimate(result, weights, procs):
+    """Return a copy of serial results, estimated for the given number of processes."""
+    phase_times = result['phase_times']
+    ranks = allocate_phases(weights, procs)
+    busiest = max(sum(phase_times[name] for name in rank) for rank in ranks)
+    parallel_time = result['time'] - sum(phase_times.values()) + busiest
+
+    return dict(
+        result,
+        procs=procs,
+        ranks=ranks,
+        parallel_time=parallel_time,
+        speedup=result['time'] / parallel_time,
+    )
+
+
+def time_phases_parallel(prob, procs=4, repeat=1):
+    """
+    Time model evaluations and total derivatives of a problem with parallel phases.
+
+    Parameters
+    ----------
+    prob : AviaryProblem
+        Set-up problem, such as the one returned by setup_reserve_mission_problem.
+    procs : int
+        Number of processes the parallel time is estimated for, when not run under MPI.
+    repeat : int
+        Number of evaluations. The fastest one is reported.
+
+    Returns
+    -------
+    dict
+        Number of processes, fastest wall-clock time (s) of an evaluation, time (s) of
+        each phase during that evaluation, names of the phases on each process, and the
+        (estimated, on a single process) wall-clock time (s) with the phases distributed.
+    """
+    phase_names = list(prob.model.traj._phases)
+    phase_times = _time_phases(prob, phase_names)
+    parallel = MPI is not None and prob.comm.size > 1
+
+    best = None
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+
+        for _ in range(repeat):
+            phase_times.clear()
+
+            if parallel:
+                prob.comm.barrier()
+            start = time.perf_counter()
+            prob.run_model()
+            prob.compute_totals()
+            if parallel:
+                prob.comm.barrier()
+            elapsed = time.perf_counter() - start
+
+            if best is None or elapsed < best[0]:
+                best = (elapsed, dict(phase_times))
+
+    elapsed, phase_times = best
+
+    result = {'procs': prob.comm.size, 'time': elapsed, 'phase_times': phase_times}
+
+    if not parallel:
+        return _estimate(result, _phase_weights(prob), procs)
+
+    # each process only timed its own phases
+    all_times = prob.comm.allgather(phase_times)
+    result['phase_times'] = {name: t for times in all_times for name, t in times.items()}
+    result['ranks'] = [list(times) for times in all_times]
+    result['parallel_time'] = elapsed
+    result['speedup'] = None
+
+    return result
+
+
+def run_benchmark(procs=(2, 4), repeat=1):
+    """
+    Set up the multi-phase reserve mission and time its phases.
+
+    Parameters
+    ----------
+    procs : tuple of int
+        Numbers of processes the parallel time is estimated for, when not run under MPI.
+    repeat : int
+        Number of evaluations. The fastest one is reported.
+
+    Returns
+    -------
+    list of dict
+        Results, as returned by time_phases_parallel: one under MPI, otherwise one for
+        each number of processes.
+    """
+    with tempfile.TemporaryDirectory() as workdir, _working_directory(workdir):
+        prob = setup_reserve_mission_problem()
+
+        if MPI is not None and prob.comm.size > 1:
+            return [time_phases_parallel(prob, repeat=repeat)]
+
+        result = time_phases_parallel(prob, procs[0], repeat)
+
+        # the same measurements, distributed over the other numbers of processes
+        weights = _phase_weights(prob)
+        return [result] + [_estimate(result, weights, n) for n in procs[1:]]
+
+
+def print_results(results, out_stream=sys.stdout):
+    """Print the results of the phase scaling benchmark."""
+    result = results[0]
+    print(f'run_model + compute_totals: {_format_value(result["time"])} s', file=out_stream)
+
+    for name, phase_time in result['phase_times'].items():
+        print(f'  {name}: {_format_value(phase_time)} s', file=out_stream)
+
+    for result in results:
+        if result['speedup'] is None:
+            label = f'{result["procs"]} processes: {_format_value(result["parallel_time"])} s'
+        else:
+            label = (
+                f'{result["procs"]} processes (estimated): '
+                f'{_format_value(result["parallel_time"])} s, {_format_value(result["speedup"])}x'
+            )
+        print(label, file=out_stream)
+
+        for rank, names in enumerate(result['ranks']):
+            print(f'  rank {rank}: {", ".join(names)}', file=out_stream)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Aviary parallel phase benchmark')
+    parser.add_argument('--repeat', type=int, default=3, help='Number of evaluations')
+    parser.add_argument(
+        '--procs',
+        type=int,
+        nargs='+',
+        default=[2, 4],
+        help='Numbers of processes the parallel time is estimated for, without MPI',
+    )
+    args = parser.parse_args()
+
+    results = run_benchmark(args.procs, args.repeat)
+
+    if not MPI or MPI.COMM_WORLD.rank == 0:
+        print_results(results)
@@ -0,0 +1,212 @@
+"""
+Throughput benchmark of the pre-mission sizing of a batch of design variants.
+
+A design of experiments over a few wing, fuselage, engine and gross mass inputs of a
+bundled model, each varied at random by up to 15% around its value in the input deck, is
+evaluated with pre_mission_batch. The throughput is reported in designs per second, with
+the set-up of the problems included. For comparison, a few of the designs are also
+evaluated one at a time, by setting up a new pre-mission problem for each of them, the way
+a single aircraft is sized.
+
+Usage::
+
+    python -m aviary.validation_cases.pre_mission_benchmarks
+    python -m aviary.validation_cases.pre_mission_benchmarks GASP --designs 1000 --workers 4
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+import warnings
+
+import numpy as np
+
+from aviary.interface.pre_mission_batch import pre_mission_batch, setup_pre_mission_problem
+from aviary.utils.process_input_decks import create_vehicle
+from aviary.validation_cases.performance_benchmarks import _format_value, _working_directory
+from aviary.variable_info.functions import get_input_default
+from aviary.variable_info.variables import Aircraft, Mission
+
+# bundled aircraft models, and the inputs their designs vary
+vehicles = {
+    'FLOPS': (
+        'models/test_aircraft/aircraft_for_bench_FwFm.csv',
+        (
+            Aircraft.Wing.AREA,
+            Aircraft.Wing.ASPECT_RATIO,
+            Aircraft.Wing.SWEEP,
+            Aircraft.Wing.TAPER_RATIO,
+            Aircraft.Fuselage.LENGTH,
+            Aircraft.Engine.SCALE_FACTOR,
+            Mission.Design.GROSS_MASS,
+        ),
+    ),
+    'GASP': (
+        'models/test_aircraft/aircraft_for_bench_GwGm.csv',
+        (
+            Aircraft.Wing.LOADING,
+            Aircraft.Wing.ASPECT_RATIO,
+            Aircraft.Wing.SWEEP,
+            Aircraft.Wing.TAPER_RATIO,
+            Aircraft.Engine.SCALE_FACTOR,
+            Mission.Design.GROSS_MASS,
+        ),
+    ),
+}
+
+# outputs tabulated for each design
+OUTPUTS = (
+    Aircraft.Wing.SPAN,
+    Aircraft.Wing.MASS,
+    Aircraft.Fuselage.MASS,
+    Aircraft.Propulsion.TOTAL_ENGINE_MASS,
+    Aircraft.Design.STRUCTURE_MASS,
+    Aircraft.Design.OPERATING_MASS,
+    Aircraft.Fuel.TOTAL_CAPACITY,
+)
+
+
+def doe_designs(vehicle, num_designs, spread=0.15, seed=0):
+    """
+    Return random design variants of a bundled model.
+
+    Parameters
+    ----------
+    vehicle : str
+        Name of the model in vehicles.
+    num_designs : int
+        Number of designs.
+    spread : float
+        Largest relative change of each input from its value in the input deck.
+    seed : int
+        Seed of the random number generator.
+
+    Returns
+    -------
+    dict
+        Values of the design inputs, as (values, units) keyed by variable name.
+    """
+    aircraft_data, inputs = vehicles[vehicle]
+    aviary_inputs, _ = create_vehicle(aircraft_data)
+    rng = np.random.default_rng(seed)
+
+    designs = {}
+    for name in inputs:
+        val, units = get_input_default(name, aviary_inputs)
+        designs[name] = (val * rng.uniform(1.0 - spread, 1.0 + spread, num_designs), units)
+
+    return designs
+
+
+def time_batch(vehicle, num_designs=100, max_workers=1, num_single=3):
+    """
+    Time the pre-mission sizing of a batch of design variants of a bundled model.
+
+    Parameters
+    ----------
+    vehicle : str
+        Name of the model in vehicles.
+    num_designs : int
+        Number of designs of the batch.
+    max_workers : int
+        Number of worker processes the batch is spread over.
+    num_single : int
+        Number of designs that are also evaluated one at a time, each with its own
+        problem.
+
+    Returns
+    -------
+    dict
+        Number of designs and of workers, time (s) and throughput (designs per second) of
+        the batch, number of designs that could not be evaluated, throughput of the
+        designs evaluated one at a time, and the speedup of the batch over them.
+    """
+    aircraft_data = vehicles[vehicle][0]
+    designs = doe_designs(vehicle, num_designs)
+
+    start = time.perf_counter()
+    data = pre_mission_batch(aircraft_data, designs, OUTPUTS, max_workers=max_workers)
+    batch_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+
+        for i in range(num_single):
+            prob = setup_pre_mission_problem(aircraft_data)
+            for name, (vals, units) in designs.items():
+                prob.set_val(name, vals[i], units=units)
+            prob.run_model()
+
+    single_rate = num_single / (time.perf_counter() - start)
+    batch_rate = num_designs / batch_time
+
+    return {
+        'vehicle': vehicle,
+        'designs': num_designs,
+        'workers': max_workers,
+        'time': batch_time,
+        'designs_per_second': batch_rate,
+        'failures': int((~data['success']).sum()),
+        'single_designs_per_second': single_rate,
+        'speedup': batch_rate / single_rate,
+    }
+
+
+def run_benchmark(names=None, num_designs=100, max_workers=1, num_single=3):
+    """
+    Time the pre-mission sizing of a batch of design variants of each bundled model.
+
+    Parameters
+    ----------
+    names : list of str, optional
+        Names of the models in vehicles. Defaults to all of them.
+    num_designs : int
+        Number of designs of each batch.
+    max_workers : int
+        Number of worker processes each batch is spread over.
+    num_single : int
+        Number of designs that are also evaluated one at a time.
+
+    Returns
+    -------
+    list of dict
+        Results of each model, as returned by time_batch.
+    """
+    if not names:
+        names = list(vehicles)
+
+    with tempfile.TemporaryDirectory() as workdir, _working_directory(workdir):
+        return [time_batch(name, num_designs, max_workers, num_single) for name in names]
+
+
+def print_results(results, out_stream=sys.stdout):
+    """Print the results of the pre-mission batch benchmark."""
+    for result in results:
+        print(
+            f'{result["vehicle"]}: {result["designs"]} designs on {result["workers"]} '
+            f'worker(s) in {_format_value(result["time"])} s, '
+            f'{_format_value(result["designs_per_second"])} designs/s '
+            f'({result["failures"]} failed)',
+            file=out_stream,
+        )
+        print(
+            f'  one problem per design: '
+            f'{_format_value(result["single_designs_per_second"])} designs/s, '
+            f'batch speedup {_format_value(result["speedup"])}x',
+            file=out_stream,
+        )
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Aviary pre-mission batch benchmark')
+    parser.add_argument('names', nargs='*', help=f'Models to run, from {list(vehicles)}')
+    parser.add_argument('--designs', type=int, default=100, help='Number of designs')
+    parser.add_argument('--workers', type=int, default=1, help='Number of worker processes')
+    parser.add_argument(
+        '--single', type=int, default=3, help='Number of designs evaluated one at a time'
+    )
+    args = parser.parse_args()
+
+    print_results(run_benchmark(args.names, args.designs, args.workers, args.single))
@@ -0,0 +1,180 @@
+"""
+Comparison of the integrators available to SGM (shooting) trajectories.
+
+The GwGm benchmark aircraft is set up once with the shooting analysis scheme, then its
+trajectory is evaluated with each integrator, selected through the 'integrator' option
+of the trajectory. For each integrator, the fastest time of a model evaluation, the
+number of ODE evaluations and stored trajectory points, and the mission results are
+reported, so both the cost and the answer of each integrator can be compared.
+
+Usage::
+
+    python -m aviary.validation_cases.shooting_benchmarks
+    python -m aviary.validation_cases.shooting_benchmarks --repeat 3
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+import warnings
+from collections import Counter
+from copy import deepcopy
+from unittest.mock import patch
+
+from aviary.mission.gasp_based.ode.time_integration_base_classes import SimuPyProblem
+from aviary.validation_cases.performance_benchmarks import _format_value, _working_directory
+from aviary.variable_info.enums import AnalysisScheme
+from aviary.variable_info.variables import Mission
+
+INTEGRATORS = ('aviary', 'aviary_radau', 'simupy')
+
+
+def setup_shooting_problem():
+    """Return the GwGm benchmark problem with an SGM trajectory, run once."""
+    from aviary.interface.default_phase_info.two_dof_fiti import (
+        phase_info,
+        phase_info_parameterization,
+    )
+    from aviary.interface.methods_for_level1 import run_aviary
+
+    return run_aviary(
+        'models/test_aircraft/aircraft_for_bench_GwGm.csv',
+        deepcopy(phase_info),
+        optimizer='SLSQP',
+        run_driver=False,
+        analysis_scheme=AnalysisScheme.SHOOTING,
+        make_plots=False,
+        verbosity=0,
+        phase_info_parameterization=phase_info_parameterization,
+    )
+
+
+def time_integrator(prob, integrator, repeat=1):
+    """
+    Evaluate the trajectory of a shooting problem with the given integrator.
+
+    Parameters
+    ----------
+    prob : AviaryProblem
+        Problem returned by setup_shooting_problem.
+    integrator : str
+        Integrator used for the trajectory, one of INTEGRATORS.
+    repeat : int
+        Number of model evaluations.
+
+    Returns
+    -------
+    dict
+        Fastest time of a model evaluation (s), number of calls to the state, output and
+        event functions of the phases, number of trajectory points, and total fuel (lbm)
+        and range (NM) of the mission.
+    """
+    traj = prob.model.traj
+    traj.options['integrator'] = integrator
+
+    counts = Counter()
+
+    def counted(name):
+        method = getattr(SimuPyProblem, name)
+
+        def wrapper(self, *args, **kwargs):
+            counts[name] += 1
+            return method(self, *args, **kwargs)
+
+        return wrapper
+
+    names = ('state_equation_function', 'output_equation_function', 'event_equation_function')
+
+    best = None
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+
+        for _ in range(repeat):
+            counts.clear()
+
+            with patch.multiple(SimuPyProblem, **{name: counted(name) for name in names}):
+                start = time.perf_counter()
+                prob.run_model()
+                elapsed = time.perf_counter() - start
+
+            best = elapsed if best is None else min(best, elapsed)
+
+    return {
+        'integrator': integrator,
+        'time': best,
+        'state_calls': counts['state_equation_function'],
+        'output_calls': counts['output_equation_function'],
+        'event_calls': counts['event_equation_function'],
+        'points': sum(result.t.size for result in traj.sim_results),
+        'total_fuel': float(prob.get_val(Mission.Summary.TOTAL_FUEL_MASS, 'lbm')[0]),
+        'range': float(prob.get_val(Mission.Summary.RANGE, 'NM')[0]),
+    }
+
+
+def run_comparison(integrators=INTEGRATORS, repeat=1):
+    """
+    Evaluate the GwGm shooting trajectory with each integrator.
+
+    Parameters
+    ----------
+    integrators : list of str
+        Integrators to compare. Defaults to all of them.
+    repeat : int
+        Number of model evaluations per integrator.
+
+    Returns
+    -------
+    list of dict
+        Results of each integrator, as returned by time_integrator.
+    """
+    for integrator in integrators:
+        if integrator not in INTEGRATORS:
+            raise ValueError(
+                f'Unknown integrator "{integrator}". Available integrators are: '
+                f'{", ".join(INTEGRATORS)}'
+            )
+
+    with tempfile.TemporaryDirectory() as workdir, _working_directory(workdir):
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore')
+            prob = setup_shooting_problem()
+
+        return [time_integrator(prob, integrator, repeat) for integrator in integrators]
+
+
+def print_results(results, out_stream=sys.stdout):
+    """Print a table of integrator comparison results."""
+    columns = (
+        'time',
+        'state_calls',
+        'output_calls',
+        'event_calls',
+        'points',
+        'total_fuel',
+        'range',
+    )
+    header = ['integrator'] + list(columns)
+    print(' | '.join(header), file=out_stream)
+    print(' | '.join('---' for _ in header), file=out_stream)
+
+    for result in results:
+        row = [result['integrator']] + [_format_value(result[column]) for column in columns]
+        print(' | '.join(row), file=out_stream)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Aviary SGM integrator comparison')
+    parser.add_argument(
+        '--integrators',
+        nargs='+',
+        default=list(INTEGRATORS),
+        choices=INTEGRATORS,
+        help='Integrators to compare. Defaults to all',
+    )
+    parser.add_argument(
+        '--repeat', type=int, default=1, help='Number of model evaluations per integrator'
+    )
+    args = parser.parse_args()
+
+    print_results(run_comparison(args.integrators, args.repeat))
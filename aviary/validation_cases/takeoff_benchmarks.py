@@ -0,0 +1,262 @@
+"""
+Wall-clock benchmark of the branches of the balanced field length takeoff trajectory.
+
+The N3CC balanced field length trajectory has two independent branches after brake
+release: the continued takeoff and the aborted takeoff. TakeoffTrajectory assigns the
+phases of each branch to their own MPI processor group, so the branches are evaluated
+concurrently when the model runs on more than one process.
+
+The model evaluation (run_model) and the total derivatives (compute_totals) are timed,
+along with the time spent in the phases of each branch. Only measured times are
+reported: to compare against the trajectory without processor groups, run again with
+--no-branches. The branches only run concurrently under MPI; on a single process both
+runs evaluate the same phases in the same order.
+
+Usage::
+
+    python -m aviary.validation_cases.takeoff_benchmarks
+    mpirun -n 2 python -m aviary.validation_cases.takeoff_benchmarks --repeat 5
+    mpirun -n 2 python -m aviary.validation_cases.takeoff_benchmarks --repeat 5 --no-branches
+"""
+
+import argparse
+import copy
+import sys
+import tempfile
+import time
+import warnings
+from collections import defaultdict
+
+import dymos as dm
+import openmdao.api as om
+from openmdao.utils.mpi import MPI
+
+from aviary.validation_cases.performance_benchmarks import _format_value, _working_directory
+
+# methods through which a parent group evaluates a phase
+_PHASE_METHODS = ('_solve_nonlinear', '_linearize', '_apply_linear', '_solve_linear')
+
+
+def setup_balanced_field_problem(parallel_branches=True):
+    """
+    Return the N3CC balanced field length problem, set up with initial guesses applied.
+
+    Parameters
+    ----------
+    parallel_branches : bool
+        If True, the phases of the engine-out takeoff and of the aborted takeoff are
+        assigned to their own processor groups.
+
+    Returns
+    -------
+    prob : om.Problem
+        The set-up problem.
+    builder : TakeoffTrajectory
+        The trajectory builder, used to find the phases of each branch.
+    """
+    from aviary.models.N3CC.N3CC_data import (
+        balanced_liftoff_user_options,
+        balanced_trajectory_builder,
+        inputs,
+    )
+    from aviary.subsystems.premission import CorePreMission
+    from aviary.subsystems.propulsion.utils import build_engine_deck
+    from aviary.utils.functions import set_aviary_initial_values, set_aviary_input_defaults
+    from aviary.utils.preprocessors import preprocess_options
+    from aviary.utils.test_utils.default_subsystems import get_default_mission_subsystems
+    from aviary.variable_info.functions import setup_model_options
+    from aviary.variable_info.variables import Aircraft, Dynamic
+
+    aviary_options = inputs.deepcopy()
+
+    engine = build_engine_deck(aviary_options)
+    preprocess_options(aviary_options, engine_models=engine)
+
+    builder = copy.deepcopy(balanced_trajectory_builder)
+
+    prob = om.Problem()
+
+    prob.model.add_subsystem(
+        'core_subsystems',
+        CorePreMission(
+            aviary_options=aviary_options,
+            subsystems=get_default_mission_subsystems('FLOPS', engine),
+        ),
+        promotes_inputs=['aircraft:*'],
+        promotes_outputs=['aircraft:*', 'mission:*'],
+    )
+
+    traj = prob.model.add_subsystem('traj', dm.Trajectory())
+
+    builder.build_trajectory(
+        aviary_options=aviary_options,
+        model=prob.model,
+        traj=traj,
+        parallel_branches=parallel_branches,
+    )
+
+    distance_max, units = balanced_liftoff_user_options.get_item('distance_max')
+    liftoff = builder.get_phase('balanced_liftoff')
+    liftoff.add_objective(Dynamic.Mission.DISTANCE, loc='final', ref=distance_max, units=units)
+
+    varnames = [Aircraft.Wing.ASPECT_RATIO, Aircraft.Engine.SCALE_FACTOR]
+    set_aviary_input_defaults(prob.model, varnames, aviary_options)
+
+    setup_model_options(prob, aviary_options)
+
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', om.PromotionWarning)
+        prob.setup()
+
+    set_aviary_initial_values(prob, aviary_options)
+    prob.set_solver_print(level=0)
+
+    builder.apply_initial_guesses(prob, 'traj')
+
+    return prob, builder
+
+
+def _time_phases(prob, phase_names):
+    """
+    Wrap the evaluation methods of the phases that are local to this process with timers.
+
+    Returns
+    -------
+    dict
+        Accumulated time (s) of each local phase, keyed by phase name.
+    """
+    phase_times = defaultdict(float)
+
+    for name in phase_names:
+        phase = prob.model.traj.phases._get_subsystem(name)
+
+        # phases assigned to other processes are not local
+        if phase is None or not phase._is_local:
+            continue
+
+        for method_name in _PHASE_METHODS:
+            method = getattr(phase, method_name)
+
+            def timed(*args, _method=method, _name=name, **kwargs):
+                start = time.perf_counter()
+                try:
+                    return _method(*args, **kwargs)
+                finally:
+                    phase_times[_name] += time.perf_counter() - start
+
+            setattr(phase, method_name, timed)
+
+    return phase_times
+
+
+def time_branches(prob, builder, repeat=1):
+    """
+    Time model evaluations and total derivatives of the balanced field length problem.
+
+    Parameters
+    ----------
+    prob : om.Problem
+        Problem returned by setup_balanced_field_problem.
+    builder : TakeoffTrajectory
+        Trajectory builder returned by setup_balanced_field_problem.
+    repeat : int
+        Number of evaluations. The fastest one is reported.
+
+    Returns
+    -------
+    dict
+        Number of processes, whether the branches have their own processor groups,
+        fastest wall-clock time (s) of an evaluation, and time (s) of each branch during
+        that evaluation.
+    """
+    branches = builder.get_branches()
+    phase_times = _time_phases(prob, builder.get_phase_names())
+    parallel = MPI is not None and prob.comm.size > 1
+
+    best = None
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+
+        for _ in range(repeat):
+            phase_times.clear()
+
+            if parallel:
+                prob.comm.barrier()
+            start = time.perf_counter()
+            prob.run_model()
+            prob.compute_totals()
+            if parallel:
+                prob.comm.barrier()
+            elapsed = time.perf_counter() - start
+
+            if best is None or elapsed < best[0]:
+                best = (elapsed, dict(phase_times))
+
+    elapsed, phase_times = best
+
+    if parallel:
+        # each process only timed its own phases
+        all_times = prob.comm.allgather(phase_times)
+        phase_times = {name: t for times in all_times for name, t in times.items()}
+
+    branch_times = {
+        branch: sum(phase_times.get(name, 0.0) for name in names)
+        for branch, names in branches.items()
+    }
+
+    proc_groups = {info[3] for info in prob.model.traj.phases._proc_info.values()}
+
+    return {
+        'procs': prob.comm.size,
+        'proc_groups': None not in proc_groups,
+        'time': elapsed,
+        'branch_times': branch_times,
+    }
+
+
+def run_benchmark(repeat=1, parallel_branches=True):
+    """
+    Set up the balanced field length problem and time its branches.
+
+    Parameters
+    ----------
+    repeat : int
+        Number of evaluations. The fastest one is reported.
+    parallel_branches : bool
+        If True, each branch is assigned to its own processor group.
+
+    Returns
+    -------
+    dict
+        Results, as returned by time_branches.
+    """
+    with tempfile.TemporaryDirectory() as workdir, _working_directory(workdir):
+        prob, builder = setup_balanced_field_problem(parallel_branches)
+
+        return time_branches(prob, builder, repeat)
+
+
+def print_results(result, out_stream=sys.stdout):
+    """Print the results of the takeoff branch benchmark."""
+    grouping = 'one processor group per branch' if result['proc_groups'] else 'none'
+    print(f'processes: {result["procs"]}, branch grouping: {grouping}', file=out_stream)
+    print(f'run_model + compute_totals: {_format_value(result["time"])} s', file=out_stream)
+
+    for branch, branch_time in result['branch_times'].items():
+        print(f'  {branch} branch: {_format_value(branch_time)} s', file=out_stream)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Aviary takeoff branch benchmark')
+    parser.add_argument('--repeat', type=int, default=3, help='Number of evaluations')
+    parser.add_argument(
+        '--no-branches',
+        action='store_true',
+        help='Do not assign the branches to their own processor groups',
+    )
+    args = parser.parse_args()
+
+    result = run_benchmark(args.repeat, parallel_branches=not args.no_branches)
+
+    if not MPI or MPI.COMM_WORLD.rank == 0:
+        print_results(result)
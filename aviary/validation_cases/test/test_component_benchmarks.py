@@ -0,0 +1,51 @@
+import unittest
+from io import StringIO
+
+from openmdao.utils.testing_utils import use_tempdirs
+
+from aviary.validation_cases.component_benchmarks import (
+    print_results,
+    run_benchmark,
+    scaling_exponent,
+)
+
+
+@use_tempdirs
+class ComponentBenchmarkTest(unittest.TestCase):
+    def test_atmosphere(self):
+        results = run_benchmark('atmosphere', num_nodes=(1, 5), min_time=1e-4)
+
+        self.assertEqual(
+            set(results),
+            {
+                'atmosphere',
+                'atmosphere.standard_atmosphere',
+                'atmosphere.flight_conditions',
+            },
+        )
+
+        for entry in results.values():
+            self.assertEqual(entry['num_nodes'], [1, 5])
+            self.assertEqual(len(entry['compute']), 2)
+            self.assertEqual(len(entry['compute_partials']), 2)
+            self.assertGreater(min(entry['compute']), 0.0)
+
+        self.assertEqual(results['atmosphere.flight_conditions']['class'], 'FlightConditions')
+
+        out_stream = StringIO()
+        print_results(results, out_stream=out_stream)
+        self.assertIn('atmosphere.standard_atmosphere', out_stream.getvalue())
+
+    def test_pre_mission_inputs(self):
+        # aerodynamics is evaluated with the outputs of the sized aircraft
+        results = run_benchmark('FLOPS_aerodynamics', num_nodes=(2,), min_time=1e-4)
+        self.assertEqual(results['FLOPS_aerodynamics']['class'], 'ComputedAeroGroup')
+
+    def test_scaling_exponent(self):
+        self.assertAlmostEqual(scaling_exponent([10, 100, 1000], [1.0, 2.0, 20.0]), 1.0)
+        self.assertAlmostEqual(scaling_exponent([10, 100], [3.0, 3.0]), 0.0)
+        self.assertIsNone(scaling_exponent([10], [1.0]))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,24 @@
+import unittest
+from io import StringIO
+
+from aviary.validation_cases.input_deck_benchmarks import bundled_decks, print_results, time_deck
+
+
+class InputDeckBenchmarkTest(unittest.TestCase):
+    def test_time_deck(self):
+        decks = bundled_decks()
+        self.assertIn('models/test_aircraft/aircraft_for_bench_FwFm.csv', decks)
+
+        result = time_deck('models/test_aircraft/aircraft_for_bench_FwFm.csv', repeat=2)
+
+        self.assertNotIn('error', result)
+        self.assertEqual(result['entries'], 157)
+        self.assertGreater(result['time'], 0.0)
+
+        out_stream = StringIO()
+        print_results([result], out_stream=out_stream)
+        self.assertIn('aircraft_for_bench_FwFm.csv | 157', out_stream.getvalue())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,64 @@
+import unittest
+from copy import deepcopy
+
+import openmdao.api as om
+from openmdao.utils.testing_utils import use_tempdirs
+
+from aviary.validation_cases.performance_benchmarks import StageTimer, find_regressions
+
+
+@use_tempdirs
+class StageTimerTest(unittest.TestCase):
+    def test_stage_times(self):
+        with StageTimer() as timer:
+            prob = om.Problem()
+            prob.model.add_subsystem('comp', om.ExecComp('y = 2.0 * x'), promotes=['*'])
+            prob.model.add_design_var('x', lower=-10.0, upper=10.0)
+            prob.model.add_objective('y')
+            prob.driver = om.ScipyOptimizeDriver(optimizer='SLSQP', maxiter=3, disp=False)
+            prob.setup()
+            prob.run_model()
+            prob.run_driver()
+
+        self.assertEqual(timer.calls['setup'], 1)
+        self.assertEqual(timer.calls['run_model'], 1)
+        self.assertEqual(timer.calls['run_driver'], 1)
+        # final_setup is called from run_model and run_driver
+        self.assertEqual(timer.calls['final_setup'], 2)
+        self.assertGreater(timer.driver_iterations, 0)
+        for stage in ('setup', 'final_setup', 'run_model', 'run_driver'):
+            self.assertGreater(timer.times[stage], 0.0)
+
+        # the original methods are restored on exit
+        self.assertNotIn('__wrapped__', om.Problem.setup.__dict__)
+
+
+class FindRegressionsTest(unittest.TestCase):
+    def test_find_regressions(self):
+        baseline = {
+            'results': {
+                'FwFm': {'total': 10.0, 'setup': 1.0, 'run_driver': 5.0, 'peak_rss_MB': 300.0},
+                'GwGm': {'total': 20.0, 'setup': 0.1},
+            }
+        }
+        record = deepcopy(baseline)
+        self.assertEqual(find_regressions(record, baseline), [])
+
+        # slower beyond the tolerance
+        record['results']['FwFm']['run_driver'] = 8.0
+        # slower beyond the tolerance, but below the minimum meaningful change
+        record['results']['GwGm']['setup'] = 0.3
+        # faster is never flagged
+        record['results']['FwFm']['total'] = 5.0
+
+        regressions = find_regressions(record, baseline, tolerance=0.2)
+        self.assertEqual(regressions, [('FwFm', 'run_driver', 5.0, 8.0)])
+
+        # cases without a baseline and failed cases are skipped
+        record['results']['N3CC'] = {'total': 100.0}
+        record['results']['GwGm'] = {'error': 'exited with code 1'}
+        self.assertEqual(len(find_regressions(record, baseline, tolerance=0.2)), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
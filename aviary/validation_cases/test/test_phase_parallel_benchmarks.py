@@ -0,0 +1,75 @@
+import tempfile
+import unittest
+from io import StringIO
+
+from openmdao.utils.assert_utils import assert_near_equal
+from openmdao.utils.mpi import MPI
+from openmdao.utils.testing_utils import use_tempdirs
+
+from aviary.validation_cases.performance_benchmarks import _working_directory
+from aviary.validation_cases.phase_parallel_benchmarks import (
+    allocate_phases,
+    print_results,
+    setup_reserve_mission_problem,
+    time_phases_parallel,
+)
+from aviary.variable_info.variables import Mission
+
+try:
+    from openmdao.vectors.petsc_vector import PETScVector
+except ImportError:
+    PETScVector = None
+
+
+class PhaseParallelBenchmarkTest(unittest.TestCase):
+    def test_allocate_phases(self):
+        weights = {'climb': 30.0, 'cruise': 15.0, 'descent': 10.0, 'reserve': 5.0}
+
+        self.assertEqual(allocate_phases(weights, 1), [list(weights)])
+        self.assertEqual(allocate_phases(weights, 2), [['climb'], ['cruise', 'descent', 'reserve']])
+
+    def test_reserve_mission(self):
+        with tempfile.TemporaryDirectory() as workdir, _working_directory(workdir):
+            prob = setup_reserve_mission_problem()
+
+            self.assertEqual(len(prob.model.traj.phases._proc_info), 8)
+
+            result = time_phases_parallel(prob, procs=4)
+
+        self.assertEqual(result['procs'], 4)
+        self.assertEqual(len(result['ranks']), 4)
+        self.assertEqual(sorted(sum(result['ranks'], [])), sorted(result['phase_times']))
+
+        out_stream = StringIO()
+        print_results([result], out_stream=out_stream)
+        self.assertIn('4 processes (estimated)', out_stream.getvalue())
+
+
+@use_tempdirs
+@unittest.skipUnless(MPI and PETScVector, 'MPI and PETSc are required.')
+class PhaseParallelMPITest(unittest.TestCase):
+    N_PROCS = 2
+
+    def test_reserve_mission(self):
+        names = [
+            Mission.Summary.FUEL_BURNED,
+            Mission.Summary.RESERVE_FUEL_BURNED,
+            Mission.Summary.GROSS_MASS,
+        ]
+        results = {}
+
+        for parallel_phases in (False, True):
+            prob = setup_reserve_mission_problem(max_iter=100, parallel_phases=parallel_phases)
+            prob.run_aviary_problem(make_plots=False)
+
+            self.assertTrue(prob.problem_ran_successfully)
+            results[parallel_phases] = [prob.get_val(name, units='lbm') for name in names]
+
+        # the phases split over the processes and linked by constraints converge to the
+        # same mission as the connected phases on every process
+        for serial, parallel in zip(results[False], results[True]):
+            assert_near_equal(parallel, serial, 1e-4)
+
+
+if __name__ == '__main__':
+    unittest.main()
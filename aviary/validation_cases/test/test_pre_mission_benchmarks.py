@@ -0,0 +1,47 @@
+import unittest
+from io import StringIO
+
+import numpy as np
+from openmdao.utils.assert_utils import assert_near_equal
+
+from aviary.validation_cases.pre_mission_benchmarks import (
+    doe_designs,
+    print_results,
+    run_benchmark,
+    vehicles,
+)
+from aviary.variable_info.variables import Aircraft
+
+
+class PreMissionBenchmarkTest(unittest.TestCase):
+    def test_doe_designs(self):
+        designs = doe_designs('GASP', 10, spread=0.1)
+
+        self.assertEqual(list(designs), list(vehicles['GASP'][1]))
+        for vals, _ in designs.values():
+            self.assertEqual(len(vals), 10)
+
+        vals, units = designs[Aircraft.Wing.ASPECT_RATIO]
+        self.assertTrue(np.all(np.abs(vals / 10.13 - 1.0) <= 0.1))
+
+        # the same seed gives the same designs
+        assert_near_equal(doe_designs('GASP', 10, spread=0.1)[Aircraft.Wing.ASPECT_RATIO][0], vals)
+        self.assertEqual(units, 'unitless')
+
+    def test_benchmark(self):
+        results = run_benchmark(['FLOPS'], num_designs=5, num_single=1)
+
+        self.assertEqual(len(results), 1)
+        result = results[0]
+        self.assertEqual(result['designs'], 5)
+        self.assertEqual(result['failures'], 0)
+        self.assertGreater(result['designs_per_second'], 0.0)
+        self.assertGreater(result['single_designs_per_second'], 0.0)
+
+        out_stream = StringIO()
+        print_results(results, out_stream=out_stream)
+        self.assertIn('FLOPS: 5 designs', out_stream.getvalue())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,32 @@
+import unittest
+from io import StringIO
+
+from openmdao.utils.assert_utils import assert_near_equal
+
+from aviary.validation_cases.shooting_benchmarks import print_results, run_comparison
+
+
+class ShootingBenchmarkTest(unittest.TestCase):
+    def test_run_comparison(self):
+        results = run_comparison(['aviary', 'aviary_radau'])
+
+        for result, integrator in zip(results, ('aviary', 'aviary_radau')):
+            self.assertEqual(result['integrator'], integrator)
+            self.assertGreater(result['state_calls'], 0)
+            self.assertGreater(result['points'], 0)
+            self.assertGreater(result['total_fuel'], 0.0)
+
+        # the explicit and implicit methods fly the same mission
+        assert_near_equal(results[1]['total_fuel'], results[0]['total_fuel'], 1e-4)
+
+        out_stream = StringIO()
+        print_results(results, out_stream=out_stream)
+        self.assertIn('aviary', out_stream.getvalue())
+
+    def test_unknown_integrator(self):
+        with self.assertRaises(ValueError):
+            run_comparison(['unknown'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,63 @@
+import tempfile
+import unittest
+from io import StringIO
+
+from aviary.validation_cases.performance_benchmarks import _working_directory
+from aviary.validation_cases.takeoff_benchmarks import (
+    print_results,
+    setup_balanced_field_problem,
+    time_branches,
+)
+
+
+class TakeoffBenchmarkTest(unittest.TestCase):
+    def test_branches(self):
+        with tempfile.TemporaryDirectory() as workdir, _working_directory(workdir):
+            prob, builder = setup_balanced_field_problem()
+
+            branches = builder.get_branches()
+            self.assertEqual(branches['abort'], ['balanced_delayed_brake', 'balanced_abort'])
+            self.assertEqual(branches['takeoff'][0], 'balanced_brake_release')
+            self.assertEqual(
+                sorted(branches['takeoff'] + branches['abort']),
+                sorted(builder.get_phase_names()),
+            )
+
+            # each branch is allocated its own processors
+            proc_info = prob.model.traj.phases._proc_info
+            for branch, names in branches.items():
+                for name in names:
+                    self.assertEqual(proc_info[name][3], branch)
+                    self.assertEqual(proc_info[name][2], float(len(names)))
+
+            result = time_branches(prob, builder)
+
+        self.assertEqual(result['procs'], 1)
+        self.assertTrue(result['proc_groups'])
+        self.assertGreater(result['branch_times']['takeoff'], 0.0)
+        self.assertGreater(result['branch_times']['abort'], 0.0)
+        self.assertLess(sum(result['branch_times'].values()), result['time'])
+
+        out_stream = StringIO()
+        print_results(result, out_stream=out_stream)
+        self.assertIn('abort branch', out_stream.getvalue())
+
+    def test_no_branches(self):
+        with tempfile.TemporaryDirectory() as workdir, _working_directory(workdir):
+            prob, builder = setup_balanced_field_problem(parallel_branches=False)
+
+            proc_info = prob.model.traj.phases._proc_info
+            for name in builder.get_phase_names():
+                self.assertIsNone(proc_info[name][3])
+
+            result = time_branches(prob, builder)
+
+        self.assertFalse(result['proc_groups'])
+
+        out_stream = StringIO()
+        print_results(result, out_stream=out_stream)
+        self.assertIn('branch grouping: none', out_stream.getvalue())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,43 @@
+import unittest
+from io import StringIO
+
+from aviary.interface.default_phase_info.two_dof import phase_info
+from aviary.validation_cases.transcription_benchmarks import (
+    collocation_phases,
+    print_results,
+    run_comparison,
+    run_transcription,
+)
+
+
+class TranscriptionBenchmarkTest(unittest.TestCase):
+    def test_collocation_phases(self):
+        phases = collocation_phases(phase_info)
+
+        self.assertIn('groundroll', phases)
+        self.assertIn('desc2', phases)
+        # the cruise is an analytic phase
+        self.assertNotIn('cruise', phases)
+
+    def test_run_transcription(self):
+        result = run_transcription('FwFm', 'gauss-lobatto', phases=['cruise'])
+
+        self.assertNotIn('error', result)
+        self.assertEqual(result['phases'], ['cruise'])
+        self.assertGreater(result['driver_iterations'], 0)
+        self.assertGreater(result['design_vars'], 0)
+        self.assertGreater(result['constraints'], 0)
+        self.assertTrue(result['success'])
+        self.assertAlmostEqual(result['fuel_burned'], 22515.0, delta=10.0)
+
+        out_stream = StringIO()
+        print_results([result], out_stream=out_stream)
+        self.assertIn('gauss-lobatto', out_stream.getvalue())
+
+    def test_unknown_case(self):
+        with self.assertRaises(ValueError):
+            run_comparison(['unknown'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,259 @@
+"""
+Comparison of the Dymos transcriptions available to the phases of the benchmark models.
+
+Each benchmark case is solved once per transcription, with that transcription selected
+(through the 'transcription' user option) for the chosen phases and Radau kept for the
+others. For every run, the wall time of the whole solve and of the driver, the number of
+driver iterations, the size of the optimization problem and the final fuel burn are
+reported, so both the cost and the answer of each transcription can be compared.
+
+Usage::
+
+    python -m aviary.validation_cases.transcription_benchmarks
+    python -m aviary.validation_cases.transcription_benchmarks FwFm --phases cruise
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+import traceback
+from copy import deepcopy
+
+from aviary.validation_cases.performance_benchmarks import (
+    StageTimer,
+    _default_optimizer,
+    _format_value,
+    _working_directory,
+)
+from aviary.variable_info.variables import Mission
+
+TRANSCRIPTIONS = ('radau', 'gauss-lobatto', 'birkhoff')
+
+
+def _FwFm_inputs():
+    from aviary.interface.default_phase_info.height_energy import phase_info
+
+    return 'models/test_aircraft/aircraft_for_bench_FwFm.csv', phase_info
+
+
+def _GwGm_inputs():
+    from aviary.interface.default_phase_info.two_dof import phase_info
+
+    return 'models/test_aircraft/aircraft_for_bench_GwGm.csv', phase_info
+
+
+# name: function() -> (aircraft data, phase_info)
+comparison_cases = {
+    'FwFm': _FwFm_inputs,
+    'GwGm': _GwGm_inputs,
+}
+
+
+def collocation_phases(phase_info):
+    """Return the names of the phases of a phase_info that use a collocation transcription."""
+    return [
+        name for name, info in phase_info.items() if 'num_segments' in info.get('user_options', {})
+    ]
+
+
+def _problem_size(prob):
+    design_vars = prob.driver.get_design_var_values()
+    constraints = prob.driver.get_constraint_values()
+
+    return (
+        sum(value.size for value in design_vars.values()),
+        sum(value.size for value in constraints.values()),
+    )
+
+
+def run_transcription(case_name, transcription, phases=None, optimizer=None, max_iter=50):
+    """
+    Solve one comparison case with the given transcription and return its measurements.
+
+    Parameters
+    ----------
+    case_name : str
+        Name of the case in comparison_cases.
+    transcription : str
+        Transcription selected for the phases, one of TRANSCRIPTIONS.
+    phases : list of str, optional
+        Phases that use the transcription. Defaults to every collocation phase.
+    optimizer : str, optional
+        Optimizer used. Defaults to IPOPT when pyoptsparse is available and SLSQP
+        otherwise.
+    max_iter : int
+        Maximum number of driver iterations.
+
+    Returns
+    -------
+    dict
+        Total and driver wall time (s), driver iterations, number of design variables and
+        constraints, fuel burned (lbm) and whether the driver succeeded. If the case could
+        not be solved, the error instead.
+    """
+    from aviary.interface.methods_for_level1 import run_aviary
+
+    aircraft_data, phase_info = comparison_cases[case_name]()
+    phase_info = deepcopy(phase_info)
+
+    if phases is None:
+        phases = collocation_phases(phase_info)
+
+    for name in phases:
+        phase_info[name]['user_options']['transcription'] = transcription
+
+    if optimizer is None:
+        optimizer = _default_optimizer()
+
+    result = {'case': case_name, 'transcription': transcription, 'phases': list(phases)}
+
+    with tempfile.TemporaryDirectory() as workdir, _working_directory(workdir):
+        try:
+            with StageTimer() as timer:
+                start = time.perf_counter()
+                prob = run_aviary(
+                    aircraft_data,
+                    phase_info,
+                    optimizer=optimizer,
+                    max_iter=max_iter,
+                    make_plots=False,
+                    verbosity=0,
+                )
+                total = time.perf_counter() - start
+
+        except Exception:
+            result['error'] = traceback.format_exc(limit=1).strip().splitlines()[-1]
+            return result
+
+        num_design_vars, num_constraints = _problem_size(prob)
+
+        result.update(
+            {
+                'total': total,
+                'run_driver': timer.times['run_driver'],
+                'driver_iterations': timer.driver_iterations,
+                'design_vars': num_design_vars,
+                'constraints': num_constraints,
+                'fuel_burned': float(prob.get_val(Mission.Summary.FUEL_BURNED, 'lbm')[0]),
+                'success': prob.problem_ran_successfully,
+            }
+        )
+
+    return result
+
+
+def run_comparison(
+    case_names=None, transcriptions=TRANSCRIPTIONS, phases=None, optimizer=None, max_iter=50
+):
+    """
+    Solve every comparison case with every transcription.
+
+    Parameters
+    ----------
+    case_names : list of str, optional
+        Cases to run. Defaults to every case in comparison_cases.
+    transcriptions : list of str
+        Transcriptions to compare. Defaults to all of them.
+    phases : list of str, optional
+        Phases that use the compared transcription. Defaults to every collocation phase.
+    optimizer : str, optional
+        Optimizer used.
+    max_iter : int
+        Maximum number of driver iterations.
+
+    Returns
+    -------
+    list of dict
+        Results of each run, as returned by run_transcription.
+    """
+    if case_names is None:
+        case_names = list(comparison_cases)
+
+    for case_name in case_names:
+        if case_name not in comparison_cases:
+            raise ValueError(
+                f'Unknown comparison case "{case_name}". Available cases are: '
+                f'{", ".join(comparison_cases)}'
+            )
+
+    return [
+        run_transcription(case_name, transcription, phases, optimizer, max_iter)
+        for case_name in case_names
+        for transcription in transcriptions
+    ]
+
+
+def print_results(results, out_stream=sys.stdout):
+    """Print a table of comparison results."""
+    columns = (
+        'total',
+        'run_driver',
+        'driver_iterations',
+        'design_vars',
+        'constraints',
+        'fuel_burned',
+        'success',
+    )
+    header = ['case', 'transcription'] + list(columns)
+    print(' | '.join(header), file=out_stream)
+    print(' | '.join('---' for _ in header), file=out_stream)
+
+    for result in results:
+        row = [result['case'], result['transcription']]
+
+        if 'error' in result:
+            row.append(result['error'])
+        else:
+            row += [_format_value(result[column]) for column in columns]
+
+        print(' | '.join(row), file=out_stream)
+
+
+def _setup_comparison_parser(parser):
+    parser.add_argument(
+        'cases',
+        nargs='*',
+        default=None,
+        help=f'Cases to run. Defaults to all: {", ".join(comparison_cases)}',
+    )
+    parser.add_argument(
+        '--transcriptions',
+        nargs='+',
+        default=list(TRANSCRIPTIONS),
+        choices=TRANSCRIPTIONS,
+        help='Transcriptions to compare. Defaults to all',
+    )
+    parser.add_argument(
+        '--phases',
+        nargs='+',
+        default=None,
+        help='Phases that use the compared transcription. Defaults to all collocation phases',
+    )
+    parser.add_argument(
+        '--optimizer',
+        default=None,
+        help='Optimizer used by the cases. Defaults to IPOPT if available, otherwise SLSQP',
+    )
+    parser.add_argument(
+        '--max_iter', type=int, default=50, help='Maximum number of driver iterations'
+    )
+
+
+def _exec_comparison(args, user_args=None):
+    results = run_comparison(
+        args.cases or None,
+        transcriptions=args.transcriptions,
+        phases=args.phases,
+        optimizer=args.optimizer,
+        max_iter=args.max_iter,
+    )
+    print_results(results)
+
+    return 0
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Aviary transcription comparison')
+    _setup_comparison_parser(parser)
+    sys.exit(_exec_comparison(parser.parse_args()))
@@ -7,7 +7,8 @@ from dymos.utils.misc import _unspecified
 from openmdao.core.component import Component
 
 from aviary.utils.aviary_options_dict import units_setter
-from aviary.utils.aviary_values import AviaryValues
+from aviary.utils.aviary_values import AviaryValues, get_items
+from aviary.utils.develop_metadata import get_metadata_version
 from aviary.utils.utils import cast_type, check_type, enum_setter, wrapped_convert_units
 from aviary.variable_info.enums import Verbosity
 from aviary.variable_info.variable_meta_data import _MetaData
@@ -476,6 +477,118 @@ def get_units(key, meta_data=None) -> str:
     return meta_data[key]['units']
 
 
+class MetaDataIndex:
+    """
+    Hashed lookup of the options and inputs defined in a metadata dictionary.
+
+    Attributes
+    ----------
+    options : frozenset
+        Names of all variables that are options.
+    inputs : tuple
+        Names of the aircraft and mission variables that are not options, in metadata
+        order. These are the variables that can be promoted inputs of an Aviary model.
+    """
+
+    __slots__ = ('options', 'inputs', '_size', '_version')
+
+    def __init__(self, meta_data):
+        self._version = get_metadata_version()
+
+        options = []
+        inputs = []
+
+        for key, meta in meta_data.items():
+            if meta['option']:
+                options.append(key)
+
+            elif ':' in key and not key.startswith('dynamic:'):
+                inputs.append(key)
+
+        self.options = frozenset(options)
+        self.inputs = tuple(inputs)
+        self._size = len(meta_data)
+
+
+# Indices of the most recently used metadata dictionaries, keyed by id. The dictionary is
+# stored along with its index, so its id cannot be reused by another dictionary while it is
+# cached, and is checked for identity before its index is reused.
+_metadata_indices = {}
+_MAX_METADATA_INDICES = 8
+
+
+def get_metadata_index(meta_data=_MetaData) -> MetaDataIndex:
+    """
+    Return the option and input index of the given metadata.
+
+    The index is built the first time a metadata dictionary is seen and reused afterwards,
+    so that setup_model_options, extract_options and AviaryGroup.configure do not need to
+    walk the full metadata each time. It is rebuilt if any metadata has been changed by
+    add_meta_data or update_meta_data since it was built, or if variables have been removed
+    from the metadata. Entries changed in place, without these functions, are not detected.
+
+    Parameters
+    ----------
+    meta_data : dict
+        (Optional) Dictionary of aircraft metadata. Uses Aviary's built-in
+        metadata by default.
+
+    Returns
+    -------
+    MetaDataIndex
+        Index of the options and inputs in the metadata.
+    """
+    key = id(meta_data)
+    cached = _metadata_indices.pop(key, None)
+
+    if (
+        cached is not None
+        and cached[0] is meta_data
+        and cached[1]._version == get_metadata_version()
+        and cached[1]._size == len(meta_data)
+    ):
+        index = cached[1]
+    else:
+        index = MetaDataIndex(meta_data)
+
+    # most recently used entries are kept at the end
+    _metadata_indices[key] = (meta_data, index)
+    if len(_metadata_indices) > _MAX_METADATA_INDICES:
+        del _metadata_indices[next(iter(_metadata_indices))]
+
+    return index
+
+
+def get_input_default(key, aviary_inputs: AviaryValues, meta_data=_MetaData):
+    """
+    Return the value and units used as the default of an input in an Aviary model.
+
+    The value in aviary_inputs is used when present, otherwise the default value from the
+    metadata.
+
+    Parameters
+    ----------
+    key : str
+        Name of the variable.
+    aviary_inputs : AviaryValues
+        Instance of AviaryValues containing all initial values.
+    meta_data : dict
+        (Optional) Dictionary of aircraft metadata. Uses Aviary's built-in
+        metadata by default.
+
+    Returns
+    -------
+    tuple
+        Value and units of the input. The value is None when the variable is not in
+        aviary_inputs and has no default value.
+    """
+    if key in aviary_inputs:
+        return aviary_inputs.get_item(key)
+
+    meta = meta_data[key]
+    return meta['default_value'], meta['units']
+
+
 def extract_options(aviary_inputs: AviaryValues, metadata=_MetaData) -> dict:
     """
     Extract a dictionary of options from the given aviary_inputs.
@@ -493,16 +606,14 @@ def extract_options(aviary_inputs: AviaryValues, metadata=_MetaData) -> dict:
     dict
         Dictionary of option names and values.
     """
-    options = {}
-    for key, meta in metadata.items():
-        if key not in aviary_inputs:
-            continue
+    option_names = get_metadata_index(metadata).options
 
-        if not meta['option']:
+    options = {}
+    for key, (val, units) in get_items(aviary_inputs):
+        if key not in option_names:
             continue
 
-        val, units = aviary_inputs.get_item(key)
-        meta_units = meta['units']
+        meta_units = metadata[key]['units']
 
         if meta_units == 'unitless' or meta_units is None:
             options[key] = val
@@ -526,8 +637,9 @@ def setup_model_options(
 
     Parameters
     ----------
-    prob: Problem
-        OpenMDAO problem prior to setup.
+    prob: Problem or Group
+        OpenMDAO problem prior to setup, or a group in its setup, whose model options are
+        set.
     aviary_inputs : AviaryValues
         Instance of AviaryValues containing all initial values.
     meta_data : dict
@@ -3,8 +3,15 @@ import unittest
 import openmdao.api as om
 from openmdao.utils.assert_utils import assert_near_equal
 
-from aviary.utils.develop_metadata import add_meta_data
-from aviary.variable_info.functions import add_aviary_input, add_aviary_option, add_aviary_output
+from aviary.utils.aviary_values import AviaryValues
+from aviary.utils.develop_metadata import add_meta_data, update_meta_data
+from aviary.variable_info.functions import (
+    add_aviary_input,
+    add_aviary_option,
+    add_aviary_output,
+    extract_options,
+    get_metadata_index,
+)
 
 
 class InputOutputOptionTest(unittest.TestCase):
@@ -23,6 +30,43 @@ class InputOutputOptionTest(unittest.TestCase):
         assert_near_equal(11.0231, prob.get_val('mass_out'), tolerance=tol)
 
 
+class MetaDataIndexTest(unittest.TestCase):
+    def test_index(self):
+        meta_data = {}
+        add_meta_data('aircraft:dummy:count', meta_data, option=True, default_value=2)
+        add_meta_data('aircraft:dummy:span', meta_data, units='ft', option=True)
+        add_meta_data('aircraft:dummy:area', meta_data, units='ft**2', default_value=1.0)
+        add_meta_data('dynamic:dummy:speed', meta_data, units='ft/s')
+        add_meta_data('dummy_state', meta_data)
+
+        index = get_metadata_index(meta_data)
+        self.assertEqual(index.options, {'aircraft:dummy:count', 'aircraft:dummy:span'})
+        self.assertEqual(index.inputs, ('aircraft:dummy:area',))
+        self.assertIs(get_metadata_index(meta_data), index)
+
+        # variables added after the index was built are picked up
+        add_meta_data('mission:dummy:range', meta_data, units='NM')
+        index = get_metadata_index(meta_data)
+        self.assertEqual(index.inputs, ('aircraft:dummy:area', 'mission:dummy:range'))
+
+        # so are changes that keep the number of variables
+        update_meta_data('aircraft:dummy:span', meta_data, units='ft')
+        index = get_metadata_index(meta_data)
+        self.assertEqual(index.options, {'aircraft:dummy:count'})
+        self.assertEqual(
+            index.inputs, ('aircraft:dummy:span', 'aircraft:dummy:area', 'mission:dummy:range')
+        )
+        update_meta_data('aircraft:dummy:span', meta_data, units='ft', option=True)
+
+        aviary_inputs = AviaryValues()
+        aviary_inputs.set_val('aircraft:dummy:count', 3, meta_data=meta_data)
+        aviary_inputs.set_val('aircraft:dummy:span', 10.0, units='m', meta_data=meta_data)
+        aviary_inputs.set_val('aircraft:dummy:area', 5.0, units='ft**2', meta_data=meta_data)
+
+        options = extract_options(aviary_inputs, meta_data)
+        self.assertEqual(options, {'aircraft:dummy:count': 3, 'aircraft:dummy:span': (10.0, 'm')})
+
+
 class DummyComp(om.ExplicitComponent):
     """Simple component to test unit conversion."""
 
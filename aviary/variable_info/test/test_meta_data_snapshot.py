@@ -0,0 +1,100 @@
+import os
+import pickle
+import unittest
+from copy import deepcopy
+
+from openmdao.utils.testing_utils import use_tempdirs
+
+from aviary.utils.develop_metadata import add_meta_data, update_meta_data
+from aviary.utils.merge_variable_metadata import merge_meta_data
+from aviary.variable_info import variable_meta_data
+from aviary.variable_info.variable_meta_data import CoreMetaData, _MetaData
+from aviary.variable_info.variables import Aircraft
+
+
+@use_tempdirs
+class MetaDataSnapshotTest(unittest.TestCase):
+    """Tests for the snapshot of the core metadata."""
+
+    def test_snapshot(self):
+        source_hash = variable_meta_data._source_hash()
+        variable_meta_data.write_snapshot('snapshot.pkl')
+
+        # readable by every user, like the other package files
+        self.assertEqual(os.stat('snapshot.pkl').st_mode & 0o777, 0o644)
+
+        snapshot = variable_meta_data._load_snapshot(source_hash, 'snapshot.pkl')
+        definitions = variable_meta_data.build_meta_data()
+
+        self.assertIsInstance(snapshot, variable_meta_data.FrozenMetaData)
+        self.assertEqual(list(snapshot), list(definitions))
+        for key, meta in definitions.items():
+            self.assertEqual(snapshot[key], meta, key)
+            # the enums and classes in 'types' must compare as the same objects
+            self.assertEqual(snapshot[key]['types'], meta['types'], key)
+
+        self.assertEqual(snapshot, _MetaData)
+
+        # a snapshot of other source files is not used
+        self.assertIsNone(variable_meta_data._load_snapshot('stale', 'snapshot.pkl'))
+        self.assertIsNone(variable_meta_data._load_snapshot(source_hash, 'missing.pkl'))
+
+    def test_round_trip(self):
+        frozen = pickle.loads(pickle.dumps(_MetaData))
+
+        self.assertIsInstance(frozen, variable_meta_data.FrozenMetaData)
+        self.assertEqual(frozen, _MetaData)
+
+
+class CopyOnWriteTest(unittest.TestCase):
+    """Tests that the core metadata cannot change and that copies share its entries."""
+
+    def test_read_only(self):
+        key = Aircraft.Wing.AREA
+
+        with self.assertRaises(TypeError):
+            _MetaData[key] = {}
+
+        with self.assertRaises(TypeError):
+            _MetaData[key]['units'] = 'm**2'
+
+        with self.assertRaises(TypeError):
+            _MetaData[key]['historical_name']['GASP'] = None
+
+        with self.assertRaises(TypeError):
+            add_meta_data('aircraft:dummy:new_var', meta_data=_MetaData)
+
+    def test_copies(self):
+        key = Aircraft.Wing.AREA
+
+        for meta_data in (CoreMetaData, _MetaData.copy(), deepcopy(_MetaData)):
+            self.assertIs(type(meta_data), dict)
+            self.assertIs(meta_data[key], _MetaData[key])
+
+        extended = deepcopy(CoreMetaData)
+        self.assertIs(extended[key], _MetaData[key])
+
+        add_meta_data('aircraft:dummy:new_var', meta_data=extended, units='ft')
+        update_meta_data(key, meta_data=extended, units='m**2', default_value=1.0)
+
+        self.assertEqual(extended[key]['units'], 'm**2')
+        self.assertEqual(_MetaData[key]['units'], 'ft**2')
+        self.assertNotIn('aircraft:dummy:new_var', _MetaData)
+        self.assertNotIn('aircraft:dummy:new_var', CoreMetaData)
+
+        # a mutable copy of a single entry can be made
+        meta = _MetaData[key].copy()
+        meta['units'] = 'm**2'
+        self.assertEqual(_MetaData[key]['units'], 'ft**2')
+
+    def test_merge(self):
+        extended = deepcopy(CoreMetaData)
+        add_meta_data('aircraft:dummy:new_var', meta_data=extended, units='ft')
+
+        merged = merge_meta_data([CoreMetaData.copy(), extended])
+        self.assertEqual(len(merged), len(CoreMetaData) + 1)
+        self.assertIs(merged[Aircraft.Wing.AREA], _MetaData[Aircraft.Wing.AREA])
+
+
+if __name__ == '__main__':
+    unittest.main()
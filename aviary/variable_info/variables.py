@@ -752,6 +752,7 @@ class Mission:
         GROSS_MASS = 'mission:summary:gross_mass'
         RANGE = 'mission:summary:range'
         RESERVE_FUEL_BURNED = 'mission:summary:reserve_fuel_burned'
+        TEMPERATURE_OFFSET = 'mission:summary:temperature_offset'
         TOTAL_FUEL_MASS = 'mission:summary:total_fuel_mass'
 
     class Takeoff:
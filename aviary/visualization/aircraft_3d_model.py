@@ -4,10 +4,10 @@ from enum import IntEnum
 from string import Template
 from typing import Iterator, List, Tuple
 
-import openmdao.api as om
 from openmdao.utils.om_warnings import issue_warning
 
 import aviary.api as av
+from aviary.utils.case_results import read_case_results
 
 
 class WingType(IntEnum):
@@ -219,6 +219,9 @@ class AircraftModelReader(object):
     ----------
     _case_recorder_file : str
         Path to the case recorder file.
+    _results : CaseResults
+        Results stored in the case recorder file, shared with the other readers of the
+        same file.
     _cr : CaseReader
         CaseReader object.
     _problem_metadata : dict
@@ -229,6 +232,7 @@ class AircraftModelReader(object):
 
     def __init__(self, case_recorder_file):
         self._case_recorder_file = case_recorder_file
+        self._results = None
         self._cr = None
         self._problem_metadata = None
         self._final_case = None
@@ -242,7 +246,8 @@ class AircraftModelReader(object):
         case_recorder_file : str
             Path to the case recorder file.
         """
-        cr = om.CaseReader(self._case_recorder_file)
+        self._results = read_case_results(self._case_recorder_file)
+        cr = self._results.reader
         self._cr = cr
         self._problem_metadata = cr.problem_metadata
 
@@ -257,12 +262,12 @@ class AircraftModelReader(object):
 
             # <class 'aviary.utils.aviary_values.AviaryValues'>
 
-        if 'final' not in cr.list_cases():
+        if not self._results.has_case('final'):
             raise AircraftModelReaderError(
                 f"Case recorder file, {self._case_recorder_file} does not have expected case named 'final'"
             )
 
-        self._final_case = cr.get_case('final')
+        self._final_case = self._results.get_case('final')
 
     def _write_input_output_variables(self):
         """Write out the input and output variables in the final case. For debugging."""
@@ -296,7 +301,7 @@ class AircraftModelReader(object):
             Value of the variable.
         """
         try:
-            val = self._final_case.get_val(var_prom_name, units=units)
+            val = self._results.get_val(var_prom_name, units=units)
             return float(val)
         except KeyError:
             pass
@@ -305,7 +310,7 @@ class AircraftModelReader(object):
         for abs_name, prom_name in abs2prom['input'].items():
             # the phrase "_OVERRIDE" in a variable indicates it is a calculated value that we are discarding
             if prom_name == var_prom_name and '_OVERRIDE' not in abs_name:
-                val = self._final_case.get_val(abs_name, units=units)
+                val = self._results.get_val(abs_name, units=units)
                 return float(val)
 
         raise AircraftModelReaderError(f'Promoted name {var_prom_name} not found in final case')
@@ -2,14 +2,12 @@ import argparse
 import importlib.util
 import json
 import os
-import re
 import shutil
 import zipfile
 from collections import defaultdict
 from pathlib import Path
 
 import numpy as np
-import openmdao.api as om
 import pandas as pd
 import panel as pn
 from bokeh.models import (
@@ -39,6 +37,7 @@ except BaseException:
 from dymos.visualization.timeseries.bokeh_timeseries_report import _meta_tree_subsys_iter
 from openmdao.utils.om_warnings import issue_warning
 
+from aviary.utils.case_results import read_case_results
 from aviary.visualization.aircraft_3d_model import Aircraft3DModel
 
 # support getting this function from OpenMDAO post movement of the function to utils
@@ -413,28 +412,12 @@ def create_aviary_variables_table_data_nested(script_name, recorder_file):
         A nested list of information about the Aviary variables.
 
     """
-    cr = om.CaseReader(recorder_file)
+    results = read_case_results(recorder_file)
 
-    if 'final' not in cr.list_cases():
+    if not results.has_case('final'):
         return None
 
-    case = cr.get_case('final')
-    outputs = case.list_outputs(
-        explicit=True,
-        implicit=True,
-        val=True,
-        residuals=False,
-        residuals_tol=None,
-        units=True,
-        shape=False,
-        bounds=False,
-        desc=False,
-        scaling=False,
-        hierarchical=False,
-        print_arrays=False,
-        out_stream=None,
-        return_format='dict',
-    )
+    outputs = results.list_outputs('final')
     sorted_abs_names = sorted(outputs.keys())
 
     grouped = {}
@@ -456,7 +439,7 @@ def create_aviary_variables_table_data_nested(script_name, recorder_file):
                 {
                     'abs_name': group_name,
                     'prom_name': prom_name,
-                    'value': convert_ndarray_to_support_nans_in_json(outputs[var_info]['val']),
+                    'value': convert_ndarray_to_support_nans_in_json(results.get_val(var_info)),
                     'units': outputs[var_info]['units'],
                     'metadata': json.dumps(aviary_metadata),
                 }
@@ -472,7 +455,7 @@ def create_aviary_variables_table_data_nested(script_name, recorder_file):
                         'abs_name': children_name,
                         'prom_name': prom_name,
                         'value': convert_ndarray_to_support_nans_in_json(
-                            outputs[children_name]['val']
+                            results.get_val(children_name)
                         ),
                         'units': outputs[children_name]['units'],
                         'metadata': json.dumps(aviary_metadata),
@@ -506,7 +489,7 @@ def convert_driver_case_recorder_file_to_df(recorder_file_name):
     recorder_file_name : str
         Name of the case recorder file.
     """
-    cr = om.CaseReader(recorder_file_name)
+    cr = read_case_results(recorder_file_name).reader
     driver_cases = cr.list_cases('driver', out_stream=None)
 
     df = None
@@ -944,7 +927,7 @@ def dashboard(script_name, problem_recorder, driver_recorder, port, run_in_backg
     if driver_recorder:
         if os.path.isfile(driver_recorder):
             df = convert_driver_case_recorder_file_to_df(f'{driver_recorder}')
-            cr = om.CaseReader(f'{driver_recorder}')
+            cr = read_case_results(driver_recorder).reader
             opt_history_pane = create_optimization_history_plot(cr, df)
             optimization_tabs_list.append(('Optimization History', opt_history_pane))
 
@@ -1112,13 +1095,14 @@ def dashboard(script_name, problem_recorder, driver_recorder, port, run_in_backg
     # Interactive XY plot of mission variables
     if problem_recorder_path:
         if os.path.exists(problem_recorder_path):
-            cr = om.CaseReader(problem_recorder_path)
+            results = read_case_results(problem_recorder_path)
 
             # determine what trajectories there are
             traj_nodes = [
                 n
                 for n in _meta_tree_subsys_iter(
-                    cr.problem_metadata['tree'], cls='dymos.trajectory.trajectory:Trajectory'
+                    results.problem_metadata['tree'],
+                    cls='dymos.trajectory.trajectory:Trajectory',
                 )
             ]
 
@@ -1133,38 +1117,34 @@ def dashboard(script_name, problem_recorder, driver_recorder, port, run_in_backg
                     'More than one trajectory found in problem case recorder file. Only using '
                     f'the first one, "{traj_name}", for the interactive XY plot of mission variables'
                 )
-            case = cr.get_case('final')
-            outputs = case.list_outputs(out_stream=None, units=True)
+            timeseries = results.get_timeseries(traj_name)
+            units_by_prom_name = {
+                meta['prom_name']: meta['units'] for meta in results.list_outputs().values()
+            }
 
             # data_by_varname_and_phase = defaultdict(dict)
             data_by_varname_and_phase = defaultdict(lambda: defaultdict(list))
 
             # Find the "largest" unit used for any timeseries output across all phases
             units_by_varname = {}
-            phases = set()
+            phases = set(timeseries)
             varnames = set()
-            # pattern used to parse out the phase names and variable names
-            pattern = rf'{traj_name}\.phases\.([a-zA-Z0-9_]+)\.timeseries\.timeseries_comp\.([a-zA-Z0-9_]+)'
-            for varname, meta in outputs:
-                match = re.match(pattern, varname)
-                if match:
-                    phase, name = match.group(1), match.group(2)
-                    phases.add(phase)
+            for phase, names in timeseries.items():
+                for name, prom_name in names.items():
                     varnames.add(name)
+                    units = units_by_prom_name[prom_name]
                     if name not in units_by_varname:
-                        units_by_varname[name] = meta['units']
+                        units_by_varname[name] = units
                     else:
-                        _, new_conv_factor = conversion_to_base_units(meta['units'])
+                        _, new_conv_factor = conversion_to_base_units(units)
                         _, old_conv_factor = conversion_to_base_units(units_by_varname[name])
                         if new_conv_factor < old_conv_factor:
-                            units_by_varname[name] = meta['units']
+                            units_by_varname[name] = units
 
             # Now get the values using those units
-            for varname, meta in outputs:
-                match = re.match(pattern, varname)
-                if match:
-                    phase, name = match.group(1), match.group(2)
-                    val = case.get_val(varname, units=units_by_varname[name])
+            for phase, names in timeseries.items():
+                for name, prom_name in names.items():
+                    val = results.get_val(prom_name, units=units_by_varname[name])
                     data_by_varname_and_phase[name][phase] = val
 
             # determine the initial variables used for X and Y
@@ -1,7 +1,10 @@
 import re
+import subprocess
+import sys
 from pathlib import Path
 
 from setuptools import find_packages, setup
+from setuptools.command.build_py import build_py
 
 # Version info is set in one place; the aviary/__init__.py file
 __version__ = re.findall(
@@ -13,6 +16,22 @@ with open(Path(__file__).parent / 'README.md', encoding='utf-8') as f:
     long_description = f.read()
 
 pkgname = 'aviary'
+
+
+class BuildPy(build_py):
+    """Also write the snapshot of the core variable metadata into the built package."""
+
+    def run(self):
+        super().run()
+
+        snapshot = Path(self.build_lib) / pkgname / 'variable_info' / 'meta_data_snapshot.pkl'
+        if not self.dry_run:
+            subprocess.check_call(
+                [sys.executable, '-m', f'{pkgname}.variable_info.variable_meta_data', snapshot],
+                cwd=Path(__file__).parent,
+            )
+
+
 extras_require = {
     'test': ['testflo', 'pre-commit', 'sphinx_book_theme==1.1.0', 'myst-nb'],
     'examples': ['openaerostruct', 'ambiance', 'itables'],
@@ -26,6 +45,7 @@ extras_require['all'] = all_packages
 
 setup(
     name='aviary',
+    cmdclass={'build_py': BuildPy},
     long_description=long_description,
     long_description_content_type='text/markdown',
     version=__version__,